@@ -0,0 +1,571 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Generates CP2K runs of arbitrary size from the sample runs in ``tests/data``. The output
+of a sample is split into a header, the block of one step and a footer. The step block
+is repeated for the number of steps, the SCF iterations and the rows of the per atom
+tables are repeated to the requested numbers.
+
+The atoms are described by a seeded :class:`Model`: the sample cell is repeated until
+it holds the requested number of atoms and each atom oscillates harmonically around its
+position (MD) or relaxes towards it (geometry optimization). The positions, velocities,
+forces and energies of each frame follow from the model, such that the output, the
+input and the aux files (``-pos-1.xyz``, ``-vel-1.xyz``, ``-1.ener``, ``-1.cell`` and
+the force files ``-1_<frame>.xyz``) are consistent.
+
+.. code-block:: sh
+
+    python benchmarks/generate.py molecular_dynamics <directory> --steps 1000 --atoms 60
+'''
+
+import os
+import re
+import sys
+import argparse
+import itertools
+import numpy as np
+
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+data_dir = os.path.join(root_dir, 'tests', 'data')
+
+samples = dict(
+    single_point=dict(mainfile='si_bulk8.out', input='si_bulk8.inp', project='Si_bulk8'),
+    molecular_dynamics=dict(
+        mainfile='H2O-32.out', input='H2O-32.inp', project='H2O-32', first_frame=0,
+        step_re=r'^ \*+\n ENSEMBLE TYPE',
+        step_numbers=[r'STEP NUMBER\s*=(\s+\d+)'],
+        input_steps=r'\n\s*STEPS(\s+\d+)'),
+    geometry_optimization=dict(
+        mainfile='H2O.out', input='H2O.inp', project='H2O', first_frame=1,
+        step_re=r'^ -+\n OPTIMIZATION STEP:',
+        step_numbers=[r'OPTIMIZATION STEP:(\s+\d+)', r'Informations at step =(\s+\d+)']))
+
+masses = dict(H=1.00794, C=12.0107, N=14.0067, O=15.9994, Si=28.0855)
+
+# atomic units
+bohr = 0.529177210903
+au_time = 0.02418884326585
+amu = 1822.888486
+boltzmann = 3.166811563e-6
+
+re_scf = re.compile(
+    r'(  -{78}\n)(.*?\n)(\s*\*\*\* SCF run converged in)(\s+\d+)( steps \*\*\*)', re.DOTALL)
+re_scf_step = re.compile(r'\s+(\d+) \S+')
+re_index = re.compile(r'^(\s*)(\d+)')
+re_token = re.compile(r'\S+')
+
+coordinates_header = r'Atom\s+Kind\s+Element\s+X\s+Y\s+Z\s+Z\(eff\)'
+forces_header = r'# Atom\s+Kind\s+Element\s+X\s+Y\s+Z\s*$'
+
+
+def fortran_float(value, digits=12):
+    '''
+    Formats the value like the Fortran E format, e.g. -0.343303964710E+02.
+    '''
+    exponent = 0 if value == 0 else int(np.floor(np.log10(abs(value)))) + 1
+    mantissa = value / 10. ** exponent
+    if abs(round(mantissa, digits)) >= 1:
+        mantissa /= 10
+        exponent += 1
+    return '%.*fE%+03d' % (digits, mantissa, exponent)
+
+
+def set_fields(text, pattern, values, flags=re.MULTILINE):
+    '''
+    Replaces the groups of the matches of pattern by the right adjusted values. Values
+    is a list of strings or a function of the index of the match returning the list.
+    '''
+    count = itertools.count()
+
+    def replace(match):
+        match_values = values(next(count)) if callable(values) else values
+        result = []
+        end = match.start()
+        for group, value in enumerate(match_values, 1):
+            start = match.start(group)
+            result.append(match.string[end:start])
+            result.append('%*s' % (match.end(group) - start, value))
+            end = match.end(group)
+        result.append(match.string[end:match.end()])
+        return ''.join(result)
+
+    return re.sub(pattern, replace, text, flags=flags)
+
+
+def set_number(text, pattern, value):
+    return set_fields(text, pattern, ['%d' % value])
+
+
+def set_columns(row, first, values, fmt):
+    '''
+    Replaces the tokens of the row starting at the token first by the right adjusted
+    formatted values.
+    '''
+    tokens = list(re_token.finditer(row))[first:first + len(values)]
+    result = []
+    end = 0
+    for token, value in zip(tokens, values):
+        result.append(row[end:token.start()])
+        result.append('%*s' % (token.end() - token.start(), fmt % value))
+        end = token.end()
+    result.append(row[end:])
+    return ''.join(result)
+
+
+def set_table(lines, header_re, first, values, fmt):
+    '''
+    Sets the columns of all tables in lines with the given header and one row per
+    value.
+    '''
+    header_re = re.compile(header_re)
+    n = 0
+    while n < len(lines):
+        if header_re.search(lines[n]) is None:
+            n += 1
+            continue
+        n += 1
+        while n < len(lines) and not lines[n].strip():
+            n += 1
+        for row in values:
+            lines[n] = set_columns(lines[n], first, row, fmt)
+            n += 1
+    return lines
+
+
+def set_scf_iterations(text, n_scf=None, energies=None):
+    '''
+    Repeats the SCF iterations in text to n_scf iterations. If energies is given, the
+    total energies of the iterations of the n-th SCF converge to energies(n).
+    '''
+    count = itertools.count()
+
+    def replace(match):
+        iterations = []
+        lines = []
+        for line in match.group(2).splitlines(keepends=True):
+            lines.append(line)
+            if re_scf_step.match(line):
+                iterations.append(lines)
+                lines = []
+        if not iterations:
+            return match.group(0)
+
+        n_iterations = len(iterations) if n_scf is None else n_scf
+        energy = None if energies is None else energies(next(count))
+        result = [match.group(1)]
+        previous = 0.
+        for n in range(n_iterations):
+            iteration = iterations[min(n, len(iterations) - 1)]
+            result.extend(iteration[:-1])
+            line = re_index.sub(
+                lambda m: '%s%*d' % (m.group(1), len(m.group(2)), n + 1), iteration[-1], 1)
+            if energy is not None:
+                value = energy + 0.5 ** (n + 1) * 1e-3 * (n_iterations - n - 1)
+                tokens = re_token.findall(line)
+                line = set_columns(line, len(tokens) - 2, [
+                    '%.10f' % value, '%.2E' % (value - previous)], '%s')
+                previous = value
+            result.append(line)
+        result.append(''.join(lines))
+        result.append(match.group(3))
+        result.append('%*d' % (len(match.group(4)), n_iterations))
+        result.append(match.group(5))
+        return ''.join(result)
+
+    return re_scf.sub(replace, text)
+
+
+def set_atoms(text, n_atoms, n_sample_atoms):
+    '''
+    Repeats the rows of all tables with one row per atom to n_atoms rows.
+    '''
+    lines = text.splitlines(keepends=True)
+    result = []
+    n = 0
+    while n < len(lines):
+        rows = lines[n:n + n_sample_atoms]
+        indices = [re_index.match(row) for row in rows]
+        is_table = len(rows) == n_sample_atoms and all(
+            index is not None and int(index.group(2)) == i + 1 for i, index in enumerate(indices))
+        if not is_table:
+            result.append(lines[n])
+            n += 1
+            continue
+
+        for i in range(n_atoms):
+            index = indices[i % n_sample_atoms]
+            result.append('%s%*d%s' % (
+                index.group(1), len(index.group(2)), i + 1,
+                rows[i % n_sample_atoms][index.end():]))
+        n += n_sample_atoms
+    return ''.join(result)
+
+
+def read_input(name):
+    with open(os.path.join(data_dir, name, samples[name]['input'])) as f:
+        return f.read()
+
+
+def read_sample_atoms(name):
+    '''
+    Returns the labels, positions and cell of the sample input in angstrom.
+    '''
+    text = read_input(name)
+    coord = re.search(r'&COORD\n(.*?)\s*&END COORD', text, re.DOTALL).group(1).split('\n')
+    labels = [row.split()[0] for row in coord]
+    positions = np.array([row.split()[1:4] for row in coord], dtype=float)
+    abc = re.search(r'\n\s*ABC\s+(.+)', text)
+    if abc is not None:
+        cell = np.diag(np.array(abc.group(1).split(), dtype=float))
+    else:
+        cell = np.array([
+            re.search(r'\n\s*%s\s+(.+)' % v, text).group(1).split() for v in 'ABC'], dtype=float)
+    return labels, positions, cell
+
+
+class Model:
+    '''
+    Seeded model of the atoms of a generated run. In molecular dynamics each atom
+    oscillates around its position, in a geometry optimization the displacement decays
+    with each step. Positions are in angstrom, velocities in bohr/au_t, forces in
+    hartree/bohr, energies in hartree and time in fs.
+    '''
+    def __init__(
+            self, labels, positions, cell, n_atoms, energy, seed=0, time_step=0.5,
+            dynamics=True):
+        n_sample_atoms = len(labels)
+        n_copies = -(-n_atoms // n_sample_atoms)
+        n_repeat = int(np.ceil(n_copies ** (1 / 3) - 1e-9))
+        grid = np.array(list(itertools.product(range(n_repeat), repeat=3)))[:n_copies]
+        offsets = np.dot(grid, cell)
+
+        self.n_atoms = n_atoms
+        self.cell = cell * n_repeat
+        self.labels = [labels[i % n_sample_atoms] for i in range(n_atoms)]
+        self.equilibrium = (positions[None, :, :] + offsets[:, None, :]).reshape(-1, 3)[:n_atoms]
+        self.time_step = time_step
+        self.dynamics = dynamics
+
+        rng = np.random.default_rng(seed)
+        self.amplitude = rng.normal(0., 0.02, (n_atoms, 3))
+        self.phase = rng.uniform(0., 2 * np.pi, (n_atoms, 3))
+        self.omega = 2 * np.pi / rng.uniform(10., 30., (n_atoms, 1))
+        self.mass = np.array([masses.get(label, 12.) for label in self.labels])[:, None] * amu
+        # force constants in hartree/bohr^2
+        self.force_constant = self.mass * (self.omega * au_time) ** 2
+        self.energy = energy * n_atoms / n_sample_atoms
+
+    def displacement(self, frame):
+        if self.dynamics:
+            return self.amplitude * np.sin(self.omega * frame * self.time_step + self.phase)
+        return self.amplitude * np.sin(self.phase) * 0.7 ** frame
+
+    def positions(self, frame):
+        return self.equilibrium + self.displacement(frame)
+
+    def velocities(self, frame):
+        if not self.dynamics:
+            return np.zeros((self.n_atoms, 3))
+        velocities = self.amplitude * self.omega * np.cos(
+            self.omega * frame * self.time_step + self.phase)
+        return velocities * au_time / bohr
+
+    def forces(self, frame):
+        return -self.force_constant * self.displacement(frame) / bohr
+
+    def potential_energy(self, frame):
+        return self.energy + 0.5 * np.sum(self.force_constant * (self.displacement(frame) / bohr) ** 2)
+
+    def kinetic_energy(self, frame):
+        return 0.5 * np.sum(self.mass * self.velocities(frame) ** 2)
+
+    def temperature(self, frame):
+        return 2 * self.kinetic_energy(frame) / (3 * self.n_atoms * boltzmann)
+
+    def kinds(self):
+        kinds = dict()
+        return [kinds.setdefault(label, len(kinds) + 1) for label in self.labels]
+
+
+class Generator:
+    '''
+    Writes a run of the sample with the given name with n_steps steps, n_atoms atoms and
+    n_scf SCF iterations per calculation. None keeps the numbers of the sample.
+    '''
+    def __init__(self, name, n_steps=None, n_atoms=None, n_scf=None, seed=0):
+        self.name = name
+        self.sample = samples[name]
+        self.n_scf = n_scf
+
+        labels, positions, cell = read_sample_atoms(name)
+        self.n_sample_atoms = len(labels)
+        self.n_atoms = self.n_sample_atoms if n_atoms is None else n_atoms
+        self.n_repeat = None
+
+        with open(os.path.join(data_dir, name, self.sample['mainfile'])) as f:
+            text = f.read()
+        energy = float(re.findall(r'ENERGY\| Total FORCE_EVAL.+:\s+(\S+)', text)[0])
+        time_step = re.search(r'MD\| Time Step \[fs\]\s+(\S+)', text)
+        self.model = Model(
+            labels, positions, cell, self.n_atoms, energy, seed=seed,
+            time_step=0. if time_step is None else float(time_step.group(1)),
+            dynamics=name == 'molecular_dynamics')
+
+        if 'step_re' in self.sample:
+            steps = [match.start() for match in re.finditer(self.sample['step_re'], text, re.MULTILINE)]
+            self.header, self.step, self.footer = [
+                self.scale(part) for part in (text[:steps[0]], text[steps[0]:steps[1]], text[steps[-1]:])]
+            self.n_steps = len(steps) if n_steps is None else n_steps
+        else:
+            self.header, self.step, self.footer = self.scale(text), None, ''
+            self.n_steps = 0
+
+    def path(self, directory, suffix):
+        return os.path.join(directory, '%s%s' % (self.sample['project'], suffix))
+
+    def scale(self, text):
+        if self.n_atoms != self.n_sample_atoms:
+            text = set_atoms(text, self.n_atoms, self.n_sample_atoms)
+        return text
+
+    def set_cell(self, text):
+        cell = self.model.cell
+
+        def vector(n):
+            v = cell[n % 3]
+            return ['%.3f' % v[0], '%.3f' % v[1], '%.3f' % v[2], '%.3f' % np.linalg.norm(v)]
+
+        text = set_fields(
+            text, r'CELL\w*\| Vector [abc] \[angstrom\]?:?\s*?(\s+\S+)(\s+\S+)(\s+\S+)\s+\|\w\| =(\s+\S+)',
+            vector)
+        text = set_fields(
+            text, r'CELL\w*\| Volume \[angstrom\^3\]:(\s+\S+)', ['%.3f' % abs(np.linalg.det(cell))])
+        return set_number(text, r'- Atoms:(\s+\d+)', self.n_atoms)
+
+    def set_frame(self, text, frames):
+        '''
+        Sets the energies, forces and positions of the calculations in text. The n-th
+        calculation in text is the frame frames(n).
+        '''
+        model = self.model
+        text = set_scf_iterations(
+            text, self.n_scf, lambda n: model.potential_energy(frames(n)))
+        text = set_fields(
+            text, r'^  Total energy:(\s+\S+)',
+            lambda n: ['%.14f' % model.potential_energy(frames(n))])
+        text = set_fields(
+            text, r'^ ENERGY\| Total FORCE_EVAL \( QS \) energy \(a\.u\.\):(\s+\S+)',
+            lambda n: ['%.15f' % model.potential_energy(frames(n))])
+
+        def forces(n):
+            forces = model.forces(frames(n)).sum(axis=0)
+            return ['%.8f' % value for value in forces] + ['%.8f' % np.linalg.norm(forces)]
+
+        text = set_fields(text, r'^ SUM OF ATOMIC FORCES(\s+\S+)(\s+\S+)(\s+\S+)(\s+\S+)', forces)
+
+        lines = text.splitlines(keepends=True)
+        # forces tables are in the order of the calculations
+        tables = [n for n, line in enumerate(lines) if re.search(forces_header, line)]
+        for n, start in enumerate(tables):
+            lines[start:start + self.n_atoms + 1] = set_table(
+                lines[start:start + self.n_atoms + 1], forces_header, 3,
+                model.forces(frames(n)), '%.8f')
+        return ''.join(lines)
+
+    def write_output(self, directory):
+        model = self.model
+        sample = self.sample
+        n_steps = self.n_steps
+
+        header = self.set_cell(self.header)
+        header = set_number(header, r'MD\| Number of Time Steps(\s+\d+)', n_steps)
+        lines = set_table(
+            header.splitlines(keepends=True), coordinates_header, 4, model.positions(0), '%.6f')
+        header = ''.join(lines)
+
+        mainfile = os.path.join(directory, sample['mainfile'])
+        with open(mainfile, 'w') as f:
+            if self.name == 'molecular_dynamics':
+                header = re.sub(
+                    r'( MD\| Velocities .+\n)', lambda m: m.group(1) + ' MD| %-19s%4d%52s\n' % (
+                        'Simulation Cell', 1, '%s-1.cell' % sample['project']), header)
+                # the header contains the calculations of frame 0 and 1
+                header = self.set_frame(header, lambda n: min(n, 1))
+                header = set_fields(header, r'INITIAL POTENTIAL ENERGY\[hartree\]\s+=(\s+\S+)', [
+                    fortran_float(model.potential_energy(0))])
+                header = set_fields(header, r'INITIAL KINETIC ENERGY\[hartree\]\s+=(\s+\S+)', [
+                    fortran_float(model.kinetic_energy(0))])
+                header = set_fields(header, r'INITIAL TEMPERATURE\[K\]\s+=(\s+\S+)', [
+                    '%.3f' % model.temperature(0)])
+                f.write(header)
+                averages = np.zeros(3)
+                for n in range(1, n_steps + 1):
+                    values = np.array([
+                        model.potential_energy(n), model.kinetic_energy(n), model.temperature(n)])
+                    averages += (values - averages) / n
+                    # the step block contains the md information of the step and the
+                    # calculation of the next frame
+                    step = self.step if n < n_steps else self.footer
+                    step = set_number(step, r'STEP NUMBER\s*=(\s+\d+)', n)
+                    step = set_fields(step, r'TIME \[fs\]\s*=(\s+\S+)', ['%.6f' % (n * model.time_step)])
+                    step = set_fields(step, r'CONSERVED QUANTITY \[hartree\] =(\s+\S+)', [
+                        fortran_float(values[0] + values[1])])
+                    for pattern, n_value, fmt in [
+                            (r'POTENTIAL ENERGY\[hartree\]\s+=(\s+\S+)(\s+\S+)', 0, fortran_float),
+                            (r'KINETIC ENERGY \[hartree\]\s+=(\s+\S+)(\s+\S+)', 1, fortran_float),
+                            (r'TEMPERATURE \[K\]\s+=(\s+\S+)(\s+\S+)', 2, lambda v: '%.3f' % v)]:
+                        step = set_fields(step, pattern, [fmt(values[n_value]), fmt(averages[n_value])])
+                    f.write(self.set_frame(step, lambda _: min(n + 1, n_steps)))
+
+            elif self.name == 'geometry_optimization':
+                header = self.set_frame(header, lambda _: 0)
+                f.write(set_fields(header, r'Total Energy\s+=(\s+\S+)', [
+                    '%.10f' % model.potential_energy(0)]))
+                for n in range(1, n_steps + 1):
+                    step = self.step if n < n_steps else self.footer
+                    for pattern in sample['step_numbers']:
+                        step = set_number(step, pattern, n)
+                    step = set_fields(step, r'Total Energy\s+=(\s+\S+)', [
+                        '%.10f' % model.potential_energy(n)])
+                    f.write(self.set_frame(step, lambda _: n))
+
+            else:
+                f.write(self.set_frame(header, lambda _: 0))
+
+        return mainfile
+
+    def write_input(self, directory):
+        text = read_input(self.name)
+        labels, positions = self.model.labels, self.model.positions(0)
+        coord = ''.join(
+            '      %-2s %14.6f %14.6f %14.6f\n' % (label, *position)
+            for label, position in zip(labels, positions))
+        text = re.sub(
+            r'(&COORD\n)(.*?\n)(\s*&END COORD)', lambda m: m.group(1) + coord + m.group(3).lstrip('\n'),
+            text, flags=re.DOTALL)
+
+        cell = self.model.cell
+        text = set_fields(text, r'^\s*ABC(\s+\S+)(\s+\S+)(\s+\S+)', [
+            '%.4f' % np.linalg.norm(v) for v in cell])
+        for n, v in enumerate('ABC'):
+            text = set_fields(text, r'^\s*%s(\s+\S+)(\s+\S+)(\s+\S+)$' % v, [
+                '%.9f' % value for value in cell[n]])
+        if self.sample.get('input_steps') is not None:
+            text = set_number(text, self.sample['input_steps'], self.n_steps)
+
+        with open(os.path.join(directory, self.sample['input']), 'w') as f:
+            f.write(text)
+
+    def write_xyz(self, path, values, fmt):
+        first_frame = self.sample['first_frame']
+        with open(path, 'w') as f:
+            for n in range(self.n_steps + 1):
+                f.write('%8d\n' % self.n_atoms)
+                if self.model.dynamics:
+                    f.write(' i = %8d, time = %12.3f, E = %20.10f\n' % (
+                        n + first_frame, n * self.model.time_step, self.model.potential_energy(n)))
+                else:
+                    f.write(' i = %8d, E = %20.10f\n' % (
+                        n + first_frame, self.model.potential_energy(n)))
+                f.writelines(
+                    fmt % (label, *value) for label, value in zip(self.model.labels, values(n)))
+
+    def write_energies(self, path):
+        model = self.model
+        with open(path, 'w') as f:
+            f.write(
+                '#     Step Nr.          Time[fs]        Kin.[a.u.]          Temp[K]'
+                '            Pot.[a.u.]        Cons Qty[a.u.]        UsedTime[s]\n')
+            for n in range(self.n_steps + 1):
+                kinetic, potential = model.kinetic_energy(n), model.potential_energy(n)
+                f.write('%10d %19.6f %19.9f %19.9f %19.9f %19.9f %19.9f\n' % (
+                    n, n * model.time_step, kinetic, model.temperature(n), potential,
+                    kinetic + potential, 0. if n == 0 else 2.))
+
+    def write_cell(self, path):
+        cell = self.model.cell
+        with open(path, 'w') as f:
+            f.write(
+                '#   Step   Time [fs]       %s   Volume [Angstrom^3]\n' % '   '.join(
+                    '%s%s [Angstrom]' % (v, c) for v in 'ABC' for c in 'xyz'))
+            for n in range(self.n_steps + 1):
+                f.write('%8d %12.3f%s %20.10f\n' % (
+                    n, n * self.model.time_step, ''.join('%20.10f' % v for v in cell.flatten()),
+                    abs(np.linalg.det(cell))))
+
+    def write_forces(self, directory):
+        model = self.model
+        kinds = model.kinds()
+        for n in range(self.n_steps + 1):
+            forces = model.forces(n)
+            with open(self.path(directory, '-1_%d.xyz' % n), 'w') as f:
+                f.write(' ATOMIC FORCES in [a.u.]\n\n')
+                f.write(' # Atom   Kind   Element          X              Y              Z\n')
+                for i, (kind, label, force) in enumerate(zip(kinds, model.labels, forces)):
+                    f.write('%7d%7d%7s%21.8f%15.8f%15.8f\n' % (i + 1, kind, label, *force))
+                total = forces.sum(axis=0)
+                f.write(' SUM OF ATOMIC FORCES%21.8f%15.8f%15.8f%15.8f\n' % (
+                    *total, np.linalg.norm(total)))
+
+    def write(self, directory):
+        '''
+        Writes the output, the input and the aux files to directory and returns the
+        path of the mainfile.
+        '''
+        os.makedirs(directory, exist_ok=True)
+        mainfile = self.write_output(directory)
+        self.write_input(directory)
+        if self.name == 'single_point':
+            return mainfile
+
+        position_fmt = '%3s %20.10f%20.10f%20.10f\n'
+        self.write_xyz(self.path(directory, '-pos-1.xyz'), self.model.positions, position_fmt)
+        self.write_forces(directory)
+        if self.model.dynamics:
+            self.write_xyz(self.path(directory, '-vel-1.xyz'), self.model.velocities, position_fmt)
+            self.write_energies(self.path(directory, '-1.ener'))
+            self.write_cell(self.path(directory, '-1.cell'))
+        return mainfile
+
+
+def write_output(name, directory, n_steps=None, n_atoms=None, n_scf=None, seed=0):
+    '''
+    Writes a run of the sample with the given name to directory, see :class:`Generator`.
+    Returns the path of the mainfile.
+    '''
+    return Generator(name, n_steps, n_atoms, n_scf, seed).write(directory)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Generates CP2K runs from the samples.')
+    arg_parser.add_argument('sample', choices=list(samples))
+    arg_parser.add_argument('directory')
+    arg_parser.add_argument('--steps', type=int, default=None)
+    arg_parser.add_argument('--atoms', type=int, default=None)
+    arg_parser.add_argument('--scf', type=int, default=None, help='SCF iterations per calculation')
+    arg_parser.add_argument('--seed', type=int, default=0)
+    args = arg_parser.parse_args(argv)
+
+    print(write_output(args.sample, args.directory, args.steps, args.atoms, args.scf, args.seed))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Scaling benchmark of the parser. Outputs of increasing size are generated with
+:mod:`generate` and each is parsed in a fresh interpreter that measures the time of
+the stages parse and serialize and the peak memory. The scaling exponent of each stage
+is fitted to the largest sizes of a series.
+
+.. code-block:: sh
+
+    python benchmarks/scaling.py
+    python benchmarks/scaling.py --full --series md_steps atoms
+
+The benchmark exits with 1 if an exponent exceeds 1 by more than the tolerance. The
+default sizes are small enough for a regular run, --full uses the sizes up to 10^5 MD
+steps and 10^4 atoms which needs several GB of disk space and hours.
+'''
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import subprocess
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate import write_output  # noqa: E402
+
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# name: (sample, parameter, default sizes, full sizes, other parameters)
+series = dict(
+    md_steps=(
+        'molecular_dynamics', 'n_steps', [30, 100, 300, 1000],
+        [10, 100, 1000, 10000, 100000], dict()),
+    opt_steps=(
+        'geometry_optimization', 'n_steps', [3, 10, 30, 100],
+        [10, 30, 100, 300, 1000], dict()),
+    atoms=(
+        'molecular_dynamics', 'n_atoms', [30, 100, 300, 1000],
+        [10, 100, 1000, 10000], dict(n_steps=10)),
+    scf=(
+        'molecular_dynamics', 'n_scf', [10, 30, 100, 300],
+        [10, 100, 1000, 10000], dict(n_steps=10)))
+
+stages = ['parse', 'serialize', 'memory']
+marker = '#stage '
+
+sample_code = '''
+import sys
+import time
+import resource
+
+def stage(name, value):
+    sys.stderr.write('%%s%%s %%.6f\\n' %% (%r, name, value))
+
+from cp2kparser import CP2KParser
+from cp2kparser.writer import write_archive
+from nomad.datamodel import EntryArchive
+
+class Null:
+    def write(self, value):
+        pass
+
+parser = CP2KParser()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+t0 = time.perf_counter()
+archive = EntryArchive()
+parser.parse(%r, archive, None)
+t1 = time.perf_counter()
+stage('parse', t1 - t0)
+write_archive(archive, Null())
+stage('serialize', time.perf_counter() - t1)
+# kilobytes on linux
+stage('memory', (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss) * 1024)
+'''
+
+
+def run_sample(mainfile):
+    '''
+    Parses the mainfile in a fresh interpreter and returns the value of each stage.
+    '''
+    result = subprocess.run(
+        [sys.executable, '-c', sample_code % (marker, mainfile)], cwd=root_dir,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError('Benchmark sample failed:\n%s' % result.stderr[-2000:])
+
+    values = dict()
+    for line in result.stderr.splitlines():
+        if line.startswith(marker):
+            name, value = line[len(marker):].split()
+            values[name] = float(value)
+    return values
+
+
+def fit_exponent(sizes, values, n_points=3, min_value=0.):
+    '''
+    Returns the exponent of a power law fitted to the largest sizes or None if there
+    are not enough values above min_value.
+    '''
+    points = [(n, v) for n, v in zip(sizes, values) if v > min_value][-n_points:]
+    if len(points) < 2:
+        return None
+    x, y = np.log(np.array(points)).T
+    return np.polyfit(x, y, 1)[0]
+
+
+def run_series(name, sizes, directory):
+    sample, parameter, _, _, parameters = series[name]
+    results = []
+    for size in sizes:
+        sample_directory = os.path.join(directory, '%s_%d' % (name, size))
+        mainfile = write_output(sample, sample_directory, **dict(
+            parameters, **{parameter: size}))
+        results.append(run_sample(mainfile))
+        shutil.rmtree(sample_directory)
+    return results
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Scaling benchmark of the CP2K parser.')
+    arg_parser.add_argument('--series', nargs='*', choices=list(series), default=list(series))
+    arg_parser.add_argument('--full', action='store_true', help='use the full sizes')
+    arg_parser.add_argument(
+        '--tolerance', type=float, default=0.15, help='allowed excess of the exponents over 1')
+    arg_parser.add_argument('--output', help='file to store the results as json')
+    args = arg_parser.parse_args(argv)
+
+    report = dict()
+    failed = []
+    directory = tempfile.mkdtemp(prefix='cp2k_scaling_')
+    try:
+        for name in args.series:
+            sizes = series[name][3] if args.full else series[name][2]
+            results = run_series(name, sizes, directory)
+            exponents = dict()
+            print('%s' % name)
+            print('  %10s %12s %12s %12s' % ('size', 'parse [s]', 'serialize [s]', 'memory [MB]'))
+            for size, values in zip(sizes, results):
+                print('  %10d %12.3f %12.3f %12.1f' % (
+                    size, values['parse'], values['serialize'], values['memory'] / 1e6))
+            for stage in stages:
+                exponent = fit_exponent(
+                    sizes, [values[stage] for values in results],
+                    min_value=1e6 if stage == 'memory' else 0.)
+                exponents[stage] = exponent
+                if exponent is not None and exponent > 1 + args.tolerance:
+                    failed.append('%s %s' % (name, stage))
+            print('  exponents: %s' % ', '.join(
+                '%s %s' % (stage, 'n/a' if value is None else '%.2f' % value)
+                for stage, value in exponents.items()))
+            report[name] = dict(sizes=sizes, results=results, exponents=exponents)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    if args.output is not None:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if failed:
+        print('Super-linear scaling: %s' % ', '.join(failed))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Cold-start benchmark of the parser. Each sample runs in a fresh interpreter and measures
+the phases import, construction of CP2KParser, first and second parse. The import time
+of the modules is attributed to the groups below with ``python -X importtime``.
+
+.. code-block:: sh
+
+    python benchmarks/startup.py --save
+    python benchmarks/startup.py --threshold 0.2
+
+The second call exits with 1 if the median of a phase is slower than the stored
+baseline by more than the threshold. Baselines are machine specific and should be
+stored on the machine that runs the comparison, they are not part of the repository.
+'''
+
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+baseline_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines', 'startup.json')
+default_mainfile = os.path.join(root_dir, 'tests', 'data', 'single_point', 'si_bulk8.out')
+
+phases = ['import', 'construct', 'first_parse', 'second_parse']
+# the first matching prefix is used
+module_groups = [
+    'cp2kparser.metainfo', 'cp2kparser', 'nomad', 'ase', 'mdtraj', 'numpy', 'scipy', 'pint']
+
+marker = '#phase '
+
+sample_code = '''
+import sys
+import time
+
+def phase(name, t0):
+    t1 = time.perf_counter()
+    sys.stderr.write('%%s%%s %%.6f\\n' %% (%r, name, t1 - t0))
+    sys.stderr.flush()
+    return time.perf_counter()
+
+t0 = time.perf_counter()
+from cp2kparser import CP2KParser
+from nomad.datamodel import EntryArchive
+t0 = phase('import', t0)
+parser = CP2KParser()
+t0 = phase('construct', t0)
+parser.parse(%r, EntryArchive(), None)
+t0 = phase('first_parse', t0)
+parser.parse(%r, EntryArchive(), None)
+t0 = phase('second_parse', t0)
+'''
+
+
+def get_group(module_name):
+    for group in module_groups:
+        if module_name == group or module_name.startswith('%s.' % group):
+            return group
+    return 'other'
+
+
+def run_sample(mainfile):
+    '''
+    Runs the phases in a fresh interpreter and returns the time of each phase and the
+    import time of each module group per phase in seconds.
+    '''
+    code = sample_code % (marker, mainfile, mainfile)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code], cwd=root_dir,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+    if result.returncode != 0:
+        raise RuntimeError('Benchmark sample failed:\n%s' % result.stderr[-2000:])
+
+    sample = dict(phases=dict(), modules=dict())
+    modules = dict()
+    for line in result.stderr.splitlines():
+        if line.startswith(marker):
+            name, value = line[len(marker):].split()
+            sample['phases'][name] = float(value)
+            sample['modules'][name] = modules
+            modules = dict()
+        elif line.startswith('import time:'):
+            fields = line[len('import time:'):].split('|')
+            if not fields[0].strip().isdigit():
+                # header
+                continue
+            group = get_group(fields[2].strip())
+            modules[group] = modules.get(group, 0.) + int(fields[0]) * 1e-6
+
+    return sample
+
+
+def median_sample(samples):
+    result = dict(phases=dict(), modules=dict())
+    for name in phases:
+        result['phases'][name] = statistics.median([s['phases'][name] for s in samples])
+        groups = set(group for s in samples for group in s['modules'][name])
+        result['modules'][name] = {
+            group: statistics.median([s['modules'][name].get(group, 0.) for s in samples])
+            for group in sorted(groups)}
+    return result
+
+
+def compare(result, baseline, threshold):
+    '''
+    Returns the phases that are slower than the baseline by more than the threshold.
+    '''
+    regressions = []
+    for name in phases:
+        reference = baseline['phases'].get(name)
+        if reference is None:
+            continue
+        if result['phases'][name] > reference * (1 + threshold):
+            regressions.append(name)
+    return regressions
+
+
+def report(result, baseline=None):
+    lines = ['%-14s %10s %10s' % ('phase', 'time [s]', 'baseline')]
+    for name in phases:
+        reference = '' if baseline is None else '%10.3f' % baseline['phases'].get(name, float('nan'))
+        lines.append('%-14s %10.3f %s' % (name, result['phases'][name], reference))
+        for group, value in sorted(
+                result['modules'][name].items(), key=lambda item: -item[1]):
+            if value >= 0.001:
+                lines.append('  %-20s %10.3f' % (group, value))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Cold-start benchmark of the CP2K parser.')
+    arg_parser.add_argument('--mainfile', default=default_mainfile)
+    arg_parser.add_argument('--repeat', type=int, default=5, help='number of fresh interpreters')
+    arg_parser.add_argument('--baseline', default=baseline_path)
+    arg_parser.add_argument('--save', action='store_true', help='store the result as baseline')
+    arg_parser.add_argument(
+        '--threshold', type=float, default=0.2, help='allowed relative slowdown of a phase')
+    args = arg_parser.parse_args(argv)
+
+    result = median_sample([run_sample(os.path.abspath(args.mainfile)) for _ in range(args.repeat)])
+
+    if args.save:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+        print(report(result))
+        return 0
+
+    baseline = None
+    if os.path.isfile(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print(report(result, baseline))
+    if baseline is None:
+        return 0
+
+    regressions = compare(result, baseline, args.threshold)
+    if regressions:
+        print('Slower than baseline by more than %d%%: %s' % (
+            args.threshold * 100, ', '.join(regressions)))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Benchmark of the unit resolution. The time of resolve_unit is measured for typical CP2K
+unit expressions without and with the cache, then the samples and a generated MD run
+are parsed to count the calls of resolve_unit and the expressions that are resolved.
+
+.. code-block:: sh
+
+    python benchmarks/units.py [--repeat 1000] [--steps 1000]
+'''
+
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+import shutil
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from generate import write_output  # noqa: E402
+
+from nomad.datamodel import EntryArchive  # noqa: E402
+from cp2kparser import CP2KParser  # noqa: E402
+from cp2kparser import cp2k_parser  # noqa: E402
+
+
+root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+expressions = [
+    'angstrom', 'bohr', 'hartree/bohr', 'bohr*au_t^-1', 'angstrom^3', 'hartree*bohr^-1',
+    '(bohr*au_t)^-1', 'bohr**3']
+
+
+def time_resolve(repeat, cached):
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for expression in expressions:
+            if not cached:
+                cp2k_parser._resolved_units.clear()
+            cp2k_parser.resolve_unit(expression)
+    return (time.perf_counter() - t0) / (repeat * len(expressions))
+
+
+def count_resolve(mainfiles):
+    '''
+    Parses the mainfiles and returns the number of calls of resolve_unit and the number
+    of expressions that were resolved.
+    '''
+    calls = [0]
+    resolve_unit = cp2k_parser.resolve_unit
+
+    def counted_resolve_unit(unit_str):
+        calls[0] += 1
+        return resolve_unit(unit_str)
+
+    cp2k_parser._resolved_units.clear()
+    cp2k_parser.resolve_unit = counted_resolve_unit
+    try:
+        parser = CP2KParser()
+        for mainfile in mainfiles:
+            parser.parse(mainfile, EntryArchive(), None)
+    finally:
+        cp2k_parser.resolve_unit = resolve_unit
+    return calls[0], len(cp2k_parser._resolved_units)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Benchmark of the unit resolution.')
+    arg_parser.add_argument('--repeat', type=int, default=1000)
+    arg_parser.add_argument('--steps', type=int, default=1000, help='steps of the generated run')
+    args = arg_parser.parse_args(argv)
+
+    uncached = time_resolve(args.repeat, cached=False)
+    cached = time_resolve(args.repeat, cached=True)
+    print('resolve_unit uncached %8.2f us' % (uncached * 1e6))
+    print('resolve_unit cached   %8.2f us' % (cached * 1e6))
+    print('speedup               %8.1f' % (uncached / cached))
+
+    mainfiles = sorted(glob.glob(os.path.join(root_dir, 'tests', 'data', '*', '*.out')))
+    directory = tempfile.mkdtemp(prefix='cp2k_units_')
+    try:
+        names = [os.path.relpath(mainfile, root_dir) for mainfile in mainfiles]
+        mainfiles.append(write_output(
+            'geometry_optimization', directory, n_steps=args.steps))
+        names.append('geometry optimization, %d steps' % args.steps)
+        for name, mainfile in zip(names, mainfiles):
+            calls, resolved = count_resolve([mainfile])
+            print('%-40s %8d calls %4d resolved' % (name, calls, resolved))
+    finally:
+        shutil.rmtree(directory)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,16 +17,27 @@
 #
 
 import sys
-import json
 import logging
+import argparse
 
 from nomad.utils import configure_logging
 from nomad.datamodel import EntryArchive
 from cp2kparser import CP2KParser
+from cp2kparser.writer import write_archive
 
 
 if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description='Parses a CP2K output and writes the archive.')
+    arg_parser.add_argument('mainfile')
+    arg_parser.add_argument('--format', choices=['json', 'msgpack'], default='json')
+    arg_parser.add_argument(
+        '--compact', action='store_true', help='write json without indentation')
+    args = arg_parser.parse_args()
+
     configure_logging(console_log_level=logging.DEBUG)
     archive = EntryArchive()
-    CP2KParser().parse(sys.argv[1], archive, logging)
-    json.dump(archive.m_to_dict(), sys.stdout, indent=2)
+    CP2KParser().parse(args.mainfile, archive, logging)
+    if args.format == 'msgpack':
+        write_archive(archive, sys.stdout.buffer, format='msgpack')
+    else:
+        write_archive(archive, sys.stdout, indent=None if args.compact else 2)
@@ -0,0 +1,250 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Parses many CP2K outputs with a pool of worker processes. Each worker creates one
+CP2KParser that is reused for all of its files.
+
+.. code-block:: sh
+
+    python -m cp2kparser.batch <paths> [--manifest <file>] [--processes <n>]
+        [--output <file.jsonl> | --output-dir <dir>]
+
+Paths can be mainfiles or directories which are searched for CP2K mainfiles, the
+manifest lists one path per line. With --output, each result is written as one JSON
+line with the keys mainfile, parse_time, write_time, error and archive. With
+--output-dir, the archive of each mainfile is written to a separate file under the same
+relative path and the other keys to index.jsonl. A summary of the timings and failures
+is written to stderr. With --cache, results of unchanged files are taken from a
+:class:`cp2kparser.cache.ResultCache` in the given directory. With --time-budget and
+--memory-budget, the parse of a file stops early if a budget is exceeded, the reason is
+given by the key partial.
+'''
+
+import os
+import io
+import sys
+import json
+import time
+import argparse
+import traceback
+import multiprocessing
+
+from nomad.datamodel import EntryArchive
+from cp2kparser import CP2KParser
+from cp2kparser.writer import write_archive
+from cp2kparser.cache import ResultCache, parser_options
+
+
+_parser = None
+_cache = None
+
+
+def _init_worker(parser_kwargs, cache_kwargs=None):
+    global _parser, _cache
+    _parser = CP2KParser(**parser_kwargs)
+    _cache = None if cache_kwargs is None else ResultCache(**cache_kwargs)
+
+
+def is_mainfile(parser, path):
+    try:
+        with open(path, 'rb') as f:
+            buffer = f.read(2048)
+    except OSError:
+        return False
+    return parser.is_mainfile(path, 'text/plain', buffer, buffer.decode('utf-8', errors='ignore'))
+
+
+def find_mainfiles(paths, manifest=None):
+    '''
+    Returns the mainfiles given by the paths and the manifest. Directories are searched
+    recursively, files are used as they are.
+    '''
+    paths = list(paths)
+    if manifest is not None:
+        with open(manifest) as f:
+            paths.extend(line.strip() for line in f if line.strip() and not line.startswith('#'))
+
+    parser = CP2KParser()
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for dirpath, dirnames, filenames in os.walk(path):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                filepath = os.path.join(dirpath, filename)
+                if is_mainfile(parser, filepath):
+                    yield filepath
+
+
+def parse_file(task, parser=None, cache=None):
+    '''
+    Parses a single mainfile in a worker. The archive is written to the given path or
+    returned as compact JSON. Without parser and cache, those of the worker are used.
+    '''
+    mainfile, path = task
+    if parser is None:
+        parser, cache = _parser, _cache
+    result = dict(mainfile=mainfile, parse_time=None, write_time=None, error=None)
+    t0 = time.perf_counter()
+    try:
+        if not os.path.isfile(mainfile):
+            raise FileNotFoundError('No such file %s' % mainfile)
+        data = None
+        if cache is not None:
+            options = parser_options(parser)
+            data = cache.get(mainfile, options)
+            result['cached'] = data is not None
+        if data is None:
+            archive = EntryArchive()
+            parser.parse(mainfile, archive, None)
+            result['partial'] = parser.partial_reason
+        t1 = time.perf_counter()
+        result['parse_time'] = t1 - t0
+        if data is None and (cache is not None or path is None):
+            f = io.StringIO()
+            write_archive(archive, f)
+            data = f.getvalue()
+            if cache is not None and parser.partial_reason is None:
+                cache.put(mainfile, parser.aux_files, data, options)
+        if path is None:
+            result['archive'] = data
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'w') as f:
+                if data is None:
+                    write_archive(archive, f)
+                else:
+                    f.write(data)
+        result['write_time'] = time.perf_counter() - t1
+    except Exception as e:
+        result['error'] = '%s: %s' % (e.__class__.__name__, e)
+        result['traceback'] = traceback.format_exc()
+    return result
+
+
+def parse_files(
+        mainfiles, output_dir=None, processes=None, parser_kwargs=None, chunksize=1,
+        cache_kwargs=None):
+    '''
+    Parses the mainfiles and yields the results of parse_file in the order in which
+    they are finished. With processes=1 the files are parsed in this process. The
+    cache_kwargs are the arguments of the ResultCache of each worker.
+    '''
+    mainfiles = [os.path.abspath(mainfile) for mainfile in mainfiles]
+    if not mainfiles:
+        return
+
+    tasks = []
+    root = os.path.commonpath([os.path.dirname(mainfile) for mainfile in mainfiles])
+    for mainfile in mainfiles:
+        path = None
+        if output_dir is not None:
+            path = os.path.join(output_dir, '%s.json' % os.path.relpath(mainfile, root))
+        tasks.append((mainfile, path))
+
+    parser_kwargs = dict() if parser_kwargs is None else parser_kwargs
+    if processes == 1:
+        _init_worker(parser_kwargs, cache_kwargs)
+        for task in tasks:
+            yield parse_file(task)
+        return
+
+    with multiprocessing.Pool(processes, _init_worker, (parser_kwargs, cache_kwargs)) as pool:
+        for result in pool.imap_unordered(parse_file, tasks, chunksize=chunksize):
+            yield result
+
+
+def write_result(result, f):
+    '''
+    Writes the result as a JSON line, the archive is written as it is.
+    '''
+    archive = result.pop('archive', None)
+    line = json.dumps(result)
+    if archive is not None:
+        line = '%s, "archive": %s}' % (line[:-1], archive)
+    f.write(line + '\n')
+
+
+def report(results, n_slowest=10):
+    parsed = [result for result in results if result['error'] is None]
+    failed = [result for result in results if result['error'] is not None]
+    parse_time = sum(result['parse_time'] for result in parsed)
+    lines = ['parsed %d files, %d failed, %d from cache, %d partial' % (
+        len(parsed), len(failed), sum(1 for result in parsed if result.get('cached')),
+        sum(1 for result in parsed if result.get('partial')))]
+    if parsed:
+        lines.append('parse time %.3f s, mean %.3f s' % (parse_time, parse_time / len(parsed)))
+        lines.append('slowest files:')
+        for result in sorted(parsed, key=lambda result: -result['parse_time'])[:n_slowest]:
+            lines.append('  %10.3f s %s' % (result['parse_time'], result['mainfile']))
+    if failed:
+        lines.append('failed files:')
+        for result in failed:
+            lines.append('  %s %s' % (result['mainfile'], result['error']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Parses many CP2K outputs with a pool of workers.')
+    arg_parser.add_argument('paths', nargs='*', help='mainfiles or directories')
+    arg_parser.add_argument('--manifest', help='file with one path per line')
+    arg_parser.add_argument('--processes', type=int, default=None, help='number of workers')
+    arg_parser.add_argument('--chunksize', type=int, default=1)
+    arg_parser.add_argument('--time-budget', type=float, help='maximum parse time per file in s')
+    arg_parser.add_argument(
+        '--memory-budget', type=int, help='maximum growth of the resident memory per file in bytes')
+    arg_parser.add_argument('--cache', help='directory of the result cache')
+    arg_parser.add_argument(
+        '--cache-size', type=int, default=1 << 30, help='maximum size of the cache in bytes')
+    output = arg_parser.add_mutually_exclusive_group()
+    output.add_argument('--output', help='JSON lines file, default is stdout')
+    output.add_argument('--output-dir', help='directory for the archives of each file')
+    args = arg_parser.parse_args(argv)
+
+    mainfiles = list(find_mainfiles(args.paths, args.manifest))
+    results = []
+    t0 = time.perf_counter()
+
+    f = sys.stdout
+    if args.output_dir is not None:
+        os.makedirs(args.output_dir, exist_ok=True)
+        f = open(os.path.join(args.output_dir, 'index.jsonl'), 'w')
+    elif args.output is not None:
+        f = open(args.output, 'w')
+
+    try:
+        for result in parse_files(
+                mainfiles, output_dir=args.output_dir, processes=args.processes,
+                chunksize=args.chunksize, parser_kwargs=dict(
+                    time_budget=args.time_budget, memory_budget=args.memory_budget),
+                cache_kwargs=None if args.cache is None else dict(
+                    directory=args.cache, max_size=args.cache_size)):
+            write_result(result, f)
+            results.append(result)
+    finally:
+        if f is not sys.stdout:
+            f.close()
+
+    sys.stderr.write('%s\ntotal time %.3f s\n' % (report(results), time.perf_counter() - t0))
+    return 1 if any(result['error'] is not None for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,230 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+On-disk cache of parse results. An entry is addressed by the hash of the mainfile
+contents, the parser version and the parser options. It stores the hashes of the aux
+files that were opened during the parse, relative to the directory of the mainfile,
+and the archive as compact JSON. An entry is only used if all aux files are unchanged.
+The least recently used entries are removed if the size of the cache exceeds max_size.
+The size is rescanned at least every scan_interval seconds such that the writes of
+other processes sharing the directory are taken into account. Partial results of parses that exceeded a budget are not stored.
+
+.. code-block:: python
+
+    cache = ResultCache('/tmp/cp2k_cache')
+    cache.parse(CP2KParser(), mainfile, archive, logger)
+'''
+
+import os
+import io
+import json
+import glob
+import time
+import inspect
+import hashlib
+import tempfile
+
+from cp2kparser.metainfo import load_input_sections
+from cp2kparser.writer import write_archive
+
+
+def file_hash(path):
+    '''
+    Returns the sha1 hash of the file contents or None if the file does not exist.
+    '''
+    sha1 = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                sha1.update(chunk)
+    except (FileNotFoundError, IsADirectoryError):
+        return None
+    return sha1.hexdigest()
+
+
+_parser_version = None
+
+
+def parser_version():
+    '''
+    Returns a hash of the parser and metainfo sources.
+    '''
+    global _parser_version
+    if _parser_version is None:
+        sha1 = hashlib.sha1()
+        source_dir = os.path.dirname(os.path.abspath(__file__))
+        for pattern in ['*.py', 'metainfo/*.py', 'metainfo/cp2k_input/*.py']:
+            for filename in sorted(glob.glob(os.path.join(source_dir, pattern))):
+                with open(filename, 'rb') as f:
+                    sha1.update(f.read())
+        _parser_version = sha1.hexdigest()
+    return _parser_version
+
+
+# options that do not change the archive of a complete parse
+ignored_options = ['profile', 'profile_memory', 'time_budget', 'memory_budget']
+
+
+def parser_options(parser):
+    # the constructor arguments are stored as attributes of the same name
+    return {
+        name: getattr(parser, name, None)
+        for name in inspect.signature(parser.__class__.__init__).parameters
+        if name != 'self' and name not in ignored_options}
+
+
+class ResultCache:
+    '''
+    Size bounded cache of serialized archives in the given directory. The access time
+    of the entries is tracked with their modification time.
+    '''
+    # maximum age of the size in seconds
+    scan_interval = 10.
+    # age in seconds after which temporary files are considered left over by a crash
+    tmp_max_age = 3600.
+
+    def __init__(self, directory, max_size=1 << 30):
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+        self._size = None
+        self._scan_time = 0.
+
+    def key(self, mainfile, options=None):
+        mainfile_hash = file_hash(mainfile)
+        if mainfile_hash is None:
+            raise FileNotFoundError('No such file %s' % mainfile)
+        sha1 = hashlib.sha1(parser_version().encode())
+        sha1.update(json.dumps(options, sort_keys=True).encode())
+        sha1.update(mainfile_hash.encode())
+        return sha1.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], '%s.json' % key)
+
+    def get(self, mainfile, options=None):
+        '''
+        Returns the archive of the mainfile as JSON string or None if there is no valid
+        entry.
+        '''
+        path = self._path(self.key(mainfile, options))
+        try:
+            with open(path) as f:
+                aux_files = json.loads(f.readline())
+                maindir = os.path.dirname(os.path.abspath(mainfile))
+                for filename, sha1 in aux_files.items():
+                    if file_hash(os.path.join(maindir, filename)) != sha1:
+                        return None
+                data = f.read()
+        except FileNotFoundError:
+            return None
+
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return data
+
+    def put(self, mainfile, aux_files, data, options=None):
+        '''
+        Stores the JSON string data of the mainfile with the hashes of the aux files.
+        '''
+        maindir = os.path.dirname(os.path.abspath(mainfile))
+        aux_files = {
+            os.path.relpath(path, maindir): file_hash(path) for path in aux_files}
+        path = self._path(self.key(mainfile, options))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # write to a temporary file first as other processes might read the entry
+        fd, tmp_path = tempfile.mkstemp(suffix='.json.tmp', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(json.dumps(aux_files, sort_keys=True) + '\n')
+                f.write(data)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        if self._size is not None:
+            self._size += os.path.getsize(path)
+        self.evict()
+
+    def _entries(self):
+        entries = []
+        for path in glob.glob(os.path.join(self.directory, '*', '*.json')):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _remove_tmp_files(self):
+        # temporary files of writers that crashed
+        for path in glob.glob(os.path.join(self.directory, '*', '*.json.tmp')):
+            try:
+                if os.stat(path).st_mtime < time.time() - self.tmp_max_age:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def evict(self):
+        '''
+        Removes the least recently used entries until the cache is smaller than max_size.
+        '''
+        scan = time.monotonic() - self._scan_time > self.scan_interval
+        if not scan and self._size is not None and self._size <= self.max_size:
+            return
+
+        if scan:
+            self._remove_tmp_files()
+        self._scan_time = time.monotonic()
+        entries = self._entries()
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if self._size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._size -= size
+
+    def parse(self, parser, mainfile, archive, logger=None):
+        '''
+        Fills the archive from the cache or parses the mainfile with the given parser
+        and stores the result. Returns the archive as JSON string.
+        '''
+        options = parser_options(parser)
+        data = self.get(mainfile, options)
+        if data is not None:
+            # unknown sub sections are dropped, the input sections are loaded on demand
+            load_input_sections()
+            archive.m_update_from_dict(json.loads(data))
+            return data
+
+        parser.parse(mainfile, archive, logger)
+        f = io.StringIO()
+        write_archive(archive, f)
+        data = f.getvalue()
+        # partial results depend on the load of the machine
+        if getattr(parser, 'partial_reason', None) is None:
+            self.put(mainfile, parser.aux_files, data, options)
+        return data
@@ -17,19 +17,35 @@
 # limitations under the License.
 #
 import os
+import sys
+import json
 import numpy as np
 import logging
 import re
-import ase
-from ase import io as aseio
+import mmap
+import struct
+import time
+import hashlib
+import contextlib
+import tracemalloc
+import importlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List
+try:
+    import resource
+except ImportError:
+    resource = None
 
-from .metainfo import m_env
+from .metainfo import m_env, resolve_input_definition
 from nomad.units import ureg
 from nomad.parsing.parser import FairdiParser
 from nomad.parsing.file_parser import TextParser, Quantity, FileParser, DataTextParser
 from nomad.datamodel.metainfo.common_dft import Run, Method, System, XCFunctionals,\
     MethodAtomKind, BasisSetCellDependent, BasisSetAtomCentered, MethodBasisSet,\
-    SingleConfigurationCalculation, ScfIteration, SamplingMethod
+    SingleConfigurationCalculation, ScfIteration, SamplingMethod, FrameSequence,\
+    SystemToSystemRefs
 
 from .metainfo.cp2k_general import x_cp2k_section_quickstep_settings, x_cp2k_section_dbcsr,\
     x_cp2k_section_startinformation, x_cp2k_section_end_information, x_cp2k_section_program_information,\
@@ -38,25 +54,126 @@ from .metainfo.cp2k_general import x_cp2k_section_quickstep_settings, x_cp2k_sec
     x_cp2k_section_maximum_angular_momentum, x_cp2k_section_quickstep_calculation,\
     x_cp2k_section_scf_iteration, x_cp2k_section_stress_tensor, x_cp2k_section_md_settings,\
     x_cp2k_section_md_step, x_cp2k_section_restart_information, x_cp2k_section_geometry_optimization,\
-    x_cp2k_section_geometry_optimization_step
+    x_cp2k_section_geometry_optimization_step, x_cp2k_section_md
 
 
-try:
-    import mdtraj
-except ImportError:
-    logging.getLogger(__name__).warn('Required MDTraj module not found.')
-    mdtraj = False
+class LazyImport:
+    '''
+    Imports the module with the given name on first use. Evaluates to False if the
+    module is not available.
+    '''
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            try:
+                self._module = importlib.import_module(self._name)
+            except ImportError:
+                logging.getLogger(__name__).warn('Required %s module not found.' % self._name)
+                self._module = False
+        return self._module
+
+    def __bool__(self):
+        return bool(self._load())
+
+    def __getattr__(self, key):
+        return getattr(self._load(), key)
+
+
+# only needed for trajectory formats without native reader
+aseio = LazyImport('ase.io')
+mdtraj = LazyImport('mdtraj')
 
 
 units_map = {
-    'hbar': ureg.hbar, 'hartree': ureg.hartree, 'angstrom': ureg.angstrom,
+    'hbar': ureg.hbar, 'hartree': ureg.hartree, 'angstrom': ureg.angstrom, 'bohr': ureg.bohr,
     'au_t': ureg.hbar / ureg.hartree}
 
+# units of the quantities in the output, the values are parsed as plain floats and
+# scaled only when written to the archive
+output_units = {
+    'energy_total': 'hartree', 'hartree_energy': 'hartree',
+    'exchange_correlation_energy': 'hartree', 'electronic_kinetic_energy': 'hartree',
+    'total_energy': 'hartree', 'scf_threshold_energy_change': 'hartree',
+    'stress_tensor': 'GPa', 'atom_forces': 'hartree/bohr', 'planewave_cutoff': 'hartree'}
+
+_scale_factors: Dict[tuple, float] = dict()
+
+
+def get_scale_factor(unit, target=None):
+    '''
+    Returns the factor which scales values in unit to target, to SI if target is None.
+    The unit can be a unit name, a pint unit or a number as returned by resolve_unit.
+    '''
+    if unit is None:
+        return 1.
+
+    key = (str(unit), str(target))
+    factor = _scale_factors.get(key)
+    if factor is None:
+        value = ureg(unit) if isinstance(unit, str) else 1 * unit
+        if not isinstance(value, ureg.Quantity):
+            factor = value
+        elif target is None:
+            factor = value.to_base_units().magnitude
+        else:
+            factor = value.to(target).magnitude
+        _scale_factors[key] = factor
+
+    return factor
+
+
+def set_quantity(section, name, value, unit):
+    '''
+    Sets the value given in unit to the quantity with the given name. The value is
+    scaled once to the unit of the quantity definition.
+    '''
+    quantity_def = section.m_def.all_quantities[name]
+    setattr(section, name, value * get_scale_factor(unit, quantity_def.unit))
+
+
+# scale factors from the units in the output to the SI units in the archive
+scale_factors = {
+    unit: get_scale_factor(unit, target) for unit, target in [
+        ('hartree', 'joule'), ('bohr', 'm'), ('bohr**3', 'm**3'), ('bar', 'pascal'),
+        ('hartree/bohr', 'joule/m'), ('GPa', 'pascal'), ('GPa**3', 'pascal**3')]}
+
+# md step quantities in the output which are converted
+md_scale_factors = {
+    'conserved_quantity': scale_factors['hartree'],
+    'potential_energy': scale_factors['hartree'],
+    'kinetic_energy': scale_factors['hartree'],
+    'pressure': scale_factors['bar'],
+    'volume': scale_factors['bohr**3'],
+    'cell_length_instantaneous': scale_factors['bohr'],
+    'cell_length_average': scale_factors['bohr']}
+
+
+_resolved_units: Dict[str, Any] = dict()
+max_resolved_units = 1024
 
-def resolve_unit(unit_str, parts=[]):
+
+def resolve_unit(unit_str):
+    '''
+    Returns the pint unit or the number of a CP2K unit expression like bohr*au_t^-1 or
+    None if it cannot be resolved. The results are cached by the normalized expression,
+    the units are not modified by the callers.
+    '''
     unit_str = unit_str.lower().replace(' ', '')
-    parts = list(parts)
+    if unit_str in _resolved_units:
+        return _resolved_units[unit_str]
+
+    unit = _resolve_unit(unit_str, [])
+    if len(_resolved_units) >= max_resolved_units:
+        _resolved_units.pop(next(iter(_resolved_units)), None)
+    _resolved_units[unit_str] = unit
+    return unit
+
 
+def _resolve_unit(unit_str, parts):
+    # parts are the resolved expressions in parentheses, referenced as [n]
     if unit_str in units_map:
         return units_map[unit_str]
 
@@ -76,22 +193,31 @@ def resolve_unit(unit_str, parts=[]):
         for n in range(n_groups):
             part = unit_str[open_p + 1:]
             part = part[:part.find(')')]
-            parts.append(resolve_unit(part, parts))
+            parts.append(_resolve_unit(part, parts))
             unit_str = unit_str.replace('(%s)' % part, '[%d]' % n)
             open_p = unit_str.rfind('(')
-        return resolve_unit(unit_str, parts)
+        return _resolve_unit(unit_str, parts)
 
     vals = unit_str.split('/')
     if len(vals) > 1:
-        vals = [resolve_unit(v, parts) for v in vals]
+        vals = [_resolve_unit(v, parts) for v in vals]
         val = vals[0]
         for v in vals[1:]:
             val /= v
         return val
 
+    # products bind weaker than powers, ** is not a product
+    vals = re.split(r'(?<!\*)\*(?!\*)', unit_str)
+    if len(vals) > 1:
+        vals = [_resolve_unit(v, parts) for v in vals]
+        unit = 1
+        for v in vals:
+            unit *= v
+        return unit
+
     vals = unit_str.split('**')
     if len(vals) > 1:
-        vals = [resolve_unit(v, parts) for v in vals]
+        vals = [_resolve_unit(v, parts) for v in vals]
         val = vals[0]
         for v in reversed(vals[1:]):
             val = val ** v
@@ -99,40 +225,138 @@ def resolve_unit(unit_str, parts=[]):
 
     vals = unit_str.split('^')
     if len(vals) > 1:
-        vals = [resolve_unit(v, parts) for v in vals]
+        vals = [_resolve_unit(v, parts) for v in vals]
         val = vals[0]
         for v in reversed(vals[1:]):
             val = val ** v
         return val
 
-    vals = unit_str.split('*')
-    if len(vals) > 1:
-        vals = [resolve_unit(v, parts) for v in vals]
-        unit = 1
-        for v in vals:
-            unit *= v
-        return unit
-
     vals = unit_str.split('-1')
     if len(vals) == 2:
-        return 1 / resolve_unit(vals[0], parts)
+        return 1 / _resolve_unit(vals[0], parts)
 
     vals = re.match(r'\[(\d+)\]', unit_str)
     if vals:
         return parts[int(vals.group(1))]
 
 
+def cellpar_to_cell(cellpar):
+    '''
+    Returns the lattice vectors from the cell lengths and angles (in degrees) with the
+    first vector along x and the second in the xy plane, same as ase.geometry.
+    '''
+    a, b, c, alpha, beta, gamma = cellpar
+    cos_alpha = 0. if alpha == 90 else np.cos(np.radians(alpha))
+    cos_beta = 0. if beta == 90 else np.cos(np.radians(beta))
+    if gamma == 90:
+        cos_gamma, sin_gamma = 0., 1.
+    elif gamma == -90:
+        cos_gamma, sin_gamma = 0., -1.
+    else:
+        cos_gamma, sin_gamma = np.cos(np.radians(gamma)), np.sin(np.radians(gamma))
+
+    cy = (cos_alpha - cos_beta * cos_gamma) / sin_gamma
+    cz_sqr = 1. - cos_beta ** 2 - cy ** 2
+    if cz_sqr < 0:
+        raise ValueError('Invalid cell angles.')
+
+    return np.array([
+        [a, 0., 0.], [b * cos_gamma, b * sin_gamma, 0.],
+        [c * cos_beta, c * cy, c * np.sqrt(cz_sqr)]])
+
+
+def read_xyz(filename):
+    '''
+    Reads all frames of an xyz file. Returns the positions and the labels of each frame.
+    '''
+    with open(filename) as f:
+        lines = f.readlines()
+
+    positions, labels = [], []
+    n = 0
+    while n < len(lines):
+        if not lines[n].strip():
+            n += 1
+            continue
+        n_atoms = int(lines[n])
+        fields = [line.split() for line in lines[n + 2:n + 2 + n_atoms]]
+        if len(fields) < n_atoms:
+            raise ValueError('Incomplete xyz frame.')
+        labels.append([field[0] for field in fields])
+        positions.append(np.array([field[1:4] for field in fields], dtype=float))
+        n += n_atoms + 2
+
+    return positions, labels
+
+
+def read_dcd(filename):
+    '''
+    Reads the positions of all frames of a CHARMM dcd file as written by CP2K.
+    '''
+    with open(filename, 'rb') as f:
+        data = f.read()
+
+    for endian in '<>':
+        if struct.unpack('%si' % endian, data[:4])[0] == 84 and data[4:8] == b'CORD':
+            break
+    else:
+        raise ValueError('Invalid dcd file.')
+    int32, float32 = np.dtype('%si4' % endian), np.dtype('%sf4' % endian)
+
+    offset = 0
+
+    def read_record():
+        nonlocal offset
+        size = int(np.frombuffer(data, int32, 1, offset)[0])
+        if offset + size + 8 > len(data):
+            raise ValueError('Incomplete dcd record.')
+        offset += size + 8
+        return data[offset - size - 4:offset - 4]
+
+    header = np.frombuffer(read_record(), int32, 20, 4)
+    if header[8] > 0:
+        raise ValueError('Fixed atoms in dcd file are not supported.')
+    has_cell = header[19] > 0 and header[10] > 0
+    has_4d = header[19] > 0 and header[11] > 0
+    # title
+    read_record()
+    n_atoms = int(np.frombuffer(read_record(), int32, 1)[0])
+
+    positions = []
+    while offset < len(data):
+        if has_cell:
+            read_record()
+        xyz = [np.frombuffer(read_record(), float32, n_atoms) for _ in range(3)]
+        if has_4d:
+            read_record()
+        positions.append(np.array(xyz, dtype=float).T)
+
+    return positions
+
+
 class Property:
+    '''
+    Record of the fields given as keyword arguments, fields that are not set are None.
+    The fields are declared in the __slots__ of the subclasses such that a record needs
+    no dict, there is one record per frame.
+    '''
+    __slots__ = ()
+
     def __init__(self, **kwargs):
-        self._data = kwargs
+        for key, val in kwargs.items():
+            setattr(self, key, val)
 
     def __getattr__(self, key):
-        return self._data.get(key, None)
+        # only called for fields that are not set
+        if key.startswith('__'):
+            raise AttributeError(key)
+        return None
 
 
 class Trajectory(Property):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
+    __slots__ = (
+        'labels', 'positions', 'scaled_positions', 'velocities', 'units', 'atomic_numbers',
+        '_frame')
 
 
 class XYZTrajParser(TextParser):
@@ -170,18 +394,28 @@ class TrajParser(FileParser):
 
             result = None
             labels = []
-            # ase is better as it reads also symbols
+            # native readers for the common formats
             try:
-                atoms_list = [atoms for atoms in aseio.iread(self.mainfile, format=self.format)]
-                result = [atoms.positions for atoms in atoms_list]
-                labels = [list(atoms.symbols) for atoms in atoms_list]
-
-            # custom parser
+                if self.format in ['xyz', 'xmol', 'atomic']:
+                    result, labels = read_xyz(self.mainfile)
+                elif self.format == 'dcd':
+                    result = read_dcd(self.mainfile)
             except Exception:
-                if self.format == 'xyz':
-                    self._xyz_parser.mainfile = self.mainfile
-                    result = [traj.positions for traj in self._xyz_parser.get('trajectory')]
-                    labels = [traj.labels for traj in self._xyz_parser.get('trajectory')]
+                result, labels = None, []
+
+            # ase is better as it reads also symbols
+            if result is None:
+                try:
+                    atoms_list = [atoms for atoms in aseio.iread(self.mainfile, format=self.format)]
+                    result = [atoms.positions for atoms in atoms_list]
+                    labels = [list(atoms.symbols) for atoms in atoms_list]
+
+                # custom parser
+                except Exception:
+                    if self.format == 'xyz':
+                        self._xyz_parser.mainfile = self.mainfile
+                        result = [traj.positions for traj in self._xyz_parser.get('trajectory')]
+                        labels = [traj.labels for traj in self._xyz_parser.get('trajectory')]
 
             if result is None and mdtraj:
                 reader = None
@@ -198,16 +432,16 @@ class TrajParser(FileParser):
                     try:
                         # we do not stream to simplify archive writing
                         result = reader.read()
+                        # dcd reader returns also the cell
+                        result = result[0] if isinstance(result, tuple) else result
                     except Exception:
                         pass
 
-            result = result * self.units if self.units is not None else result
-
-            result = [Trajectory(**{self.type: res}) for res in result]
+            result = [Trajectory(**{self.type: res, 'units': self.units}) for res in result]
 
             # add labels to trajectory
             for n, labels_i in enumerate(labels):
-                result[n]._data.update({'labels': labels_i})
+                result[n].labels = labels_i
 
             self._file_handler = result
 
@@ -222,25 +456,62 @@ class ForceParser(TextParser):
         re_float = r'[\d\.\-\+eE]+'
         self._quantities = [Quantity(
             'atom_forces',
-            rf'\d+\s*\d+\s*\w+\s*({re_float})\s*({re_float})\s*({re_float})', repeats=True)]
+            rf'\n *\d+\s+\d+\s+[A-Za-z]\w*\s+({re_float})\s+({re_float})\s+({re_float})',
+            repeats=True)]
 
 
 class XCFunctional(Property):
+    __slots__ = ('name', 'weight')
+
     def __init__(self, name, **kwargs):
         super().__init__(name=name, **kwargs)
 
 
+class ScfIterations:
+    '''
+    Columnar store of the iterations of a wave function optimization from which both the
+    common and the x_cp2k scf iteration sections are written. Energies are in joule.
+    '''
+    keys = ['energy_total_scf_iteration', 'energy_change_scf_iteration']
+
+    def __init__(self, iterations):
+        data = np.array(iterations, dtype=float).reshape(-1, len(self.keys)) * scale_factors['hartree']
+        self.columns = {key: data[:, n] for n, key in enumerate(self.keys)}
+        self.n_iterations = len(data)
+
+    def add_sections(self, parent, section_def, prefix=''):
+        '''
+        Creates a section_def in parent for each iteration with the quantity names
+        prefixed by prefix.
+        '''
+        names = [(prefix + key, column) for key, column in self.columns.items()]
+        for n in range(self.n_iterations):
+            sec_scf = parent.m_create(section_def)
+            for name, column in names:
+                setattr(sec_scf, name, column[n])
+
+
 class InpValue:
+    __slots__ = ('_data', '_name', '_dict', '_frozen')
+
     def __init__(self, name, **kwargs):
         self._data = kwargs
         self._name = name
         self._dict = None
+        self._frozen = False
 
     @property
     def name(self):
         return self._name
 
+    @property
+    def loaded(self):
+        return True
+
     def add(self, key, val):
+        if self._frozen:
+            raise TypeError('Input section %s is read-only.' % self._name)
+
         if key in self._data:
             self._data[key] = self._data[key] if isinstance(self._data[key], list) else [self._data[key]]
             self._data[key].append(val)
@@ -252,27 +523,107 @@ class InpValue:
             def extract(data):
                 out = dict()
                 for key, val in data.items():
-                    if isinstance(val, InpValue):
+                    if isinstance(val, InpValue) and val.loaded:
                         val = extract(val.to_dict())
                     out[key] = val
-                return out
+                return MappingProxyType(out) if self._frozen else out
 
             self._dict = extract(self._data)
 
         return self._dict
 
+    def freeze(self):
+        '''
+        Makes the section and all its sub sections read-only such that it can be shared
+        by several parsers. Repeated keys are stored as tuples.
+        '''
+        for key, val in self._data.items():
+            if isinstance(val, list):
+                val = tuple(val)
+                self._data[key] = val
+            for val_n in val if isinstance(val, tuple) else [val]:
+                if isinstance(val_n, InpValue):
+                    val_n.freeze()
+        self._dict = None
+        self._frozen = True
+
     def items(self):
         for key, val in self._data.items():
             yield key, val
 
     def __getattr__(self, key):
+        # unset slots must not recurse
+        if key.startswith('_'):
+            raise AttributeError(key)
         return self._data.get(key, None)
 
     def __repr__(self):
         return self._name
 
 
+class LazyInpValue(InpValue):
+    '''
+    Input section of which only the location in the file is known. The contents are
+    read and decoded on first access.
+    '''
+    __slots__ = ('_mainfile', '_span', '_decode')
+
+    def __init__(self, name, mainfile, span, decode):
+        super().__init__(name)
+        self._mainfile = mainfile
+        self._span = span
+        self._decode = decode
+
+    @property
+    def loaded(self):
+        return self._span is None
+
+    def load(self):
+        if self._span is not None:
+            with open(self._mainfile, 'rb') as f:
+                f.seek(self._span[0])
+                lines = f.read(self._span[1] - self._span[0]).decode().split('\n')
+            self._data = self._decode(lines)
+            self._span = None
+            if self._frozen:
+                self._frozen = False
+                self.freeze()
+        return self
+
+    def freeze(self):
+        if self._span is None:
+            super().freeze()
+        else:
+            self._frozen = True
+
+    def get(self, key, default=None):
+        return self.to_dict().get(key, default)
+
+    def to_dict(self):
+        self.load()
+        return super().to_dict()
+
+    def items(self):
+        return self.load()._data.items()
+
+    def __getattr__(self, key):
+        if key.startswith('_'):
+            raise AttributeError(key)
+        return self.load()._data.get(key, None)
+
+
 class InpParser(FileParser):
+    '''
+    Parser for CP2K input files. The parsed trees are read-only and cached by the hash
+    of the file contents such that input files shared by several mainfiles are only
+    tokenized once per process.
+    '''
+    # maximum total size of the contents of the cached inputs
+    max_cache_size = 2 ** 26
+    _trees: Dict[str, Any] = OrderedDict()
+    _cache_size = 0
+    _cache_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
         self._re_open = re.compile(r'&(\w+)\s*(.*)[#!]*')
@@ -281,49 +632,93 @@ class InpParser(FileParser):
         self._re_set_variable = re.compile(r'\@SET\s+(\w+)\s+(.+)')
         self._re_variable = re.compile(r'\$\{\w+\}')
 
+    def parse_tree(self, lines):
+        '''
+        Builds the tree from the input lines. Sections which are already parsed can be
+        given in place of their lines and are added to the current section.
+        '''
+        def override(data):
+            if data[0] == 'PROJECT':
+                return 'PROJECT_NAME', data[1]
+            elif not data[0].isupper():
+                return 'DEFAULT_KEYWORD', ' '.join(data)
+            return data
+
+        sections = [InpValue('tree')]
+        variables = dict()
+        for line in lines:
+            if isinstance(line, InpValue):
+                sections[-1].add(line.name, line)
+                continue
+            # comments
+            strip = line.strip()
+            if not strip or strip[0] in ('#', '!'):
+                continue
+            set_variable = self._re_set_variable.search(line)
+            if set_variable:
+                variables['${%s}' % set_variable.group(1)] = set_variable.group(2)
+                continue
+            close_section = self._re_close.search(line)
+            if close_section:
+                sections.pop(-1)
+                continue
+            open_section = self._re_open.search(line)
+            if open_section:
+                section = InpValue(open_section.group(1))
+                sections[-1].add(open_section.group(1), section)
+                sections.append(section)
+                if open_section.group(2):
+                    sections[-1].add('VALUE', open_section.group(2))
+                continue
+            key_value = self._re_key_value.search(line)
+            if key_value:
+                key_value = list(key_value.groups())
+                key_value[1] = variables.get(key_value[1], key_value[1])
+                key_value = override(key_value)
+                sections[-1].add(key_value[0], key_value[1])
+                continue
+
+        sections[0].freeze()
+        return sections[0]
+
+    @classmethod
+    def _add_to_cache(cls, key, tree, size):
+        with cls._cache_lock:
+            if key not in cls._trees:
+                cls._trees[key] = (tree, size)
+                cls._cache_size += size
+            while cls._cache_size > cls.max_cache_size and len(cls._trees) > 1:
+                cls._cache_size -= cls._trees.popitem(last=False)[1][1]
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._trees.clear()
+            cls._cache_size = 0
+
     @property
     def tree(self):
         if self._file_handler is None:
-            def override(data):
-                if data[0] == 'PROJECT':
-                    return 'PROJECT_NAME', data[1]
-                elif not data[0].isupper():
-                    return 'DEFAULT_KEYWORD', ' '.join(data)
-                return data
-
-            line = True
-            sections = [InpValue('tree')]
-            variables = dict()
-            while line:
-                line = self.mainfile_obj.readline()
-                # comments
-                strip = line.strip()
-                if not strip or strip[0] in ('#', '!'):
-                    continue
-                set_variable = self._re_set_variable.search(line)
-                if set_variable:
-                    variables['${%s}' % set_variable.group(1)] = set_variable.group(2)
-                    continue
-                close_section = self._re_close.search(line)
-                if close_section:
-                    sections.pop(-1)
-                    continue
-                open_section = self._re_open.search(line)
-                if open_section:
-                    section = InpValue(open_section.group(1))
-                    sections[-1].add(open_section.group(1), section)
-                    sections.append(section)
-                    if open_section.group(2):
-                        sections[-1].add('VALUE', open_section.group(2))
-                    continue
-                key_value = self._re_key_value.search(line)
-                if key_value:
-                    key_value = list(key_value.groups())
-                    key_value[1] = variables.get(key_value[1], key_value[1])
-                    key_value = override(key_value)
-                    sections[-1].add(key_value[0], key_value[1])
-                    continue
-            self._file_handler = sections[0]
+            # the file object of a previous mainfile is kept if mainfile is set to None
+            if self.mainfile is None or self.mainfile_obj is None:
+                return
+
+            contents = self.mainfile_obj.read()
+            contents = contents.decode() if isinstance(contents, bytes) else contents
+            key = hashlib.sha1(contents.encode()).hexdigest()
+
+            with self._cache_lock:
+                cached = self._trees.get(key)
+                if cached is not None:
+                    self._trees.move_to_end(key)
+
+            if cached is None:
+                tree = self.parse_tree(contents.split('\n'))
+                self._add_to_cache(key, tree, len(contents))
+            else:
+                tree = cached[0]
+
+            self._file_handler = tree
         return self._file_handler
 
     def parse(self, key):
@@ -339,11 +734,413 @@ class InpParser(FileParser):
         self._results[key] = val
 
 
-class CP2KOutParser(TextParser):
+class RestartParser(InpParser):
+    '''
+    Parser for CP2K restart files. Only the section headers are indexed, the contents of
+    the heavy blocks (coordinates, velocities, thermostat states) are decoded when they
+    are first accessed.
+    '''
+    heavy_sections = [
+        'COORD', 'VELOCITY', 'MASS', 'FORCE', 'CORE_COORD', 'CORE_VELOCITY',
+        'SHELL_COORD', 'SHELL_VELOCITY', 'RNG_INIT']
+
+    def __init__(self):
+        super().__init__()
+        self._re_heavy_open = re.compile(rb'\s*&(%s)\s*$' % '|'.join(self.heavy_sections).encode())
+        self._re_keyword = re.compile(r'\s*(UNIT|SCALED)\s+(.+)')
+
+    def decode_block(self, lines):
+        # a block consists of data lines and possibly some unit keywords
+        data: Dict[str, Any] = dict()
+        default = []
+        for line in lines:
+            strip = line.strip()
+            if not strip or strip[0] in ('#', '!'):
+                continue
+            keyword = self._re_keyword.match(line)
+            if keyword:
+                data[keyword.group(1)] = keyword.group(2).strip()
+            else:
+                default.append(strip)
+        if default:
+            data['DEFAULT_KEYWORD'] = default
+        return data
+
+    def iter_lines(self, mainfile):
+        with open(mainfile, 'rb') as f:
+            try:
+                contents = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # empty file
+                return
+
+        for line in iter(contents.readline, b''):
+            heavy_open = self._re_heavy_open.match(line)
+            if heavy_open is None:
+                yield line.decode()
+                continue
+            # skip to the end of the block without reading it
+            start = contents.tell()
+            end = contents.find(b'&END', start)
+            end = contents.size() if end < 0 else end
+            contents.seek(end)
+            contents.readline()
+            yield LazyInpValue(
+                heavy_open.group(1).decode(), mainfile, (start, end), self.decode_block)
+
+    @property
+    def tree(self):
+        if self._file_handler is None:
+            if self.mainfile is None:
+                return
+
+            self._file_handler = self.parse_tree(self.iter_lines(self.mainfile))
+        return self._file_handler
+
+
+class InputPlan:
+    '''
+    Precompiled mapping of the paths in an input tree to the metainfo definitions of
+    x_cp2k_section_input. A plan is compiled once for each shape of input tree and
+    shared by all trees of the same shape, such that filling the input section only
+    requires a loop over the precomputed steps.
+    '''
+    max_plans = 256
+    _plans: Dict[tuple, 'InputPlan'] = dict()
+    _definitions: Dict[str, Any] = dict()
+
+    def __init__(self, shape):
+        # each step is (is section, parent index, section class or quantity definition,
+        # sub section definition or type), the target is None if it cannot be resolved
+        self.steps: List[tuple] = []
+        names: List[str] = []
+        for parent, key, is_section in shape:
+            name = key if parent < 0 else '%s_%s' % (names[parent], key)
+            names.append(name)
+            if parent >= 0 and self.steps[parent][2] is None:
+                # skip contents of unresolved section
+                self.steps.append((is_section, parent, None, None))
+            elif is_section:
+                sec_def = self.resolve_definition(name)
+                if sec_def is None:
+                    self.steps.append((True, parent, None, None))
+                    continue
+                sub_section_def = None
+                if parent >= 0:
+                    sub_section_def = self.steps[parent][2].m_def.all_sub_sections_by_section.get(
+                        sec_def, [None])[0]
+                self.steps.append((True, parent, sec_def.section_cls, sub_section_def))
+            else:
+                name = self.override_keyword(name.replace('_section', ''))
+                quantity_def = self.resolve_definition(name)
+                if quantity_def is None:
+                    self.steps.append((False, parent, None, None))
+                else:
+                    self.steps.append((False, parent, quantity_def, quantity_def.type))
+
+    @classmethod
+    def resolve_definition(cls, name):
+        if name not in cls._definitions:
+            # definitions are loaded on demand
+            cls._definitions[name] = resolve_input_definition(name)
+        return cls._definitions[name]
+
+    @staticmethod
+    def override_keyword(name):
+        # override keys to be compatible with metainfo name
+        # TODO change metainfo name
+        if name.endswith('_VALUE'):
+            return name.replace('VALUE', 'SECTION_PARAMETERS')
+        elif name.endswith('KIND_RI_AUX_BASIS'):
+            return name.replace('BASIS', 'BASIS_SET')
+        return name
+
+    @staticmethod
+    def flatten(name, tree):
+        '''
+        Returns the shape of the tree as (parent index, key, is section) and the keyword
+        values, both in depth-first order. The tree can also be given as nested dicts.
+        '''
+        shape: List[tuple] = [(-1, name, True)]
+        values: List[Any] = []
+
+        def flatten_section(data, parent):
+            for key, val in data.items():
+                for val_n in val if isinstance(val, (tuple, list)) else [val]:
+                    if isinstance(val_n, (InpValue, dict)):
+                        shape.append((parent, key, True))
+                        flatten_section(val_n, len(shape) - 1)
+                    else:
+                        shape.append((parent, key, False))
+                        values.append(val_n)
+
+        flatten_section(tree, 0)
+        return tuple(shape), values
+
+    @classmethod
+    def get(cls, shape):
+        plan = cls._plans.get(shape)
+        if plan is None:
+            if len(cls._plans) >= cls.max_plans:
+                cls._plans.pop(next(iter(cls._plans)))
+            plan = cls(shape)
+            cls._plans[shape] = plan
+        return plan
+
+    def apply(self, values, section):
+        '''
+        Creates the sections under section and sets the keyword values.
+        '''
+        sections: List[Any] = [None] * len(self.steps)
+        values = iter(values)
+        for n, (is_section, parent, target, extra) in enumerate(self.steps):
+            if is_section:
+                if target is None:
+                    continue
+                if extra is None:
+                    sections[n] = (section if parent < 0 else sections[parent]).m_create(target)
+                else:
+                    sections[n] = target()
+                    sections[parent].m_add_sub_section(extra, sections[n])
+                continue
+
+            value = next(values)
+            if target is not None:
+                target.__set__(sections[parent], extra(value))
+
+
+class ScanProfile:
+    '''
+    Statistics of the regex scans of a :class:`ProfiledTextParser` and its sub parsers.
+    The wall time, the number of regex evaluations, the number of bytes the patterns
+    were applied to and the number of matches are accumulated by the path of the
+    quantity, e.g. quickstep.single_point. The time of a quantity with a sub parser
+    includes the time of the sub parser. The quantities without sub parser are matched
+    together in a single findall of their parser, which is recorded as <path>.*.
+    '''
+    fields = ['time', 'evaluations', 'bytes_scanned', 'matches']
+
+    def __init__(self, file_size=0):
+        self.file_size = file_size
+        self.stats: Dict[str, List[Any]] = dict()
+
+    def add(self, key, time, evaluations, bytes_scanned, matches):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = [0., 0, 0, 0]
+        stats[0] += time
+        stats[1] += evaluations
+        stats[2] += bytes_scanned
+        stats[3] += matches
+
+    def report(self):
+        '''
+        Returns the statistics as list of dicts sorted by time. The amplification is the
+        number of scanned bytes relative to the file size, a large value hints at a
+        pattern that is applied to the whole file many times.
+        '''
+        report = []
+        for key, stats in sorted(self.stats.items(), key=lambda item: -item[1][0]):
+            entry = dict(key=key, **dict(zip(self.fields, stats)))
+            entry['amplification'] = stats[2] / self.file_size if self.file_size else None
+            report.append(entry)
+        return report
+
+    @property
+    def amplification(self):
+        '''
+        The number of bytes scanned by all quantities relative to the file size.
+        '''
+        if not self.file_size:
+            return None
+        return sum(stats[2] for stats in self.stats.values()) / self.file_size
+
+    def format(self, n_entries=None):
+        lines = ['%-60s %10s %8s %14s %8s %8s' % (
+            'quantity', 'time [s]', 'evals', 'bytes', 'matches', 'ampl.')]
+        for entry in self.report()[:n_entries]:
+            amplification = entry['amplification']
+            lines.append('%-60s %10.4f %8d %14d %8d %8s' % (
+                entry['key'], entry['time'], entry['evaluations'], entry['bytes_scanned'],
+                entry['matches'], 'n/a' if amplification is None else '%.2f' % amplification))
+        return '\n'.join(lines)
+
+
+class MemoryProfile:
+    '''
+    Memory of the phases of a parse measured with tracemalloc, which is started with the
+    outermost phase if it is not already running. For each phase name, the number of
+    calls, the peak and the retained memory in bytes relative to the start of the phase
+    and the growth of the maximum resident set size are accumulated. The peak is the
+    maximum over all calls and includes nested phases, retained and rss are summed up.
+    Memory that is not allocated by python, e.g. mapped files, is only seen in rss.
+    Before python 3.9, the peak cannot be reset and the peak of a phase is the maximum
+    since the start of tracing, which overestimates phases that follow a larger one.
+    '''
+    fields = ['calls', 'peak', 'retained', 'rss']
+
+    def __init__(self):
+        self.stats: Dict[str, List[Any]] = dict()
+        self._stack: List[List[Any]] = []
+        self._tracing = False
+
+    def add(self, key, peak, retained, rss):
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = [0, 0, 0, 0]
+        stats[0] += 1
+        stats[1] = max(stats[1], peak)
+        stats[2] += retained
+        stats[3] += rss
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        if not self._stack and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._tracing = True
+        # list the phases in the order in which they are entered
+        self.stats.setdefault(name, [0, 0, 0, 0])
+
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            self._stack[-1][1] = max(self._stack[-1][1], peak)
+        # python >= 3.9
+        if hasattr(tracemalloc, 'reset_peak'):
+            tracemalloc.reset_peak()
+        # start, peak of the nested phases
+        entry = [current, current, max_rss()]
+        self._stack.append(entry)
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            self._stack.pop()
+            peak = max(peak, entry[1])
+            if self._stack:
+                self._stack[-1][1] = max(self._stack[-1][1], peak)
+            self.add(name, peak - entry[0], current - entry[0], max_rss() - entry[2])
+            if not self._stack and self._tracing:
+                tracemalloc.stop()
+                self._tracing = False
+
+    def report(self):
+        '''
+        Returns the statistics as list of dicts in the order in which the phases were
+        first entered.
+        '''
+        return [dict(phase=key, **dict(zip(self.fields, stats))) for key, stats in self.stats.items()]
+
+    def format(self):
+        lines = ['%-40s %8s %14s %14s %14s' % ('phase', 'calls', 'peak', 'retained', 'rss')]
+        for entry in self.report():
+            lines.append('%-40s %8d %14d %14d %14d' % (
+                entry['phase'], entry['calls'], entry['peak'], entry['retained'], entry['rss']))
+        return '\n'.join(lines)
+
+
+def max_rss():
+    '''
+    Returns the maximum resident set size of the process in bytes or 0 if it is not
+    available.
+    '''
+    if resource is None:
+        return 0
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macos, kilobytes elsewhere
+    return rss if sys.platform == 'darwin' else rss * 1024
+
+
+def current_rss():
+    '''
+    Returns the resident set size of the process in bytes, the maximum if the current
+    size is not available.
+    '''
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * mmap.PAGESIZE
+    except (OSError, ValueError, IndexError):
+        return max_rss()
+
+
+_no_phase = contextlib.nullcontext()
+
+
+# the profile and path of the sub parser that is currently matched, the sub parsers
+# themselves can be shared between threads and only serve as templates for the copies
+_sub_parser_context = threading.local()
+
+
+class ProfiledTextParser(TextParser):
+    '''
+    TextParser that records its scans and those of its sub parsers in profile, a
+    :class:`ScanProfile`, if it is set. The sub parsers need to be ProfiledTextParsers
+    as well.
+    '''
+    def __init__(self, mainfile=None, quantities=None, logger=None, **kwargs):
+        self.profile = None
+        self.path = ''
+        super().__init__(mainfile, quantities, logger, **kwargs)
+
+    def copy(self):
+        parser = ProfiledTextParser(self.mainfile, self.quantities, self.logger, **self._kwargs)
+        parser.profile = getattr(_sub_parser_context, 'profile', None)
+        parser.path = getattr(_sub_parser_context, 'path', '')
+        return parser
+
+    def _n_matches(self, quantity):
+        value = self._results.get(quantity.name)
+        if value is None:
+            return 0
+        return len(value) if quantity.repeats else 1
+
+    def _parse_quantities(self, quantities):
+        if self.profile is None:
+            return super()._parse_quantities(quantities)
+
+        t0 = time.perf_counter()
+        super()._parse_quantities(quantities)
+        self.profile.add(
+            '%s.*' % self.path if self.path else '*', time.perf_counter() - t0, 1,
+            len(self.file_mmap), sum(self._n_matches(quantity) for quantity in quantities))
+
+    def _parse_quantity(self, quantity):
+        if self.profile is None:
+            return super()._parse_quantity(quantity)
+
+        path = '%s.%s' % (self.path, quantity.name) if self.path else quantity.name
+        # the sub parser is copied for each match and passes on the profile
+        previous = (
+            getattr(_sub_parser_context, 'profile', None), getattr(_sub_parser_context, 'path', ''))
+        _sub_parser_context.profile, _sub_parser_context.path = self.profile, path
+        t0 = time.perf_counter()
+        try:
+            super()._parse_quantity(quantity)
+        finally:
+            _sub_parser_context.profile, _sub_parser_context.path = previous
+        self.profile.add(
+            path, time.perf_counter() - t0, 1, len(self.file_mmap), self._n_matches(quantity))
+
+
+class CP2KOutParser(ProfiledTextParser):
+    '''
+    Parser for the CP2K output. The quantities and their sub parsers are built and
+    compiled once and shared read-only by all instances, the results of a parse are
+    kept by the instance and the copies of the sub parsers.
+    '''
+    _shared_quantities: List[Quantity] = None
+    _quantities_lock = threading.Lock()
+
     def __init__(self):
         super().__init__()
 
     def init_quantities(self):
+        with CP2KOutParser._quantities_lock:
+            if CP2KOutParser._shared_quantities is None:
+                self.build_quantities()
+                CP2KOutParser._shared_quantities = self._quantities
+        self._quantities = CP2KOutParser._shared_quantities
+
+    def build_quantities(self):
         def str_to_header(val_in):
             val = val_in.split('  ', 1)
             return [val[0].strip().replace(' ', '_').lower(), val[-1].strip()]
@@ -357,20 +1154,21 @@ class CP2KOutParser(TextParser):
             lengthunit = val[0][0].lower()
             val = np.transpose(np.array([v for v in val if len(v) == 9]))
             labels = val[2]
-            positions = np.transpose(np.array(val[4:7], dtype=float)) * resolve_unit(lengthunit)
+            positions = np.transpose(np.array(val[4:7], dtype=float))
             atomic_numbers = {element: int(val[3][n]) for n, element in enumerate(val[2])}
-            return Trajectory(labels=labels, positions=positions, atomic_numbers=atomic_numbers)
+            return Trajectory(
+                labels=labels, positions=positions, units=resolve_unit(lengthunit),
+                atomic_numbers=atomic_numbers)
 
         def str_to_stress_eigenvalues(val_in):
             val = [v.split() for v in val_in.strip().split('\n')]
             val = np.array([v for v in val if v], dtype=float)
-            return val[0] * ureg.GPa, val[1:]
+            # eigenvalues in GPa
+            return val[0], val[1:]
 
         def str_to_iteration(val_in):
             val = val_in.strip().split()
-            return {
-                'energy_total_scf_iteration': float(val[-2]) * ureg.hartree,
-                'energy_change_scf_iteration': float(val[-1]) * ureg.hartree}
+            return [float(val[-2]), float(val[-1])]
 
         def str_to_information(val_in):
             val = [v.split('=') for v in val_in.strip().split('\n')]
@@ -386,7 +1184,7 @@ class CP2KOutParser(TextParser):
 
         energy_quantities = [Quantity(
             '%s' % key.lower().replace(' ', '_').replace('-', '_'),
-            rf'%s:\s*({re_float})' % key, dtype=float, unit='hartree', repeats=True) for key in [
+            rf'%s:\s*({re_float})' % key, dtype=float, repeats=True) for key in [
                 'Hartree energy', 'Exchange-correlation energy', 'Electronic kinetic energy',
                 'Total energy']]
         # what is the difference between Total energy and ENERGY| Total
@@ -408,7 +1206,7 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'energy_total',
                 rf'ENERGY\| Total FORCE_EVAL \( \w+ \) energy \(a\.u\.\):\s*({re_float})',
-                dtype=float, unit='hartree'),
+                dtype=float),
             Quantity(
                 'atom_forces',
                 rf'ATOMIC FORCES in \[a\.u\.\]\s*.+([\s\S]+?)SUM', convert=False,
@@ -419,13 +1217,13 @@ class CP2KOutParser(TextParser):
                 'stress_tensor',
                 r' (?:NUMERICAL )?STRESS TENSOR \[GPa\]\s+X\s+Y\s+Z\s+([\d\.\-\s]+)',
                 str_operation=lambda x:np.array([v.split() for v in x.strip().split('\n')], dtype=float),
-                convert=False, unit='GPa'),
+                convert=False),
             Quantity(
                 'stress_tensor_one_third_of_trace',
-                rf'  1/3 Trace\(stress tensor\)\s*:\s*({re_float})', dtype=float, unit='GPa'),
+                rf'  1/3 Trace\(stress tensor\)\s*:\s*({re_float})', dtype=float),
             Quantity(
                 'stress_tensor_determinant',
-                rf'Det\(stress tensor\)\s*:\s*({re_float})', dtype=float, unit='GPa**3'),
+                rf'Det\(stress tensor\)\s*:\s*({re_float})', dtype=float),
             Quantity(
                 'stress_eigenvalues_eigenvectors',
                 r' EIGENVECTORS AND EIGENVALUES OF THE STRESS TENSOR\s*([\d\.\-\s]+)',
@@ -435,7 +1233,7 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'self_consistent',
                 r'SCF WAVEFUNCTION OPTIMIZATION([\s\S]+?)\Z', repeats=False,
-                sub_parser=TextParser(quantities=scf_wavefunction_optimization_quantities)),
+                sub_parser=ProfiledTextParser(quantities=scf_wavefunction_optimization_quantities)),
             # TODO add rpa, etc.
         ]
 
@@ -446,11 +1244,11 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'self_consistent',
                 r'SCF WAVEFUNCTION OPTIMIZATION([\s\S]+?)OPTIMIZ', repeats=False,
-                sub_parser=TextParser(quantities=scf_wavefunction_optimization_quantities)),
+                sub_parser=ProfiledTextParser(quantities=scf_wavefunction_optimization_quantities)),
             Quantity(
                 'optimization_step',
                 r'(ATION STEP:\s*\d+[\s\S]+?)(?:\-\s+OPTIMIZ|\Z)', repeats=True,
-                sub_parser=TextParser(quantities=[
+                sub_parser=ProfiledTextParser(quantities=[
                     # TODO parse atomic positions
                     Quantity('step', r'ATION STEP:\s*(\d+)'),
                     # I do not quite get why there can be multiple scfs in a step
@@ -461,7 +1259,7 @@ class CP2KOutParser(TextParser):
                     Quantity(
                         'self_consistent',
                         r'FUNCTION OPTIMIZATION([\s\S]+?)(?: SCF WAVE|\Z)', repeats=True,
-                        sub_parser=TextParser(quantities=scf_wavefunction_optimization_quantities))]))
+                        sub_parser=ProfiledTextParser(quantities=scf_wavefunction_optimization_quantities))]))
         ]
 
         molecular_dynamics_quantities = [
@@ -471,11 +1269,11 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'self_consistent',
                 r'SCF WAVEFUNCTION OPTIMIZATION([\s\S]+?)(?:\*\n *ENSEM|\Z)', repeats=False,
-                sub_parser=TextParser(quantities=scf_wavefunction_optimization_quantities)),
+                sub_parser=ProfiledTextParser(quantities=scf_wavefunction_optimization_quantities)),
             Quantity(
                 'md_step',
                 r'(BLE TYPE[\s\S]+?)(?:\*\n *ENSEM|\Z)',
-                repeats=True, sub_parser=TextParser(quantities=[
+                repeats=True, sub_parser=ProfiledTextParser(quantities=[
                     Quantity(
                         'ensemble_type', r'BLE TYPE\s*=\s*(.+)'),
                     Quantity(
@@ -485,7 +1283,7 @@ class CP2KOutParser(TextParser):
                     Quantity(
                         'conserved_quantity',
                         rf'CONSERVED QUANTITY \[hartree\]\s*=\s*({re_float})',
-                        dtype=float, unit='hartree'),
+                        dtype=float),
                     Quantity(
                         'cpu_time',
                         rf'CPU TIME \[s\]\s*=\s*({re_float})\s*(re_float)',
@@ -497,33 +1295,33 @@ class CP2KOutParser(TextParser):
                     Quantity(
                         'potential_energy',
                         rf'POTENTIAL ENERGY\[hartree\]\s*=\s*({re_float})\s*({re_float})',
-                        dtype=float, unit='hartree'),
+                        dtype=float),
                     Quantity(
                         'kinetic_energy',
                         rf'KINETIC ENERGY\[hartree\]\s*=\s*({re_float})\s*({re_float})',
-                        dtype=float, unit='hartree'),
+                        dtype=float),
                     Quantity(
                         'temperature',
                         rf'TEMPERATURE \[K\]\s*=\s*({re_float})\s*({re_float})', dtype=float),
                     Quantity(
                         'pressure',
                         rf'PRESSURE \[bar\]\s*=\s*({re_float})\s*({re_float})',
-                        dtype=float, unit='bar'),
+                        dtype=float),
                     Quantity(
                         'barostat_temperature',
                         rf'BAROSTAT TEMP\[K\]\s*=\s*({re_float})\s*({re_float})', dtype=float),
                     Quantity(
                         'volume',
                         rf'VOLUME\[bohr\^3\]\s*=\s*({re_float})\s*({re_float})',
-                        dtype=float, unit='bohr**3'),
+                        dtype=float),
                     Quantity(
                         'cell_length_instantaneous',
                         rf'CELL LNTHS\[bohr\]\s*=\s*({re_float})\s*({re_float})\s*({re_float})',
-                        dtype=float, unit='bohr'),
+                        dtype=float),
                     Quantity(
                         'cell_length_average',
                         rf'AVE\. CELL LNTHS\[bohr\]\s*=\s*({re_float})\s*({re_float})\s*({re_float})',
-                        dtype=float, unit='bohr'),
+                        dtype=float),
                     Quantity(
                         'cell_angle_instantaneous',
                         rf'CELL ANGLS\[deg\]\s*=\s*({re_float})\s*({re_float})\s*({re_float})',
@@ -535,7 +1333,7 @@ class CP2KOutParser(TextParser):
                     Quantity(
                         'self_consistent',
                         r'FUNCTION OPTIMIZATION([\s\S]+?)(?: SCF WAVE|\Z)', repeats=True,
-                        sub_parser=TextParser(quantities=scf_wavefunction_optimization_quantities))])
+                        sub_parser=ProfiledTextParser(quantities=scf_wavefunction_optimization_quantities))])
             )
         ]
 
@@ -559,10 +1357,10 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'atomic_kind_information',
                 r' ATOMIC KIND INFORMATION([\s\S]+?)\n\n\n',
-                sub_parser=TextParser(quantities=[Quantity(
+                sub_parser=ProfiledTextParser(quantities=[Quantity(
                     'atom',
                     r'(ic kind: [A-Z][a-z]?[\s\S]+?)(?:\d+\. Atom|\Z)', repeats=True,
-                    sub_parser=TextParser(quantities=[
+                    sub_parser=ProfiledTextParser(quantities=[
                         Quantity('kind_label', r'ic kind:\s*(\w+)'),
                         Quantity('kind_number_of_atoms', r'Number of atoms:\s*(\d+)', dtype=int),
                         Quantity('kind_basis_set_name', r'Orbital Basis Set\s*(.+)'),
@@ -571,7 +1369,7 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'total_maximum_numbers',
                 r' TOTAL NUMBERS AND MAXIMUM NUMBERS([\s\S]+?)\n\n\n',
-                sub_parser=TextParser(quantities=[Quantity(
+                sub_parser=ProfiledTextParser(quantities=[Quantity(
                     '%s' % key.lower().replace('the ', '').replace(' ', '_').replace('-', '_'),
                     r'\- %s:\s*(\d+)' % key, dtype=int) for key in [
                         'Atomic kinds', 'Atoms', 'Shell sets', 'Shells', 'Primitive Cartesian functions',
@@ -585,11 +1383,11 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'scf_parameters',
                 r' SCF PARAMETERS([\s\S]+?)\*{79}',
-                sub_parser=TextParser(quantities=[
+                sub_parser=ProfiledTextParser(quantities=[
                     Quantity('scf_max_iteration', r'max_scf:\s*(\d+)', dtype=int),
                     Quantity(
                         'scf_threshold_energy_change', rf'eps_scf:\s*({re_float})',
-                        dtype=float, unit='hartree'),
+                        dtype=float),
                     Quantity(
                         'md',
                         r' MD\| (.+? {2}) +(.+)', str_operation=str_to_header, repeats=True
@@ -598,15 +1396,15 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'single_point',
                 r'( Iteration\s*Convergence\s*Energy[\s\S]+?(?:\-{50}\n\s*\-|MD_ENERGIES))',
-                sub_parser=TextParser(quantities=single_point_quantities)),
+                sub_parser=ProfiledTextParser(quantities=single_point_quantities)),
             Quantity(
                 'geometry_optimization',
                 r'STARTING GEOMETRY OPTIMIZATION([\s\S]+?(?:GEOMETRY OPTIMIZATION COMPLETED|\Z))',
-                sub_parser=TextParser(quantities=geometry_optimization_quantities)),
+                sub_parser=ProfiledTextParser(quantities=geometry_optimization_quantities)),
             Quantity(
                 'molecular_dynamics',
                 r'(MD_ENERGIES\| Initialization proceeding[\s\S]+?\-{50}\n\s*\-)',
-                sub_parser=TextParser(quantities=molecular_dynamics_quantities))
+                sub_parser=ProfiledTextParser(quantities=molecular_dynamics_quantities))
         ]
 
         self._quantities = [
@@ -626,7 +1424,7 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'restart',
                 r'RESTART INFORMATION\s*\*+\s*\*+([\s\S]+?)\*{79}',
-                sub_parser=TextParser(quantities=[
+                sub_parser=ProfiledTextParser(quantities=[
                     Quantity('filename', r'RESTART FILE NAME: (\S+)'),
                     Quantity(
                         'quantities',
@@ -640,7 +1438,7 @@ class CP2KOutParser(TextParser):
             Quantity(
                 'quickstep',
                 r'\.\.\. make the atoms dance([\s\S]+?(?:\-{79}\s*\-|\Z))',
-                sub_parser=TextParser(quantities=quickstep_quantities)),
+                sub_parser=ProfiledTextParser(quantities=quickstep_quantities)),
             Quantity(
                 'qs_dftb',
                 r'  #####   #####        # ######  ####### ####### ######\s*'
@@ -651,13 +1449,65 @@ class CP2KOutParser(TextParser):
                 r' #    #  #     #  #      #     # #          #    #     #\s*'
                 r'  #### #  #####  #       ######  #          #    ######\s*'
                 r'([\s\S]+?(?:\-{79}\s*\-|\Z))',
-                sub_parser=TextParser(quantities=quickstep_quantities))
+                sub_parser=ProfiledTextParser(quantities=quickstep_quantities))
             # TODO add other calculation types
         ]
 
 
+def dump_input_tree(tree):
+    '''
+    Serializes the input tree into normalized JSON with sorted keys. Sections are objects,
+    repeated keys are lists and keyword values are strings.
+    '''
+    def to_json(val):
+        if isinstance(val, InpValue):
+            return {key: to_json(val_n) for key, val_n in val.items()}
+        elif isinstance(val, (tuple, list)):
+            return [to_json(val_n) for val_n in val]
+        return val
+
+    return json.dumps(to_json(tree), sort_keys=True, separators=(',', ':'))
+
+
+def get_input_sections(sec_run):
+    '''
+    Returns the x_cp2k_section_input of the run. For archives parsed in the compact
+    input mode, the sections are created from x_cp2k_input_tree on first access.
+    '''
+    if not sec_run.x_cp2k_section_input and sec_run.x_cp2k_input_tree is not None:
+        shape, values = InputPlan.flatten(
+            'x_cp2k_section_input', json.loads(sec_run.x_cp2k_input_tree))
+        InputPlan.get(shape).apply(values, sec_run)
+
+    return sec_run.x_cp2k_section_input
+
+
 class CP2KParser(FairdiParser):
-    def __init__(self):
+    '''
+    Parser for CP2K. With compact_input, the input is stored as a single JSON quantity
+    x_cp2k_input_tree instead of the x_cp2k_section_input sections, see
+    :func:`get_input_sections`. Without legacy_scf_iterations, the scf iterations are
+    only written to section_scf_iteration and not to x_cp2k_section_scf_iteration.
+    With md_frames, the MD step quantities of all frames are written as arrays to
+    x_cp2k_section_md, md_step_sections controls the per frame x_cp2k_section_md_step.
+    With dedup_systems, the atom labels, lattice vectors and periodic dimensions are only
+    written to a system if they differ from the previous system, otherwise the system
+    references the last system that carries them. With profile, the scans of the output
+    are recorded in scan_profile, a :class:`ScanProfile`, and logged after the parse.
+    With profile_memory, the memory of the parse phases and aux file readers is recorded
+    in memory_profile, a :class:`MemoryProfile`.
+    The time_budget in seconds and the memory_budget in bytes limit the parse. The memory
+    is the growth of the resident memory since the start of the parse, such that a
+    reused parser is not limited by the memory of its previous parses. If one is exceeded, the remaining frames, SCF iterations and aux files are
+    skipped and the reason is stored in x_cp2k_partial_reason of the run.
+    '''
+    # minimum time in seconds between two checks of the budgets
+    budget_interval = 0.01
+
+    def __init__(
+            self, compact_input=False, legacy_scf_iterations=True, md_frames=False,
+            md_step_sections=True, dedup_systems=False, profile=False, profile_memory=False,
+            time_budget=None, memory_budget=None):
         super().__init__(
             name='parsers/cp2k', code_name='CP2K', code_homepage='https://www.cp2k.org/',
             mainfile_contents_re=(
@@ -668,8 +1518,23 @@ class CP2KParser(FairdiParser):
                 r'  \*\*\*\* \*\*  \*\*\*\*\*\*\*  \*\*  PROGRAM STARTED IN .*\n')
         )
         self._metainfo_env = m_env
+        self.compact_input = compact_input
+        self.legacy_scf_iterations = legacy_scf_iterations
+        self.md_frames = md_frames
+        self.md_step_sections = md_step_sections
+        self.dedup_systems = dedup_systems
+        self.profile = profile
+        self.scan_profile = None
+        self.profile_memory = profile_memory
+        self.memory_profile = None
+        self.time_budget = time_budget
+        self.memory_budget = memory_budget
+        self.partial_reason = None
+        self._start_time = None
+        self._next_budget_check = 0.
         self.out_parser = CP2KOutParser()
         self.inp_parser = InpParser()
+        self.restart_parser = RestartParser()
         # use a custom xyz parser as the output of cp2k is sometimes not up to standard
         self.traj_parser = TrajParser(type='positions')
         self.velocities_parser = TrajParser(type='velocities')
@@ -678,6 +1543,11 @@ class CP2KParser(FairdiParser):
         self.force_parser = ForceParser()
         self._method = None
         self._calculation_type = None
+        self._md_energies = None
+        self._periodic_dimensions = None
+        self._system_invariants = dict()
+        self._invariant_system = None
+        self._aux_files = set()
 
         # TODO add vdw parameter
         self._metainfo_name_map = {
@@ -723,16 +1593,17 @@ class CP2KParser(FairdiParser):
             'CONJUGATE GRADIENTS': 'conjugate gradient', 'BFGS': 'bfgs', 'L-BFGS': 'bfgs'}
         self._file_extension_map = {
             'XYZ': 'xyz', 'XMOL': 'xyz', 'ATOMIC': 'xyz', 'PDB': 'pdb', 'DCD': 'dcd'}
-        self._xc_functional_map = {
-            'BLYP': [XCFunctional('GGA_X_B88'), XCFunctional('GGA_C_LYP')],
-            'LDA': [XCFunctional('LDA_XC_TETER93')],
-            'PADE': [XCFunctional('LDA_XC_TETER93')],
-            'PBE': [XCFunctional('GGA_X_PBE'), XCFunctional('GGA_C_PBE')],
-            'OLYP': [XCFunctional('GGA_X_OPTX'), XCFunctional('GGA_C_LYP')],
-            'HCTH120': [XCFunctional('GGA_XC_HCTH_120')],
-            'PBE0': [XCFunctional('HYB_GGA_XC_PBEH')],
-            'B3LYP': [XCFunctional('HYB_GGA_XC_B3LYP')],
-            'TPSS': [XCFunctional('MGGA_X_TPSS'), XCFunctional('MGGA_C_TPSS')]}
+        # the functionals are created for each parse as their weights are set
+        self._xc_functional_names = {
+            'BLYP': ['GGA_X_B88', 'GGA_C_LYP'],
+            'LDA': ['LDA_XC_TETER93'],
+            'PADE': ['LDA_XC_TETER93'],
+            'PBE': ['GGA_X_PBE', 'GGA_C_PBE'],
+            'OLYP': ['GGA_X_OPTX', 'GGA_C_LYP'],
+            'HCTH120': ['GGA_XC_HCTH_120'],
+            'PBE0': ['HYB_GGA_XC_PBEH'],
+            'B3LYP': ['HYB_GGA_XC_B3LYP'],
+            'TPSS': ['MGGA_X_TPSS', 'MGGA_C_TPSS']}
         self._ensemble_map = {'NVE': 'NVE', 'NVT': 'NVT', 'NPT_F': 'NPT', 'NPT_I': 'NPT'}
         self._vdw_map = {
             "S. Grimme, JCC 27: 1787 (2006)": "G06",
@@ -743,12 +1614,18 @@ class CP2KParser(FairdiParser):
     def init_parser(self):
         self.out_parser.mainfile = self.filepath
         self.inp_parser.mainfile = None
+        self.restart_parser.mainfile = None
         self.traj_parser.mainfile = None
         self.velocities_parser.mainfile = None
+        for traj_parser in [self.traj_parser, self.velocities_parser]:
+            traj_parser.format = None
+            traj_parser.units = None
         self.energy_parser.mainfile = None
         self.force_parser.mainfile = None
+        self.cell_parser.mainfile = None
         self.out_parser.logger = self.logger
         self.inp_parser.logger = self.logger
+        self.restart_parser.logger = self.logger
         self.traj_parser.logger = self.logger
         self.velocities_parser.logger = self.logger
         self.energy_parser.logger = self.logger
@@ -756,6 +1633,81 @@ class CP2KParser(FairdiParser):
         self._settings = None
         self._method = None
         self._calculation_type = None
+        self._periodic_dimensions = None
+        self._system_invariants = dict()
+        self._invariant_system = None
+        self._aux_files = set()
+        self._xc_functional_map = {
+            key: [XCFunctional(name) for name in names]
+            for key, names in self._xc_functional_names.items()}
+        self.scan_profile = ScanProfile(os.path.getsize(self.filepath)) if self.profile else None
+        self.out_parser.profile = self.scan_profile
+        self.memory_profile = MemoryProfile() if self.profile_memory else None
+        self.partial_reason = None
+        self._start_time = time.perf_counter()
+        self._start_rss = current_rss() if self.memory_budget is not None else 0
+        self._next_budget_check = 0.
+
+    def within_budget(self):
+        '''
+        Returns False if the time or the memory budget is exceeded. Once exceeded, the
+        reason is kept in partial_reason for the rest of the parse.
+        '''
+        if self.partial_reason is not None:
+            return False
+        if self.time_budget is None and self.memory_budget is None:
+            return True
+
+        # reading the memory is not for free, check at most every budget_interval
+        now = time.perf_counter()
+        if now < self._next_budget_check:
+            return True
+        self._next_budget_check = now + self.budget_interval
+
+        if self.time_budget is not None and now - self._start_time > self.time_budget:
+            self.partial_reason = 'time budget of %g s exceeded' % self.time_budget
+        elif self.memory_budget is not None:
+            growth = current_rss() - self._start_rss
+            if growth > self.memory_budget:
+                self.partial_reason = 'memory budget of %d bytes exceeded with %d bytes' % (
+                    self.memory_budget, growth)
+
+        if self.partial_reason is not None:
+            self.logger.warning('Parse stopped, %s.' % self.partial_reason)
+            return False
+        return True
+
+    def memory_phase(self, name):
+        '''
+        Returns a context manager that records the memory of the enclosed phase if the
+        memory is profiled.
+        '''
+        if self.memory_profile is None:
+            return _no_phase
+        return self.memory_profile.phase(name)
+
+    def set_aux_file(self, parser, filename):
+        if not self.within_budget():
+            parser.mainfile = None
+            return
+        path = os.path.join(self.maindir, filename)
+        parser.mainfile = path
+        self._aux_files.add(path)
+
+    @property
+    def aux_files(self):
+        '''
+        The paths of the files besides the mainfile that were opened in the last parse,
+        including the paths of files that do not exist.
+        '''
+        return sorted(self._aux_files)
+
+    @property
+    def periodic_dimensions(self):
+        if self._periodic_dimensions is None:
+            periodic = self.inp_parser.get('FORCE_EVAL/SUBSYS/CELL/PERIODIC', 'xyz').lower()
+            self._periodic_dimensions = np.array([v in periodic for v in ('x', 'y', 'z')])
+        return self._periodic_dimensions
 
     @property
     def settings(self):
@@ -827,7 +1779,7 @@ class CP2KParser(FairdiParser):
                 filename = '%s-vel-1.xyz' % self.inp_parser.get('GLOBAL/PROJECT_NAME')
                 frequency = 1
 
-            self.velocities_parser.mainfile = os.path.join(self.maindir, filename)
+            self.set_aux_file(self.velocities_parser, filename)
             self.velocities_parser.units = resolve_unit(
                 self.inp_parser.get('MOTION/PRINT/VELOCITIES/UNIT', 'bohr*au_t^-1'))
             self.velocities_parser._frequency = frequency
@@ -839,7 +1791,9 @@ class CP2KParser(FairdiParser):
             return
 
         try:
-            return self.velocities_parser.trajectory[frame // self.velocities_parser._frequency]
+            with self.memory_phase('velocities_parser'):
+                trajectory = self.velocities_parser.trajectory
+            return trajectory[frame // self.velocities_parser._frequency]
         except Exception:
             self.logger.error('Error reading velocities.')
 
@@ -851,22 +1805,24 @@ class CP2KParser(FairdiParser):
             units = resolve_unit(self.inp_parser.get('FORCE_EVAL/SUBSYS/COORD/UNIT', 'angstrom'))
             if coord is None:
                 coord_filename = self.inp_parser.get('FORCE_EVAL/SUBSYS/TOPOLOGY/COORD_FILE_NAME', '')
-                self.traj_parser.mainfile = os.path.join(self.maindir, coord_filename.strip())
+                self.set_aux_file(self.traj_parser, coord_filename.strip())
                 self.traj_parser.units = units
-                if self.traj_parser.trajectory is not None:
-                    result = self.traj_parser.trajectory[0]
+                with self.memory_phase('traj_parser'):
+                    result = self.traj_parser.trajectory
+                if result is not None:
+                    result = result[0]
                     # reset for output trajectory
                     self.traj_parser.mainfile = None
                     trajectory = result
 
             else:
                 coord = np.transpose([c.split() for c in coord])
-                positions = np.array(coord[1:4], dtype=float).T * units
+                positions = np.array(coord[1:4], dtype=float).T
                 scaled = 'T' in self.inp_parser.get('FORCE_EVAL/SUBSYS/COORD/SCALED', 'False')
                 if scaled:
                     trajectory = Trajectory(labels=coord[0], scaled_positions=positions)
                 else:
-                    trajectory = Trajectory(labels=coord[0], positions=positions)
+                    trajectory = Trajectory(labels=coord[0], positions=positions, units=units)
 
         if trajectory is not None:
             return trajectory
@@ -883,7 +1839,7 @@ class CP2KParser(FairdiParser):
                 filename = '%s-pos-1.%s' % (filename, traj_format)
                 frequency = 1
 
-            self.traj_parser.mainfile = os.path.join(self.maindir, filename)
+            self.set_aux_file(self.traj_parser, filename)
             self.traj_parser.units = resolve_unit(
                 self.inp_parser.get('MOTION/PRINT/TRAJECTORY/UNIT', 'angstrom'))
             self.traj_parser._frequency = frequency
@@ -895,12 +1851,18 @@ class CP2KParser(FairdiParser):
             return
 
         try:
-            return self.traj_parser.trajectory[frame // self.traj_parser._frequency]
+            with self.memory_phase('traj_parser'):
+                trajectory = self.traj_parser.trajectory
+            return trajectory[frame // self.traj_parser._frequency]
         except Exception:
             self.logger.error('Error reading trajectory.')
 
     def get_lattice_vectors(self, frame):
+        '''
+        Returns the lattice vectors of the frame in the unit of System.lattice_vectors.
+        '''
         lattice_vectors = None
+        target = System.lattice_vectors.unit
 
         if frame == 0:
             lattice_vectors = self.out_parser.get('lattice_vectors')
@@ -915,17 +1877,18 @@ class CP2KParser(FairdiParser):
 
                 if 'A' in cell and 'B' in cell and 'C' in cell:
                     lattice_vectors = np.array([
-                        cell.get(c).split() for c in ('A', 'B', 'C')], dtype=float) * units
+                        cell.get(c).split() for c in ('A', 'B', 'C')], dtype=float) * get_scale_factor(units, target)
                 elif 'ABC' in cell:
-                    abc = (np.array(
-                        cell.get('ABC').split(), dtype=float) * units).to('angstrom').magnitude
+                    abc = np.array(
+                        cell.get('ABC').split(), dtype=float) * get_scale_factor(units, 'angstrom')
                     angles = np.array(cell.get('ALPHA_BETA_GAMMA', '90. 90. 90.').split(), dtype=float)
-                    lattice_vectors = ase.geometry.cellpar_to_cell(np.hstack((abc, angles))) * ureg.angstrom
+                    lattice_vectors = cellpar_to_cell(
+                        np.hstack((abc, angles))) * get_scale_factor('angstrom', target)
 
             else:
                 units = resolve_unit(
                     self.inp_parser.get('FORCE_EVAL/SUBSYS/COORD/UNIT', 'angstrom'))
-                lattice_vectors = lattice_vectors * units
+                lattice_vectors = np.array(lattice_vectors) * get_scale_factor(units, target)
 
         if lattice_vectors is not None:
             return lattice_vectors
@@ -939,7 +1902,7 @@ class CP2KParser(FairdiParser):
                 frequency = 1
 
             if filename:
-                self.cell_parser.mainfile = os.path.join(self.maindir, filename)
+                self.set_aux_file(self.cell_parser, filename)
                 self.cell_parser.units = resolve_unit(
                     self.inp_parser.get('MOTION/PRINT/TRAJECTORY/UNIT', 'angstrom'))
                 self.cell_parser._frequency = frequency
@@ -958,7 +1921,11 @@ class CP2KParser(FairdiParser):
             return
 
         try:
-            return self.cell_parser.data[frame // self.cell_parser._frequency] * resolve_unit(self.cell_parser.units)
+            # step, time, lattice vectors, volume
+            with self.memory_phase('cell_parser'):
+                data = self.cell_parser.data
+            data = data[frame // self.cell_parser._frequency]
+            return np.reshape(data[2:11], (3, 3)) * get_scale_factor(self.cell_parser.units, target)
         except Exception:
             self.logger.error('Error reading lattice vectors.')
 
@@ -968,8 +1935,9 @@ class CP2KParser(FairdiParser):
             frequency = int(frequency)
             if frequency == 0:
                 return
-            self.energy_parser.mainfile = os.path.join(self.maindir, filename)
+            self.set_aux_file(self.energy_parser, filename)
             self.energy_parser._frequency = frequency
+            self._md_energies = None
 
         if self.get_ensemble_type(frame) == 'REFTRAJ':
             frame -= 1
@@ -978,13 +1946,18 @@ class CP2KParser(FairdiParser):
             return dict()
 
         try:
-            data = self.energy_parser.data[frame // self.energy_parser._frequency]
+            if self._md_energies is None:
+                # convert the energies of all frames at once
+                with self.memory_phase('energy_parser'):
+                    self._md_energies = np.array(self.energy_parser.data, dtype=float, ndmin=2)
+                self._md_energies[:, [2, 4, 5]] *= scale_factors['hartree']
+            data = self._md_energies[frame // self.energy_parser._frequency]
             return dict(
                 time=data[1],
-                kinetic_energy_instantaneous=data[2] * ureg.hartree,
+                kinetic_energy_instantaneous=data[2],
                 temperature_instantaneous=data[3],
-                potential_energy_instantaneous=data[4] * ureg.hartree,
-                conserved_quantity=data[5] * ureg.hartree,
+                potential_energy_instantaneous=data[4],
+                conserved_quantity=data[5],
                 cpu_time_instantaneous=data[6])
 
         except Exception:
@@ -994,8 +1967,9 @@ class CP2KParser(FairdiParser):
         filename = self.inp_parser.get('FORCE_EVAL/PRINT/FORCES/FILENAME', '').strip()
         filename = self._normalize_filename(filename)
         filename = '%s-1_%d.xyz' % (filename, frame)
-        self.force_parser.mainfile = os.path.join(self.maindir, filename)
-        return self.force_parser.get('atom_forces')
+        self.set_aux_file(self.force_parser, filename)
+        with self.memory_phase('force_parser'):
+            return self.force_parser.get('atom_forces')
 
     def get_xc_functionals(self):
         functionals = self.inp_parser.get('FORCE_EVAL/DFT/XC/XC_FUNCTIONAL/VALUE')
@@ -1011,10 +1985,10 @@ class CP2KParser(FairdiParser):
                 values = self._xc_functional_map.get(name, [XCFunctional(name)])
                 for n, value in enumerate(values):
                     weight = attrib.get('SCALE_X', None) if n == 0 else attrib.get('SCALE_C', None)
-                    value._data.update({'weight': weight})
+                    value.weight = weight
                 functionals.extend(values)
         else:
-            names = [functionals] if not isinstance(functionals, list) else functionals
+            names = [functionals] if not isinstance(functionals, tuple) else functionals
             functionals = []
             for name in names:
                 name = name.upper()
@@ -1025,6 +1999,14 @@ class CP2KParser(FairdiParser):
 
         return functionals
 
+    def get_scf_iterations(self, source):
+        # the same store is used for the common and the x_cp2k sections
+        iterations = vars(source).get('_scf_iterations')
+        if iterations is None:
+            iterations = ScfIterations(source.get('iteration', []))
+            source._scf_iterations = iterations
+        return iterations
+
     def parse_scc(self, source):
         if source is None:
             return
@@ -1034,25 +2016,20 @@ class CP2KParser(FairdiParser):
         for key in ['energy_total', 'stress_tensor']:
             val = source.get(key)
             if val is not None:
-                setattr(sec_scc, key, val)
+                set_quantity(sec_scc, key, val, output_units[key])
 
         for key in ['electronic_kinetic_energy', 'exchange_correlation_energy']:
             val = source.get(key)
             if val is not None:
-                key = self._metainfo_name_map.get(key, key)
-                setattr(sec_scc, key, val[-1])
+                set_quantity(sec_scc, self._metainfo_name_map.get(key, key), val[-1], output_units[key])
 
         # self consistency
-        for iteration in source.get('iteration', []):
-            sec_scf = sec_scc.m_create(ScfIteration)
-            for key, val in iteration.items():
-                if val is not None:
-                    setattr(sec_scf, key, val)
+        if self.within_budget():
+            self.get_scf_iterations(source).add_sections(sec_scc, ScfIteration)
 
         atom_forces = source.get('atom_forces', self.get_forces(source._frame))
         if atom_forces is not None:
-            atom_forces = np.array(atom_forces) * ureg.hartree / ureg.bohr
-            sec_scc.atom_forces = atom_forces
+            set_quantity(sec_scc, 'atom_forces', np.array(atom_forces), output_units['atom_forces'])
 
         # TODO add dos
         return sec_scc
@@ -1075,26 +2052,45 @@ class CP2KParser(FairdiParser):
         lattice_vectors = self.get_lattice_vectors(trajectory._frame)
 
         if trajectory.positions is not None:
-            sec_system.atom_positions = trajectory.positions
+            set_quantity(sec_system, 'atom_positions', trajectory.positions, trajectory.units)
         elif trajectory.scaled_positions is not None and lattice_vectors is not None:
             sec_system.atom_positions = np.dot(trajectory.scaled_positions, lattice_vectors)
 
         labels = trajectory.labels if trajectory.labels is not None else self.out_parser.get(
             self._calculation_type).get('atomic_coordinates')
-        if labels is not None:
-            sec_system.atom_labels = labels
 
-        if lattice_vectors is not None:
-            sec_system.lattice_vectors = lattice_vectors
-        periodic = self.inp_parser.get('FORCE_EVAL/SUBSYS/CELL/PERIODIC', 'xyz').lower()
-        sec_system.configuration_periodic_dimensions = [v in periodic for v in ('x', 'y', 'z')]
+        # values that usually do not change during the run are shared with the previous
+        # system and only replaced if they change, e.g. the cell in NPT
+        invariants = dict(
+            atom_labels=labels, lattice_vectors=lattice_vectors,
+            configuration_periodic_dimensions=self.periodic_dimensions)
+        changed = False
+        for name, value in invariants.items():
+            previous = self._system_invariants.get(name)
+            if value is None:
+                changed = changed or previous is not None
+            elif previous is not None and np.array_equal(previous, value):
+                invariants[name] = previous
+            else:
+                changed = True
+            self._system_invariants[name] = invariants[name]
+
+        if self.dedup_systems and not changed and self._invariant_system is not None:
+            sec_system_ref = sec_system.m_create(SystemToSystemRefs)
+            sec_system_ref.system_to_system_kind = 'invariants'
+            sec_system_ref.system_to_system_ref = self._invariant_system
+        else:
+            for name, value in invariants.items():
+                if value is not None:
+                    setattr(sec_system, name, value)
+            self._invariant_system = sec_system
 
         # TODO test this I cannot find an example
         # velocities
         if self.sampling_method == 'molecular_dynamics':
             velocities = self.get_velocities(trajectory._frame)
             if velocities is not None:
-                sec_system.atom_velocities = velocities
+                set_quantity(sec_system, 'atom_velocities', velocities.velocities, velocities.units)
 
         return sec_system
 
@@ -1107,67 +2103,114 @@ class CP2KParser(FairdiParser):
             if source is None:
                 return
             sec_quickstep_calc = sec_run.m_create(x_cp2k_section_quickstep_calculation)
-            for key in ['energy_total', 'atom_forces']:
-                val = source.get(key)
-                if val is not None:
-                    setattr(sec_quickstep_calc, 'x_cp2k_%s' % key, val)
-                sec_quickstep_calc.x_cp2k_quickstep_converged = source.get('converged') is not None
+            val = source.get('energy_total')
+            if val is not None:
+                set_quantity(sec_quickstep_calc, 'x_cp2k_energy_total', val, output_units['energy_total'])
+            val = source.get('atom_forces')
+            if val is not None:
+                set_quantity(
+                    sec_quickstep_calc, 'x_cp2k_atom_forces', np.array(val), output_units['atom_forces'])
+            sec_quickstep_calc.x_cp2k_quickstep_converged = source.get('converged') is not None
 
             if source.get('electronic_kinetic_energy') is not None:
-                sec_quickstep_calc.x_cp2k_electronic_kinetic_energy = source.get('electronic_kinetic_energy')[-1]
+                set_quantity(
+                    sec_quickstep_calc, 'x_cp2k_electronic_kinetic_energy',
+                    source.get('electronic_kinetic_energy')[-1], output_units['electronic_kinetic_energy'])
 
-            for iteration in source.get('iteration', []):
-                sec_scf = sec_quickstep_calc.m_create(x_cp2k_section_scf_iteration)
-                for key, val in iteration.items():
-                    if val is not None:
-                        setattr(sec_scf, 'x_cp2k_%s' % key, val)
+            if self.legacy_scf_iterations and self.within_budget():
+                self.get_scf_iterations(source).add_sections(
+                    sec_quickstep_calc, x_cp2k_section_scf_iteration, 'x_cp2k_')
 
             if source.stress_tensor is not None:
                 sec_stress = sec_quickstep_calc.m_create(x_cp2k_section_stress_tensor)
                 if source.stress_tensor_one_third_of_trace is not None:
-                    val = source.stress_tensor_one_third_of_trace
-                    sec_stress.stress_tensor_one_third_of_trace = val.to('pascal').magnitude
+                    sec_stress.stress_tensor_one_third_of_trace = source.stress_tensor_one_third_of_trace * scale_factors['GPa']
                 if source.stress_tensor_determinant is not None:
-                    sec_stress.stress_tensor_determinant = val.to('pascal**3').magnitude
+                    sec_stress.stress_tensor_determinant = source.stress_tensor_determinant * scale_factors['GPa**3']
                 if source.stress_eigenvalues_eigenvectors is not None:
                     val = source.stress_eigenvalues_eigenvectors
-                    sec_stress.x_cp2k_stress_tensor_eigenvalues = val[0].to('pascal').magnitude
+                    sec_stress.x_cp2k_stress_tensor_eigenvalues = val[0] * scale_factors['GPa']
                     sec_stress.x_cp2k_stress_tensor_eigenvectors = val[1]
 
-        def parse_md_step(source):
+        def get_md_columns(calculations):
+            # md quantities of all frames in the output, each converted once
+            columns = dict()
+            for key, factor in md_scale_factors.items():
+                frames = [n for n, calculation in enumerate(calculations) if calculation.get(key) is not None]
+                if frames:
+                    values = np.array([calculations[n].get(key) for n in frames], dtype=float) * factor
+                    columns[key] = dict(zip(frames, values))
+            return columns
+
+        def parse_md_step(source, md_columns):
             # we put md output in scc, originally in frame sequence
             # TODO put in workflow
             md_output = self.get_md_output(source._frame)
-            md_output = md_output if md_output else source
-            sec_scc = sec_run.section_single_configuration_calculation[-1]
-            sec_md_step = sec_scc.m_create(x_cp2k_section_md_step)
+            if not md_output:
+                md_output = {
+                    key: md_columns.get(key, {}).get(source._frame, val)
+                    for key, val in source.items()}
 
             with_average = [
                 'cpu_time', 'energy_drift', 'potential_energy', 'kinetic_energy',
                 'temperature', 'pressure', 'barostat_temperature', 'volume']
+            md_step = dict()
             for key, val in md_output.items():
                 if val is None:
                     continue
-                name = 'x_cp2k_md_%s' % key
-
-                if key == 'energy_drift':
-                    pass
-                elif 'energy' in key or 'conserved' in key:
-                    val = val.to('joule').magnitude
-                elif 'pressure' in key:
-                    val - val.to('pascal').magnitude
-                elif 'volume' in key:
-                    val = val.to('m**3').magnitude
 
                 if key in with_average:
-                    setattr(sec_md_step, '%s_instantaneous' % name, val[0])
-                    name = '%s_average' % name
+                    md_step['%s_instantaneous' % key] = val[0]
+                    key = '%s_average' % key
                     val = val[1]
 
-                setattr(sec_md_step, name, val)
+                md_step[key] = val
+
+            if self.md_step_sections:
+                sec_md_step = sec_run.section_single_configuration_calculation[-1].m_create(
+                    x_cp2k_section_md_step)
+                for key, val in md_step.items():
+                    setattr(sec_md_step, 'x_cp2k_md_%s' % key, val)
+
+            return md_step
+
+        def parse_md_frames(md_steps):
+            # md step quantities of all frames as arrays
+            sec_frame_sequence = sec_run.m_create(FrameSequence)
+            sec_frame_sequence.number_of_frames_in_sequence = len(md_steps)
+            sec_frame_sequence.frame_sequence_local_frames_ref = [
+                sec_run.section_single_configuration_calculation[n] for n, _ in md_steps]
+            for key, name, number in [
+                    ('temperature_instantaneous', 'temperature', 'temperatures'),
+                    ('potential_energy_instantaneous', 'potential_energy', 'potential_energies'),
+                    ('kinetic_energy_instantaneous', 'kinetic_energy', 'kinetic_energies'),
+                    ('conserved_quantity', 'conserved_quantity', 'conserved_quantity_evaluations'),
+                    ('pressure_instantaneous', 'pressure', 'pressure_evaluations')]:
+                frames = [n for n, (_, md_step) in enumerate(md_steps) if md_step.get(key) is not None]
+                if frames:
+                    setattr(sec_frame_sequence, 'number_of_%s_in_sequence' % number, len(frames))
+                    setattr(sec_frame_sequence, 'frame_sequence_%s_frames' % name, frames)
+                    setattr(sec_frame_sequence, 'frame_sequence_%s' % name, [
+                        md_steps[n][1][key] for n in frames])
+
+            sec_md = sec_frame_sequence.m_create(x_cp2k_section_md)
+            sec_md.x_cp2k_md_frames_index = [n for n, _ in md_steps]
+            for quantity_def in x_cp2k_section_md.m_def.all_quantities.values():
+                key = quantity_def.name[len('x_cp2k_md_frames_'):]
+                values = [md_step.get(key) for _, md_step in md_steps]
+                if key == 'index' or all(val is None for val in values):
+                    continue
+                missing = -1 if quantity_def.type == np.int32 else np.full(quantity_def.shape[1:], np.nan)
+                setattr(sec_md, quantity_def.name, np.array(
+                    [missing if val is None else val for val in values], dtype=quantity_def.type))
 
         def parse_calculations(calculations):
+            md_columns = get_md_columns(calculations)
+            md_steps = []
             for n, calculation in enumerate(calculations):
+                # keep at least one frame
+                if n > 0 and not self.within_budget():
+                    break
                 self_consistent = calculation.get('self_consistent', [])
                 self_consistent = [self_consistent] if not isinstance(self_consistent, list) else self_consistent
                 # there may be several wave function optimizations in a calculation
@@ -1180,7 +2223,9 @@ class CP2KParser(FairdiParser):
                 sec_scc = self.parse_scc(scf)
                 if calculation.get('ensemble_type') is not None:
                     calculation._frame = n
-                    parse_md_step(calculation)
+                    md_steps.append((
+                        len(sec_run.section_single_configuration_calculation) - 1,
+                        parse_md_step(calculation, md_columns)))
 
                 if n == 0:
                     atomic_coord = quickstep.get('atomic_coordinates')
@@ -1193,6 +2238,9 @@ class CP2KParser(FairdiParser):
                 if sec_system is not None:
                     sec_scc.single_configuration_calculation_to_system_ref = sec_system
 
+            if md_steps and self.md_frames:
+                parse_md_frames(md_steps)
+
             sec_scc.single_configuration_to_calculation_method_ref = sec_run.section_method[-1]
 
         single_point = quickstep.get('single_point')
@@ -1303,7 +2351,10 @@ class CP2KParser(FairdiParser):
             for key, val in scf_parameters.items():
                 if val is None:
                     continue
-                setattr(sec_method, key, val)
+                if key in output_units:
+                    set_quantity(sec_method, key, val, output_units[key])
+                else:
+                    setattr(sec_method, key, val)
 
         sec_method_basis_set = sec_method.m_create(MethodBasisSet)
         sec_method_basis_set.method_basis_set_kind = 'wavefunction'
@@ -1343,11 +2394,11 @@ class CP2KParser(FairdiParser):
 
                     name = self._metainfo_name_map.get(key, key)
                     if name.startswith('energy') and isinstance(val, float):
-                        val = (val * ureg.hartree).to('joule').magnitude
+                        val = val * scale_factors['hartree']
                     elif 'step_size' in name and isinstance(val, float):
-                        val = (val * ureg.bohr).to('m').magnitude
+                        val = val * scale_factors['bohr']
                     elif 'gradient' in name and isinstance(val, float):
-                        val = (val * ureg.hartree / ureg.bohr).to('joule/m').magnitude
+                        val = val * scale_factors['hartree/bohr']
                     elif isinstance(val, str):
                         val = val.strip()
 
@@ -1378,49 +2429,46 @@ class CP2KParser(FairdiParser):
                 else:
                     setattr(sec_md_settings, 'x_cp2k_md_%s' % key, val)
 
+    def parse_restart(self, sec_restart):
+        '''
+        Reads the settings of the restart file from which the run was started. Only the
+        section headers of the file are indexed, the heavy blocks are not decoded.
+        '''
+        for key, name, convert in [
+                ('GLOBAL/PROJECT_NAME', 'project_name', str),
+                ('GLOBAL/RUN_TYPE', 'run_type', str),
+                ('MOTION/MD/STEP_START_VAL', 'step_start_val', int),
+                ('MOTION/MD/TIME_START_VAL', 'time_start_val', lambda val: float(
+                    val) * get_scale_factor('femtosecond', 's')),
+                ('MOTION/MD/ECONS_START_VAL', 'econs_start_val', lambda val: float(
+                    val) * scale_factors['hartree'])]:
+            val = self.restart_parser.get(key)
+            if val is None:
+                continue
+            try:
+                setattr(sec_restart, 'x_cp2k_restart_%s' % name, convert(val))
+            except (TypeError, ValueError):
+                self.logger.error('Error reading restart value %s.' % key)
+
     def parse_input(self):
         # TODO include extended input
         input_filename = self.settings['cp2k'].get('input_filename', None)
         if input_filename is None:
             return
 
-        def resolve_definition(name):
-            return self._metainfo_env.all_definitions_by_name.get(name, [None])[0]
-
-        def override_keyword(name):
-            # override keys to be compatible with metainfo name
-            # TODO change metainfo name
-            if name.endswith('_VALUE'):
-                return name.replace('VALUE', 'SECTION_PARAMETERS')
-            elif name.endswith('KIND_RI_AUX_BASIS'):
-                return name.replace('BASIS', 'BASIS_SET')
-            return name
-
-        def parse(name, data, section):
-            if isinstance(data, InpValue):
-                sec_def = resolve_definition(name)
-                if sec_def is not None:
-                    sub_section = section.m_create(sec_def.section_cls)
-                    for key, val in data.items():
-                        sec_name = '%s_%s' % (name, key)
-                        parse(sec_name, val, sub_section)
-
-            elif isinstance(data, list) and data:
-                for val in data:
-                    parse(name, val, section)
+        self.set_aux_file(self.inp_parser, input_filename)
+        with self.memory_phase('inp_parser'):
+            tree = self.inp_parser.tree
+        if tree is None:
+            return
 
-            else:
-                name = name.replace('_section', '')
-                name = override_keyword(name)
-                quantity_def = resolve_definition(name)
-                if quantity_def is not None:
-                    setattr(section, name, quantity_def.type(data))
-
-        self.inp_parser.mainfile = os.path.join(self.maindir, input_filename)
-        if self.inp_parser.tree is None:
+        if self.compact_input:
+            self.archive.section_run[-1].x_cp2k_input_tree = dump_input_tree(tree)
             return
 
-        parse('x_cp2k_section_input', self.inp_parser.tree, self.archive.section_run[-1])
+        shape, values = InputPlan.flatten('x_cp2k_section_input', tree)
+        plan = InputPlan.get(shape)
+        plan.apply(values, self.archive.section_run[-1])
 
     def parse(self, filepath, archive, logger):
         self.filepath = os.path.abspath(filepath)
@@ -1430,6 +2478,23 @@ class CP2KParser(FairdiParser):
 
         self.init_parser()
 
+        with self.memory_phase('parse'):
+            self.parse_run()
+
+        if self.partial_reason is not None and self.archive.section_run:
+            self.archive.section_run[-1].x_cp2k_partial_reason = self.partial_reason
+
+        if self.scan_profile is not None:
+            self.logger.info('Scan profile of %s, amplification %.2f\n%s' % (
+                self.filepath, self.scan_profile.amplification, self.scan_profile.format(20)))
+
+        if self.memory_profile is not None:
+            self.logger.info('Memory profile of %s\n%s' % (self.filepath, self.memory_profile.format()))
+
+    def parse_run(self):
+        with self.memory_phase('output'):
+            self.out_parser.parse()
+
         # identify calculation type, TODO add more
         calculation_types = ['quickstep', 'qs_dftb']
         for calculation_type in calculation_types:
@@ -1477,7 +2542,8 @@ class CP2KParser(FairdiParser):
         planewave_cutoff = self.settings.get('qs', {}).get('planewave_cutoff', None)
         if planewave_cutoff is not None:
             sec_basis_set = sec_run.m_create(BasisSetCellDependent)
-            sec_basis_set.basis_set_planewave_cutoff = planewave_cutoff * ureg.hartree
+            set_quantity(
+                sec_basis_set, 'basis_set_planewave_cutoff', planewave_cutoff, output_units['planewave_cutoff'])
 
         atoms = self.out_parser.get(
             self._calculation_type, {}).get('atomic_kind_information', {}).get('atom', [])
@@ -1492,12 +2558,20 @@ class CP2KParser(FairdiParser):
         if restart is not None:
             sec_restart = sec_run.m_create(x_cp2k_section_restart_information)
             sec_restart.x_cp2k_restart_file_name = restart.get('filename')
-            sec_restart.x_cp2k_restarted_quantity_name = ' '.join(restart.get('quantities'))
+            sec_restart.x_cp2k_restarted_quantity_name = ' '.join(restart.get('quantities', []))
+            if restart.get('filename') is not None:
+                with self.memory_phase('restart_parser'):
+                    self.set_aux_file(self.restart_parser, restart.get('filename'))
+                    self.parse_restart(sec_restart)
 
-        self.parse_input()
+        with self.memory_phase('parse_input'):
+            self.parse_input()
 
         if self._calculation_type in ['quickstep', 'qs_dftb']:
-            self.parse_method_quickstep()
-            self.parse_configurations_quickstep()
+            with self.memory_phase('parse_method_quickstep'):
+                self.parse_method_quickstep()
+            with self.memory_phase('parse_configurations_quickstep'):
+                self.parse_configurations_quickstep()
 
-        self.parse_sampling_method()
+        with self.memory_phase('parse_sampling_method'):
+            self.parse_sampling_method()
@@ -0,0 +1,274 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Long-lived parser process that answers parse requests. The workers keep their parsers
+and the loaded metainfo between requests, such that the latency of a request is the
+cost of the parse itself.
+
+.. code-block:: sh
+
+    python -m cp2kparser.daemon [--socket <path>] [--processes <n>] [--cache <dir>]
+        [--preload]
+
+Requests and responses are JSON lines, read from stdin and written to stdout or, with
+--socket, exchanged over connections to a Unix socket. A request has the keys mainfile,
+the optional options, which are the arguments of :class:`cp2kparser.CP2KParser`, the
+optional output path of the archive and an optional id that is returned with the
+response. The response has the keys of :func:`cp2kparser.batch.parse_file`, the archive
+is inlined if no output is given. Requests are handled concurrently, the responses are
+written in the order in which the parses finish.
+
+.. code-block:: sh
+
+    echo '{"id": 1, "mainfile": "tests/data/single_point/si_bulk8.out"}' | \\
+        python -m cp2kparser.daemon
+'''
+
+import os
+import io
+import sys
+import json
+import stat
+import socket
+import inspect
+import argparse
+import threading
+import socketserver
+import multiprocessing
+from collections import OrderedDict
+
+from cp2kparser import CP2KParser
+from cp2kparser.metainfo import load_input_sections
+from cp2kparser.cache import ResultCache, ignored_options
+from cp2kparser.batch import parse_file, write_result
+
+
+# maximum number of parsers with different options kept by a worker
+max_parsers = 8
+
+_parsers: OrderedDict = OrderedDict()
+_cache = None
+_default_options = {
+    name: parameter.default
+    for name, parameter in inspect.signature(CP2KParser.__init__).parameters.items()
+    if name in ignored_options}
+
+
+def _init_worker(cache_kwargs=None, preload=False):
+    global _cache
+    _cache = None if cache_kwargs is None else ResultCache(**cache_kwargs)
+    get_parser(dict())
+    if preload:
+        load_input_sections()
+
+
+def get_parser(options):
+    '''
+    Returns the parser of the worker for the given options. The options that do not
+    change the archive, e.g. the budgets, are set for each request on a parser that is
+    shared with the other values of these options.
+    '''
+    key = json.dumps({
+        name: val for name, val in options.items() if name not in ignored_options},
+        sort_keys=True)
+    parser = _parsers.get(key)
+    if parser is None:
+        parser = CP2KParser(**options)
+        while len(_parsers) >= max_parsers:
+            _parsers.popitem(last=False)
+        _parsers[key] = parser
+    else:
+        _parsers.move_to_end(key)
+    for name, default in _default_options.items():
+        setattr(parser, name, options.get(name, default))
+    return parser
+
+
+def handle_request(request):
+    '''
+    Parses the mainfile of the request in a worker and returns the response.
+    '''
+    mainfile = os.path.abspath(request['mainfile'])
+    output = request.get('output')
+    try:
+        parser = get_parser(request.get('options') or dict())
+    except Exception as e:
+        result = dict(mainfile=mainfile, error='%s: %s' % (e.__class__.__name__, e))
+    else:
+        result = parse_file(
+            (mainfile, None if output is None else os.path.abspath(output)), parser, _cache)
+    result['id'] = request.get('id')
+    return result
+
+
+class Daemon:
+    '''
+    Handles parse requests with a pool of workers. With processes=1, the requests are
+    handled one after the other in this process, also if they come from several
+    connections of serve_socket. With preload, the workers load the definitions of all
+    input sections on start instead of on first use.
+    '''
+    def __init__(self, processes=None, cache_kwargs=None, preload=False):
+        self.pool = None
+        # the parsers of this process are not thread-safe
+        self._lock = threading.Lock()
+        if processes == 1:
+            _init_worker(cache_kwargs, preload)
+        else:
+            self.pool = multiprocessing.Pool(processes, _init_worker, (cache_kwargs, preload))
+
+    def submit(self, request, callback):
+        '''
+        Handles the request and calls callback with the response. Returns the
+        AsyncResult of the pool or None if the request was handled in this process.
+        '''
+        if not isinstance(request, dict):
+            callback(dict(id=None, error='Invalid request, not an object.'))
+            return None
+
+        def error_callback(e):
+            callback(dict(
+                id=request.get('id'), mainfile=request.get('mainfile'),
+                error='%s: %s' % (e.__class__.__name__, e)))
+
+        if not isinstance(request.get('mainfile'), str):
+            callback(dict(id=request.get('id'), error='Invalid request, mainfile is not a path.'))
+            return None
+        if not isinstance(request.get('output', ''), (str, type(None))):
+            callback(dict(
+                id=request.get('id'), mainfile=request['mainfile'],
+                error='Invalid request, output is not a path.'))
+            return None
+
+        if self.pool is None:
+            try:
+                with self._lock:
+                    result = handle_request(request)
+            except Exception as e:
+                error_callback(e)
+            else:
+                callback(result)
+            return None
+
+        return self.pool.apply_async(
+            handle_request, (request,), callback=callback, error_callback=error_callback)
+
+    def serve_stream(self, f_in, f_out):
+        '''
+        Reads requests from the text stream f_in and writes the responses to f_out until
+        f_in is closed and all requests are answered.
+        '''
+        lock = threading.Lock()
+
+        def respond(result):
+            with lock:
+                # the client might be gone, this must not stop the pool
+                try:
+                    write_result(result, f_out)
+                    f_out.flush()
+                except (OSError, ValueError):
+                    pass
+
+        pending = []
+        for line in f_in:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as e:
+                respond(dict(id=None, error='Invalid request, %s' % e))
+                continue
+
+            async_result = self.submit(request, respond)
+            if async_result is not None:
+                pending.append(async_result)
+            if len(pending) > 1000:
+                pending = [async_result for async_result in pending if not async_result.ready()]
+
+        for async_result in pending:
+            async_result.wait()
+
+    def serve_socket(self, path):
+        '''
+        Answers the requests of each connection to the Unix socket at path until the
+        process is interrupted.
+        '''
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                f_out = io.TextIOWrapper(self.wfile, encoding='utf-8', write_through=True)
+                daemon.serve_stream(io.TextIOWrapper(self.rfile, encoding='utf-8'), f_out)
+                f_out.detach()
+
+        if os.path.exists(path):
+            if not stat.S_ISSOCK(os.stat(path).st_mode):
+                raise FileExistsError('%s exists and is not a socket' % path)
+            # remove the socket of a daemon that is gone
+            with socket.socket(socket.AF_UNIX) as sock:
+                try:
+                    sock.connect(path)
+                except OSError:
+                    os.remove(path)
+                else:
+                    raise FileExistsError('%s is used by a running daemon' % path)
+        server = socketserver.ThreadingUnixStreamServer(path, Handler)
+        server.daemon_threads = True
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            os.remove(path)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description='Answers CP2K parse requests.')
+    arg_parser.add_argument('--socket', help='path of the Unix socket, default is stdin')
+    arg_parser.add_argument('--processes', type=int, default=None, help='number of workers')
+    arg_parser.add_argument('--cache', help='directory of the result cache')
+    arg_parser.add_argument(
+        '--cache-size', type=int, default=1 << 30, help='maximum size of the cache in bytes')
+    arg_parser.add_argument(
+        '--preload', action='store_true', help='load all input definitions on start')
+    args = arg_parser.parse_args(argv)
+
+    daemon = Daemon(args.processes, None if args.cache is None else dict(
+        directory=args.cache, max_size=args.cache_size), preload=args.preload)
+    try:
+        if args.socket is None:
+            daemon.serve_stream(sys.stdin, sys.stdout)
+        else:
+            daemon.serve_socket(args.socket)
+    except FileExistsError as e:
+        sys.stderr.write('%s\n' % e)
+        return 1
+    finally:
+        daemon.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -17,8 +17,11 @@
 # limitations under the License.
 #
 import sys
-from nomad.metainfo import Environment
-from nomad.metainfo.legacy import LegacyMetainfoEnvironment
+import importlib
+import threading
+from typing import Any
+from nomad.metainfo import Environment, Package
+from nomad.metainfo.legacy import LegacyMetainfoEnvironment, LegacyDefinition
 import cp2kparser.metainfo.cp2k
 import cp2kparser.metainfo.cp2k_general
 import nomad.datamodel.metainfo.common
@@ -31,3 +34,96 @@ m_env.m_add_sub_section(Environment.packages, sys.modules['cp2kparser.metainfo.c
 m_env.m_add_sub_section(Environment.packages, sys.modules['nomad.datamodel.metainfo.common'].m_package)  # type: ignore
 m_env.m_add_sub_section(Environment.packages, sys.modules['nomad.datamodel.metainfo.public'].m_package)  # type: ignore
 m_env.m_add_sub_section(Environment.packages, sys.modules['nomad.datamodel.metainfo.general'].m_package)  # type: ignore
+
+# top-level input sections, their definitions are loaded on demand
+input_sections = [
+    'ATOM', 'DEBUG', 'EXT_RESTART', 'FARMING', 'FORCE_EVAL', 'GLOBAL', 'MOTION',
+    'MULTIPLE_FORCE_EVALS', 'OPTIMIZE_BASIS', 'OPTIMIZE_INPUT', 'SWARM', 'TEST',
+    'VIBRATIONAL_ANALYSIS']
+_input_modules = {
+    name: 'cp2kparser.metainfo.cp2k_input.%s' % ('global_' if name == 'GLOBAL' else name.lower())
+    for name in input_sections}
+_input_lock = threading.Lock()
+
+
+_prebuilt: Any = None
+
+
+def _get_prebuilt():
+    global _prebuilt
+
+    if _prebuilt is None:
+        _prebuilt = False
+        try:
+            from cp2kparser.metainfo.prebuilt import PrebuiltDefinitions  # pylint: disable=import-outside-toplevel
+
+            package = Package(
+                name='cp2k_input_nomadmetainfo_json', description='None',
+                a_legacy=LegacyDefinition(name='cp2k_input.nomadmetainfo.json'))
+            _prebuilt = PrebuiltDefinitions(
+                package, cp2kparser.metainfo.cp2k.x_cp2k_section_input.m_def)
+            m_env.m_add_sub_section(Environment.packages, package)  # type: ignore
+        except (OSError, ValueError, KeyError):
+            # artifact is missing or outdated, fall back to the python modules
+            pass
+
+    return _prebuilt
+
+
+def _get_input_section(name):
+    for prefix in ['x_cp2k_section_input_', 'x_cp2k_input_']:
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+            for section in input_sections:
+                if name == section or name.startswith('%s_' % section):
+                    return section
+
+
+def load_input_section(name):
+    '''
+    Imports the definitions of the top-level input section with the given name and adds
+    them to m_env. Returns False if there is no such section.
+    '''
+    module_name = _input_modules.get(name)
+    if module_name is None:
+        return False
+
+    with _input_lock:
+        if module_name not in sys.modules:
+            module = importlib.import_module(module_name)
+            m_env.m_add_sub_section(Environment.packages, module.m_package)  # type: ignore
+
+    return True
+
+
+def load_input_sections():
+    '''
+    Loads the definitions of all input sections, e.g. to read archives.
+    '''
+    with _input_lock:
+        if _get_prebuilt():
+            _prebuilt.resolve_all()
+            m_env.m_mod_count += 1
+            return
+
+    for name in input_sections:
+        load_input_section(name)
+
+
+def resolve_input_definition(name):
+    '''
+    Returns the definition of the input section or keyword quantity with the given name.
+    The definition is created from the prebuilt artifact if available, otherwise the
+    module of the respective top-level section is loaded.
+    '''
+    with _input_lock:
+        if _get_prebuilt():
+            definition = _prebuilt.resolve(name)
+            # definitions were added to the package, update the name index of m_env
+            m_env.m_mod_count += 1
+            return definition
+
+    section = _get_input_section(name)
+    if section is not None:
+        load_input_section(section)
+    return m_env.all_definitions_by_name.get(name, [None])[0]
@@ -55,6 +55,48 @@ class x_cp2k_section_restart_information(MSection):
         ''',
         a_legacy=LegacyDefinition(name='x_cp2k_restarted_quantity_name'))
 
+    x_cp2k_restart_project_name = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Project name in the restart file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_restart_project_name'))
+
+    x_cp2k_restart_run_type = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Run type in the restart file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_restart_run_type'))
+
+    x_cp2k_restart_step_start_val = Quantity(
+        type=np.dtype(np.int32),
+        shape=[],
+        description='''
+        Index of the MD step from which the run is restarted.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_restart_step_start_val'))
+
+    x_cp2k_restart_time_start_val = Quantity(
+        type=np.dtype(np.float64),
+        shape=[],
+        unit='second',
+        description='''
+        Simulation time from which the MD run is restarted.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_restart_time_start_val'))
+
+    x_cp2k_restart_econs_start_val = Quantity(
+        type=np.dtype(np.float64),
+        shape=[],
+        unit='joule',
+        description='''
+        Conserved quantity of the MD run at the restart.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_restart_econs_start_val'))
+
 
 class x_cp2k_section_dbcsr(MSection):
     '''
@@ -738,11 +780,204 @@ class x_cp2k_section_total_numbers(MSection):
 
 class x_cp2k_section_md(MSection):
     '''
-    CP2K Molecular Dynamics information.
+    CP2K Molecular Dynamics information. The x_cp2k_md_frames quantities hold the MD step
+    quantities of all frames of the sequence as arrays over the frames.
     '''
 
     m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_md'))
 
+    x_cp2k_md_frames_index = Quantity(
+        type=np.dtype(np.int32),
+        shape=['*'],
+        description='''
+        Indices of the section_single_configuration_calculation of the MD frames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_index'))
+
+    x_cp2k_md_frames_step_number = Quantity(
+        type=np.dtype(np.int32),
+        shape=['*'],
+        description='''
+        MD step numbers.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_step_number'))
+
+    x_cp2k_md_frames_time = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Simulation time of the MD frames in fs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_time'))
+
+    x_cp2k_md_frames_potential_energy_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous potential energy of the MD frames in J.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_potential_energy_instantaneous'))
+
+    x_cp2k_md_frames_potential_energy_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average potential energy of the MD frames in J.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_potential_energy_average'))
+
+    x_cp2k_md_frames_kinetic_energy_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous kinetic energy of the MD frames in J.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_kinetic_energy_instantaneous'))
+
+    x_cp2k_md_frames_kinetic_energy_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average kinetic energy of the MD frames in J.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_kinetic_energy_average'))
+
+    x_cp2k_md_frames_energy_drift_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous energy drift per atom of the MD frames in K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_energy_drift_instantaneous'))
+
+    x_cp2k_md_frames_energy_drift_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average energy drift per atom of the MD frames in K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_energy_drift_average'))
+
+    x_cp2k_md_frames_temperature_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous temperature of the MD frames in K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_temperature_instantaneous'))
+
+    x_cp2k_md_frames_temperature_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average temperature of the MD frames in K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_temperature_average'))
+
+    x_cp2k_md_frames_barostat_temperature_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous barostat temperature of the MD frames in K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_barostat_temperature_instantaneous'))
+
+    x_cp2k_md_frames_barostat_temperature_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average barostat temperature of the MD frames in K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_barostat_temperature_average'))
+
+    x_cp2k_md_frames_pressure_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous pressure of the MD frames in Pa.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_pressure_instantaneous'))
+
+    x_cp2k_md_frames_pressure_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average pressure of the MD frames in Pa.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_pressure_average'))
+
+    x_cp2k_md_frames_cpu_time_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous CPU time of the MD frames in s.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_cpu_time_instantaneous'))
+
+    x_cp2k_md_frames_cpu_time_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average CPU time of the MD frames in s.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_cpu_time_average'))
+
+    x_cp2k_md_frames_volume_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Instantaneous volume of the MD frames in m^3.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_volume_instantaneous'))
+
+    x_cp2k_md_frames_volume_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Average volume of the MD frames in m^3.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_volume_average'))
+
+    x_cp2k_md_frames_conserved_quantity = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*'],
+        description='''
+        Conserved quantity of the MD frames in J.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_conserved_quantity'))
+
+    x_cp2k_md_frames_cell_length_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*', 3],
+        description='''
+        Instantaneous cell lengths of the MD frames in m.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_cell_length_instantaneous'))
+
+    x_cp2k_md_frames_cell_length_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*', 3],
+        description='''
+        Average cell lengths of the MD frames in m.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_cell_length_average'))
+
+    x_cp2k_md_frames_cell_angle_instantaneous = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*', 3],
+        description='''
+        Instantaneous cell angles of the MD frames in degrees.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_cell_angle_instantaneous'))
+
+    x_cp2k_md_frames_cell_angle_average = Quantity(
+        type=np.dtype(np.float64),
+        shape=['*', 3],
+        description='''
+        Average cell angles of the MD frames in degrees.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_md_frames_cell_angle_average'))
+
     x_cp2k_section_md_step = SubSection(
         sub_section=SectionProxy('x_cp2k_section_md_step'),
         repeats=True,
@@ -0,0 +1,3711 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_atom_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_atom.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_ATOM_AE_BASIS_BASIS(MSection):
+    '''
+    Section used to specify a general basis set for QM calculations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.AE_BASIS.BASIS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_BASIS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CP2K Basis Set Standard Format
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.BASIS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_ATOM_AE_BASIS(MSection):
+    '''
+    Section of basis set information for all-electron calculations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.AE_BASIS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_BASIS_SET_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the basis set file, may include a path
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.BASIS_SET_FILE_NAME'))
+
+    x_cp2k_input_ATOM_AE_BASIS_BASIS_SET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The contracted Gaussian basis set
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.BASIS_SET'))
+
+    x_cp2k_input_ATOM_AE_BASIS_BASIS_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Basis set type
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.BASIS_TYPE'))
+
+    x_cp2k_input_ATOM_AE_BASIS_D_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for d functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.D_EXPONENTS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_D_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for d functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.D_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_EPS_EIGENVALUE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cutoff of overlap matrix eigenvalues included into basis
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.EPS_EIGENVALUE'))
+
+    x_cp2k_input_ATOM_AE_BASIS_F_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for f functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.F_EXPONENTS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_F_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for f functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.F_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_GEO_START_VALUE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Geometrical basis: starting value a in a*C^k
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.GEO_START_VALUE'))
+
+    x_cp2k_input_ATOM_AE_BASIS_GEOMETRICAL_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Geometrical basis: factor C in a*C^k
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.GEOMETRICAL_FACTOR'))
+
+    x_cp2k_input_ATOM_AE_BASIS_GRID_POINTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of radial grid points
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.GRID_POINTS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_NUM_GTO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of Gaussian type functions for s, p, d, ...
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.NUM_GTO'))
+
+    x_cp2k_input_ATOM_AE_BASIS_NUM_SLATER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of Slater type functions for s, p, d, ...
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.NUM_SLATER'))
+
+    x_cp2k_input_ATOM_AE_BASIS_P_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for p functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.P_EXPONENTS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_P_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for p functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.P_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_QUADRATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Algorithm to construct the atomic radial grids
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.QUADRATURE'))
+
+    x_cp2k_input_ATOM_AE_BASIS_S_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for s functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.S_EXPONENTS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_S_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for s functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.S_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_AE_BASIS_START_INDEX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Starting index for Geometrical Basis sets
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.AE_BASIS.START_INDEX'))
+
+    x_cp2k_section_input_ATOM_AE_BASIS_BASIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_AE_BASIS_BASIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.AE_BASIS.BASIS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_EXTERNAL_VXC(MSection):
+    '''
+    Section used to specify exernal VXC Potentials.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.EXTERNAL_VXC'))
+
+    x_cp2k_input_ATOM_METHOD_EXTERNAL_VXC_FILE_VXC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the filename containing the external vxc
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.EXTERNAL_VXC.FILE_VXC'))
+
+    x_cp2k_input_ATOM_METHOD_EXTERNAL_VXC_GRID_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance in the equivalence of read-grid in ZMP method
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.EXTERNAL_VXC.GRID_TOL'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_ADIABATIC_RESCALING(MSection):
+    '''
+    Parameters for self interation corrected hybrid functionals
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.ADIABATIC_RESCALING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_ADIABATIC_RESCALING_FUNCTIONAL_MODEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which model for the coupling constant integration should be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.ADIABATIC_RESCALING.FUNCTIONAL_MODEL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_ADIABATIC_RESCALING_FUNCTIONAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which Hybrid functional should be used. (Has to be consistent with the definitions
+        in XC and HF).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.ADIABATIC_RESCALING.FUNCTIONAL_TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_ADIABATIC_RESCALING_LAMBDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The point to be used along the adiabatic curve (0 &#60; λ &#60; 1)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.ADIABATIC_RESCALING.LAMBDA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_ADIABATIC_RESCALING_OMEGA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Long-range parameter
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.ADIABATIC_RESCALING.OMEGA'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_HF_INFO(MSection):
+    '''
+    Controls the printing basic info about hf method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.HF_INFO'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HF_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HF_INFO.ADD_LAST'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HF_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HF_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HF_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HF_INFO.FILENAME'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HF_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HF_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HF_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HF_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_HFX_RI(MSection):
+    '''
+    All parameters needed in a HFX RI calculation
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.HFX_RI'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HFX_RI_EPS_OPTIMIZATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Accuracy of iterative RI fit
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HFX_RI.EPS_OPTIMIZATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HFX_RI_EPS_SCREENING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Accuracy of geminal integral evaluation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HFX_RI.EPS_SCREENING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_HFX_RI_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iteration in RI fit
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.HFX_RI.MAX_ITER'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL(MSection):
+    '''
+    Sets up interaction potential if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_CUTOFF_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines cutoff radius for the truncated 1/r potential. Only valid when doing
+        truncated calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.CUTOFF_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_OMEGA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameter for short/longrange interaction
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.OMEGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_POTENTIAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which interaction potential should be used (Coulomb, longrange or shortrange).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.POTENTIAL_TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_SCALE_COULOMB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scales Hartree-Fock contribution arising from a coulomb potential. Only valid when
+        doing a mixed potential calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.SCALE_COULOMB'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_SCALE_GAUSSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scales Hartree-Fock contribution arising from a gaussian potential. Only valid
+        when doing a mixed potential calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.SCALE_GAUSSIAN'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_SCALE_LONGRANGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scales Hartree-Fock contribution arising from a longrange potential. Only valid
+        when doing a mixed potential calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.SCALE_LONGRANGE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL_T_C_G_DATA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Location of the file t_c_g.dat that contains the data for the evaluation of the
+        truncated gamma function
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL.T_C_G_DATA'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_LOAD_BALANCE(MSection):
+    '''
+    Parameters influencing the load balancing of the HF
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.LOAD_BALANCE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_LOAD_BALANCE_BLOCK_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the blocking used for the atomic quartet loops. A proper choice can
+        speedup the calculation. The default (-1) is automatic.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.LOAD_BALANCE.BLOCK_SIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_LOAD_BALANCE_NBINS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of bins per process used to group atom quartets.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.LOAD_BALANCE.NBINS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_LOAD_BALANCE_RANDOMIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This flag controls the randomization of the bin assignment to processes. For
+        highly ordered input structures with a bad load balance, setting this flag to TRUE
+        might improve.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.LOAD_BALANCE.RANDOMIZE'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_MEMORY(MSection):
+    '''
+    Sets up memory parameters for the storage of the ERI's if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.MEMORY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_MEMORY_EPS_STORAGE_SCALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scaling factor to scale eps_schwarz. Storage threshold for compression will be
+        EPS_SCHWARZ*EPS_STORAGE_SCALING.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.MEMORY.EPS_STORAGE_SCALING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_MEMORY_MAX_DISK_SPACE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the maximum amount of disk space [MB] used to store precomputed compressed
+        four-center integrals. If 0, nothing is stored to disk
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.MEMORY.MAX_DISK_SPACE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_MEMORY_MAX_MEMORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the maximum amount of memory [MB] to be consumed by the full HFX module.
+        All temporary buffers and helper arrays are subtracted from this number. What
+        remains will be used for storage of integrals. NOTE: This number is assumed to
+        represent the memory available to one MPI process. When running a threaded
+        version, cp2k automatically takes care of distributing the memory among all the
+        threads within a process.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.MEMORY.MAX_MEMORY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_MEMORY_STORAGE_LOCATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Loaction where ERI's are stored if MAX_DISK_SPACE /=0 Expects a path to a
+        directory.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.MEMORY.STORAGE_LOCATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_MEMORY_TREAT_FORCES_IN_CORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines whether the derivative ERI's should be stored to RAM or not. Only
+        meaningful when performing Ehrenfest MD. Memory usage is defined via MAX_MEMORY,
+        i.e. the memory is shared wit the energy ERI's.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.MEMORY.TREAT_FORCES_IN_CORE'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_PERIODIC(MSection):
+    '''
+    Sets up periodic boundary condition parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.PERIODIC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_PERIODIC_NUMBER_OF_SHELLS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of shells taken into account for periodicity. By default, cp2k tries to
+        automatically evaluate this number. This algorithm might be to conservative,
+        resulting in some overhead. You can try to adjust this number in order to make a
+        calculation cheaper.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.PERIODIC.NUMBER_OF_SHELLS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF_SCREENING(MSection):
+    '''
+    Sets up screening parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.SCREENING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_SCREENING_EPS_SCHWARZ_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screens the near field part of the electronic repulsion integrals using the
+        Schwarz inequality for the given threshold. This will be approximately the
+        accuracy of the forces,  and should normally be similar to EPS_SCF
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.SCREENING.EPS_SCHWARZ_FORCES'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_SCREENING_EPS_SCHWARZ = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screens the near field part of the electronic repulsion integrals using the
+        Schwarz inequality for the given threshold.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.SCREENING.EPS_SCHWARZ'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_SCREENING_P_SCREEN_CORRECTION_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Recalculates integrals on the fly if the actual density matrix is larger by a
+        given factor than the initial one. If the factor is set to 0.0_dp, this feature is
+        disabled.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.SCREENING.P_SCREEN_CORRECTION_FACTOR'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_SCREENING_SCREEN_ON_INITIAL_P = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screen on an initial density matrix. For the first MD step this matrix must be
+        provided by a Restart File.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.SCREENING.SCREEN_ON_INITIAL_P'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_SCREENING_SCREEN_P_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screens the electronic repulsion integrals for the forces using the density
+        matrix. This results in a significant speedup for large systems, but might require
+        a somewhat tigher EPS_SCHWARZ_FORCES.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.SCREENING.SCREEN_P_FORCES'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_HF(MSection):
+    '''
+    Sets up the Hartree-Fock parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_FRACTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The fraction of Hartree-Fock to add to the total energy. 1.0 implies standard
+        Hartree-Fock if used with XC_FUNCTIONAL NONE. NOTE: In a mixed potential
+        calculation this should be set to 1.0, otherwise all parts are multiplied with
+        this factor.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.FRACTION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_PW_HFX_BLOCKSIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Improve the performance of pw_hfx at the cost of some additional memory by storing
+        the realspace representation of PW_HFX_BLOCKSIZE states.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.PW_HFX_BLOCKSIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_PW_HFX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Compute the Hartree-Fock energy also in the plane wave basis.The value is ignored,
+        and intended for debugging only.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.PW_HFX'))
+
+    x_cp2k_input_ATOM_METHOD_XC_HF_TREAT_LSD_IN_CORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines how spin denisities are taken into account. If true, the beta spin
+        density is included via a second in core call. If false, alpha and beta spins are
+        done in one shot
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.HF.TREAT_LSD_IN_CORE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_HF_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_HF_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.HF_INFO'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_HFX_RI = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_HFX_RI'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.HFX_RI'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_INTERACTION_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.INTERACTION_POTENTIAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_LOAD_BALANCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_LOAD_BALANCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.LOAD_BALANCE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_MEMORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_MEMORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.MEMORY'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_PERIODIC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_PERIODIC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.PERIODIC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF_SCREENING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF_SCREENING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF.SCREENING'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL(MSection):
+    '''
+    Information on the non local dispersion functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The cutoff of the FFT grid used in the calculation of the nonlocal vdW functional
+        [Ry].
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL.CUTOFF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL_KERNEL_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the kernel data file, may include a path.vdW_kernel_table.dat is for DRSLL
+        and LMKLL andrVV10_kernel_table.dat is for rVV10.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL.KERNEL_FILE_NAME'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameters b and C of the rVV10 functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL.PARAMETERS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of functional (the corresponding kernel data file should be selected).Allows
+        for common forms such as vdW-DF, vdW-DF2, optB88-vdW, rVV10.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL.TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL_VERBOSE_OUTPUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Extensive output for non local functionals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL.VERBOSE_OUTPUT'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD(MSection):
+    '''
+    Controls the printing of some info about DFTD contributions
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD.ADD_LAST'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD.FILENAME'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD.LOG_PRINT_KEY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL(MSection):
+    '''
+    Information on the pair potential to calculate dispersion
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_ATOM_COORDINATION_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the coordination number of a set of atoms for the C9 term in DFT-D3.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.ATOM_COORDINATION_NUMBERS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_ATOMPARM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies parameters for atom types (in atomic units). If not provided default
+        parameters are used (DFT-D2).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.ATOMPARM'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_CALCULATE_C9_TERM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculate C9 terms in DFT-D3 model
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.CALCULATE_C9_TERM'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_D3_SCALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        XC Functional dependent scaling parameters (s6,sr6,s8) for the DFT-D3 method, if
+        set to zero CP2K attempts to guess the xc functional from REFERENCE_FUNCTIONAL and
+        sets the associated scaling parameter.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.D3_SCALING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_D3BJ_SCALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        XC Functional dependent scaling parameters (s6,a1,s8,a2) for the DFT-D3(BJ)
+        method, if set to zero CP2K attempts to guess the xc functional from
+        REFERENCE_FUNCTIONAL and sets the associated scaling parameter.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.D3BJ_SCALING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_EPS_CN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cutoff value for coordination number function (DFT-D3 method)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.EPS_CN'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_EXP_PRE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Prefactor in exponential damping factor (DFT-D2 potential)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.EXP_PRE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_KIND_COORDINATION_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the coordination number for a kind for the C9 term in DFT-D3.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.KIND_COORDINATION_NUMBERS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_LONG_RANGE_CORRECTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculate a long range correction to the DFT-D3 model
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.LONG_RANGE_CORRECTION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PARAMETER_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the parameter file, may include a path
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PARAMETER_FILE_NAME'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_R_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Range of potential. The cutoff will be 2 times this value
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.R_CUTOFF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_REFERENCE_C9_TERM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculate C9 terms in DFT-D3 model using reference coordination numbers
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.REFERENCE_C9_TERM'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_REFERENCE_FUNCTIONAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use parameters for this specific density functional. For available D3 and D3(BJ)
+        parameters see: http://www.thch.uni-bonn.de/tc/downloads/DFT-D3/functionals.html,
+        http://www.thch.uni-bonn.de/tc/downloads/DFT-D3/functionalsbj.html
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.REFERENCE_FUNCTIONAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_SCALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        XC Functional dependent scaling parameter, if set to zero CP2K attempts to guess
+        the xc functional that is in use and sets the associated scaling parameter.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.SCALING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of potential
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_VERBOSE_OUTPUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Extensive output for the DFT-D2 and DFT-D3 models
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.VERBOSE_OUTPUT'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL_PRINT_DFTD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL.PRINT_DFTD'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL(MSection):
+    '''
+    This section combines all possible additional dispersion corrections to the normal XC
+    functionals. This can be more functionals or simple empirical pair potentials.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_VDW_POTENTIAL_POTENTIAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of dispersion/vdW functional or potential to use
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.VDW_POTENTIAL.POTENTIAL_TYPE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_NON_LOCAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL.NON_LOCAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL_PAIR_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL.PAIR_POTENTIAL'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_CPHF(MSection):
+    '''
+    Parameters influencing the solution of the Z-vector equations in MP2 gradients
+    calculations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.CPHF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_CPHF_EPS_CONV = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence threshold for the solution of the Z-vector equations. The Z-vector
+        equations have the form of a linear system of equations Ax=b, convergence is
+        achieved when |Ax-b|<=EPS_CONV.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.CPHF.EPS_CONV'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_CPHF_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iterations allowed for the solution of the Z-vector equations.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.CPHF.MAX_ITER'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_DIRECT_CANONICAL(MSection):
+    '''
+    Parameters influencing the direct canonical method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.DIRECT_CANONICAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_DIRECT_CANONICAL_BIG_SEND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Send big messages between processes (useful for >48 processors).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.DIRECT_CANONICAL.BIG_SEND'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_INTERACTION_POTENTIAL(MSection):
+    '''
+    Parameters the interaction potential in computing the biel integrals
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.INTERACTION_POTENTIAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_INTERACTION_POTENTIAL_POTENTIAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which interaction potential should be used (Coulomb, TShPSC operator).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.INTERACTION_POTENTIAL.POTENTIAL_TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_INTERACTION_POTENTIAL_TRUNCATION_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines truncation radius for the truncated TShPSC potential. Only valid when
+        doing truncated calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.INTERACTION_POTENTIAL.TRUNCATION_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_INTERACTION_POTENTIAL_TSHPSC_DATA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Location of the file TShPSC.dat that contains the data for the evaluation of the
+        TShPSC G0
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.INTERACTION_POTENTIAL.TSHPSC_DATA'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO(MSection):
+    '''
+    Controls the printing basic info about MP2 method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO.ADD_LAST'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO.FILENAME'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS(MSection):
+    '''
+    Parameters influencing the optimization of the RI MP2 basis. Only exponents of non-
+    contracted auxiliary basis can be optimized. An initial RI auxiliary basis has to be
+    specified.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS_BASIS_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the size of the auxiliary basis set automatically generated as initial
+        guess. This will be effective only if RI_AUX_BASIS_SET in the KIND section and
+        NUM_FUNC are not specified.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS.BASIS_SIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS_DELTA_I_REL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Target accuracy in the relative deviation of the amplitudes calculated with and
+        without RI approximation, (more details in Chem.Phys.Lett.294(1998)143).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS.DELTA_I_REL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS_DELTA_RI = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Target accuracy in the absolute difference between the RI-MP2 and the exact MP2
+        energy, DRI=ABS(E_MP2-E_RI-MP2).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS.DELTA_RI'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS_EPS_DERIV = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The derivatives of the MP2 energy with respect to the exponents of the basis are
+        calculated numerically. The change in the exponent a_i employed for the numerical
+        evaluation is defined as h_i=EPS_DERIV*a_i.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS.EPS_DERIV'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum number of steps in the RI basis optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS.MAX_ITER'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS_NUM_FUNC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the number of function, for each angular momentum (s, p, d ...),
+        employed in the automatically generated initial guess. This will be effective only
+        if RI_AUX_BASIS_SET in the KIND section is not specified.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS.NUM_FUNC'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_LAPLACE(MSection):
+    '''
+    Parameters influencing the RI-SOS-MP2-Laplace method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_LAPLACE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_LAPLACE_QUADRATURE_POINTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of quadrature points for the numerical integration in the RI-SOS-
+        MP2-Laplace method.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_LAPLACE.QUADRATURE_POINTS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_LAPLACE_SIZE_INTEG_GROUP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Group size for the integration in the Laplace method, that is the number of
+        processes involved in the computation of each integration point. SIZE_INTEG_GROUP
+        has to be a multiple of GROUP_SIZE in the WF_CORRELATION section. The default (-1)
+        is automatic.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_LAPLACE.SIZE_INTEG_GROUP'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_MP2(MSection):
+    '''
+    Parameters influencing the RI MP2 method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_MP2'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_MP2_BLOCK_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the blocking used for communication in RI-MP2. Larger BLOCK_SIZE
+        reduces communication but requires more memory. The default (-1) is automatic.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_MP2.BLOCK_SIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_MP2_EPS_CANONICAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Threshold for discriminate if a given ij pairs of the unrelaxed MP2 density matrix
+        has to be calculated with a canonical reformulation based on the occupied
+        eigenvalues differences.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_MP2.EPS_CANONICAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_MP2_FREE_HFX_BUFFER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Free the buffer containing the 4 center integrals used in the Hartree-Fock
+        exchange calculation. This will be effective only for gradients calculations,
+        since for the energy only case, the buffers are released by default. (Right now
+        debugging only).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_MP2.FREE_HFX_BUFFER'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO(MSection):
+    '''
+    Controls the printing basic info about hf method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO.ADD_LAST'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO.FILENAME'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HFX_RI(MSection):
+    '''
+    All parameters needed in a HFX RI calculation
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HFX_RI'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HFX_RI_EPS_OPTIMIZATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Accuracy of iterative RI fit
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HFX_RI.EPS_OPTIMIZATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HFX_RI_EPS_SCREENING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Accuracy of geminal integral evaluation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HFX_RI.EPS_SCREENING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HFX_RI_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iteration in RI fit
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HFX_RI.MAX_ITER'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL(MSection):
+    '''
+    Sets up interaction potential if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_CUTOFF_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines cutoff radius for the truncated 1/r potential. Only valid when doing
+        truncated calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.CUTOFF_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_OMEGA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameter for short/longrange interaction
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.OMEGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_POTENTIAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which interaction potential should be used (Coulomb, longrange or shortrange).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.POTENTIAL_TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_SCALE_COULOMB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scales Hartree-Fock contribution arising from a coulomb potential. Only valid when
+        doing a mixed potential calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.SCALE_COULOMB'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_SCALE_GAUSSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scales Hartree-Fock contribution arising from a gaussian potential. Only valid
+        when doing a mixed potential calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.SCALE_GAUSSIAN'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_SCALE_LONGRANGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scales Hartree-Fock contribution arising from a longrange potential. Only valid
+        when doing a mixed potential calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.SCALE_LONGRANGE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL_T_C_G_DATA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Location of the file t_c_g.dat that contains the data for the evaluation of the
+        truncated gamma function
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL.T_C_G_DATA'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_LOAD_BALANCE(MSection):
+    '''
+    Parameters influencing the load balancing of the HF
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.LOAD_BALANCE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_LOAD_BALANCE_BLOCK_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the blocking used for the atomic quartet loops. A proper choice can
+        speedup the calculation. The default (-1) is automatic.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.LOAD_BALANCE.BLOCK_SIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_LOAD_BALANCE_NBINS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of bins per process used to group atom quartets.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.LOAD_BALANCE.NBINS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_LOAD_BALANCE_RANDOMIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This flag controls the randomization of the bin assignment to processes. For
+        highly ordered input structures with a bad load balance, setting this flag to TRUE
+        might improve.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.LOAD_BALANCE.RANDOMIZE'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY(MSection):
+    '''
+    Sets up memory parameters for the storage of the ERI's if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY_EPS_STORAGE_SCALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scaling factor to scale eps_schwarz. Storage threshold for compression will be
+        EPS_SCHWARZ*EPS_STORAGE_SCALING.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY.EPS_STORAGE_SCALING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY_MAX_DISK_SPACE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the maximum amount of disk space [MB] used to store precomputed compressed
+        four-center integrals. If 0, nothing is stored to disk
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY.MAX_DISK_SPACE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY_MAX_MEMORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the maximum amount of memory [MB] to be consumed by the full HFX module.
+        All temporary buffers and helper arrays are subtracted from this number. What
+        remains will be used for storage of integrals. NOTE: This number is assumed to
+        represent the memory available to one MPI process. When running a threaded
+        version, cp2k automatically takes care of distributing the memory among all the
+        threads within a process.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY.MAX_MEMORY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY_STORAGE_LOCATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Loaction where ERI's are stored if MAX_DISK_SPACE /=0 Expects a path to a
+        directory.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY.STORAGE_LOCATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY_TREAT_FORCES_IN_CORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines whether the derivative ERI's should be stored to RAM or not. Only
+        meaningful when performing Ehrenfest MD. Memory usage is defined via MAX_MEMORY,
+        i.e. the memory is shared wit the energy ERI's.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY.TREAT_FORCES_IN_CORE'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_PERIODIC(MSection):
+    '''
+    Sets up periodic boundary condition parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.PERIODIC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_PERIODIC_NUMBER_OF_SHELLS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of shells taken into account for periodicity. By default, cp2k tries to
+        automatically evaluate this number. This algorithm might be to conservative,
+        resulting in some overhead. You can try to adjust this number in order to make a
+        calculation cheaper.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.PERIODIC.NUMBER_OF_SHELLS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING(MSection):
+    '''
+    Sets up screening parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING_EPS_SCHWARZ_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screens the near field part of the electronic repulsion integrals using the
+        Schwarz inequality for the given threshold. This will be approximately the
+        accuracy of the forces,  and should normally be similar to EPS_SCF
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING.EPS_SCHWARZ_FORCES'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING_EPS_SCHWARZ = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screens the near field part of the electronic repulsion integrals using the
+        Schwarz inequality for the given threshold.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING.EPS_SCHWARZ'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING_P_SCREEN_CORRECTION_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Recalculates integrals on the fly if the actual density matrix is larger by a
+        given factor than the initial one. If the factor is set to 0.0_dp, this feature is
+        disabled.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING.P_SCREEN_CORRECTION_FACTOR'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING_SCREEN_ON_INITIAL_P = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screen on an initial density matrix. For the first MD step this matrix must be
+        provided by a Restart File.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING.SCREEN_ON_INITIAL_P'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING_SCREEN_P_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Screens the electronic repulsion integrals for the forces using the density
+        matrix. This results in a significant speedup for large systems, but might require
+        a somewhat tigher EPS_SCHWARZ_FORCES.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING.SCREEN_P_FORCES'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF(MSection):
+    '''
+    Sets up the Hartree-Fock parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_FRACTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The fraction of Hartree-Fock to add to the total energy. 1.0 implies standard
+        Hartree-Fock if used with XC_FUNCTIONAL NONE. NOTE: In a mixed potential
+        calculation this should be set to 1.0, otherwise all parts are multiplied with
+        this factor.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.FRACTION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_PW_HFX_BLOCKSIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Improve the performance of pw_hfx at the cost of some additional memory by storing
+        the realspace representation of PW_HFX_BLOCKSIZE states.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.PW_HFX_BLOCKSIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_PW_HFX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Compute the Hartree-Fock energy also in the plane wave basis.The value is ignored,
+        and intended for debugging only.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.PW_HFX'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_TREAT_LSD_IN_CORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines how spin denisities are taken into account. If true, the beta spin
+        density is included via a second in core call. If false, alpha and beta spins are
+        done in one shot
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.TREAT_LSD_IN_CORE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HF_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HF_INFO'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HFX_RI = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_HFX_RI'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.HFX_RI'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_INTERACTION_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.INTERACTION_POTENTIAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_LOAD_BALANCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_LOAD_BALANCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.LOAD_BALANCE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_MEMORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.MEMORY'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_PERIODIC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_PERIODIC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.PERIODIC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF_SCREENING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF.SCREENING'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA(MSection):
+    '''
+    Parameters influencing the RI RPA method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_MINIMAX_QUADRATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use the Minimax quadrature scheme for performing the numerical integration.
+        Maximum number of quadrature point limited to 20.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.MINIMAX_QUADRATURE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_MM_STYLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Matrix multiplication style for the Q matrix.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.MM_STYLE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_QUADRATURE_POINTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of quadrature points for the numerical integration in the RI-RPA method.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.QUADRATURE_POINTS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_SIZE_FREQ_INTEG_GROUP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Group size for frequency integration, that is the number of processes involved in
+        the computation of each integration point. SIZE_FREQ_INTEG_GROUP has to be a
+        multiple of GROUP_SIZE in the WF_CORRELATION section. The default (-1) is
+        automatic.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.SIZE_FREQ_INTEG_GROUP'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA_HF'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA.HF'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW(MSection):
+    '''
+    Parameters for the GPW approach in Wavefunction-based Correlation methods
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The cutoff of the finest grid level in the MP2 gpw integration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW.CUTOFF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW_EPS_FILTER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines a threshold for the DBCSR based multiply (usually 10 times smaller than
+        EPS_GRID).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW.EPS_FILTER'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW_EPS_GRID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines a threshold for the GPW based integration
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW.EPS_GRID'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW_PRINT_LEVEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How much output is written by the individual groups.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW.PRINT_LEVEL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW_REL_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the grid at which a Gaussian is mapped.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW.REL_CUTOFF'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION(MSection):
+    '''
+    Sets up the Wavefunction-based Correlation parameters if requested
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_CALC_COND_NUM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculate the condition number of the (P|Q) matrix for the RI methods.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.CALC_COND_NUM'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_COL_BLOCK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of the column block used in the SCALAPACK block cyclic data
+        distribution.Default is (COL_BLOCK=-1) is automatic. A proper choice can speedup
+        the parallel matrix multiplication in the case of RI-RPA and RI-SOS-MP2-Laplace.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.COL_BLOCK'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_GROUP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Group size used in the computation of the integrals. Default is to use all
+        processors (GROUP_SIZE=-1).A smaller group size (for example the node size), might
+        a better choice if the actual MP2 time is large compared to integral computation
+        time. This is usually the case if the total number of processors is not too large.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.GROUP_SIZE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_MEMORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum allowed total memory usage during MP2 methods [Mb].
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.MEMORY'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which method should be used to compute the MP2 energy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.METHOD'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_ROW_BLOCK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of the row block used in the SCALAPACK block cyclic data distribution.Default
+        is (ROW_BLOCK=-1) is automatic. A proper choice can speedup the parallel matrix
+        multiplication in the case of RI-RPA and RI-SOS-MP2-Laplace.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.ROW_BLOCK'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_SCALE_S = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scaling factor of the singlet energy component (opposite spin, OS).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.SCALE_S'))
+
+    x_cp2k_input_ATOM_METHOD_XC_WF_CORRELATION_SCALE_T = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scaling factor of the triplet energy component (same spin, SS).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.WF_CORRELATION.SCALE_T'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_CPHF = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_CPHF'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.CPHF'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_DIRECT_CANONICAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_DIRECT_CANONICAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.DIRECT_CANONICAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_INTERACTION_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_INTERACTION_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.INTERACTION_POTENTIAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_MP2_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.MP2_INFO'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_OPT_RI_BASIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.OPT_RI_BASIS'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_LAPLACE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_LAPLACE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_LAPLACE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_MP2 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_MP2'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_MP2'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_RI_RPA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.RI_RPA'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION_WFC_GPW'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION.WFC_GPW'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC(MSection):
+    '''
+    Uses the Becke 88 longrange exchange functional in an adiabatic fashion
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR_ADIABATIC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC_LAMBDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the parameter of the adiabatic curve
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR_ADIABATIC.LAMBDA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC_OMEGA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Potential parameter in erf(omega*r)/r
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR_ADIABATIC.OMEGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR_ADIABATIC.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR_ADIABATIC.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR(MSection):
+    '''
+    Uses the Becke 88 longrange exchange functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_OMEGA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Potential parameter in erf(omega*r)/r
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR.OMEGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88(MSection):
+    '''
+    Uses the Becke 88 exchange functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97(MSection):
+    '''
+    Uses the Becke 97 exchange correlation functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE97'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97_PARAMETRIZATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        switches between the B97 and Grimme parametrization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE97.PARAMETRIZATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE97.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional, if -1 the default for the given
+        parametrization is used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE97.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE97.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL(MSection):
+    '''
+    Becke Roussel exchange hole model. Can be usedas long range correction with a
+    truncated coulomb potential
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE_ROUSSEL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL_CUTOFF_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the cutoff radius for the truncation. If put to zero, the standard full
+        range potential will be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE_ROUSSEL.CUTOFF_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameter in the exchange hole. Usually this is put to 1.0 or 0.8
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE_ROUSSEL.GAMMA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE_ROUSSEL.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE_ROUSSEL.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BEEF(MSection):
+    '''
+    Uses the BEEFvdW exchange functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BEEF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BEEF_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BEEF.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BEEF_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BEEF.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_CS1(MSection):
+    '''
+    Uses the CS1 functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.CS1'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_CS1_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.CS1.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09(MSection):
+    '''
+    Combination of three different exchange hole models
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.GV09'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09_CUTOFF_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines cutoff for lower integration boundary
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.GV09.CUTOFF_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameter for Becke Roussel hole
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.GV09.GAMMA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.GV09.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.GV09.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_HCTH(MSection):
+    '''
+    Uses the HCTH class of functionals
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.HCTH'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_HCTH_PARAMETER_SET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which version of the parameters should be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.HCTH.PARAMETER_SET'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_HCTH_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.HCTH.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_GGA(MSection):
+    '''
+    Uses one of the KE_GGA functionals (optimized versions of some of these functionals
+    might be available outside this section). These functionals are needed for the
+    computation of the kinetic energy in the Kim-Gordon method.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_GGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_GGA_FUNCTIONAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which one of the KE_GGA functionals should be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_GGA.FUNCTIONAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_GGA_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_GGA.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC(MSection):
+    '''
+    To be used for KG runs. Uses kinetic energy functionals from LIBXC, see also
+    http://www.tddft.org/programs/octopus/wiki/index.php/Libxc
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_LIBXC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC_FUNCTIONAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        names of the functionals, see also
+        http://www.tddft.org/programs/octopus/wiki/index.php/Libxc:manual .The precise
+        list of available functionals depends on the version of libxc interfaced
+        (currently 2.0.1).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_LIBXC.FUNCTIONAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        parameters of the functionals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_LIBXC.PARAMETERS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scaling factors of the functionals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_LIBXC.SCALE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_LIBXC.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LDA_HOLE_T_C_LR(MSection):
+    '''
+    LDA exchange hole model in truncated coulomb potential
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LDA_HOLE_T_C_LR'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LDA_HOLE_T_C_LR_CUTOFF_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines cutoff for lower integration boundary
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LDA_HOLE_T_C_LR.CUTOFF_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LDA_HOLE_T_C_LR_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LDA_HOLE_T_C_LR.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LDA_HOLE_T_C_LR_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LDA_HOLE_T_C_LR.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC(MSection):
+    '''
+    Uses functionals from LIBXC, see also
+    http://www.tddft.org/programs/octopus/wiki/index.php/Libxc
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LIBXC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC_FUNCTIONAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        names of the functionals, see also
+        http://www.tddft.org/programs/octopus/wiki/index.php/Libxc:manual .The precise
+        list of available functionals depends on the version of libxc interfaced
+        (currently 2.0.1).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LIBXC.FUNCTIONAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        parameters of the functionals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LIBXC.PARAMETERS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scaling factors of the functionals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LIBXC.SCALE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LIBXC.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_ADIABATIC(MSection):
+    '''
+    Uses the LYP correlation functional in an adiabatic fashion
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP_ADIABATIC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_ADIABATIC_LAMBDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the parameter of the adiabatic curve.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP_ADIABATIC.LAMBDA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_ADIABATIC_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP_ADIABATIC.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP(MSection):
+    '''
+    Uses the LYP functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_OPTX(MSection):
+    '''
+    Uses the OPTX functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.OPTX'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_OPTX_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.OPTX.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_OPTX_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.OPTX.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_P86C(MSection):
+    '''
+    Uses the P86C functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.P86C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_P86C_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.P86C.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_P86C_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.P86C.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PADE(MSection):
+    '''
+    Uses the PADE functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PADE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PADE_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PADE.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_HOLE_T_C_LR(MSection):
+    '''
+    PBE exchange hole model in trucanted coulomb potential
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE_HOLE_T_C_LR'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_HOLE_T_C_LR_CUTOFF_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines cutoff for lower integration boundary
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE_HOLE_T_C_LR.CUTOFF_RADIUS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_HOLE_T_C_LR_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE_HOLE_T_C_LR.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_HOLE_T_C_LR_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE_HOLE_T_C_LR.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE(MSection):
+    '''
+    Uses the PBE functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_PARAMETRIZATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        switches between the different parametrizations of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE.PARAMETRIZATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PW92(MSection):
+    '''
+    Uses the PerdewWang correlation functional.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PW92'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PW92_PARAMETRIZATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which one of parametrizations should be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PW92.PARAMETRIZATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PW92_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Scaling of the energy functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PW92.SCALE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PW92_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PW92.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PZ81(MSection):
+    '''
+    Uses the PZ functional.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PZ81'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PZ81_PARAMETRIZATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which one of parametrizations should be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PZ81.PARAMETRIZATION'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PZ81_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PZ81.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PZ81_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PZ81.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TFW(MSection):
+    '''
+    Uses the TFW functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TFW'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TFW_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TFW.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TF(MSection):
+    '''
+    Uses the TF functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TF_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TF.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TPSS(MSection):
+    '''
+    Uses the TPSS functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TPSS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TPSS_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TPSS.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TPSS_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TPSS.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TPSS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TPSS.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_VWN(MSection):
+    '''
+    Uses the VWN functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.VWN'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_VWN_FUNCTIONAL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which version of the VWN functional should be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.VWN.FUNCTIONAL_TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_VWN_SCALE_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the correlation part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.VWN.SCALE_C'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_VWN_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.VWN.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XALPHA(MSection):
+    '''
+    Uses the XALPHA (SLATER) functional.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XALPHA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XALPHA_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XALPHA.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XALPHA_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XALPHA.SECTION_PARAMETERS'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XALPHA_XA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the xa parameter (this does not change the exponent, just the mixing)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XALPHA.XA'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XGGA(MSection):
+    '''
+    Uses one of the XGGA functionals (optimized versions of some of these functionals
+    might be available outside this section).
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XGGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XGGA_FUNCTIONAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which one of the XGGA functionals should be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XGGA.FUNCTIONAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XGGA_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XGGA.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE(MSection):
+    '''
+    Uses the short range PBE functional
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XWPBE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE_OMEGA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        screening parameter
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XWPBE.OMEGA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE_SCALE_X0 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the original hole PBE-functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XWPBE.SCALE_X0'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE_SCALE_X = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scales the exchange part of the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XWPBE.SCALE_X'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        activates the functional
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XWPBE.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL(MSection):
+    '''
+    The xc functional to use
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_FUNCTIONAL_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Shortcut for the most common functional combinations.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_FUNCTIONAL.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR_ADIABATIC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR_ADIABATIC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88_LR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88_LR'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE88'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE88'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE97'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE97'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BECKE_ROUSSEL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BECKE_ROUSSEL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BEEF = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_BEEF'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.BEEF'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_CS1 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_CS1'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.CS1'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_GV09'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.GV09'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_HCTH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_HCTH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.HCTH'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_GGA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_GGA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_GGA'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_KE_LIBXC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.KE_LIBXC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LDA_HOLE_T_C_LR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LDA_HOLE_T_C_LR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LDA_HOLE_T_C_LR'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LIBXC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LIBXC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_ADIABATIC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP_ADIABATIC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP_ADIABATIC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_LYP'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.LYP'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_OPTX = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_OPTX'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.OPTX'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_P86C = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_P86C'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.P86C'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PADE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PADE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PADE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_HOLE_T_C_LR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE_HOLE_T_C_LR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE_HOLE_T_C_LR'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PBE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PBE'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PW92 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PW92'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PW92'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PZ81 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_PZ81'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.PZ81'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TFW = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TFW'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TFW'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TF = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TF'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TF'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TPSS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_TPSS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.TPSS'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_VWN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_VWN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.VWN'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XALPHA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XALPHA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XALPHA'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XGGA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XGGA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XGGA'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL_XWPBE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL.XWPBE'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_GRID(MSection):
+    '''
+    The xc parameters used when calculating the xc on the grid
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_GRID'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_GRID_USE_FINER_GRID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a finer grid only to calculate the xc
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_GRID.USE_FINER_GRID'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_GRID_XC_DERIV = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The method used to compute the derivatives
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_GRID.XC_DERIV'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_GRID_XC_SMOOTH_RHO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The density smoothing used for the xc calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_GRID.XC_SMOOTH_RHO'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_POTENTIAL_SAOP(MSection):
+    '''
+    Uses the SAOP potential
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_POTENTIAL.SAOP'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_POTENTIAL_SAOP_ALPHA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the alpha parameter (default = 1.19).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_POTENTIAL.SAOP.ALPHA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_POTENTIAL_SAOP_BETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the beta parameter (default = 0.01).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_POTENTIAL.SAOP.BETA'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_POTENTIAL_SAOP_K_RHO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the K_rho parameter (default = 0.42).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_POTENTIAL.SAOP.K_RHO'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC_XC_POTENTIAL(MSection):
+    '''
+    The xc potential to use (CAREFUL: xc potential here refers to potentials that are not
+    derived from an xc functional, but rather are modelled directly. Therefore there is no
+    consistent xc energy available. To still get an energy expression, see ENERGY below
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_POTENTIAL'))
+
+    x_cp2k_input_ATOM_METHOD_XC_XC_POTENTIAL_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How to determine the total energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.XC_POTENTIAL.ENERGY'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_POTENTIAL_SAOP = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_POTENTIAL_SAOP'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_POTENTIAL.SAOP'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_XC(MSection):
+    '''
+    parameters needed calculate the xc potential
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC'))
+
+    x_cp2k_input_ATOM_METHOD_XC_DENSITY_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The cutoff on the density used by the xc calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.DENSITY_CUTOFF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_DENSITY_SMOOTH_CUTOFF_RANGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameter for the smoothing procedure inxc calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.DENSITY_SMOOTH_CUTOFF_RANGE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_FUNCTIONAL_ROUTINE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Select the code for xc calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.FUNCTIONAL_ROUTINE'))
+
+    x_cp2k_input_ATOM_METHOD_XC_GRADIENT_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The cutoff on the gradient of the density used by the xc calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.GRADIENT_CUTOFF'))
+
+    x_cp2k_input_ATOM_METHOD_XC_TAU_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The cutoff on tau used by the xc calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.XC.TAU_CUTOFF'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_ADIABATIC_RESCALING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_ADIABATIC_RESCALING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.ADIABATIC_RESCALING'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_HF = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_HF'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.HF'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_VDW_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.VDW_POTENTIAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_WF_CORRELATION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.WF_CORRELATION'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_FUNCTIONAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_FUNCTIONAL'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_GRID = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_GRID'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_GRID'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC_XC_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC_XC_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC.XC_POTENTIAL'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_ZMP_RESTART(MSection):
+    '''
+    Section used to specify the restart option in the ZMPprocedure, and the file that must
+    be read.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.ZMP.RESTART'))
+
+    x_cp2k_input_ATOM_METHOD_ZMP_RESTART_FILE_RESTART = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the filename containing the restart file density
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.ZMP.RESTART.FILE_RESTART'))
+
+
+class x_cp2k_section_input_ATOM_METHOD_ZMP(MSection):
+    '''
+    Section used to specify ZMP Potentials.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.ZMP'))
+
+    x_cp2k_input_ATOM_METHOD_ZMP_DM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        read external density from density matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.ZMP.DM'))
+
+    x_cp2k_input_ATOM_METHOD_ZMP_FILE_DENSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the filename containing the target density
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.ZMP.FILE_DENSITY'))
+
+    x_cp2k_input_ATOM_METHOD_ZMP_GRID_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance in the equivalence of read-grid in ZMP method
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.ZMP.GRID_TOL'))
+
+    x_cp2k_input_ATOM_METHOD_ZMP_LAMBDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parameter used for the constraint in ZMP method
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.ZMP.LAMBDA'))
+
+    x_cp2k_section_input_ATOM_METHOD_ZMP_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_ZMP_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.ZMP.RESTART'))
+
+
+class x_cp2k_section_input_ATOM_METHOD(MSection):
+    '''
+    Section of information on method to use.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD'))
+
+    x_cp2k_input_ATOM_METHOD_METHOD_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of electronic structure method to be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.METHOD_TYPE'))
+
+    x_cp2k_input_ATOM_METHOD_RELATIVISTIC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of scalar relativistic method to be used
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.METHOD.RELATIVISTIC'))
+
+    x_cp2k_section_input_ATOM_METHOD_EXTERNAL_VXC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_EXTERNAL_VXC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.EXTERNAL_VXC'))
+
+    x_cp2k_section_input_ATOM_METHOD_XC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_XC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.XC'))
+
+    x_cp2k_section_input_ATOM_METHOD_ZMP = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD_ZMP'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD.ZMP'))
+
+
+class x_cp2k_section_input_ATOM_OPTIMIZATION(MSection):
+    '''
+    Section of information on optimization thresholds and algorithms.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.OPTIMIZATION'))
+
+    x_cp2k_input_ATOM_OPTIMIZATION_DAMPING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Damping parameter for extrapolation method
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.OPTIMIZATION.DAMPING'))
+
+    x_cp2k_input_ATOM_OPTIMIZATION_EPS_DIIS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Starting DIIS method at convergence to EPS_DIIS
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.OPTIMIZATION.EPS_DIIS'))
+
+    x_cp2k_input_ATOM_OPTIMIZATION_EPS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterion for SCF
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.OPTIMIZATION.EPS_SCF'))
+
+    x_cp2k_input_ATOM_OPTIMIZATION_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iterations for optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.OPTIMIZATION.MAX_ITER'))
+
+    x_cp2k_input_ATOM_OPTIMIZATION_N_DIIS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of DIIS vectors
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.OPTIMIZATION.N_DIIS'))
+
+
+class x_cp2k_section_input_ATOM_POTENTIAL_GTH_POTENTIAL(MSection):
+    '''
+    Section used to specify Potentials.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.POTENTIAL.GTH_POTENTIAL'))
+
+    x_cp2k_input_ATOM_POTENTIAL_GTH_POTENTIAL_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CP2K Pseudo Potential Standard Format (GTH, ALL or KG)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POTENTIAL.GTH_POTENTIAL.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_ATOM_POTENTIAL(MSection):
+    '''
+    Section of information on potential.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.POTENTIAL'))
+
+    x_cp2k_input_ATOM_POTENTIAL_CONFINEMENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Definition of confinement potential
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POTENTIAL.CONFINEMENT'))
+
+    x_cp2k_input_ATOM_POTENTIAL_POTENTIAL_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the pseudo potential file, may include a path
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POTENTIAL.POTENTIAL_FILE_NAME'))
+
+    x_cp2k_input_ATOM_POTENTIAL_POTENTIAL_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The name of the pseudopotential for the defined kind.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POTENTIAL.POTENTIAL_NAME'))
+
+    x_cp2k_input_ATOM_POTENTIAL_PSEUDO_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Pseudopotential type
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POTENTIAL.PSEUDO_TYPE'))
+
+    x_cp2k_section_input_ATOM_POTENTIAL_GTH_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_POTENTIAL_GTH_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.POTENTIAL.GTH_POTENTIAL'))
+
+
+class x_cp2k_section_input_ATOM_POWELL(MSection):
+    '''
+    Section defines basic parameters for Powell optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.POWELL'))
+
+    x_cp2k_input_ATOM_POWELL_ACCURACY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Final accuracy requested in optimization (RHOEND)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.ACCURACY'))
+
+    x_cp2k_input_ATOM_POWELL_MAX_FUN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of function evaluations
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.MAX_FUN'))
+
+    x_cp2k_input_ATOM_POWELL_RCOV_MULTIPLICATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Multiply Rcov integration limit for charge conservation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.RCOV_MULTIPLICATION'))
+
+    x_cp2k_input_ATOM_POWELL_STEP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size for search algorithm (RHOBEG)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.STEP_SIZE'))
+
+    x_cp2k_input_ATOM_POWELL_TARGET_POT_SEMICORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Target accuracy for semicore state eigenvalues in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.TARGET_POT_SEMICORE'))
+
+    x_cp2k_input_ATOM_POWELL_TARGET_POT_VALENCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Target accuracy for valence state eigenvalues in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.TARGET_POT_VALENCE'))
+
+    x_cp2k_input_ATOM_POWELL_TARGET_POT_VIRTUAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Target accuracy for virtual state eigenvalues in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.TARGET_POT_VIRTUAL'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_ELECTRON_CONFIGURATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for different electronic states in optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_ELECTRON_CONFIGURATION'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for different methods in optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_METHOD'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_POT_NODE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for node mismatch in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_POT_NODE'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_POT_SEMICORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for semi core states in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_POT_SEMICORE'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_POT_VALENCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for valence states in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_POT_VALENCE'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_POT_VIRTUAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for virtual states in pseudopotential optimization
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_POT_VIRTUAL'))
+
+    x_cp2k_input_ATOM_POWELL_WEIGHT_PSIR0 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight for the wavefunctions at r=0 (only occupied states)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.POWELL.WEIGHT_PSIR0'))
+
+
+class x_cp2k_section_input_ATOM_PP_BASIS_BASIS(MSection):
+    '''
+    Section used to specify a general basis set for QM calculations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.PP_BASIS.BASIS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_BASIS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CP2K Basis Set Standard Format
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.BASIS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_ATOM_PP_BASIS(MSection):
+    '''
+    Section of basis set information for pseudopotential calculations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.PP_BASIS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_BASIS_SET_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the basis set file, may include a path
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.BASIS_SET_FILE_NAME'))
+
+    x_cp2k_input_ATOM_PP_BASIS_BASIS_SET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The contracted Gaussian basis set
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.BASIS_SET'))
+
+    x_cp2k_input_ATOM_PP_BASIS_BASIS_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Basis set type
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.BASIS_TYPE'))
+
+    x_cp2k_input_ATOM_PP_BASIS_D_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for d functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.D_EXPONENTS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_D_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for d functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.D_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_EPS_EIGENVALUE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cutoff of overlap matrix eigenvalues included into basis
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.EPS_EIGENVALUE'))
+
+    x_cp2k_input_ATOM_PP_BASIS_F_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for f functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.F_EXPONENTS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_F_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for f functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.F_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_GEO_START_VALUE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Geometrical basis: starting value a in a*C^k
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.GEO_START_VALUE'))
+
+    x_cp2k_input_ATOM_PP_BASIS_GEOMETRICAL_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Geometrical basis: factor C in a*C^k
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.GEOMETRICAL_FACTOR'))
+
+    x_cp2k_input_ATOM_PP_BASIS_GRID_POINTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of radial grid points
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.GRID_POINTS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_NUM_GTO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of Gaussian type functions for s, p, d, ...
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.NUM_GTO'))
+
+    x_cp2k_input_ATOM_PP_BASIS_NUM_SLATER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of Slater type functions for s, p, d, ...
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.NUM_SLATER'))
+
+    x_cp2k_input_ATOM_PP_BASIS_P_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for p functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.P_EXPONENTS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_P_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for p functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.P_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_QUADRATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Algorithm to construct the atomic radial grids
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.QUADRATURE'))
+
+    x_cp2k_input_ATOM_PP_BASIS_S_EXPONENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponents for s functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.S_EXPONENTS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_S_QUANTUM_NUMBERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Main quantum numbers for s functions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.S_QUANTUM_NUMBERS'))
+
+    x_cp2k_input_ATOM_PP_BASIS_START_INDEX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Starting index for Geometrical Basis sets
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.PP_BASIS.START_INDEX'))
+
+    x_cp2k_section_input_ATOM_PP_BASIS_BASIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_PP_BASIS_BASIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.PP_BASIS.BASIS'))
+
+
+class x_cp2k_section_input_ATOM(MSection):
+    '''
+    Section handling input for atomic calculations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM'))
+
+    x_cp2k_input_ATOM_ATOMIC_NUMBER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the atomic number
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.ATOMIC_NUMBER'))
+
+    x_cp2k_input_ATOM_CALCULATE_STATES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the number of states calculated per l value
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.CALCULATE_STATES'))
+
+    x_cp2k_input_ATOM_CORE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the core electrons for a pseudopotential
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.CORE'))
+
+    x_cp2k_input_ATOM_COULOMB_INTEGRALS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Method to calculate Coulomb integrals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.COULOMB_INTEGRALS'))
+
+    x_cp2k_input_ATOM_ELECTRON_CONFIGURATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the electron configuration. Optional the multiplicity (m) and a core
+        state [XX] can be declared
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.ELECTRON_CONFIGURATION'))
+
+    x_cp2k_input_ATOM_ELEMENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the element to be calculated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.ELEMENT'))
+
+    x_cp2k_input_ATOM_EXCHANGE_INTEGRALS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Method to calculate Exchange integrals
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.EXCHANGE_INTEGRALS'))
+
+    x_cp2k_input_ATOM_MAX_ANGULAR_MOMENTUM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the largest angular momentum calculated [0-3]
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.MAX_ANGULAR_MOMENTUM'))
+
+    x_cp2k_input_ATOM_RUN_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of run that you want to perform
+        [ENERGY,BASIS_OPTIMIZATION,PSEUDOPOTENTIAL_OPTIMIZATION,,...]
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_ATOM.RUN_TYPE'))
+
+    x_cp2k_section_input_ATOM_AE_BASIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_AE_BASIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.AE_BASIS'))
+
+    x_cp2k_section_input_ATOM_METHOD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_METHOD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.METHOD'))
+
+    x_cp2k_section_input_ATOM_OPTIMIZATION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_OPTIMIZATION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.OPTIMIZATION'))
+
+    x_cp2k_section_input_ATOM_POTENTIAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_POTENTIAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.POTENTIAL'))
+
+    x_cp2k_section_input_ATOM_POWELL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_POWELL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.POWELL'))
+
+    x_cp2k_section_input_ATOM_PP_BASIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM_PP_BASIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM.PP_BASIS'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_ATOM = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_ATOM'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_ATOM'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,159 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_debug_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_debug.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_DEBUG_PROGRAM_RUN_INFO(MSection):
+    '''
+    Controls the printing of the DEBUG specific output
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_DEBUG.PROGRAM_RUN_INFO'))
+
+    x_cp2k_input_DEBUG_PROGRAM_RUN_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.PROGRAM_RUN_INFO.ADD_LAST'))
+
+    x_cp2k_input_DEBUG_PROGRAM_RUN_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.PROGRAM_RUN_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_DEBUG_PROGRAM_RUN_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.PROGRAM_RUN_INFO.FILENAME'))
+
+    x_cp2k_input_DEBUG_PROGRAM_RUN_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.PROGRAM_RUN_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_DEBUG_PROGRAM_RUN_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.PROGRAM_RUN_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_DEBUG(MSection):
+    '''
+    Section to setup parameters for debug runs.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_DEBUG'))
+
+    x_cp2k_input_DEBUG_DEBUG_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Activates the debugging of the atomic forces
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.DEBUG_FORCES'))
+
+    x_cp2k_input_DEBUG_DEBUG_STRESS_TENSOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Activates the debugging of the stress tensor
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.DEBUG_STRESS_TENSOR'))
+
+    x_cp2k_input_DEBUG_DX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Increment for the calculation of the numerical derivatives
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.DX'))
+
+    x_cp2k_input_DEBUG_EPS_NO_ERROR_CHECK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The mismatch between the numerical and the analytical value is not checked for
+        analytical values smaller than this threshold value
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.EPS_NO_ERROR_CHECK'))
+
+    x_cp2k_input_DEBUG_STOP_ON_MISMATCH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Stop the debug run when a mismatch between the numerical and the analytical value
+        is detected
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_DEBUG.STOP_ON_MISMATCH'))
+
+    x_cp2k_section_input_DEBUG_PROGRAM_RUN_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_DEBUG_PROGRAM_RUN_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_DEBUG.PROGRAM_RUN_INFO'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_DEBUG = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_DEBUG'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_DEBUG'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,351 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_ext_restart_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_ext_restart.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_EXT_RESTART(MSection):
+    '''
+    Section for external restart, specifies an external input file where to take
+    positions,...
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_EXT_RESTART'))
+
+    x_cp2k_input_EXT_RESTART_BINARY_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of an additional restart file from which selected input
+        sections are read in binary format (see SPLIT_RESTART_FILE).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.BINARY_RESTART_FILE_NAME'))
+
+    x_cp2k_input_EXT_RESTART_CUSTOM_PATH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the given path from the EXTERNAL file. Allows a major flexibility for
+        restarts.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.CUSTOM_PATH'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_AVERAGES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts information for AVERAGES.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_AVERAGES'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts positions and velocities of the Band.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_BAND'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_BAROSTAT_THERMOSTAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the barostat thermostat from the external file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_BAROSTAT_THERMOSTAT'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_BAROSTAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the barostat from the external file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_BAROSTAT'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts information for BSSE calculations.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_BSSE'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_CELL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the cell (and cell_ref) from the EXTERNAL file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_CELL'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_CONSTRAINT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts constraint section. It's necessary when doing restraint calculation to
+        have a perfect energy conservation. For constraints only it's use is optional.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_CONSTRAINT'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_CORE_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Takes the positions of the cores from the external file (only if shell-model)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_CORE_POS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_CORE_VELOCITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Takes the velocities of the shells from the external file (only if shell-model)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_CORE_VELOCITY'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_COUNTERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the counters in MD schemes
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_COUNTERS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_DEFAULT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword controls the default value for all possible  restartable keywords,
+        unless explicitly defined. For example setting this keyword to .FALSE. does not
+        restart any quantity. If, at the  same time, one keyword is set to .TRUE. only
+        that quantity will be restarted.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_DEFAULT'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_DIMER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts information for DIMER geometry optimizations.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_DIMER'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of restart file (or any other input file) to be read. Only
+        fields relevant to a restart will be used (unless switched off with the keywords
+        in this section)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_FILE_NAME'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_HELIUM_DENSITIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts helium density distributions from PINT%HELIUM%RHO.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_HELIUM_DENSITIES'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_HELIUM_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart helium forces exerted on the solute from PINT%HELIUM%FORCE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_HELIUM_FORCE'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_HELIUM_PERMUTATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart helium permutation state from PINT%HELIUM%PERM.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_HELIUM_PERMUTATION'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_HELIUM_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart helium positions from PINT%HELIUM%COORD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_HELIUM_POS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_HELIUM_RNG = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts helium random number generators from PINT%HELIUM%RNG_STATE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_HELIUM_RNG'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts hills from a previous metadynamics run from the EXTERNAL file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_METADYNAMICS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_OPTIMIZE_INPUT_VARIABLES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart with the optimize input variables
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_OPTIMIZE_INPUT_VARIABLES'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_PINT_GLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart GLE thermostat for beads from PINT%GLE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_PINT_GLE'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_PINT_NOSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart Nose thermostat for beads from PINT%NOSE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_PINT_NOSE'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_PINT_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart bead positions from PINT%BEADS%COORD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_PINT_POS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_PINT_VEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart bead velocities from PINT%BEADS%VELOCITY.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_PINT_VEL'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Takes the positions from the external file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_POS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_QMMM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the following specific QMMM info: translation vectors.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_QMMM'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_RANDOMG = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the random number generator from the external file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_RANDOMG'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_RTP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts information for REAL TIME PROPAGATION and EHRENFEST DYNAMICS.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_RTP'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_SHELL_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Takes the positions of the shells from the external file (only if shell-model)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_SHELL_POS'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_SHELL_THERMOSTAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the shell thermostat from the external file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_SHELL_THERMOSTAT'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_SHELL_VELOCITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Takes the velocities of the shells from the external file (only if shell-model)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_SHELL_VELOCITY'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_THERMOSTAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts the nose thermostats of the particles from the EXTERNAL file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_THERMOSTAT'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_VEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Takes the velocities from the external file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_VEL'))
+
+    x_cp2k_input_EXT_RESTART_RESTART_WALKERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restarts walkers informations from a previous metadynamics run from the EXTERNAL
+        file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_EXT_RESTART.RESTART_WALKERS'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_EXT_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_EXT_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_EXT_RESTART'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,329 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_farming_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_farming.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_FARMING_JOB(MSection):
+    '''
+    description of the jobs to be executed
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING.JOB'))
+
+    x_cp2k_input_FARMING_JOB_DEPENDENCIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        specifies a list of JOB_IDs on which the current job depends. The current job will
+        not be executed before all the dependencies have finished. The keyword requires a
+        MASTER_SLAVE farming run. Beyond the default case, some special cases might arise:
+        1) circular dependencies will lead to a deadlock. 2) This keyword is not
+        compatible with CYCLE. 3) MAX_JOBS_PER_GROUP is ignored (though only a total of
+        MAX_JOBS_PER_GROUP*NGROUPS jobs will be executed) 4) dependencies on jobs that
+        will not be executed (due to RESTART or MAX_JOBS_PER_GROUP) are ignored.
+        Additionally, note that, on some file systems,  output (restart) files might not
+        be immediately available on all compute nodes,potentially resulting in unexpected
+        failures.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.JOB.DEPENDENCIES'))
+
+    x_cp2k_input_FARMING_JOB_DIRECTORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the directory in which the job should be executed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.JOB.DIRECTORY'))
+
+    x_cp2k_input_FARMING_JOB_INPUT_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the input file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.JOB.INPUT_FILE_NAME'))
+
+    x_cp2k_input_FARMING_JOB_JOB_ID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        An ID used to indentify a job in DEPENDENCIES. JOB_IDs do not need to be unique,
+        dependencies will be on all jobs with a given ID. If no JOB_ID is given, the index
+        of the &JOB section in the input file will be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.JOB.JOB_ID'))
+
+    x_cp2k_input_FARMING_JOB_OUTPUT_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the output file, if not specified will use the project name in the
+        &GLOBAL section.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.JOB.OUTPUT_FILE_NAME'))
+
+
+class x_cp2k_section_input_FARMING_PROGRAM_RUN_INFO(MSection):
+    '''
+    controls the printing of FARMING specific output
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING.PROGRAM_RUN_INFO'))
+
+    x_cp2k_input_FARMING_PROGRAM_RUN_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.PROGRAM_RUN_INFO.ADD_LAST'))
+
+    x_cp2k_input_FARMING_PROGRAM_RUN_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.PROGRAM_RUN_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_FARMING_PROGRAM_RUN_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.PROGRAM_RUN_INFO.FILENAME'))
+
+    x_cp2k_input_FARMING_PROGRAM_RUN_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.PROGRAM_RUN_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_FARMING_PROGRAM_RUN_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.PROGRAM_RUN_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_FARMING_RESTART(MSection):
+    '''
+    controls the printing of the restart for FARMING.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING.RESTART'))
+
+    x_cp2k_input_FARMING_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.RESTART.ADD_LAST'))
+
+    x_cp2k_input_FARMING_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_FARMING_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.RESTART.FILENAME'))
+
+    x_cp2k_input_FARMING_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_FARMING_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.RESTART.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_FARMING(MSection):
+    '''
+    Describes a farming job, in which multiple inputs are executed.
+
+    The RUN_TYPE in the global section has to be set to NONE for FARMING.
+
+    The different groups are executed in parallel. The jobs inside the same groups in
+    series.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING'))
+
+    x_cp2k_input_FARMING_CYCLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If farming should process all jobs in a cyclic way, stopping only if
+        MAX_JOBS_PER_GROUP is exceeded.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.CYCLE'))
+
+    x_cp2k_input_FARMING_DO_RESTART = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Restart a farming job (and should pick up where the previous left off)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.DO_RESTART'))
+
+    x_cp2k_input_FARMING_GROUP_PARTITION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        gives the exact number of processors for each group.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.GROUP_PARTITION'))
+
+    x_cp2k_input_FARMING_GROUP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Gives the preferred size of a working group, groups will always be equal or larger
+        than this size.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.GROUP_SIZE'))
+
+    x_cp2k_input_FARMING_MASTER_SLAVE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a master-slave setup should be employed, in which one process is used to
+        distribute the tasks. This is most useful to load-balance if not all jobs have the
+        same length, and a lot of CPUs/groups are availabe.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.MASTER_SLAVE'))
+
+    x_cp2k_input_FARMING_MAX_JOBS_PER_GROUP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        maximum number of jobs executed per group
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.MAX_JOBS_PER_GROUP'))
+
+    x_cp2k_input_FARMING_NGROUPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Gives the preferred number of working groups.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.NGROUPS'))
+
+    x_cp2k_input_FARMING_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the restart file to use for restarting a FARMING run. If not specified the
+        name is determined from PROJECT name.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.RESTART_FILE_NAME'))
+
+    x_cp2k_input_FARMING_WAIT_TIME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time to wait [s] for a new task if no task is currently available, make this zero
+        if no clock is available
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_FARMING.WAIT_TIME'))
+
+    x_cp2k_section_input_FARMING_JOB = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_FARMING_JOB'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING.JOB'))
+
+    x_cp2k_section_input_FARMING_PROGRAM_RUN_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_FARMING_PROGRAM_RUN_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING.PROGRAM_RUN_INFO'))
+
+    x_cp2k_section_input_FARMING_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_FARMING_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING.RESTART'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_FARMING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_FARMING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_FARMING'))
+
+
+m_package.__init_metainfo__()
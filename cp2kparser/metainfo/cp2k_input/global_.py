@@ -0,0 +1,890 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_global_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_global.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_GLOBAL_DBCSR_ACC(MSection):
+    '''
+    Configuration options for the ACC-Driver.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.DBCSR.ACC'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_AVOID_AFTER_BUSY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If enabled, stacks are not processed by the acc-driver after it has signaled
+        congestion during a round of flushing. For the next round of flusing the driver is
+        used again.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.AVOID_AFTER_BUSY'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_BINNING_BINSIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of bins used when ordering the stacks with the binning-scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.BINNING_BINSIZE'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_BINNING_NBINS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of bins used when ordering the stacks with the binning-scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.BINNING_NBINS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_MIN_FLOP_PROCESS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Only process stacks with more than the given number of floating-point operations
+        per stack-entry (2*m*n*k).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.MIN_FLOP_PROCESS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_MIN_FLOP_SORT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Only sort stacks with more than the given number of floating-point operations per
+        stack-entry (2*m*n*k). Alternatively, the stacks are roughly ordered through a
+        binning-scheme by Peter Messmer.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.MIN_FLOP_SORT'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_POSTERIOR_BUFFERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of transfer-buffers associated with low priority streams.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.POSTERIOR_BUFFERS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_POSTERIOR_STREAMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of acc streams created with low priority.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.POSTERIOR_STREAMS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_PRIORITY_BUFFERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of transfer-buffers associated with high priority streams.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.PRIORITY_BUFFERS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_PRIORITY_STREAMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of acc streams created with high priority.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.PRIORITY_STREAMS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_ACC_PROCESS_INHOMOGENOUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If enabled, inhomogenous stacks are also processed by the acc driver.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.ACC.PROCESS_INHOMOGENOUS'))
+
+
+class x_cp2k_section_input_GLOBAL_DBCSR(MSection):
+    '''
+    Configuration options for the DBCSR library.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.DBCSR'))
+
+    x_cp2k_input_GLOBAL_DBCSR_COMBINED_TYPES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Combine matrix index and data into a single MPI derived data type for
+        communication (avoid using).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.COMBINED_TYPES'))
+
+    x_cp2k_input_GLOBAL_DBCSR_COMM_THREAD_LOAD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a communications thread is used, specify how much multiplication workload (%)
+        the thread should perform in addition to communication tasks. A negative value
+        leaves the decision up to DBCSR.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.COMM_THREAD_LOAD'))
+
+    x_cp2k_input_GLOBAL_DBCSR_MAX_ELEMENTS_PER_BLOCK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Default block size for turning dense matrices in blocked ones
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.MAX_ELEMENTS_PER_BLOCK'))
+
+    x_cp2k_input_GLOBAL_DBCSR_MM_DRIVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Select which routines to use for matrix block multiplications.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.MM_DRIVER'))
+
+    x_cp2k_input_GLOBAL_DBCSR_MM_STACK_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of multiplication parameter stack. A negative value leaves the decision up to
+        DBCSR.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.MM_STACK_SIZE'))
+
+    x_cp2k_input_GLOBAL_DBCSR_MULTREC_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Recursion limit of cache oblivious multrec algorithm.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.MULTREC_LIMIT'))
+
+    x_cp2k_input_GLOBAL_DBCSR_N_SIZE_MNK_STACKS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of stacks to use for distinct atomic sizes (e.g., 2 for a system of mostly
+        waters). A negative value leaves the decision up to DBCSR.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.N_SIZE_MNK_STACKS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_SUBCOMMUNICATORS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use MPI subcommunicators for transfers that are limited to process grid rows and
+        columns.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.SUBCOMMUNICATORS'))
+
+    x_cp2k_input_GLOBAL_DBCSR_USE_COMM_THREAD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        During multiplication, use a thread to periodically poll MPI to progress
+        outstanding message completions.  This is beneficial on systems without a DMA-
+        capable network adapter e.g. Cray XE6.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.USE_COMM_THREAD'))
+
+    x_cp2k_input_GLOBAL_DBCSR_USE_MPI_ALLOCATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allow use of MPI-allocated memory for potentially faster network communication.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.DBCSR.USE_MPI_ALLOCATION'))
+
+    x_cp2k_section_input_GLOBAL_DBCSR_ACC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_DBCSR_ACC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.DBCSR.ACC'))
+
+
+class x_cp2k_section_input_GLOBAL_FM(MSection):
+    '''
+    Configuration options for the full matrices.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.FM'))
+
+    x_cp2k_input_GLOBAL_FM_FORCE_BLOCK_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Ensure for small matrices that the layout is compatible with bigger ones, i.e. no
+        subdivision is performed (can break LAPACK!!!).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FM.FORCE_BLOCK_SIZE'))
+
+    x_cp2k_input_GLOBAL_FM_NCOL_BLOCKS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the number of columns per scalapack block in the creation of vlock cyclic
+        dense matrices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FM.NCOL_BLOCKS'))
+
+    x_cp2k_input_GLOBAL_FM_NROW_BLOCKS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the number of rows per scalapack block in the creation of block cyclic
+        dense matrices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FM.NROW_BLOCKS'))
+
+    x_cp2k_input_GLOBAL_FM_TYPE_OF_MATRIX_MULTIPLICATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allows to switch between scalapack pdgemm and dbcsr_multiply. On normal systems
+        pdgemm is recommended on system with GPU is optimized and can give better
+        performance. NOTE: if DBCSR is employed FORCE_BLOCK_SIZE should be set. The
+        perfomance on GPU's dependes crucially on the BLOCK_SIZES. Make sure optimized
+        kernels are available.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FM.TYPE_OF_MATRIX_MULTIPLICATION'))
+
+
+class x_cp2k_section_input_GLOBAL_MACHINE_ARCH(MSection):
+    '''
+    Configuration options for the machine architecture.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.MACHINE_ARCH'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_MEM_POL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enable memory binding on the compute node.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.MEM_POL'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_MEMORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The memory banks ID for each MPI process. It will beuse to set memory bank of the
+        MPI process
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.MEMORY'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_MPI_REORDERING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Apply a global MPI reordering for the run
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.MPI_REORDERING'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PRINT_BRANCH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print machine architecture component organization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PRINT_BRANCH'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PRINT_FULL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print full machine architecture
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PRINT_FULL'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PRINT_PROC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the process binding in the machine.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PRINT_PROC'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PRINT_RESUME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the compute node architecture number of components.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PRINT_RESUME'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PRINT_THREAD_CUR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the current threads binding in the machine.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PRINT_THREAD_CUR'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PRINT_THREAD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the threads binding in the machine.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PRINT_THREAD'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_PROCESS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Core ID for each MPI process of a compute node. It will be used to place the MPI
+        process.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.PROCESS'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_SCHED_MPI = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enable process scheduling on the compute node.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.SCHED_MPI'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_SCHED_THREAD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enable thread scheduling on the compute node.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.SCHED_THREAD'))
+
+    x_cp2k_input_GLOBAL_MACHINE_ARCH_THREAD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Core ID for each thread of a compute node. It will be used to place the thread.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.MACHINE_ARCH.THREAD'))
+
+
+class x_cp2k_section_input_GLOBAL_PROGRAM_RUN_INFO(MSection):
+    '''
+    controls the printing of  initialization controlled by the global section
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.PROGRAM_RUN_INFO'))
+
+    x_cp2k_input_GLOBAL_PROGRAM_RUN_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROGRAM_RUN_INFO.ADD_LAST'))
+
+    x_cp2k_input_GLOBAL_PROGRAM_RUN_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROGRAM_RUN_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_GLOBAL_PROGRAM_RUN_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROGRAM_RUN_INFO.FILENAME'))
+
+    x_cp2k_input_GLOBAL_PROGRAM_RUN_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROGRAM_RUN_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_GLOBAL_PROGRAM_RUN_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROGRAM_RUN_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_GLOBAL_REFERENCES(MSection):
+    '''
+    Controls the printing of the references relevant to the calculations performed
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.REFERENCES'))
+
+    x_cp2k_input_GLOBAL_REFERENCES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.REFERENCES.ADD_LAST'))
+
+    x_cp2k_input_GLOBAL_REFERENCES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.REFERENCES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_GLOBAL_REFERENCES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.REFERENCES.FILENAME'))
+
+    x_cp2k_input_GLOBAL_REFERENCES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.REFERENCES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_GLOBAL_REFERENCES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.REFERENCES.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_GLOBAL_TIMINGS(MSection):
+    '''
+    Controls the printing of the timing report at the end of CP2K execution
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.TIMINGS'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.ADD_LAST'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.FILENAME'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.LOG_PRINT_KEY'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.SECTION_PARAMETERS'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_SORT_BY_SELF_TIME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sort the final timing report by the average self (exclusive) time instead of the
+        total (inclusive) time of a routine
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.SORT_BY_SELF_TIME'))
+
+    x_cp2k_input_GLOBAL_TIMINGS_THRESHOLD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify % of CPUTIME above which the contribution will be inserted in the final
+        timing report (e.g. 0.02 = 2%)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TIMINGS.THRESHOLD'))
+
+
+class x_cp2k_section_input_GLOBAL(MSection):
+    '''
+    Section with general information regarding which kind of simulation to perform an
+    parameters for the whole PROGRAM
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL'))
+
+    x_cp2k_input_GLOBAL_ALLTOALL_SGL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        All-to-all communication (FFT) should use single precision
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.ALLTOALL_SGL'))
+
+    x_cp2k_input_GLOBAL_BLACS_GRID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        how to distribute the processors on the 2d grid needed by BLACS (and thus
+        SCALAPACK)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.BLACS_GRID'))
+
+    x_cp2k_input_GLOBAL_BLACS_REPEATABLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use a topology for BLACS collectives that is guaranteed to be repeatable on
+        homegeneous architectures
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.BLACS_REPEATABLE'))
+
+    x_cp2k_input_GLOBAL_CALLGRAPH_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the callgraph file, which is writte a the end of the run. If not specified
+        the project name will be used as filename.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.CALLGRAPH_FILE_NAME'))
+
+    x_cp2k_input_GLOBAL_CALLGRAPH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        At the end of the run write a callgraph to file, which contains detailed timing
+        informations. This callgraph can be viewed e.g. with the open-source program
+        kcachegrind.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.CALLGRAPH'))
+
+    x_cp2k_input_GLOBAL_ECHO_ALL_HOSTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Echo a list of hostname and pid for all MPI processes.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.ECHO_ALL_HOSTS'))
+
+    x_cp2k_input_GLOBAL_ECHO_INPUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the input should be echoed to the output with all the defaults made explicit
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.ECHO_INPUT'))
+
+    x_cp2k_input_GLOBAL_ENABLE_UNSUPPORTED_FEATURES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the usage of unsupported features in a release version. It
+        affects ONLY release versions of CP2K (no effects on development versions).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.ENABLE_UNSUPPORTED_FEATURES'))
+
+    x_cp2k_input_GLOBAL_EXTENDED_FFT_LENGTHS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use fft library specific values for the allows number of points in FFTs. The
+        default is to use the internal FFT lengths. For external fft libraries this may
+        create an error at the external library level, because the length provided by cp2k
+        is not supported by the external library. In this case switch on this keyword to
+        obtain, with certain fft libraries, lengths matching the external fft library
+        lengths, or larger allowed grids, or grids that more precisely match a given
+        cutoff. IMPORTANT NOTE: in this case, the actual grids used in CP2K depends on the
+        FFT library. A change of FFT library must therefore be considered equivalent to a
+        change of basis, which implies a change of total energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.EXTENDED_FFT_LENGTHS'))
+
+    x_cp2k_input_GLOBAL_FFT_POOL_SCRATCH_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Limits the memory usage of the FFT scratch pool, potentially reducing efficiency a
+        bit
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FFT_POOL_SCRATCH_LIMIT'))
+
+    x_cp2k_input_GLOBAL_FFTW_PLAN_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        FFTW can have improved performance if it is allowed to plan with explicit
+        measurements which strategy is best for a given FFT. While a plan based on
+        measurements is generally faster, differences in machine load will lead to
+        different plans for the same input file, and thus numerics for the FFTs will be
+        slightly different from run to run.PATIENT planning is recommended for long ab
+        initio MD runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FFTW_PLAN_TYPE'))
+
+    x_cp2k_input_GLOBAL_FFTW_WISDOM_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The name of the file that contains wisdom (pre-planned FFTs) for use with FFTW3.
+        Using wisdom can significantly speed up the FFTs (see the FFTW homepage for
+        details). Note that wisdom is not transferable between different computer
+        (architectures). Wisdom can be generated using the fftw-wisdom tool that is part
+        of the fftw installation. cp2k/tools/cp2k-wisdom is a script that contains some
+        additional info, and can help to generate a useful default for /etc/fftw/wisdom or
+        particular values for a given simulation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FFTW_WISDOM_FILE_NAME'))
+
+    x_cp2k_input_GLOBAL_FLUSH_SHOULD_FLUSH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Flush output regularly, enabling this option might degrade performance
+        significantly on certain machines.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.FLUSH_SHOULD_FLUSH'))
+
+    x_cp2k_input_GLOBAL_OUTPUT_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the output file. Relevant only if automatically started (through farming
+        for example). If empty uses the project name as basis for it.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.OUTPUT_FILE_NAME'))
+
+    x_cp2k_input_GLOBAL_PREFERRED_DIAG_LIBRARY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the DIAGONALIZATION library. If not availabe ....
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PREFERRED_DIAG_LIBRARY'))
+
+    x_cp2k_input_GLOBAL_PREFERRED_FFT_LIBRARY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the FFT library which should be preferred. If it is not available, use
+        FFTW3 if this is linked in, if FFTW3 is not available use FFTSG. Improved
+        performance with FFTW3 can be obtained specifying a proper value for
+        FFTW_PLAN_TYPE. Contrary to earlier CP2K versions, all libraries will result in
+        the same grids, i.e. the subset of grids which all FFT libraries can transform.
+        See EXTENDED_FFT_LENGTHS if larger FFTs or grids that more precisely match a given
+        cutoff are needed, or older results need to be reproduced. FFTW3 is often (close
+        to) optimal, and well tested with CP2K.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PREFERRED_FFT_LIBRARY'))
+
+    x_cp2k_input_GLOBAL_PRINT_LEVEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How much output is written out.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PRINT_LEVEL'))
+
+    x_cp2k_input_GLOBAL_PROGRAM_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which program should be run
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROGRAM_NAME'))
+
+    x_cp2k_input_GLOBAL_PROJECT_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the project (used to build the name of the trajectory, and other files
+        generated by the program)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.PROJECT_NAME'))
+
+    x_cp2k_input_GLOBAL_RUN_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Type of run that you want to perform Geometry optimization, md, montecarlo,...
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.RUN_TYPE'))
+
+    x_cp2k_input_GLOBAL_SAVE_MEM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Some sections of the input structure are deallocated when not needed, and
+        reallocated only when used. This reduces the required maximum memory
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.SAVE_MEM'))
+
+    x_cp2k_input_GLOBAL_SEED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial seed for the global (pseudo)random number generator to create a stream of
+        normally Gaussian distributed random numbers.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.SEED'))
+
+    x_cp2k_input_GLOBAL_TRACE_MASTER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        For parallel TRACEd runs: only the master node writes output.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TRACE_MASTER'))
+
+    x_cp2k_input_GLOBAL_TRACE_MAX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Limit the total number a given subroutine is printed in the trace. Accounting is
+        not influenced.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TRACE_MAX'))
+
+    x_cp2k_input_GLOBAL_TRACE_ROUTINES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        A list of routines to trace. If left empty all routines are traced. Accounting is
+        not influenced.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TRACE_ROUTINES'))
+
+    x_cp2k_input_GLOBAL_TRACE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a debug trace of the execution of the program should be written
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.TRACE'))
+
+    x_cp2k_input_GLOBAL_WALLTIME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum execution time for this run. Time in seconds or in HH:MM:SS.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_GLOBAL.WALLTIME'))
+
+    x_cp2k_section_input_GLOBAL_DBCSR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_DBCSR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.DBCSR'))
+
+    x_cp2k_section_input_GLOBAL_FM = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_FM'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.FM'))
+
+    x_cp2k_section_input_GLOBAL_MACHINE_ARCH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_MACHINE_ARCH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.MACHINE_ARCH'))
+
+    x_cp2k_section_input_GLOBAL_PROGRAM_RUN_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_PROGRAM_RUN_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.PROGRAM_RUN_INFO'))
+
+    x_cp2k_section_input_GLOBAL_REFERENCES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_REFERENCES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.REFERENCES'))
+
+    x_cp2k_section_input_GLOBAL_TIMINGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL_TIMINGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL.TIMINGS'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_GLOBAL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_GLOBAL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_GLOBAL'))
+
+
+m_package.__init_metainfo__()
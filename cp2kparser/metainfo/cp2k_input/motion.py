@@ -0,0 +1,13322 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_motion_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_motion.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_MOTION_BAND_BANNER(MSection):
+    '''
+    Controls the printing of the BAND banner
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.BANNER'))
+
+    x_cp2k_input_MOTION_BAND_BANNER_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.BANNER.ADD_LAST'))
+
+    x_cp2k_input_MOTION_BAND_BANNER_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.BANNER.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_BAND_BANNER_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.BANNER.FILENAME'))
+
+    x_cp2k_input_MOTION_BAND_BANNER_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.BANNER.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_BAND_BANNER_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.BANNER.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_BAND_CI_NEB(MSection):
+    '''
+    Controls parameters for CI-NEB type calculation only.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.CI_NEB'))
+
+    x_cp2k_input_MOTION_BAND_CI_NEB_NSTEPS_IT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of steps of IT-NEB to perform before switching on the CI
+        algorithm
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CI_NEB.NSTEPS_IT'))
+
+
+class x_cp2k_section_input_MOTION_BAND_CONVERGENCE_CONTROL(MSection):
+    '''
+    Setup parameters to control the convergence criteria for BAND
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.CONVERGENCE_CONTROL'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_CONTROL_MAX_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance on the maximum value of the displacement on the BAND.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_CONTROL.MAX_DR'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_CONTROL_MAX_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance on the maximum value of Forces on the BAND.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_CONTROL.MAX_FORCE'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_CONTROL_RMS_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance on RMS displacements on the BAND.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_CONTROL.RMS_DR'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_CONTROL_RMS_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance on RMS Forces on the BAND.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_CONTROL.RMS_FORCE'))
+
+
+class x_cp2k_section_input_MOTION_BAND_CONVERGENCE_INFO(MSection):
+    '''
+    Controls the printing of the convergence criteria during a BAND run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.CONVERGENCE_INFO'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_INFO.ADD_LAST'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_INFO.FILENAME'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_BAND_CONVERGENCE_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.CONVERGENCE_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_BAND_ENERGY(MSection):
+    '''
+    Controls the printing of the ENER file in a BAND run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.ENERGY'))
+
+    x_cp2k_input_MOTION_BAND_ENERGY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ENERGY.ADD_LAST'))
+
+    x_cp2k_input_MOTION_BAND_ENERGY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ENERGY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_BAND_ENERGY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ENERGY.FILENAME'))
+
+    x_cp2k_input_MOTION_BAND_ENERGY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ENERGY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_BAND_ENERGY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ENERGY.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO(MSection):
+    '''
+    Controls the printing of diis info during a BAND run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO.ADD_LAST'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO.FILENAME'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_DIIS(MSection):
+    '''
+    Activate the DIIS based optimization procedure for BAND
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.DIIS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_CHECK_DIIS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Performes a series of checks on the DIIS solution in order to accept the DIIS
+        step. If set to .FALSE. the only check performed is that the angle between the
+        DIIS solution and the reference vector is less than Pi/2. Can be useful if many
+        DIIS steps are rejected.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.CHECK_DIIS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_MAX_SD_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the maximum number of SD steps to perform before switching on DIIS (the
+        minimum number will always be equal to N_DIIS).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.MAX_SD_STEPS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_MAX_STEPSIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum stepsize used for the line search, sometimes this parametercan be reduced
+        to stablize the LS for particularly difficult initial geometries
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.MAX_STEPSIZE'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_MAX_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the maximum number of optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.MAX_STEPS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_N_DIIS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of history vectors to be used with DIIS
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.N_DIIS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_NO_LS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not perform LS during SD. Useful in combination with a proper STEPSIZE for
+        particularly out of equilibrium starting geometries.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.NO_LS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_NP_LS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of points used in the line search SD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.NP_LS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_STEPSIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial stepsize used for the line search, sometimes this parametercan be reduced
+        to stablize DIIS
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.STEPSIZE'))
+
+    x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_DIIS_DIIS_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.DIIS.DIIS_INFO'))
+
+
+class x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMP_CONTROL(MSection):
+    '''
+    Setup parameters to control the temperature during a BAND MD run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.MD.TEMP_CONTROL'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMP_CONTROL_TEMP_TOL_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of steps to apply a temperature control
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.TEMP_CONTROL.TEMP_TOL_STEPS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMP_CONTROL_TEMP_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the tolerance on the temperature for rescaling
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.TEMP_CONTROL.TEMP_TOL'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMP_CONTROL_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the target temperature
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.TEMP_CONTROL.TEMPERATURE'))
+
+
+class x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD_VEL_CONTROL(MSection):
+    '''
+    Setup parameters to control the velocity during a BAND MD run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.MD.VEL_CONTROL'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_VEL_CONTROL_ANNEALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the annealing coefficient
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.VEL_CONTROL.ANNEALING'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_VEL_CONTROL_PROJ_VELOCITY_VERLET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a Projected Velocity Verlet instead of a normal Velocity Verlet. Every time
+        the cosine between velocities and forces is < 0 velocities are zeroed.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.VEL_CONTROL.PROJ_VELOCITY_VERLET'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_VEL_CONTROL_SD_LIKE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Zeros velocity at each MD step emulating a steepest descent like(SD_LIKE) approach
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.VEL_CONTROL.SD_LIKE'))
+
+
+class x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD(MSection):
+    '''
+    Activate the MD based optimization procedure for BAND
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.MD'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_MAX_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the maximum number of MD steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.MAX_STEPS'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the initial temperature
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.TEMPERATURE'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_MD_TIMESTEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The length of an integration step
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.MD.TIMESTEP'))
+
+    x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMP_CONTROL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD_TEMP_CONTROL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.MD.TEMP_CONTROL'))
+
+    x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD_VEL_CONTROL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD_VEL_CONTROL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.MD.VEL_CONTROL'))
+
+
+class x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND(MSection):
+    '''
+    Specify the optimization method for the band
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_OPT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the type optimizer used for the band
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.OPT_TYPE'))
+
+    x_cp2k_input_MOTION_BAND_OPTIMIZE_BAND_OPTIMIZE_END_POINTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Performs also an optimization of the end points of the band.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.OPTIMIZE_BAND.OPTIMIZE_END_POINTS'))
+
+    x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_DIIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_DIIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.DIIS'))
+
+    x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND_MD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND.MD'))
+
+
+class x_cp2k_section_input_MOTION_BAND_PROGRAM_RUN_INFO(MSection):
+    '''
+    Controls the printing basic info about the BAND run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.PROGRAM_RUN_INFO'))
+
+    x_cp2k_input_MOTION_BAND_PROGRAM_RUN_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROGRAM_RUN_INFO.ADD_LAST'))
+
+    x_cp2k_input_MOTION_BAND_PROGRAM_RUN_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROGRAM_RUN_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_BAND_PROGRAM_RUN_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROGRAM_RUN_INFO.FILENAME'))
+
+    x_cp2k_input_MOTION_BAND_PROGRAM_RUN_INFO_INITIAL_CONFIGURATION_INFO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print information for the setup of the initial configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROGRAM_RUN_INFO.INITIAL_CONFIGURATION_INFO'))
+
+    x_cp2k_input_MOTION_BAND_PROGRAM_RUN_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROGRAM_RUN_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_BAND_PROGRAM_RUN_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROGRAM_RUN_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_BAND_REPLICA_COORD(MSection):
+    '''
+    The positions for BAND used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA.COORD'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_BAND_REPLICA_VELOCITY(MSection):
+    '''
+    The velocities for BAND used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA.VELOCITY'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_BAND_REPLICA_INFO(MSection):
+    '''
+    Controls the printing of each replica info during a BAND run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA_INFO'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA_INFO.ADD_LAST'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA_INFO.FILENAME'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_BAND_REPLICA(MSection):
+    '''
+    Specify coordinates and velocities (possibly) of the replica
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_COLLECTIVE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the value of the collective variables used in the projected BAND method.
+        The order of the values is the order of the COLLECTIVE section in the
+        constraints/restraints section
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA.COLLECTIVE'))
+
+    x_cp2k_input_MOTION_BAND_REPLICA_COORD_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the xyz file with coordinates (alternative to &COORD section)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.REPLICA.COORD_FILE_NAME'))
+
+    x_cp2k_section_input_MOTION_BAND_REPLICA_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_REPLICA_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA.COORD'))
+
+    x_cp2k_section_input_MOTION_BAND_REPLICA_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_REPLICA_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_BAND_STRING_METHOD(MSection):
+    '''
+    Controls parameters for String Method type calculation only.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.STRING_METHOD'))
+
+    x_cp2k_input_MOTION_BAND_STRING_METHOD_SMOOTHING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Smoothing parameter for the reparametrization of the frames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.STRING_METHOD.SMOOTHING'))
+
+    x_cp2k_input_MOTION_BAND_STRING_METHOD_SPLINE_ORDER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the oder of the spline used in the String Method.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.STRING_METHOD.SPLINE_ORDER'))
+
+
+class x_cp2k_section_input_MOTION_BAND(MSection):
+    '''
+    The section that controls a BAND run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND'))
+
+    x_cp2k_input_MOTION_BAND_ALIGN_FRAMES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enables the alignment of the frames at the beginning of a BAND calculation. This
+        keyword does not affect the rotation of the replicas during a BAND calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ALIGN_FRAMES'))
+
+    x_cp2k_input_MOTION_BAND_BAND_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the type of BAND calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.BAND_TYPE'))
+
+    x_cp2k_input_MOTION_BAND_K_SPRING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the value of the spring constant
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.K_SPRING'))
+
+    x_cp2k_input_MOTION_BAND_NPROC_REP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of processors to be used per replica environment (for parallel
+        runs)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.NPROC_REP'))
+
+    x_cp2k_input_MOTION_BAND_NUMBER_OF_REPLICA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of Replica to use in the BAND
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.NUMBER_OF_REPLICA'))
+
+    x_cp2k_input_MOTION_BAND_POT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the type of potential used in the BAND calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.POT_TYPE'))
+
+    x_cp2k_input_MOTION_BAND_PROC_DIST_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the topology of the mapping of processors into replicas.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.PROC_DIST_TYPE'))
+
+    x_cp2k_input_MOTION_BAND_ROTATE_FRAMES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Compute at each BAND step the RMSD and rotate the frames in order to minimize it.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.ROTATE_FRAMES'))
+
+    x_cp2k_input_MOTION_BAND_USE_COLVARS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a version of the band scheme projected in a subspace of colvars.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.BAND.USE_COLVARS'))
+
+    x_cp2k_section_input_MOTION_BAND_BANNER = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_BANNER'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.BANNER'))
+
+    x_cp2k_section_input_MOTION_BAND_CI_NEB = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_CI_NEB'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.CI_NEB'))
+
+    x_cp2k_section_input_MOTION_BAND_CONVERGENCE_CONTROL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_CONVERGENCE_CONTROL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.CONVERGENCE_CONTROL'))
+
+    x_cp2k_section_input_MOTION_BAND_CONVERGENCE_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_CONVERGENCE_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.CONVERGENCE_INFO'))
+
+    x_cp2k_section_input_MOTION_BAND_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.ENERGY'))
+
+    x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_OPTIMIZE_BAND'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.OPTIMIZE_BAND'))
+
+    x_cp2k_section_input_MOTION_BAND_PROGRAM_RUN_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_PROGRAM_RUN_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.PROGRAM_RUN_INFO'))
+
+    x_cp2k_section_input_MOTION_BAND_REPLICA_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_REPLICA_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA_INFO'))
+
+    x_cp2k_section_input_MOTION_BAND_REPLICA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_REPLICA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.REPLICA'))
+
+    x_cp2k_section_input_MOTION_BAND_STRING_METHOD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND_STRING_METHOD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND.STRING_METHOD'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_BFGS_RESTART(MSection):
+    '''
+    Controls the printing of Hessian Restart file
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.BFGS.RESTART'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART.ADD_LAST'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART.FILENAME'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_BFGS(MSection):
+    '''
+    Provides parameters to tune the BFGS optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.BFGS'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the file used to read the initial Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART_FILE_NAME'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_RESTART_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the reading of the initial Hessian from file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.RESTART_HESSIAN'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_TRUST_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Trust radius used in BFGS. Previously set to 0.1. Large values can lead to
+        instabilities
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.TRUST_RADIUS'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_USE_MODEL_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a model Hessian as initial guess instead of a unit matrix. Should lead in
+        general to improved convergence might be switched off for exotic cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.USE_MODEL_HESSIAN'))
+
+    x_cp2k_input_MOTION_CELL_OPT_BFGS_USE_RAT_FUN_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Includes a rational function optimization to determine the step. Previously
+        default but did not improve convergence in many cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.BFGS.USE_RAT_FUN_OPT'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_BFGS_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_BFGS_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.BFGS.RESTART'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH_2PNT(MSection):
+    '''
+    Provides parameters to tune the line search for the two point based line search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_2PNT_LINMIN_GRAD_ONLY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use only the gradient, not the energy for line minimizations (e.g. in conjugate
+        gradients).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.2PNT.LINMIN_GRAD_ONLY'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_2PNT_MAX_ALLOWED_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Max allowed value for the line search step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.2PNT.MAX_ALLOWED_STEP'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD(MSection):
+    '''
+    Provides parameters to tune the line search for the gold search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG.LINE_SEARCH.GOLD'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD_BRACK_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Limit in 1D bracketing during line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.GOLD.BRACK_LIMIT'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD_BRENT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iterations in brent algorithm (used for the line search in
+        Conjugated Gradients Optimization)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.GOLD.BRENT_MAX_ITER'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD_BRENT_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance requested during Brent line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.GOLD.BRENT_TOL'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD_INITIAL_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size used, e.g. for bracketing or minimizers. Might need to be
+        reduced for systems with close contacts
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.GOLD.INITIAL_STEP'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH(MSection):
+    '''
+    Provides parameters to tune the line search during the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG.LINE_SEARCH'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_LINE_SEARCH_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        1D line search algorithm to be used with the CG optimizer, in increasing order of
+        robustness and cost.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.LINE_SEARCH.TYPE'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH_2PNT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH_2PNT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH_GOLD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG.LINE_SEARCH.GOLD'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_CG(MSection):
+    '''
+    Provides parameters to tune the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_FLETCHER_REEVES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses FLETCHER-REEVES instead of POLAK-RIBIERE when using Conjugate Gradients
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.FLETCHER_REEVES'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_MAX_STEEP_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of steepest descent steps before starting the conjugate gradients
+        optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.MAX_STEEP_STEPS'))
+
+    x_cp2k_input_MOTION_CELL_OPT_CG_RESTART_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cosine of the angle between two consecutive searching directions. If the angle
+        during a CG optimization is less than the one corresponding to  to the
+        RESTART_LIMIT the CG is reset and one step of steepest descent is  performed.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.CG.RESTART_LIMIT'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_CG_LINE_SEARCH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG.LINE_SEARCH'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT_LBFGS(MSection):
+    '''
+    Provides parameters to tune the limited memory BFGS (LBFGS) optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.LBFGS'))
+
+    x_cp2k_input_MOTION_CELL_OPT_LBFGS_MAX_F_PER_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of force evaluations per iteration(used for the line search)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.LBFGS.MAX_F_PER_ITER'))
+
+    x_cp2k_input_MOTION_CELL_OPT_LBFGS_MAX_H_RANK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum rank (and consequently size) of the approximate Hessian matrix used by the
+        LBFGS optimizer. Larger values (e.g. 30) will accelerate the convergence behaviour
+        at the cost of a larger memory consumption.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.LBFGS.MAX_H_RANK'))
+
+    x_cp2k_input_MOTION_CELL_OPT_LBFGS_WANTED_PROJ_GRADIENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested norm threshold of the
+        gradient multiplied by the approximate Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.LBFGS.WANTED_PROJ_GRADIENT'))
+
+    x_cp2k_input_MOTION_CELL_OPT_LBFGS_WANTED_REL_F_ERROR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested relative error on the
+        objective functionof the optimizer (the energy)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.LBFGS.WANTED_REL_F_ERROR'))
+
+
+class x_cp2k_section_input_MOTION_CELL_OPT(MSection):
+    '''
+    This section sets the environment for the optimization of the simulation cell. Two
+    possible schemes are available: (1) Zero temperature optimization;  (2) Finite
+    temperature optimization.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT'))
+
+    x_cp2k_input_MOTION_CELL_OPT_EXTERNAL_PRESSURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the external pressure (1 value or the full 9 components of the pressure
+        tensor) applied during the cell optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.EXTERNAL_PRESSURE'))
+
+    x_cp2k_input_MOTION_CELL_OPT_KEEP_ANGLES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Keep angles between the cell vectors constant, but allow the lenghts of the cell
+        vectors to change independently. Albeit general, this is most useful for triclinic
+        cells, to enforce higher symmetry, see KEEP_SYMMETRY.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.KEEP_ANGLES'))
+
+    x_cp2k_input_MOTION_CELL_OPT_KEEP_SYMMETRY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Keep the requested initial cell symmetry (e.g. during a cell optimisation). The
+        initial symmetry must be specified in the &CELL section.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.KEEP_SYMMETRY'))
+
+    x_cp2k_input_MOTION_CELL_OPT_MAX_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum geometry change between the current and the
+        last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.MAX_DR'))
+
+    x_cp2k_input_MOTION_CELL_OPT_MAX_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum force component of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.MAX_FORCE'))
+
+    x_cp2k_input_MOTION_CELL_OPT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum number of geometry optimization steps. One step might imply
+        several force evaluations for the CG and LBFGS optimizers.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.MAX_ITER'))
+
+    x_cp2k_input_MOTION_CELL_OPT_OPTIMIZER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which method to use to perform a geometry optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.OPTIMIZER'))
+
+    x_cp2k_input_MOTION_CELL_OPT_PRESSURE_TOLERANCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the Pressure tolerance (compared to the external pressure) to achieve
+        during the cell optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.PRESSURE_TOLERANCE'))
+
+    x_cp2k_input_MOTION_CELL_OPT_RMS_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) geometry change between the
+        current and the last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.RMS_DR'))
+
+    x_cp2k_input_MOTION_CELL_OPT_RMS_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) force of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.RMS_FORCE'))
+
+    x_cp2k_input_MOTION_CELL_OPT_STEP_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting step value for the CELL_OPT module.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.STEP_START_VAL'))
+
+    x_cp2k_input_MOTION_CELL_OPT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which kind of method to use for the optimization of the simulation cell
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CELL_OPT.TYPE'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_BFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_BFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.BFGS'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_CG = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_CG'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.CG'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT_LBFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT_LBFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT.LBFGS'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_COLLECTIVE_RESTRAINT(MSection):
+    '''
+    Activate and specify information on restraint instead of constraint
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.COLLECTIVE.RESTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_RESTRAINT_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the force constant for the harmonic restraint. The functional form for
+        the restraint is: K*(X-TARGET)^2.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.RESTRAINT.K'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_COLLECTIVE(MSection):
+    '''
+    Used to constraint collective (general) degrees of freedom, writing langrangian
+    multipliers to file.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.COLLECTIVE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_COLVAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the index (in input file order) of the type of colvar to constrain.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.COLVAR'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_EXCLUDE_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the MM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.EXCLUDE_MM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_EXCLUDE_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the QM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.EXCLUDE_QM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_INTERMOLECULAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify if the constraint/restraint is intermolecular.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.INTERMOLECULAR'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_MOLECULE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the index of the molecule kind (in input file order)on which the
+        constraint will be applied. MOLECULE and MOLNAME keyword exclude themself
+        mutually.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.MOLECULE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecule on which the constraint will be applied.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.MOLNAME'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_TARGET_GROWTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the growth speed of the target value of the constrained collective
+        variable.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.TARGET_GROWTH'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_TARGET_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the limit of the growth of the target value of the constrained
+        collective variable. By default no limit at the colvar growth is set.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.TARGET_LIMIT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLLECTIVE_TARGET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the target value of the constrained collective variable (units depend on
+        the colvar).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLLECTIVE.TARGET'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_COLLECTIVE_RESTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_COLLECTIVE_RESTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.COLLECTIVE.RESTRAINT'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_COLVAR_RESTART(MSection):
+    '''
+    Specify restart position only for COLVAR restraints.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.COLVAR_RESTART'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_COLVAR_RESTART_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The restarting values for COLVAR restraints. The order is an internal order. So if
+        you decide to modify these values by hand first think what you're doing!
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.COLVAR_RESTART.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_CONSTRAINT_INFO(MSection):
+    '''
+    Prints information about iterative constraints solutions
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.CONSTRAINT_INFO'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_CONSTRAINT_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.CONSTRAINT_INFO.ADD_LAST'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_CONSTRAINT_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.CONSTRAINT_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_CONSTRAINT_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.CONSTRAINT_INFO.FILENAME'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_CONSTRAINT_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.CONSTRAINT_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_CONSTRAINT_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.CONSTRAINT_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_FIX_ATOM_RESTART(MSection):
+    '''
+    Specify restart position only for FIXED_ATOMS restraints.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.FIX_ATOM_RESTART'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIX_ATOM_RESTART_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The restarting position of fixed atoms for restraints. The order is an internal
+        order. So if you decide to modify these values by hand first think what you're
+        doing!
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIX_ATOM_RESTART.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_FIXED_ATOMS_RESTRAINT(MSection):
+    '''
+    Activate and specify information on restraint instead of constraint
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.FIXED_ATOMS.RESTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_RESTRAINT_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the force constant for the harmonic restraint. The functional form for
+        the restraint is: K*(X-TARGET)^2.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.RESTRAINT.K'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_FIXED_ATOMS(MSection):
+    '''
+    This section is used to constraint the overall atomic position (X,Y,Z). In case a
+    restraint is specified the value of the TARGET is considered to be the value of the
+    coordinates at the beginning of the run or alternatively the corresponding value in
+    the section: FIX_ATOM_RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.FIXED_ATOMS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_COMPONENTS_TO_FIX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which components (X,Y,Z or combinations) of the atoms specified in the
+        sectionwill be constrained/restrained.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.COMPONENTS_TO_FIX'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_EXCLUDE_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the MM region within a QM/MM calculation. This
+        keyword is active only together with MOLNAME
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.EXCLUDE_MM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_EXCLUDE_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the QM region within a QM/MM calculation. This
+        keyword is active only together with MOLNAME
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.EXCLUDE_QM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms to freeze.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.LIST'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_MM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all  MM atoms are fixed according to the argument.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.MM_SUBSYS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecule to fix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.MOLNAME'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_FIXED_ATOMS_QM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all QM atoms are fixed according to the argument.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.FIXED_ATOMS.QM_SUBSYS'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_FIXED_ATOMS_RESTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_FIXED_ATOMS_RESTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.FIXED_ATOMS.RESTRAINT'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_G3X3_RESTRAINT(MSection):
+    '''
+    Activate and specify information on restraint instead of constraint
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G3X3.RESTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_RESTRAINT_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the force constant for the harmonic restraint. The functional form for
+        the restraint is: K*(X-TARGET)^2.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.RESTRAINT.K'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_G3X3(MSection):
+    '''
+    This section is used to set 3x3 (3 atoms and 3 distances) constraints.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G3X3'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Atoms' index on which apply the constraint
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.ATOMS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_DISTANCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The constrained distances' values.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.DISTANCES'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_EXCLUDE_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the MM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.EXCLUDE_MM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_EXCLUDE_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the QM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.EXCLUDE_QM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_INTERMOLECULAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify if the constraint/restraint is intermolecular.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.INTERMOLECULAR'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_MOLECULE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the molecule kind number on which constraint will be applied. MOLECULE
+        and MOLNAME keyword exclude themself mutually.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.MOLECULE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G3X3_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecule on which the constraint will be applied.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G3X3.MOLNAME'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_G3X3_RESTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_G3X3_RESTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G3X3.RESTRAINT'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_G4X6_RESTRAINT(MSection):
+    '''
+    Activate and specify information on restraint instead of constraint
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G4X6.RESTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_RESTRAINT_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the force constant for the harmonic restraint. The functional form for
+        the restraint is: K*(X-TARGET)^2.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.RESTRAINT.K'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_G4X6(MSection):
+    '''
+    This section is used to set 4x6 (4 atoms and 6 distances) constraints.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G4X6'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Atoms' index on which apply the constraint
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.ATOMS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_DISTANCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The constrained distances' values.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.DISTANCES'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_EXCLUDE_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the MM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.EXCLUDE_MM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_EXCLUDE_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the QM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.EXCLUDE_QM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_INTERMOLECULAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify if the constraint/restraint is intermolecular.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.INTERMOLECULAR'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_MOLECULE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the molecule number on which constraint will be applied. MOLECULE and
+        MOLNAME keyword exclude themself mutually.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.MOLECULE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_G4X6_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecule on which the constraint will be applied.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.G4X6.MOLNAME'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_G4X6_RESTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_G4X6_RESTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G4X6.RESTRAINT'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_HBONDS_RESTRAINT(MSection):
+    '''
+    Activate and specify information on restraint instead of constraint
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.HBONDS.RESTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_RESTRAINT_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the force constant for the harmonic restraint. The functional form for
+        the restraint is: K*(X-TARGET)^2.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.RESTRAINT.K'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_HBONDS(MSection):
+    '''
+    This section is used to set bonds constraints involving Hydrogen atoms
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.HBONDS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_ATOM_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the atoms' type forming a bond with an hydrogen. If not specified  the
+        default bond value of the first molecule is used as constraint target
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.ATOM_TYPE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_EXCLUDE_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not shake HBONDS in the MM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.EXCLUDE_MM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_EXCLUDE_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not shake HBONDS in the QM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.EXCLUDE_QM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_MOLECULE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the indexes of the molecule kind (in input file order)on which the
+        constraint will be applied. MOLECULE and MOLNAME keyword exclude themself
+        mutually.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.MOLECULE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the names of the molecule on which the constraint will be applied.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.MOLNAME'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_HBONDS_TARGETS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The constrained distances' values  for the types defines in ATOM_TYPE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.HBONDS.TARGETS'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_HBONDS_RESTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_HBONDS_RESTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.HBONDS.RESTRAINT'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS(MSection):
+    '''
+    Prints out the lagrange multipliers of the specified constraints during an MD.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS.ADD_LAST'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS.FILENAME'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_VIRTUAL_SITE_RESTRAINT(MSection):
+    '''
+    Activate and specify information on restraint instead of constraint
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.VIRTUAL_SITE.RESTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_RESTRAINT_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the force constant for the harmonic restraint. The functional form for
+        the restraint is: K*(X-TARGET)^2.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.RESTRAINT.K'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT_VIRTUAL_SITE(MSection):
+    '''
+    This section is used to set a virtual interaction-site constraint.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.VIRTUAL_SITE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Atoms' index on which apply the constraint (v i j k), first is virtual site
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.ATOMS'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_EXCLUDE_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the MM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.EXCLUDE_MM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_EXCLUDE_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Does not apply the constraint to the QM region within a QM/MM calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.EXCLUDE_QM'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_INTERMOLECULAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify if the constraint/restraint is intermolecular.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.INTERMOLECULAR'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_MOLECULE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the molecule number on which constraint will be applied. MOLECULE and
+        MOLNAME keyword exclude themself mutually.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.MOLECULE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecule on which the constraint will be applied.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.MOLNAME'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_VIRTUAL_SITE_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The constrained paramters' values to construct virtual site.r_v=a*r_ij+b*r_kj
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.VIRTUAL_SITE.PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_VIRTUAL_SITE_RESTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_VIRTUAL_SITE_RESTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.VIRTUAL_SITE.RESTRAINT'))
+
+
+class x_cp2k_section_input_MOTION_CONSTRAINT(MSection):
+    '''
+    Section specifying information regarding how to impose constraints on the system.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_CONSTRAINT_INIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Apply constraints to the initial position and velocities. Default is to apply
+        constraints only after the first MD step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.CONSTRAINT_INIT'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_ROLL_TOLERANCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the tolerance for the roll constraint algorithm.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.ROLL_TOLERANCE'))
+
+    x_cp2k_input_MOTION_CONSTRAINT_SHAKE_TOLERANCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the tolerance for the shake/rattle constraint algorithm.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.CONSTRAINT.SHAKE_TOLERANCE'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_COLLECTIVE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_COLLECTIVE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.COLLECTIVE'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_COLVAR_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_COLVAR_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.COLVAR_RESTART'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_CONSTRAINT_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_CONSTRAINT_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.CONSTRAINT_INFO'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_FIX_ATOM_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_FIX_ATOM_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.FIX_ATOM_RESTART'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_FIXED_ATOMS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_FIXED_ATOMS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.FIXED_ATOMS'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_G3X3 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_G3X3'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G3X3'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_G4X6 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_G4X6'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.G4X6'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_HBONDS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_HBONDS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.HBONDS'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_LAGRANGE_MULTIPLIERS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.LAGRANGE_MULTIPLIERS'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT_VIRTUAL_SITE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT_VIRTUAL_SITE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT.VIRTUAL_SITE'))
+
+
+class x_cp2k_section_input_MOTION_DRIVER(MSection):
+    '''
+    This section defines the parameters needed to run in i-PI driver mode.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.DRIVER'))
+
+    x_cp2k_input_MOTION_DRIVER_HOST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Host name for the i-PI server.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.DRIVER.HOST'))
+
+    x_cp2k_input_MOTION_DRIVER_PORT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Port number for the i-PI server.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.DRIVER.PORT'))
+
+    x_cp2k_input_MOTION_DRIVER_UNIX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use a UNIX socket rather than an INET socket.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.DRIVER.UNIX'))
+
+
+class x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL(MSection):
+    '''
+    Controls the printing of FP info at startup
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL.ADD_LAST'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL.FILENAME'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS(MSection):
+    '''
+    Controls the printing of FP info during flexible partitioning simulations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS.ADD_LAST'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS.FILENAME'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING(MSection):
+    '''
+    This section sets up flexible_partitioning
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FLEXIBLE_PARTITIONING'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_BIAS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a bias potential counter-acting the weight term should be applied
+        (recommended).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.BIAS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_CENTRAL_ATOM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the central atom.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.CENTRAL_ATOM'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_INNER_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the list of atoms that should remain close to the central atom.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.INNER_ATOMS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_INNER_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        radius of the inner wall
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.INNER_RADIUS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_OUTER_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the list of atoms that should remain far from the central atom.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.OUTER_ATOMS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_OUTER_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        radius of the outer wall
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.OUTER_RADIUS'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_SMOOTH_WIDTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sets the width of the smooth counting function.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.SMOOTH_WIDTH'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_STRENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sets the force constant of the repulsive harmonic potential
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.STRENGTH'))
+
+    x_cp2k_input_MOTION_FLEXIBLE_PARTITIONING_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sets the temperature parameter that is used in the baising potential.It is
+        recommended to use the actual simulation temperature
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FLEXIBLE_PARTITIONING.TEMPERATURE'))
+
+    x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING_CONTROL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FLEXIBLE_PARTITIONING.CONTROL'))
+
+    x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING_WEIGHTS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FLEXIBLE_PARTITIONING.WEIGHTS'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE(MSection):
+    '''
+    Controls the calculation of delta free energies with the alchemical change method.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.ALCHEMICAL_CHANGE'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE_EPS_CONV = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the relative tolerance for the convergence of the free energy derivative
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.ALCHEMICAL_CHANGE.EPS_CONV'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE_NEQUIL_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the number of equilibration steps, skipped to compute averages
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.ALCHEMICAL_CHANGE.NEQUIL_STEPS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE_PARAMETER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the perturbing parameter of the alchemical change tranformation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.ALCHEMICAL_CHANGE.PARAMETER'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE_WEIGHTING_FUNCTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the weighting function (umbrella potential, part of the mixing function)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.ALCHEMICAL_CHANGE.WEIGHTING_FUNCTION'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO(MSection):
+    '''
+    Controls the printing of basic and summary information during the Free Energy
+    calculation
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO.ADD_LAST'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO.FILENAME'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_FS(MSection):
+    '''
+    Colvar force within an extended Lagrangian formalism.Used for RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_FS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_FS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specified the theta
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_FS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS0(MSection):
+    '''
+    Colvar position within an extended Lagrangian formalism.Used for RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_SS0'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS0_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specified the positions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_SS0.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS(MSection):
+    '''
+    Colvar Theta within an extended Lagrangian formalism.Used for RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_SS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specified the theta
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_SS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_VVP(MSection):
+    '''
+    Colvar velocities within an extended Lagrangian formalism.Used for RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_VVP'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_VVP_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specified the velocities
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_VVP.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_GAUSSIAN(MSection):
+    '''
+    Parameters controlling the gaussian wall.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.GAUSSIAN'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_GAUSSIAN_SIGMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the width of the gaussian: WW*e^(-((CV-POS)/sigma)^2)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.GAUSSIAN.SIGMA'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_GAUSSIAN_WW = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the height of the gaussian: WW*e^(-((CV-POS)/sigma)^2)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.GAUSSIAN.WW'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUADRATIC(MSection):
+    '''
+    Parameters controlling the quadratic wall
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUADRATIC'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUADRATIC_DIRECTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the direction of the wall.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUADRATIC.DIRECTION'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUADRATIC_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the value of the quadratic potential constant: K*(CV-POS)^2
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUADRATIC.K'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUARTIC(MSection):
+    '''
+    Parameters controlling the quartic wall
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUARTIC'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUARTIC_DIRECTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the direction of the wall.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUARTIC.DIRECTION'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUARTIC_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the value of the quartic potential constant: K*(CV-(POS+/-(1/K^(1/4))))^4
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUARTIC.K'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_REFLECTIVE(MSection):
+    '''
+    Parameters controlling the reflective wall
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.REFLECTIVE'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_REFLECTIVE_DIRECTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the direction of the wall.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.REFLECTIVE.DIRECTION'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL(MSection):
+    '''
+    Controls the activation of walls on COLVAR during a metadynamic run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_POSITION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the value of the colvar for the wall position
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.POSITION'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the type of wall
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.TYPE'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_GAUSSIAN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_GAUSSIAN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.GAUSSIAN'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUADRATIC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUADRATIC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUADRATIC'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUARTIC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_QUARTIC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.QUARTIC'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_REFLECTIVE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL_REFLECTIVE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL.REFLECTIVE'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR(MSection):
+    '''
+    This section specify the nature of the collective variables.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_COLVAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the colvar on which to apply metadynamics.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.COLVAR'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the friction term in Langevin integration of the collective variable in
+        the extended lagrangian scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.GAMMA'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_LAMBDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the lambda parameter of the collective variable in the extended
+        lagrangian scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.LAMBDA'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_MASS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the mass parameter of the collective variable in the extended lagrangian
+        scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.MASS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_METAVAR_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the scale factor for the following collective variable. The history
+        dependent term has the expression: WW * Sum_{j=1}^{nhills} Prod_{k=1}^{ncolvar}
+        [EXP[-0.5*((ss-ss0(k,j))/SCALE(k))^2]], where ncolvar is the number of defined
+        METAVAR and nhills is the number of spawned hills.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.METAVAR.SCALE'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR_WALL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR.WALL'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKERS_FILE_NAME(MSection):
+    '''
+    Specify the basename for the NUMBER_OF_WALKERS files used to communicate between the
+    walkers. Absolute path can be input as well together with the filename. One file will
+    be created for each spawned hill.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.WALKERS_FILE_NAME'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKERS_FILE_NAME_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specified the communication filename for each walker.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.WALKERS_FILE_NAME.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS(MSection):
+    '''
+    Enables and configures the metadynamics using multiple walkers.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_NUMBER_OF_WALKERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sets the total number of walkers in the metadynamic run.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.NUMBER_OF_WALKERS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the usage of the multiple walkers in a metadynamics run.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKER_COMM_FREQUENCY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sets the frequency (in unit of spawned hills) for the communication between the
+        several walkers, in order to update the local list of hills with the ones coming
+        from the other walkers
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.WALKER_COMM_FREQUENCY'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKER_ID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sets the walker ID for the local metadynamics run.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.WALKER_ID'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKERS_STATUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Stores the status of the several walkers in the local run.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.WALKERS_STATUS'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKERS_FILE_NAME = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS_WALKERS_FILE_NAME'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS.WALKERS_FILE_NAME'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_HEIGHT(MSection):
+    '''
+    The height of the spawned hills during metadynamics.Used for RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_HEIGHT'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_HEIGHT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the spawned hills
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_HEIGHT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_INVDT(MSection):
+    '''
+    The inverse of the DELTA_T parameter used for Well-Tempered metadynamics.Used for
+    RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_INVDT'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_INVDT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the spawned hills
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_INVDT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_POS(MSection):
+    '''
+    The position of the spawned hills during metadynamics.Used for RESTART.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_POS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_POS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the spawned hills
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_POS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_SCALE(MSection):
+    '''
+    The scales of the spawned hills during metadynamics.Used for RESTART. When a scale is
+    zero in one or more directions, the Gaussian hill is assumed to be infinitely wide in
+    those directions. The latter can be used to combine spawned hills from multiple 1D
+    metadynamics runs in one multidimensional metadynamics run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_SCALE'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_SCALE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the spawned hills
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_SCALE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN(MSection):
+    '''
+    This section sets parameters to set up a calculation of metadynamics.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_COLVAR_AVG_TEMPERATURE_RESTART = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        COLVAR average temperature. Only for restarting purposes.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.COLVAR_AVG_TEMPERATURE_RESTART'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_DELTA_T = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If Well-tempered metaD is used, the temperature parameter must be specified.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.DELTA_T'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_DO_HILLS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword enables the spawning of the hills. Default .FALSE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.DO_HILLS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_HILL_TAIL_CUTOFF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        By setting this variable larger than 0 the tail of the Gaussian hill  is damped to
+        zero faster. The Gaussian function is multiplied by a cutoff function that becomes
+        active at |x-X0|>HILL_TAIL_CUTOFF*SCALE, where X0 is the location of the Gaussian
+        and SCALE is the width of the Gaussian. For more than one METAVAR X0 and SCALE are
+        METAVAR-dependent.  (1-(|x-X0|/HILL_TAIL_CUTOFF*SCALE)^P_EXP)/(1-(|x-X0|/HILL_TAIL
+        _CUTOFF*SCALE)^Q_EXP)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.HILL_TAIL_CUTOFF'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_LAGRANGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies whether an extended-lagrangian should be used. Default .FALSE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.LAGRANGE'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_LANGEVIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a Lagrangian scheme is used the eq. motion of the COLVARS are integrated with a
+        LANGEVIN scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.LANGEVIN'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MIN_DISP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Minimum displacement between hills before placing a new hill.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MIN_DISP'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_MIN_NT_HILLS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the minimum MD step interval between spawning two hills. If specified, it
+        must be >= than NT_HILLS. In case MIN_DISP is used, if MIN_DISP is satisfied
+        before MIN_NT_HILLS MD steps have been performed, the MD will continue without any
+        spawning until MIN_NT_HILLS is reached. The default value has the net effect of
+        skipping this check.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.MIN_NT_HILLS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_NHILLS_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting value of previously spawned hills
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.NHILLS_START_VAL'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_NT_HILLS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the maximum MD step interval between spawning two hills. When negative, no
+        new hills are spawned and only the hills read from SPAWNED_HILLS_* are in effect.
+        The latteris useful when one wants to add a custom constant bias potential.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.NT_HILLS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_OLD_HILL_NUMBER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Index of the last hill spawned for this walker.Needed to calculate MIN_DISP
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.OLD_HILL_NUMBER'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_OLD_HILL_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Timestep of the last hill spawned for this walker.Needed to calculate MIN_DISP
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.OLD_HILL_STEP'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_P_EXPONENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponent at the numerator of the cutoff function to damp the tail of the Gaussian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.P_EXPONENT'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_PLUMED_INPUT_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the file name of the external plumed input file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.PLUMED_INPUT_FILE'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_Q_EXPONENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Exponent at the denominator of the cutoff function to damp the tail of the
+        Gaussian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.Q_EXPONENT'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_SLOW_GROWTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Let the last hill grow slowly over NT_HILLS.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.SLOW_GROWTH'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_STEP_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting step value for metadynamics
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.STEP_START_VAL'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_TAMCSTEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of sampling points for z
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.TAMCSTEPS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_TEMP_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a Lagrangian scheme is used the temperature tolerance for the collective
+        variables is specified.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.TEMP_TOL'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If a Lagrangian scheme is used the temperature for the collective variables is
+        specified.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.TEMPERATURE'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_TIMESTEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The length of an integration step for colvars (TAMC only)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.TIMESTEP'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_USE_PLUMED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify whether to use plumed as an external metadynamics driver.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.USE_PLUMED'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_WELL_TEMPERED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword enables Well-tempered metadynamics. Default .FALSE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.WELL_TEMPERED'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_WTGAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If Well-tempered metaD is used, the gamma parameter must be specified if not
+        DELTA_T.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.WTGAMMA'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METADYN_WW = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the height of the gaussian to spawn. Default 0.1 .
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METADYN.WW'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_FS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_FS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_FS'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS0 = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS0'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_SS0'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_SS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_SS'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_VVP = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_EXT_LAGRANGE_VVP'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.EXT_LAGRANGE_VVP'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_METAVAR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.METAVAR'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_MULTIPLE_WALKERS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.MULTIPLE_WALKERS'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_HEIGHT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_HEIGHT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_HEIGHT'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_INVDT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_INVDT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_INVDT'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_POS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_POS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_POS'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_SCALE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN_SPAWNED_HILLS_SCALE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN.SPAWNED_HILLS_SCALE'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL(MSection):
+    '''
+    This section specify parameters controlling the convergence of the free energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_COARSE_GRAINED_POINTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the minimum amount of coarse grained points to collect before starting the
+        statistical analysis
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.COARSE_GRAINED_POINTS'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_COARSE_GRAINED_WIDTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Width of segments in MD steps to generate the set of coarse grained data,
+        providing a correlation independent data set.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.COARSE_GRAINED_WIDTH'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_EPS_CONV = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the relative tolerance for the convergence of the collective variable averages
+        used to compute the free energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.EPS_CONV'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_K_CONFIDENCE_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the confidence limit for the Mann-Kendall trend test.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.K_CONFIDENCE_LIMIT'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_MAX_COARSE_GRAINED_WIDTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Max Width of segments in MD steps to generate the set of coarse grained data.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.MAX_COARSE_GRAINED_WIDTH'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_SW_CONFIDENCE_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the confidence limit for the Shapiro-Wilks normality test.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.SW_CONFIDENCE_LIMIT'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL_VN_CONFIDENCE_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the confidence limit for the Von Neumann serial correlation test.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL.VN_CONFIDENCE_LIMIT'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_UVAR(MSection):
+    '''
+    This section specify the nature of the collective variables used in computing the free
+    energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.UVAR'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_UVAR_COLVAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the colvar used to compute free energy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.UVAR.COLVAR'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION(MSection):
+    '''
+    Controls the calculation of free energy derivatives with the umbrella integration
+    method.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_CONVERGENCE_CONTROL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.CONVERGENCE_CONTROL'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_UVAR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION_UVAR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION.UVAR'))
+
+
+class x_cp2k_section_input_MOTION_FREE_ENERGY(MSection):
+    '''
+    Controls the calculation of free energy and free energy derivatives with different
+    possible methods
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY'))
+
+    x_cp2k_input_MOTION_FREE_ENERGY_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the method to use to compute free energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.FREE_ENERGY.METHOD'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_ALCHEMICAL_CHANGE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.ALCHEMICAL_CHANGE'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_FREE_ENERGY_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.FREE_ENERGY_INFO'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_METADYN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.METADYN'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY_UMBRELLA_INTEGRATION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY.UMBRELLA_INTEGRATION'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_BFGS_RESTART(MSection):
+    '''
+    Controls the printing of Hessian Restart file
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.BFGS.RESTART'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART.ADD_LAST'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART.FILENAME'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_BFGS(MSection):
+    '''
+    Provides parameters to tune the BFGS optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.BFGS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the file used to read the initial Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART_FILE_NAME'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_RESTART_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the reading of the initial Hessian from file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.RESTART_HESSIAN'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_TRUST_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Trust radius used in BFGS. Previously set to 0.1. Large values can lead to
+        instabilities
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.TRUST_RADIUS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_USE_MODEL_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a model Hessian as initial guess instead of a unit matrix. Should lead in
+        general to improved convergence might be switched off for exotic cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.USE_MODEL_HESSIAN'))
+
+    x_cp2k_input_MOTION_GEO_OPT_BFGS_USE_RAT_FUN_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Includes a rational function optimization to determine the step. Previously
+        default but did not improve convergence in many cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.BFGS.USE_RAT_FUN_OPT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_BFGS_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_BFGS_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.BFGS.RESTART'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH_2PNT(MSection):
+    '''
+    Provides parameters to tune the line search for the two point based line search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_2PNT_LINMIN_GRAD_ONLY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use only the gradient, not the energy for line minimizations (e.g. in conjugate
+        gradients).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.2PNT.LINMIN_GRAD_ONLY'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_2PNT_MAX_ALLOWED_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Max allowed value for the line search step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.2PNT.MAX_ALLOWED_STEP'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD(MSection):
+    '''
+    Provides parameters to tune the line search for the gold search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG.LINE_SEARCH.GOLD'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD_BRACK_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Limit in 1D bracketing during line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.GOLD.BRACK_LIMIT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD_BRENT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iterations in brent algorithm (used for the line search in
+        Conjugated Gradients Optimization)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.GOLD.BRENT_MAX_ITER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD_BRENT_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance requested during Brent line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.GOLD.BRENT_TOL'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD_INITIAL_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size used, e.g. for bracketing or minimizers. Might need to be
+        reduced for systems with close contacts
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.GOLD.INITIAL_STEP'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH(MSection):
+    '''
+    Provides parameters to tune the line search during the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG.LINE_SEARCH'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_LINE_SEARCH_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        1D line search algorithm to be used with the CG optimizer, in increasing order of
+        robustness and cost.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.LINE_SEARCH.TYPE'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH_2PNT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH_2PNT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH_GOLD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG.LINE_SEARCH.GOLD'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_CG(MSection):
+    '''
+    Provides parameters to tune the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_FLETCHER_REEVES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses FLETCHER-REEVES instead of POLAK-RIBIERE when using Conjugate Gradients
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.FLETCHER_REEVES'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_MAX_STEEP_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of steepest descent steps before starting the conjugate gradients
+        optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.MAX_STEEP_STEPS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_CG_RESTART_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cosine of the angle between two consecutive searching directions. If the angle
+        during a CG optimization is less than the one corresponding to  to the
+        RESTART_LIMIT the CG is reset and one step of steepest descent is  performed.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.CG.RESTART_LIMIT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_CG_LINE_SEARCH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG.LINE_SEARCH'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_LBFGS(MSection):
+    '''
+    Provides parameters to tune the limited memory BFGS (LBFGS) optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.LBFGS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_LBFGS_MAX_F_PER_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of force evaluations per iteration(used for the line search)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.LBFGS.MAX_F_PER_ITER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_LBFGS_MAX_H_RANK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum rank (and consequently size) of the approximate Hessian matrix used by the
+        LBFGS optimizer. Larger values (e.g. 30) will accelerate the convergence behaviour
+        at the cost of a larger memory consumption.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.LBFGS.MAX_H_RANK'))
+
+    x_cp2k_input_MOTION_GEO_OPT_LBFGS_WANTED_PROJ_GRADIENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested norm threshold of the
+        gradient multiplied by the approximate Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.LBFGS.WANTED_PROJ_GRADIENT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_LBFGS_WANTED_REL_F_ERROR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested relative error on the
+        objective functionof the optimizer (the energy)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.LBFGS.WANTED_REL_F_ERROR'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_DIMER_VECTOR(MSection):
+    '''
+    Specifies the initial dimer vector (used frequently to restart DIMER calculations). If
+    not provided the starting orientation of the dimer is chosen randomly.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.DIMER_VECTOR'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_DIMER_VECTOR_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify on each line the components of the dimer vector.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.DIMER_VECTOR.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART(MSection):
+    '''
+    Controls the printing of Hessian Restart file
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART.ADD_LAST'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART.FILENAME'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS(MSection):
+    '''
+    Provides parameters to tune the BFGS optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the file used to read the initial Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART_FILE_NAME'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the reading of the initial Hessian from file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART_HESSIAN'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_TRUST_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Trust radius used in BFGS. Previously set to 0.1. Large values can lead to
+        instabilities
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.TRUST_RADIUS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_USE_MODEL_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a model Hessian as initial guess instead of a unit matrix. Should lead in
+        general to improved convergence might be switched off for exotic cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.USE_MODEL_HESSIAN'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_USE_RAT_FUN_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Includes a rational function optimization to determine the step. Previously
+        default but did not improve convergence in many cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.USE_RAT_FUN_OPT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS.RESTART'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_2PNT(MSection):
+    '''
+    Provides parameters to tune the line search for the two point based line search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_2PNT_LINMIN_GRAD_ONLY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use only the gradient, not the energy for line minimizations (e.g. in conjugate
+        gradients).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.2PNT.LINMIN_GRAD_ONLY'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_2PNT_MAX_ALLOWED_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Max allowed value for the line search step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.2PNT.MAX_ALLOWED_STEP'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD(MSection):
+    '''
+    Provides parameters to tune the line search for the gold search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.GOLD'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD_BRACK_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Limit in 1D bracketing during line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.GOLD.BRACK_LIMIT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD_BRENT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iterations in brent algorithm (used for the line search in
+        Conjugated Gradients Optimization)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.GOLD.BRENT_MAX_ITER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD_BRENT_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance requested during Brent line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.GOLD.BRENT_TOL'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD_INITIAL_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size used, e.g. for bracketing or minimizers. Might need to be
+        reduced for systems with close contacts
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.GOLD.INITIAL_STEP'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH(MSection):
+    '''
+    Provides parameters to tune the line search during the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        1D line search algorithm to be used with the CG optimizer, in increasing order of
+        robustness and cost.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.TYPE'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_2PNT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_2PNT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH_GOLD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH.GOLD'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG(MSection):
+    '''
+    Provides parameters to tune the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_FLETCHER_REEVES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses FLETCHER-REEVES instead of POLAK-RIBIERE when using Conjugate Gradients
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.FLETCHER_REEVES'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_MAX_STEEP_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of steepest descent steps before starting the conjugate gradients
+        optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.MAX_STEEP_STEPS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_RESTART_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cosine of the angle between two consecutive searching directions. If the angle
+        during a CG optimization is less than the one corresponding to  to the
+        RESTART_LIMIT the CG is reset and one step of steepest descent is  performed.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.RESTART_LIMIT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG_LINE_SEARCH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG.LINE_SEARCH'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS(MSection):
+    '''
+    Provides parameters to tune the limited memory BFGS (LBFGS) optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.LBFGS'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS_MAX_F_PER_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of force evaluations per iteration(used for the line search)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.LBFGS.MAX_F_PER_ITER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS_MAX_H_RANK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum rank (and consequently size) of the approximate Hessian matrix used by the
+        LBFGS optimizer. Larger values (e.g. 30) will accelerate the convergence behaviour
+        at the cost of a larger memory consumption.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.LBFGS.MAX_H_RANK'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS_WANTED_PROJ_GRADIENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested norm threshold of the
+        gradient multiplied by the approximate Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.LBFGS.WANTED_PROJ_GRADIENT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS_WANTED_REL_F_ERROR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested relative error on the
+        objective functionof the optimizer (the energy)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.LBFGS.WANTED_REL_F_ERROR'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT(MSection):
+    '''
+    This section sets the environment for the optimization of the rotation of the Dimer.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_MAX_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum geometry change between the current and the
+        last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.MAX_DR'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_MAX_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum force component of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.MAX_FORCE'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum number of geometry optimization steps. One step might imply
+        several force evaluations for the CG and LBFGS optimizers.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.MAX_ITER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_OPTIMIZER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which method to use to perform a geometry optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.OPTIMIZER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_RMS_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) geometry change between the
+        current and the last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.RMS_DR'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_RMS_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) force of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.RMS_FORCE'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_STEP_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting step value for the ROT_OPT module.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.STEP_START_VAL'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_BFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.BFGS'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_CG'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.CG'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT_LBFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT.LBFGS'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER(MSection):
+    '''
+    Specifies parameters for Dimer Method
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ANGLE_TOLERANCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword sets the value of the tolerance angle for the line search  performed
+        to optimize the orientation of the dimer.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ANGLE_TOLERANCE'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword sets the value for the DR parameter.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.DR'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_INTERPOLATE_GRADIENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword controls the interpolation of the gradient whenever possible during
+        the optimization of the Dimer. The use of this keywords saves 1 evaluation  of
+        energy/forces.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.INTERPOLATE_GRADIENT'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_DIMER_VECTOR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_DIMER_VECTOR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.DIMER_VECTOR'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER_ROT_OPT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER.ROT_OPT'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE(MSection):
+    '''
+    Specifies parameters to perform a transition state search
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TRANSITION_STATE_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which kind of method to use for locating transition states
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TRANSITION_STATE.METHOD'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE_DIMER'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE.DIMER'))
+
+
+class x_cp2k_section_input_MOTION_GEO_OPT(MSection):
+    '''
+    This section sets the environment of the geometry optimizer.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT'))
+
+    x_cp2k_input_MOTION_GEO_OPT_MAX_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum geometry change between the current and the
+        last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.MAX_DR'))
+
+    x_cp2k_input_MOTION_GEO_OPT_MAX_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum force component of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.MAX_FORCE'))
+
+    x_cp2k_input_MOTION_GEO_OPT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum number of geometry optimization steps. One step might imply
+        several force evaluations for the CG and LBFGS optimizers.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.MAX_ITER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_OPTIMIZER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which method to use to perform a geometry optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.OPTIMIZER'))
+
+    x_cp2k_input_MOTION_GEO_OPT_RMS_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) geometry change between the
+        current and the last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.RMS_DR'))
+
+    x_cp2k_input_MOTION_GEO_OPT_RMS_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) force of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.RMS_FORCE'))
+
+    x_cp2k_input_MOTION_GEO_OPT_STEP_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting step value for the GEO_OPT module.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.STEP_START_VAL'))
+
+    x_cp2k_input_MOTION_GEO_OPT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which kind of geometry optimization to perform
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.GEO_OPT.TYPE'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_BFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_BFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.BFGS'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_CG = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_CG'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.CG'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_LBFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_LBFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.LBFGS'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT_TRANSITION_STATE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT.TRANSITION_STATE'))
+
+
+class x_cp2k_section_input_MOTION_MC_AVBMC(MSection):
+    '''
+    Parameters for Aggregation Volume Bias Monte Carlo (AVBMC) which explores cluster
+    formation and destruction. Chen and Siepmann, J. Phys. Chem. B 105, 11275-11282
+    (2001).
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.AVBMC'))
+
+    x_cp2k_input_MOTION_MC_AVBMC_AVBMC_ATOM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The target atom for an AVBMC swap move for each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.AVBMC.AVBMC_ATOM'))
+
+    x_cp2k_input_MOTION_MC_AVBMC_AVBMC_RMAX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The outer radius for an AVBMC swap move, in angstroms, for every molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.AVBMC.AVBMC_RMAX'))
+
+    x_cp2k_input_MOTION_MC_AVBMC_AVBMC_RMIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The inner radius for an AVBMC swap move, in angstroms for every molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.AVBMC.AVBMC_RMIN'))
+
+    x_cp2k_input_MOTION_MC_AVBMC_PBIAS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of swapping to an inner region in an AVBMC swap move for each
+        molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.AVBMC.PBIAS'))
+
+
+class x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS_BOX_DISPLACEMENTS(MSection):
+    '''
+    Maximum displacements for any move that is performed on each simulation box.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MAX_DISPLACEMENTS.BOX_DISPLACEMENTS'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISPLACEMENTS_BOX_DISPLACEMENTS_RMVOLUME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum volume displacement, in angstrom**3.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISPLACEMENTS.BOX_DISPLACEMENTS.RMVOLUME'))
+
+
+class x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS(MSection):
+    '''
+    Maximum displacements for every move type that requires a value for each molecular
+    type in the simulation.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS_RMANGLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum bond angle displacement, in degrees, for each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS.RMANGLE'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS_RMBOND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum bond length displacement, in angstroms, for each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS.RMBOND'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS_RMDIHEDRAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum dihedral angle distplacement, in degrees, for each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS.RMDIHEDRAL'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS_RMROT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum rotational displacement, in degrees, for each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS.RMROT'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS_RMTRANS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum translational displacement, in angstroms, for each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS.RMTRANS'))
+
+
+class x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS(MSection):
+    '''
+    The maximum displacements for all attempted moves.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MAX_DISPLACEMENTS'))
+
+    x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS_BOX_DISPLACEMENTS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS_BOX_DISPLACEMENTS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MAX_DISPLACEMENTS.BOX_DISPLACEMENTS'))
+
+    x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS_MOL_DISPLACEMENTS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MAX_DISPLACEMENTS.MOL_DISPLACEMENTS'))
+
+
+class x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES_BOX_PROBABILITIES(MSection):
+    '''
+    Probabilities of attempting various moves types on the box.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_PROBABILITIES.BOX_PROBABILITIES'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_BOX_PROBABILITIES_PMHMC_BOX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a HMC move on this box.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.BOX_PROBABILITIES.PMHMC_BOX'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_BOX_PROBABILITIES_PMVOL_BOX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a volume move on this box (GEMC_NpT).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.BOX_PROBABILITIES.PMVOL_BOX'))
+
+
+class x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES(MSection):
+    '''
+    Probabilities of attempting various moves types on the various molecular types present
+    in the simulation.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES_PMAVBMC_MOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting an AVBMC swap move on each molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES.PMAVBMC_MOL'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES_PMROT_MOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a molecule rotation of a given molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES.PMROT_MOL'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES_PMSWAP_MOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a molecule swap of a given molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES.PMSWAP_MOL'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES_PMTRAION_MOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a conformational change of a given molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES.PMTRAION_MOL'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES_PMTRANS_MOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a molecule translation of a given molecule type.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES.PMTRANS_MOL'))
+
+
+class x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES(MSection):
+    '''
+    Parameters for fraction of moves performed for each move type.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_PROBABILITIES'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_PMAVBMC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting an AVBMC swap move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.PMAVBMC'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_PMHMC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a hybrid MC move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.PMHMC'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_PMSWAP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a swap move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.PMSWAP'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_PMTRAION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a conformational change.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.PMTRAION'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_PMTRANS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a molecule translation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.PMTRANS'))
+
+    x_cp2k_input_MOTION_MC_MOVE_PROBABILITIES_PMVOLUME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The probability of attempting a volume move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_PROBABILITIES.PMVOLUME'))
+
+    x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES_BOX_PROBABILITIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES_BOX_PROBABILITIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_PROBABILITIES.BOX_PROBABILITIES'))
+
+    x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES_MOL_PROBABILITIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_PROBABILITIES.MOL_PROBABILITIES'))
+
+
+class x_cp2k_section_input_MOTION_MC_MOVE_UPDATES(MSection):
+    '''
+    Frequency for updating move maximum displacements.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_UPDATES'))
+
+    x_cp2k_input_MOTION_MC_MOVE_UPDATES_IUPTRANS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Every iuptrans steps update maximum translation/rotation/configurational changes.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_UPDATES.IUPTRANS'))
+
+    x_cp2k_input_MOTION_MC_MOVE_UPDATES_IUPVOLUME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Every iupvolume steps update maximum volume displacement.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVE_UPDATES.IUPVOLUME'))
+
+
+class x_cp2k_section_input_MOTION_MC(MSection):
+    '''
+    This section sets parameters to set up a MonteCarlo calculation.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC'))
+
+    x_cp2k_input_MOTION_MC_BOX2_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        For GEMC, the name of the input file for the other box.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.BOX2_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_CELL_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print current cell length info to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.CELL_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_COORDINATE_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print the current coordinates to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.COORDINATE_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_DATA_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print current configurational info to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.DATA_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_DISCRETE_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The size of the discrete volume move step, in angstroms.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.DISCRETE_STEP'))
+
+    x_cp2k_input_MOTION_MC_ENERGY_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print current energies to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.ENERGY_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_ENSEMBLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the type of simulation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.ENSEMBLE'))
+
+    x_cp2k_input_MOTION_MC_ETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The free energy bias (in Kelvin) for swapping a molecule of each type into this
+        box.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.ETA'))
+
+    x_cp2k_input_MOTION_MC_IPRINT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Prints coordinate/cell/etc information every IPRINT steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.IPRINT'))
+
+    x_cp2k_input_MOTION_MC_LBIAS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Dictates if we presample moves with a different potential.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.LBIAS'))
+
+    x_cp2k_input_MOTION_MC_LDISCRETE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Changes the volume of the box in discrete steps, one side at a time.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.LDISCRETE'))
+
+    x_cp2k_input_MOTION_MC_LSTOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Makes nstep in terms of steps, instead of cycles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.LSTOP'))
+
+    x_cp2k_input_MOTION_MC_MAX_DISP_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print current maximum displacement info to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MAX_DISP_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_MOLECULES_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print the number of molecules to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOLECULES_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_MOVES_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The file to print the move statistics to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.MOVES_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_NMOVES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the number of classical moves between energy evaluations.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.NMOVES'))
+
+    x_cp2k_input_MOTION_MC_NSTEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the number of MC cycles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.NSTEP'))
+
+    x_cp2k_input_MOTION_MC_NSWAPMOVES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many insertions to try per swap move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.NSWAPMOVES'))
+
+    x_cp2k_input_MOTION_MC_NVIRIAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use this many random orientations to compute the second virial coefficient
+        (ENSEMBLE=VIRIAL)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.NVIRIAL'))
+
+    x_cp2k_input_MOTION_MC_PRESSURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The pressure for NpT simulations, in bar.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.PRESSURE'))
+
+    x_cp2k_input_MOTION_MC_RANDOMTOSKIP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of random numbers from the acceptance/rejection stream to skip
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.RANDOMTOSKIP'))
+
+    x_cp2k_input_MOTION_MC_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the restart file for MC information.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.RESTART_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MC_RESTART = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Read initial configuration from restart file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.RESTART'))
+
+    x_cp2k_input_MOTION_MC_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The temperature of the simulation, in Kelvin.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.TEMPERATURE'))
+
+    x_cp2k_input_MOTION_MC_VIRIAL_TEMPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The temperatures you wish to compute the virial coefficient for.  Only used if
+        ensemble=VIRIAL.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MC.VIRIAL_TEMPS'))
+
+    x_cp2k_section_input_MOTION_MC_AVBMC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_AVBMC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.AVBMC'))
+
+    x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MAX_DISPLACEMENTS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MAX_DISPLACEMENTS'))
+
+    x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MOVE_PROBABILITIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_PROBABILITIES'))
+
+    x_cp2k_section_input_MOTION_MC_MOVE_UPDATES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC_MOVE_UPDATES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC.MOVE_UPDATES'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION(MSection):
+    '''
+    This section provides the possibility to define arbitrary region  for the fast
+    thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.DEFINE_REGION'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms to thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.DEFINE_REGION.LIST'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION_MM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all  MM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.DEFINE_REGION.MM_SUBSYS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecules to thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.DEFINE_REGION.MOLNAME'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION_QM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all QM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.DEFINE_REGION.QM_SUBSYS'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_COORD(MSection):
+    '''
+    The positions for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.COORD'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_FORCE(MSection):
+    '''
+    The forces for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.FORCE'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_FORCE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.FORCE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_MASS(MSection):
+    '''
+    The masses for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.MASS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_VELOCITY(MSection):
+    '''
+    The velocities for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.VELOCITY'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE(MSection):
+    '''
+    paramameters of the Nose Hoover thermostat chain
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_LENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        length of the Nose-Hoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.LENGTH'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_MTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of multiple timesteps to be used for the NoseHoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.MTS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        timeconstant of the thermostat chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.TIMECON'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_YOSHIDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        order of the yoshida integretor used for the thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.YOSHIDA'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.COORD'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_FORCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_FORCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.FORCE'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.MASS'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST(MSection):
+    '''
+    Specify thermostat type and parameters controlling the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_REGION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the defined region for fast thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.REGION'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the thermostat used for the constant temperature ensembles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.TYPE'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_DEFINE_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.DEFINE_REGION'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST_NOSE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST.NOSE'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION(MSection):
+    '''
+    This section provides the possibility to define arbitrary region  for the slow
+    thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.DEFINE_REGION'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms to thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.DEFINE_REGION.LIST'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION_MM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all  MM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.DEFINE_REGION.MM_SUBSYS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecules to thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.DEFINE_REGION.MOLNAME'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION_QM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all QM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.DEFINE_REGION.QM_SUBSYS'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_COORD(MSection):
+    '''
+    The positions for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.COORD'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_FORCE(MSection):
+    '''
+    The forces for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.FORCE'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_FORCE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.FORCE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_MASS(MSection):
+    '''
+    The masses for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.MASS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_VELOCITY(MSection):
+    '''
+    The velocities for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.VELOCITY'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE(MSection):
+    '''
+    paramameters of the Nose Hoover thermostat chain
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_LENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        length of the Nose-Hoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.LENGTH'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_MTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of multiple timesteps to be used for the NoseHoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.MTS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        timeconstant of the thermostat chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.TIMECON'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_YOSHIDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        order of the yoshida integretor used for the thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.YOSHIDA'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.COORD'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_FORCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_FORCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.FORCE'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.MASS'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW(MSection):
+    '''
+    Specify thermostat type and parameters controlling the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_REGION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the defined region for slow thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.REGION'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the thermostat used for the constant temperature ensembles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.TYPE'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_DEFINE_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.DEFINE_REGION'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW_NOSE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW.NOSE'))
+
+
+class x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS(MSection):
+    '''
+    Parameters used in canonical adiabatic free energy sampling (CAFES).
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_N_RESP_FAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of respa steps for fast degrees of freedom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.N_RESP_FAST'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_TEMP_FAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Temperature in K used to control the fast degrees of freedom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.TEMP_FAST'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_TEMP_SLOW = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Temperature in K used to control the slow degrees of freedom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.TEMP_SLOW'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_TEMP_TOL_FAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum accepted temperature deviation from the expected value, for the fast
+        motion.If 0, no rescaling is performed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.TEMP_TOL_FAST'))
+
+    x_cp2k_input_MOTION_MD_ADIABATIC_DYNAMICS_TEMP_TOL_SLOW = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum accepted temperature deviation from the expected value, for the slow
+        motion.If 0, no rescaling is performed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ADIABATIC_DYNAMICS.TEMP_TOL_SLOW'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_FAST'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_FAST'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS_THERMOSTAT_SLOW'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS.THERMOSTAT_SLOW'))
+
+
+class x_cp2k_section_input_MOTION_MD_AVERAGES_PRINT_AVERAGES(MSection):
+    '''
+    Controls the output the averaged quantities
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.AVERAGES.PRINT_AVERAGES'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_PRINT_AVERAGES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.PRINT_AVERAGES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_PRINT_AVERAGES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.PRINT_AVERAGES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_PRINT_AVERAGES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.PRINT_AVERAGES.FILENAME'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_PRINT_AVERAGES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.PRINT_AVERAGES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_PRINT_AVERAGES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.PRINT_AVERAGES.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_MD_AVERAGES_RESTART_AVERAGES(MSection):
+    '''
+    Stores information for restarting averages.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.AVERAGES.RESTART_AVERAGES'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_COLVARS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        COLVARS averages
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_COLVARS'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_ECONS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CONSTANT ENERGY average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_ECONS'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_MMATRIX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        METRIC TENSOR averages
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_MMATRIX'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PRESS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PRESSURE average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PRESS'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PV_CNSTR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PV CONSTRAINTS average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PV_CNSTR'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PV_FOCK_4C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PV XC average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PV_FOCK_4C'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PV_KIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PV KINETIC average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PV_KIN'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PV_TOT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PV TOTAL average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PV_TOT'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PV_VIR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PV VIRIAL average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PV_VIR'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PV_XC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PV XC average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PV_XC'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVE_PXX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        P_{XX} average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVE_PXX'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEALPHA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        ALPHA cell angle average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEALPHA'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEBETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        BETA cell angle average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEBETA'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVECELL_A = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CELL VECTOR A average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVECELL_A'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVECELL_B = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CELL VECTOR B average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVECELL_B'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVECELL_C = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CELL VECTOR C average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVECELL_C'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVECPU = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        CPU average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVECPU'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEGAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        GAMMA cell angle average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEGAMMA'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEHUGONIOT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        HUGONIOT average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEHUGONIOT'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEKIN_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        QM KINETIC ENERGY average in QMMM runs
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEKIN_QM'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEKIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        KINETIC ENERGY average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEKIN'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEPOT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        POTENTIAL ENERGY average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEPOT'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVETEMP_BARO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        BAROSTAT TEMPERATURE average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVETEMP_BARO'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVETEMP_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        QM TEMPERATURE average in QMMM runs
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVETEMP_QM'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVETEMP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        TEMPERATURE average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVETEMP'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_AVEVOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        VOLUME average
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.AVEVOL'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_RESTART_AVERAGES_ITIMES_START = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        TIME STEP starting the evaluation of averages
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.RESTART_AVERAGES.ITIMES_START'))
+
+
+class x_cp2k_section_input_MOTION_MD_AVERAGES(MSection):
+    '''
+    Controls the calculation of the averages during an MD run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.AVERAGES'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_ACQUISITION_START_TIME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Setup up the simulation time when the acquisition process to compute  averages is
+        started.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.ACQUISITION_START_TIME'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_AVERAGE_COLVAR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Switch for computing the averages of COLVARs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.AVERAGE_COLVAR'))
+
+    x_cp2k_input_MOTION_MD_AVERAGES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the calculations of the averages.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.AVERAGES.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_MD_AVERAGES_PRINT_AVERAGES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_AVERAGES_PRINT_AVERAGES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.AVERAGES.PRINT_AVERAGES'))
+
+    x_cp2k_section_input_MOTION_MD_AVERAGES_RESTART_AVERAGES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_AVERAGES_RESTART_AVERAGES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.AVERAGES.RESTART_AVERAGES'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_MASS(MSection):
+    '''
+    The masses for BAROSTAT used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.MASS'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_CHI(MSection):
+    '''
+    Information to initialize the Ad-Langevin thermostat DOF CHI
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.CHI'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_CHI_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat DOF CHI for Ad-Langevin thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.CHI.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_MASS(MSection):
+    '''
+    Information to initialize the Ad-Langevin thermostat DOF MASS
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.MASS'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat DOF MASS for Ad-Langevin thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN(MSection):
+    '''
+    Parameters of the adaptive-Langevin thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_TIMECON_LANGEVIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the Langevin part of the AD_LANGEVIN thermostat. A small time
+        constant will result in strong thermostatting (useful for initial equilibrations)
+        and a large time constant would be adequate to get weak thermostatting in
+        production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.TIMECON_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_TIMECON_NH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the Nose-Hoover part of the AD_LANGEVIN thermostat. A small time
+        constant will result in strong thermostatting (useful for initial equilibrations)
+        and a large time constant would be adequate to get weak thermostatting in
+        production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.TIMECON_NH'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_CHI = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_CHI'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.CHI'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN.MASS'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.RNG_INIT'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR(MSection):
+    '''
+    Parameters of the canonical sampling through velocity rescaling thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the CSVR thermostat. A small time constant will result in strong
+        thermostatting (useful for initial equilibrations) and a large time constant would
+        be adequate to get weak thermostatting in production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.TIMECON'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.RNG_INIT'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_S(MSection):
+    '''
+    The s variable for GLE used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.S'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_S_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify s variable for GLE thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.S.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE(MSection):
+    '''
+    paramameters of the gle thermostat. This section can be generated  from https://epfl-
+    cosmo.github.io/gle4md/index.html?page=matrix
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_A_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        A matrix The defaults give optimal sampling for most cristalline and liquid
+        compounds. Generated with the parameters set kv_4-4.acentered on w_0=40 cm^-1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.A_LIST'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_A_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scaling factor for matrix A (for generic matrix A, depends on the characteristic
+        frequency of the system).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.A_SCALE'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_C_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        C matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.C_LIST'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_NDIM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of the gle matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.NDIM'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_S = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_S'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.S'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_COORD(MSection):
+    '''
+    The positions for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.COORD'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_FORCE(MSection):
+    '''
+    The forces for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.FORCE'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_FORCE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.FORCE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_MASS(MSection):
+    '''
+    The masses for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.MASS'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_VELOCITY(MSection):
+    '''
+    The velocities for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.VELOCITY'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE(MSection):
+    '''
+    paramameters of the Nose Hoover thermostat chain
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_LENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        length of the Nose-Hoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.LENGTH'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_MTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of multiple timesteps to be used for the NoseHoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.MTS'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        timeconstant of the thermostat chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.TIMECON'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_YOSHIDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        order of the yoshida integretor used for the thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.YOSHIDA'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.COORD'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_FORCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_FORCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.FORCE'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.MASS'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT(MSection):
+    '''
+    Specify thermostat type and parameters controlling the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_THERMOSTAT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the thermostat used for the constant temperature ensembles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.THERMOSTAT.TYPE'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_AD_LANGEVIN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.AD_LANGEVIN'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_CSVR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.CSVR'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_GLE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.GLE'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT_NOSE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT.NOSE'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT_VELOCITY(MSection):
+    '''
+    The velocities for BAROSTAT used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.VELOCITY'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_BAROSTAT(MSection):
+    '''
+    Parameters of barostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_PRESSURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial pressure
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.PRESSURE'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_TEMP_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum oscillation of the Barostat temperature imposed by rescaling.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.TEMP_TOL'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Barostat initial temperature. If not set, the ensemble temperature is used
+        instead.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.TEMPERATURE'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Barostat time constant
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.TIMECON'))
+
+    x_cp2k_input_MOTION_MD_BAROSTAT_VIRIAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        For NPT_F only: allows the screening of one or more components of the virial in
+        order to relax the cell only along specific cartesian axis
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.BAROSTAT.VIRIAL'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.MASS'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_THERMOSTAT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.THERMOSTAT'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_MD_CASCADE_ATOM_LIST(MSection):
+    '''
+    Defines a list of atoms for which the initial velocities are modified
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.CASCADE.ATOM_LIST'))
+
+    x_cp2k_input_MOTION_MD_CASCADE_ATOM_LIST_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the list of atoms for which the velocities are modified. Each record
+        consists of the atomic index, the velocity vector, and a weight to define which
+        fraction of the total energy is assigned to the current
+        atom:<p><tt><big>Atomic_index v<sub>x</sub> v<sub>y</sub> v<sub>x</sub>
+        Weight</big></tt></p>
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.CASCADE.ATOM_LIST.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_CASCADE(MSection):
+    '''
+    Defines the parameters for the setup of a cascade simulation.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.CASCADE'))
+
+    x_cp2k_input_MOTION_MD_CASCADE_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Total energy transferred to the system during the cascade event.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.CASCADE.ENERGY'))
+
+    x_cp2k_input_MOTION_MD_CASCADE_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the activation of the CASCADE section.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.CASCADE.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_MD_CASCADE_ATOM_LIST = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_CASCADE_ATOM_LIST'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.CASCADE.ATOM_LIST'))
+
+
+class x_cp2k_section_input_MOTION_MD_LANGEVIN(MSection):
+    '''
+    Controls the set of parameters to run a Langevin MD. The integrator used follows that
+    given in the article by Ricci et al. The user can define regions in the system where
+    the atoms inside undergoes Langevin MD, while those outside the regions undergoes NVE
+    Born Oppenheimer MD. To define the regions, the user should use THERMAL_REGION
+    subsection of MOTION%MD. The theory for Langevin MD involving sub-regions can be found
+    in articles by Kantorovitch et al. All the references can be found in the links below.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_LANGEVIN_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Gamma parameter for the Langevin dynamics (LD)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.LANGEVIN.GAMMA'))
+
+    x_cp2k_input_MOTION_MD_LANGEVIN_NOISY_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Imaginary Langevin Friction term for LD with noisy forces.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.LANGEVIN.NOISY_GAMMA'))
+
+    x_cp2k_input_MOTION_MD_LANGEVIN_SHADOW_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Shadow Langevin Friction term for LD with noisy forces in order to adjust
+        Noisy_Gamma.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.LANGEVIN.SHADOW_GAMMA'))
+
+
+class x_cp2k_section_input_MOTION_MD_MSST(MSection):
+    '''
+    Parameters for Multi-Scale Shock Technique (MSST) which simulate the effect of a
+    steady planar shock on a unit cell. Reed et. al. Physical Review Letters 90, 235503
+    (2003).
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.MSST'))
+
+    x_cp2k_input_MOTION_MD_MSST_CMASS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Effective cell mass
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.MSST.CMASS'))
+
+    x_cp2k_input_MOTION_MD_MSST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial energy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.MSST.ENERGY'))
+
+    x_cp2k_input_MOTION_MD_MSST_GAMMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Damping coefficient for cell volume
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.MSST.GAMMA'))
+
+    x_cp2k_input_MOTION_MD_MSST_PRESSURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial pressure
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.MSST.PRESSURE'))
+
+    x_cp2k_input_MOTION_MD_MSST_VOLUME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial volume
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.MSST.VOLUME'))
+
+    x_cp2k_input_MOTION_MD_MSST_VSHOCK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Velocity shock
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.MSST.VSHOCK'))
+
+
+class x_cp2k_section_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION(MSection):
+    '''
+    This section provides the possibility to define arbitrary region  for the MSD
+    calculation.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.REFTRAJ.MSD.DEFINE_REGION'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms to thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.DEFINE_REGION.LIST'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION_MM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all  MM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.DEFINE_REGION.MM_SUBSYS'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecules to thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.DEFINE_REGION.MOLNAME'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION_QM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all QM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.DEFINE_REGION.QM_SUBSYS'))
+
+
+class x_cp2k_section_input_MOTION_MD_REFTRAJ_MSD(MSection):
+    '''
+    Loads an external trajectory file and performs analysis on the loaded snapshots.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.REFTRAJ.MSD'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_DISPLACED_ATOM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Identify the atoms that moved from their initialposition of a distance larger than
+        a given tolerance (see msd%displacement_tol).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.DISPLACED_ATOM'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_DISPLACEMENT_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Lower limit to define displaced atoms
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.DISPLACEMENT_TOL'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_MSD_PER_KIND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set up the calculation of the MSD for each atomic kind
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.MSD_PER_KIND'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_MSD_PER_MOLKIND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set up the calculation of the MSD for each molecule kind.The position of the
+        center of mass of the molecule is considered.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.MSD_PER_MOLKIND'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_MSD_PER_REGION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set up the calculation of the MSD for each defined region.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.MSD_PER_REGION'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_REF0_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the filename where the initial reference configuration is stored.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.REF0_FILENAME'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_MSD_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls the activation of core-level spectroscopy simulations
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.MSD.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_REFTRAJ_MSD_DEFINE_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.REFTRAJ.MSD.DEFINE_REGION'))
+
+
+class x_cp2k_section_input_MOTION_MD_REFTRAJ(MSection):
+    '''
+    Loads an external trajectory file and performs analysis on the loaded snapshots.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.REFTRAJ'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_CELL_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the filename where the cell is stored (for trajectories generated within
+        variable cell ensembles).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.CELL_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_EVAL_ENERGY_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Evaluate energy and forces for each retrieved snapshot during a REFTRAJ run
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.EVAL_ENERGY_FORCES'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_FIRST_SNAPSHOT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Index of the snapshot stored in the trajectory file from which to start a REFTRAJ
+        run
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.FIRST_SNAPSHOT'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_LAST_SNAPSHOT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Index of the last snapshot stored in the trajectory file that is read along a
+        REFTRAJ run
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.LAST_SNAPSHOT'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_STRIDE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Stride in number of snapshot for the  reftraj analysis
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.STRIDE'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_TRAJ_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the filename where the trajectory is stored.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.TRAJ_FILE_NAME'))
+
+    x_cp2k_input_MOTION_MD_REFTRAJ_VARIABLE_VOLUME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enables the possibility to read a CELL file with information on the CELL size
+        during the MD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.REFTRAJ.VARIABLE_VOLUME'))
+
+    x_cp2k_section_input_MOTION_MD_REFTRAJ_MSD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_REFTRAJ_MSD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.REFTRAJ.MSD'))
+
+
+class x_cp2k_section_input_MOTION_MD_RESPA(MSection):
+    '''
+    Multiple timestep integration based on RESPA (implemented for NVE only). RESPA
+    exploits multiple force_eval. In this case the order of the force_eval maps  the order
+    of the respa shells from the slowest to the fastest force evaluation. If force_evals
+    share the same subsys, it's enough then to specify the  subsys in the force_eval
+    corresponding at the first index in the multiple_force_eval list. Can be used to
+    speedup classical and ab initio MD simulations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.RESPA'))
+
+    x_cp2k_input_MOTION_MD_RESPA_FREQUENCY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The number of reference MD steps between two RESPA corrections.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.RESPA.FREQUENCY'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_CHI(MSection):
+    '''
+    Information to initialize the Ad-Langevin thermostat DOF CHI
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.CHI'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_CHI_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat DOF CHI for Ad-Langevin thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.CHI.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_MASS(MSection):
+    '''
+    Information to initialize the Ad-Langevin thermostat DOF MASS
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.MASS'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat DOF MASS for Ad-Langevin thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN(MSection):
+    '''
+    Parameters of the adaptive-Langevin thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_TIMECON_LANGEVIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the Langevin part of the AD_LANGEVIN thermostat. A small time
+        constant will result in strong thermostatting (useful for initial equilibrations)
+        and a large time constant would be adequate to get weak thermostatting in
+        production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.TIMECON_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_TIMECON_NH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the Nose-Hoover part of the AD_LANGEVIN thermostat. A small time
+        constant will result in strong thermostatting (useful for initial equilibrations)
+        and a large time constant would be adequate to get weak thermostatting in
+        production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.TIMECON_NH'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_CHI = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_CHI'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.CHI'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN.MASS'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.RNG_INIT'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR(MSection):
+    '''
+    Parameters of the canonical sampling through velocity rescaling thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.CSVR'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the CSVR thermostat. A small time constant will result in strong
+        thermostatting (useful for initial equilibrations) and a large time constant would
+        be adequate to get weak thermostatting in production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.TIMECON'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.CSVR.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION(MSection):
+    '''
+    This section provides the possibility to define arbitrary region  for the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.DEFINE_REGION'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms to thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.DEFINE_REGION.LIST'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION_MM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all  MM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.DEFINE_REGION.MM_SUBSYS'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecules to thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.DEFINE_REGION.MOLNAME'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION_QM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all QM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.DEFINE_REGION.QM_SUBSYS'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE.RNG_INIT'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_S(MSection):
+    '''
+    The s variable for GLE used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE.S'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_S_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify s variable for GLE thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.S.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE(MSection):
+    '''
+    paramameters of the gle thermostat. This section can be generated  from https://epfl-
+    cosmo.github.io/gle4md/index.html?page=matrix
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_A_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        A matrix The defaults give optimal sampling for most cristalline and liquid
+        compounds. Generated with the parameters set kv_4-4.acentered on w_0=40 cm^-1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.A_LIST'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_A_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scaling factor for matrix A (for generic matrix A, depends on the characteristic
+        frequency of the system).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.A_SCALE'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_C_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        C matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.C_LIST'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_GLE_NDIM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of the gle matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.GLE.NDIM'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_S = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_S'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE.S'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_COORD(MSection):
+    '''
+    The positions for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.COORD'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_FORCE(MSection):
+    '''
+    The forces for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.FORCE'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_FORCE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.FORCE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_MASS(MSection):
+    '''
+    The masses for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.MASS'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_VELOCITY(MSection):
+    '''
+    The velocities for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.VELOCITY'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE(MSection):
+    '''
+    paramameters of the Nose Hoover thermostat chain
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_LENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        length of the Nose-Hoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.LENGTH'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_MTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of multiple timesteps to be used for the NoseHoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.MTS'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        timeconstant of the thermostat chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.TIMECON'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_YOSHIDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        order of the yoshida integretor used for the thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.YOSHIDA'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.COORD'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_FORCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_FORCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.FORCE'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.MASS'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT(MSection):
+    '''
+    Specify thermostat type and parameters controlling the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_REGION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the region each thermostat is attached to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.REGION'))
+
+    x_cp2k_input_MOTION_MD_SHELL_THERMOSTAT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the thermostat used for the constant temperature ensembles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.THERMOSTAT.TYPE'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_AD_LANGEVIN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.AD_LANGEVIN'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_CSVR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.CSVR'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_DEFINE_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.DEFINE_REGION'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_GLE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.GLE'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT_NOSE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT.NOSE'))
+
+
+class x_cp2k_section_input_MOTION_MD_SHELL(MSection):
+    '''
+    Parameters of shell model in adiabatic dynamics.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL'))
+
+    x_cp2k_input_MOTION_MD_SHELL_DISPLACEMENT_SHELL_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword sets a maximum variation of the shell core distance in each Cartesian
+        direction.The maximum internal core-shell velocity is evaluated and if it is too
+        large to remainwithin the assigned limit, the time step is rescaled
+        accordingly,and the first half step of the velocity verlet is repeated.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.DISPLACEMENT_SHELL_TOL'))
+
+    x_cp2k_input_MOTION_MD_SHELL_NOSE_PARTICLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If nvt or npt, the core and shell velocities are controlled by the same thermostat
+        used for the particle. This might favour heat exchange and additional rescaling of
+        the internal core-shell velocity is needed (TEMP_TOL)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.NOSE_PARTICLE'))
+
+    x_cp2k_input_MOTION_MD_SHELL_TEMP_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum accepted temperature deviation from the expected value, for the internal
+        core-shell motion.If 0, no rescaling is performed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.TEMP_TOL'))
+
+    x_cp2k_input_MOTION_MD_SHELL_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Temperature in K used to control the internal velocities of the core-shell motion
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SHELL.TEMPERATURE'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL_THERMOSTAT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL.THERMOSTAT'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION(MSection):
+    '''
+    This section provides the possibility to define arbitrary region
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMAL_REGION.DEFINE_REGION'))
+
+    x_cp2k_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION_DO_LANGEVIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        When ENSEMBLE is set to LANGEVIN, Controls whether the atoms in the thermal region
+        should undergo Langevin MD. If not, then they will undergo NVE Born-Oppenheimer
+        MD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMAL_REGION.DEFINE_REGION.DO_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms belonging to the region.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMAL_REGION.DEFINE_REGION.LIST'))
+
+    x_cp2k_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION_TEMP_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum accepted temperature deviation from the expected value for this region. If
+        temp_tol=0 no rescaling is performed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMAL_REGION.DEFINE_REGION.TEMP_TOL'))
+
+    x_cp2k_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The temperature in K used to initialize the velocities of the atoms in this region
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMAL_REGION.DEFINE_REGION.TEMPERATURE'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMAL_REGION(MSection):
+    '''
+    Define regions where different initialization and control of the temperature is used.
+    When MOTION%MD%ENSEMBLE is set to LANGEVIN, this section controls if the atoms defined
+    inside and outside the thermal regions should undergo Langevin MD or NVE Born-
+    Oppenheimer MD. The theory behind Langevin MD using different regions can be found in
+    articles by Kantorovitch et al. listed below.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMAL_REGION'))
+
+    x_cp2k_input_MOTION_MD_THERMAL_REGION_DO_LANGEVIN_DEFAULT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If ENSEMBLE is set to LANGEVIN, controls whether the atoms NOT defined in the
+        thermal regions to undergo langevin MD or not. If not, then the atoms will undergo
+        NVE Born-Oppenheimer MD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMAL_REGION.DO_LANGEVIN_DEFAULT'))
+
+    x_cp2k_input_MOTION_MD_THERMAL_REGION_FORCE_RESCALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Control the rescaling ot the velocities in all the regions, according to the
+        temperature assigned to each reagion, when RESTART_VELOCITY in EXT_RESTART is
+        active.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMAL_REGION.FORCE_RESCALING'))
+
+    x_cp2k_section_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMAL_REGION_DEFINE_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMAL_REGION.DEFINE_REGION'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_CHI(MSection):
+    '''
+    Information to initialize the Ad-Langevin thermostat DOF CHI
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.CHI'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_CHI_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat DOF CHI for Ad-Langevin thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.CHI.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_MASS(MSection):
+    '''
+    Information to initialize the Ad-Langevin thermostat DOF MASS
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.MASS'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat DOF MASS for Ad-Langevin thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN(MSection):
+    '''
+    Parameters of the adaptive-Langevin thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_TIMECON_LANGEVIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the Langevin part of the AD_LANGEVIN thermostat. A small time
+        constant will result in strong thermostatting (useful for initial equilibrations)
+        and a large time constant would be adequate to get weak thermostatting in
+        production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.TIMECON_LANGEVIN'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_TIMECON_NH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the Nose-Hoover part of the AD_LANGEVIN thermostat. A small time
+        constant will result in strong thermostatting (useful for initial equilibrations)
+        and a large time constant would be adequate to get weak thermostatting in
+        production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.TIMECON_NH'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_CHI = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_CHI'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.CHI'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN.MASS'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.CSVR.RNG_INIT'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_CSVR_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.CSVR.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.CSVR.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_CSVR_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.CSVR.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR(MSection):
+    '''
+    Parameters of the canonical sampling through velocity rescaling thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.CSVR'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_CSVR_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Time constant of the CSVR thermostat. A small time constant will result in strong
+        thermostatting (useful for initial equilibrations) and a large time constant would
+        be adequate to get weak thermostatting in production runs.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.CSVR.TIMECON'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.CSVR.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.CSVR.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_DEFINE_REGION(MSection):
+    '''
+    This section provides the possibility to define arbitrary region  for the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.DEFINE_REGION'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_DEFINE_REGION_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies a list of atoms to thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.DEFINE_REGION.LIST'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_DEFINE_REGION_MM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all  MM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.DEFINE_REGION.MM_SUBSYS'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_DEFINE_REGION_MOLNAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the molecules to thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.DEFINE_REGION.MOLNAME'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_DEFINE_REGION_QM_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        In a QM/MM run all QM atoms are specified as a whole ensemble to be thermostated
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.DEFINE_REGION.QM_SUBSYS'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE.RNG_INIT'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_S(MSection):
+    '''
+    The s variable for GLE used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE.S'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_S_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify s variable for GLE thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.S.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE(MSection):
+    '''
+    paramameters of the gle thermostat. This section can be generated  from https://epfl-
+    cosmo.github.io/gle4md/index.html?page=matrix
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_A_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        A matrix The defaults give optimal sampling for most cristalline and liquid
+        compounds. Generated with the parameters set kv_4-4.acentered on w_0=40 cm^-1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.A_LIST'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_A_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scaling factor for matrix A (for generic matrix A, depends on the characteristic
+        frequency of the system).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.A_SCALE'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_C_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        C matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.C_LIST'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_GLE_NDIM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of the gle matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.GLE.NDIM'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_S = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_S'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE.S'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_COORD(MSection):
+    '''
+    The positions for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.COORD'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_FORCE(MSection):
+    '''
+    The forces for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.FORCE'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_FORCE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.FORCE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_MASS(MSection):
+    '''
+    The masses for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.MASS'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_MASS_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify masses of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.MASS.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_VELOCITY(MSection):
+    '''
+    The velocities for NOSE HOOVER used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.VELOCITY'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE(MSection):
+    '''
+    paramameters of the Nose Hoover thermostat chain
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_LENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        length of the Nose-Hoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.LENGTH'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_MTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of multiple timesteps to be used for the NoseHoover chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.MTS'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_TIMECON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        timeconstant of the thermostat chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.TIMECON'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_NOSE_YOSHIDA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        order of the yoshida integretor used for the thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.NOSE.YOSHIDA'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.COORD'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_FORCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_FORCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.FORCE'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_MASS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_MASS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.MASS'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_MD_THERMOSTAT(MSection):
+    '''
+    Specify thermostat type and parameters controlling the thermostat.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_REGION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines the region each thermostat is attached to.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.REGION'))
+
+    x_cp2k_input_MOTION_MD_THERMOSTAT_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the thermostat used for the constant temperature ensembles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.THERMOSTAT.TYPE'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_AD_LANGEVIN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.AD_LANGEVIN'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_CSVR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.CSVR'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_DEFINE_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_DEFINE_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.DEFINE_REGION'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_GLE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.GLE'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT_NOSE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT.NOSE'))
+
+
+class x_cp2k_section_input_MOTION_MD_VELOCITY_SOFTENING(MSection):
+    '''
+    A method to initialize the velocities along low-curvature directions in order to
+    favors MD trajectories to cross rapidly over small energy barriers into neighboring
+    basins. In each iteration the forces are calculated at a point y, which is slightly
+    displaced from the current positions x in the direction of the original velocities v.
+    The velocities are then updated with the force component F_t, which is perpendicular
+    to N. N = v / |v|;  y = x + delta * N;  F_t = F(y) - 〈 F(y) | N 〉 * N; v' = v + alpha
+    * F_t
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.VELOCITY_SOFTENING'))
+
+    x_cp2k_input_MOTION_MD_VELOCITY_SOFTENING_ALPHA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Mixing factor used for updating velocities.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.VELOCITY_SOFTENING.ALPHA'))
+
+    x_cp2k_input_MOTION_MD_VELOCITY_SOFTENING_DELTA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Displacement used to obtain y.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.VELOCITY_SOFTENING.DELTA'))
+
+    x_cp2k_input_MOTION_MD_VELOCITY_SOFTENING_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of softening iterations performed. Typical values are around 40 steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.VELOCITY_SOFTENING.STEPS'))
+
+
+class x_cp2k_section_input_MOTION_MD(MSection):
+    '''
+    This section defines the whole set of parameters needed perform an MD run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD'))
+
+    x_cp2k_input_MOTION_MD_ANGVEL_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The maximum accepted angular velocity. This option is ignored when the system is
+        periodic. Removes the components of the velocities thatproject on the external
+        rotational degrees of freedom.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ANGVEL_TOL'))
+
+    x_cp2k_input_MOTION_MD_ANGVEL_ZERO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the initial angular velocity to zero. This option is ignored when the system
+        is periodic or when initial velocities are defined. Technically, the part of the
+        random initial velocities that projects on the external rotational degrees of
+        freedom is subtracted.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ANGVEL_ZERO'))
+
+    x_cp2k_input_MOTION_MD_ANNEALING_CELL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the rescaling factor for annealing velocities of the CELL Automatically
+        enables the annealing procedure for the CELL. This scheme works only for ensambles
+        that do not have thermostat on CELLS velocities.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ANNEALING_CELL'))
+
+    x_cp2k_input_MOTION_MD_ANNEALING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the rescaling factor for annealing velocities. Automatically enables the
+        annealing procedure. This scheme works only for ensembles that do not have
+        thermostats on particles.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ANNEALING'))
+
+    x_cp2k_input_MOTION_MD_COMVEL_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The maximum accepted velocity of the center of mass. With Shell-Model, comvel may
+        drift if MD%THERMOSTAT%REGION /= GLOBAL
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.COMVEL_TOL'))
+
+    x_cp2k_input_MOTION_MD_DISPLACEMENT_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword sets a maximum atomic displacement  in each Cartesian direction.The
+        maximum velocity is evaluated and if it is too large to remainwithin the assigned
+        limit, the time step is rescaled accordingly,and the first half step of the
+        velocity verlet is repeated.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.DISPLACEMENT_TOL'))
+
+    x_cp2k_input_MOTION_MD_ECONS_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting  value of the conserved quantity
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ECONS_START_VAL'))
+
+    x_cp2k_input_MOTION_MD_ENSEMBLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The ensemble/integrator that you want to use for MD propagation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.ENSEMBLE'))
+
+    x_cp2k_input_MOTION_MD_SCALE_TEMP_KIND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        When necessary rescale the temperature per each kind separately
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.SCALE_TEMP_KIND'))
+
+    x_cp2k_input_MOTION_MD_STEP_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting step value for the MD
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.STEP_START_VAL'))
+
+    x_cp2k_input_MOTION_MD_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The number of MD steps to perform
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.STEPS'))
+
+    x_cp2k_input_MOTION_MD_TEMP_KIND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Compute the temperature per each kind separately
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.TEMP_KIND'))
+
+    x_cp2k_input_MOTION_MD_TEMP_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The maximum accepted deviation of the (global) temperaturefrom the desired target
+        temperature before a rescaling of the velocites is performed. If it is 0 no
+        rescaling is performed. NOTE: This keyword is obsolescent; Using a CSVR thermostat
+        with a short timeconstant is recommended as a better alternative.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.TEMP_TOL'))
+
+    x_cp2k_input_MOTION_MD_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The temperature in K used to initialize the velocities with init and pos restart,
+        and in the NPT/NVT simulations
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.TEMPERATURE'))
+
+    x_cp2k_input_MOTION_MD_TIME_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting timer value for the MD
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.TIME_START_VAL'))
+
+    x_cp2k_input_MOTION_MD_TIMESTEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The length of an integration step (in case RESPA the large TIMESTEP)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.MD.TIMESTEP'))
+
+    x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_ADIABATIC_DYNAMICS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.ADIABATIC_DYNAMICS'))
+
+    x_cp2k_section_input_MOTION_MD_AVERAGES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_AVERAGES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.AVERAGES'))
+
+    x_cp2k_section_input_MOTION_MD_BAROSTAT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_BAROSTAT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.BAROSTAT'))
+
+    x_cp2k_section_input_MOTION_MD_CASCADE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_CASCADE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.CASCADE'))
+
+    x_cp2k_section_input_MOTION_MD_LANGEVIN = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_LANGEVIN'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.LANGEVIN'))
+
+    x_cp2k_section_input_MOTION_MD_MSST = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_MSST'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.MSST'))
+
+    x_cp2k_section_input_MOTION_MD_REFTRAJ = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_REFTRAJ'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.REFTRAJ'))
+
+    x_cp2k_section_input_MOTION_MD_RESPA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_RESPA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.RESPA'))
+
+    x_cp2k_section_input_MOTION_MD_SHELL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_SHELL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.SHELL'))
+
+    x_cp2k_section_input_MOTION_MD_THERMAL_REGION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMAL_REGION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMAL_REGION'))
+
+    x_cp2k_section_input_MOTION_MD_THERMOSTAT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_THERMOSTAT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.THERMOSTAT'))
+
+    x_cp2k_section_input_MOTION_MD_VELOCITY_SOFTENING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD_VELOCITY_SOFTENING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD.VELOCITY_SOFTENING'))
+
+
+class x_cp2k_section_input_MOTION_PINT_BEADS_COORD(MSection):
+    '''
+    The positions for BEADS used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.BEADS.COORD'))
+
+    x_cp2k_input_MOTION_PINT_BEADS_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.BEADS.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_BEADS_VELOCITY(MSection):
+    '''
+    The velocities for BEADS used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.BEADS.VELOCITY'))
+
+    x_cp2k_input_MOTION_PINT_BEADS_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.BEADS.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_BEADS(MSection):
+    '''
+    Sets positions and velocities of the beads
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.BEADS'))
+
+    x_cp2k_section_input_MOTION_PINT_BEADS_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_BEADS_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.BEADS.COORD'))
+
+    x_cp2k_section_input_MOTION_PINT_BEADS_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_BEADS_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.BEADS.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_PINT_GLE_RNG_INIT(MSection):
+    '''
+    Information to initialize the parallel random number generator streams
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE.RNG_INIT'))
+
+    x_cp2k_input_MOTION_PINT_GLE_RNG_INIT_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial RNG stream record
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.RNG_INIT.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_GLE_S(MSection):
+    '''
+    The s variable for GLE used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE.S'))
+
+    x_cp2k_input_MOTION_PINT_GLE_S_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify s variable for GLE thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.S.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_GLE_THERMOSTAT_ENERGY(MSection):
+    '''
+    Information to initialize the CSVR thermostat energy.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE.THERMOSTAT_ENERGY'))
+
+    x_cp2k_input_MOTION_PINT_GLE_THERMOSTAT_ENERGY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify an initial thermostat energy for CSVR thermostat.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.THERMOSTAT_ENERGY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_GLE(MSection):
+    '''
+    paramameters of the gle thermostat. This section can be generated  from https://epfl-
+    cosmo.github.io/gle4md/index.html?page=matrix
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE'))
+
+    x_cp2k_input_MOTION_PINT_GLE_A_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        A matrix The defaults give optimal sampling for most cristalline and liquid
+        compounds. Generated with the parameters set kv_4-4.acentered on w_0=40 cm^-1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.A_LIST'))
+
+    x_cp2k_input_MOTION_PINT_GLE_A_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scaling factor for matrix A (for generic matrix A, depends on the characteristic
+        frequency of the system).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.A_SCALE'))
+
+    x_cp2k_input_MOTION_PINT_GLE_C_LIST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        C matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.C_LIST'))
+
+    x_cp2k_input_MOTION_PINT_GLE_NDIM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Size of the gle matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.GLE.NDIM'))
+
+    x_cp2k_section_input_MOTION_PINT_GLE_RNG_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_GLE_RNG_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE.RNG_INIT'))
+
+    x_cp2k_section_input_MOTION_PINT_GLE_S = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_GLE_S'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE.S'))
+
+    x_cp2k_section_input_MOTION_PINT_GLE_THERMOSTAT_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_GLE_THERMOSTAT_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE.THERMOSTAT_ENERGY'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_COORD(MSection):
+    '''
+    The positions for HELIUM used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.COORD'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_FORCE(MSection):
+    '''
+    Forces exerted by the helium on the solute system (used for restarts)
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.FORCE'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_FORCE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of real values should be 3 * <num_solute_atoms> * <num_solute_beads>
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.FORCE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_M_SAMPLING(MSection):
+    '''
+    Permutation cycle length sampling settings
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.M-SAMPLING'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_M_SAMPLING_M_RATIO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Probability ratio betw M-VALUE and other cycle lengths
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.M-SAMPLING.M-RATIO'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_M_SAMPLING_M_VALUE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of m treated in a special way
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.M-SAMPLING.M-VALUE'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_PERM(MSection):
+    '''
+    Permutation state used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.PERM'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_PERM_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify particle index permutation for every helium atom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.PERM.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_RDF(MSection):
+    '''
+    Radial distribution function generation settings
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RDF'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RDF_MAXR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum RDF range, defaults to unit cell size
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RDF.MAXR'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RDF_NBIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of bins
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RDF.NBIN'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_RHO_CUBE_DATA(MSection):
+    '''
+    Density data used for restarts
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RHO.CUBE_DATA'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RHO_CUBE_DATA_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cubefile data
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RHO.CUBE_DATA.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_RHO(MSection):
+    '''
+    Density distribution settings
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RHO'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RHO_IWEIGHT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Weight the restarted density should be given (number of MC steps used to average
+        the restarted density, negative value - the same weight as the run-time density,
+        usually should not be changed)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RHO.IWEIGHT'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RHO_NBIN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of bins
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RHO.NBIN'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RHO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Whether or not to actually calculate densities (requires significant amount of
+        memory, depending on the value of NBIN)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RHO.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_RHO_CUBE_DATA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_RHO_CUBE_DATA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RHO.CUBE_DATA'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM_RNG_STATE(MSection):
+    '''
+    Random number generator state for all processors
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RNG_STATE'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_RNG_STATE_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Three real arrays of DIMENSION(3,2) times two RNG streams - 36 real values per
+        processor
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.RNG_STATE.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_HELIUM(MSection):
+    '''
+    The section that controls optional helium solvent environment (highly experimental,
+    not for general use yet)
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_BISECTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        how many time slices to change at once (+1). Must be a power of 2 currently
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.BISECTION'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_CELL_SHAPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PBC unit cell shape for helium
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.CELL_SHAPE'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_CELL_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        PBC unit cell size (NOTE 1: density, number of atoms and volume are interdependent
+        - give only two of them; NOTE 2: for small cell sizes specify NATOMS instead)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.CELL_SIZE'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_DENSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        trial density of helium for determining the helium box size
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.DENSITY'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_DROP_UNUSED_ENVS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Drop He environments if N_restart > N_runtime (Warning: this will cause data loss
+        in the restart file!)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.DROP_UNUSED_ENVS'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_HELIUM_ONLY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Simulate helium solvent only, disregard solute entirely
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.HELIUM_ONLY'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_INOROT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of MC iterations at the same time slice(s)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.INOROT'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_IROT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        how often to reselect the time slice(s) to work on
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.IROT'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_MAX_PERM_CYCLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        how large cyclic permutations to try
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.MAX_PERM_CYCLE'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_NATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of helium atoms
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.NATOMS'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_NBEADS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of helium path integral beads
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.NBEADS'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_NUM_ENV = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of independent helium environments (only for restarts, do not set
+        explicitly)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.NUM_ENV'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_PERIODIC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use periodic boundary conditions for helium
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.PERIODIC'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_POTENTIAL_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the Helium interaction potential file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.POTENTIAL_FILE_NAME'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_PRESAMPLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Presample He coordinates before first PIMD step
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.PRESAMPLE'))
+
+    x_cp2k_input_MOTION_PINT_HELIUM_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Whether or not to actually use this section
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.HELIUM.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.COORD'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_FORCE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_FORCE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.FORCE'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_M_SAMPLING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_M_SAMPLING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.M-SAMPLING'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_PERM = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_PERM'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.PERM'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_RDF = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_RDF'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RDF'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_RHO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_RHO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RHO'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM_RNG_STATE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM_RNG_STATE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM.RNG_STATE'))
+
+
+class x_cp2k_section_input_MOTION_PINT_INIT(MSection):
+    '''
+    Controls the initialization if the beads are not present
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.INIT'))
+
+    x_cp2k_input_MOTION_PINT_INIT_CENTROID_SPEED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        adds random velocity component to the centroid modes (useful to correct for the
+        averaging out of the speed of various beads)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.CENTROID_SPEED'))
+
+    x_cp2k_input_MOTION_PINT_INIT_LEVY_CORRELATED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use the same Levy path for all atoms, though with mass-dependent variances (might
+        help at very low T)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.LEVY_CORRELATED'))
+
+    x_cp2k_input_MOTION_PINT_INIT_LEVY_POS_SAMPLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sample bead positions assuming free particle behavior (performs a Levy random walk
+        of length P around the classical position of each atom at the physical temperature
+        defined in PINT%TEMP)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.LEVY_POS_SAMPLE'))
+
+    x_cp2k_input_MOTION_PINT_INIT_LEVY_SEED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial seed for the (pseudo)random number generator that controls Levy walk for
+        bead positions.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.LEVY_SEED'))
+
+    x_cp2k_input_MOTION_PINT_INIT_LEVY_TEMP_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Multiplicative correction factor for the temperature at which the Levy walk is
+        performed (correction is due to the interactions that modify the spread of a free
+        particle)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.LEVY_TEMP_FACTOR'))
+
+    x_cp2k_input_MOTION_PINT_INIT_RANDOMIZE_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        add gaussian noise to the positions of the beads
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.RANDOMIZE_POS'))
+
+    x_cp2k_input_MOTION_PINT_INIT_VELOCITY_QUENCH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        set the initial velocities to zero
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.VELOCITY_QUENCH'))
+
+    x_cp2k_input_MOTION_PINT_INIT_VELOCITY_SCALE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        scale initial velocities to the temperature given in MOTION%PINT%TEMP
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.INIT.VELOCITY_SCALE'))
+
+
+class x_cp2k_section_input_MOTION_PINT_NORMALMODE(MSection):
+    '''
+    Controls the normal mode transformation
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NORMALMODE'))
+
+    x_cp2k_input_MOTION_PINT_NORMALMODE_MODEFACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        mass scale factor for non-centroid degrees of freedom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NORMALMODE.MODEFACTOR'))
+
+    x_cp2k_input_MOTION_PINT_NORMALMODE_Q_BEAD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the thermostat mass of non-centroid degrees of freedom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NORMALMODE.Q_BEAD'))
+
+    x_cp2k_input_MOTION_PINT_NORMALMODE_Q_CENTROID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the thermostat mass of centroid degree of freedom
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NORMALMODE.Q_CENTROID'))
+
+
+class x_cp2k_section_input_MOTION_PINT_NOSE_COORD(MSection):
+    '''
+    The positions for NOSE used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NOSE.COORD'))
+
+    x_cp2k_input_MOTION_PINT_NOSE_COORD_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify positions of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NOSE.COORD.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_NOSE_VELOCITY(MSection):
+    '''
+    The velocities for NOSE used for restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NOSE.VELOCITY'))
+
+    x_cp2k_input_MOTION_PINT_NOSE_VELOCITY_DEFAULT_KEYWORD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify velocities of the system
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NOSE.VELOCITY.DEFAULT_KEYWORD'))
+
+
+class x_cp2k_section_input_MOTION_PINT_NOSE(MSection):
+    '''
+    Controls the Nose-Hoover thermostats
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NOSE'))
+
+    x_cp2k_input_MOTION_PINT_NOSE_NNOS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        length of nose-hoover chain. 0 means no thermostat
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NOSE.NNOS'))
+
+    x_cp2k_section_input_MOTION_PINT_NOSE_COORD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_NOSE_COORD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NOSE.COORD'))
+
+    x_cp2k_section_input_MOTION_PINT_NOSE_VELOCITY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_NOSE_VELOCITY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NOSE.VELOCITY'))
+
+
+class x_cp2k_section_input_MOTION_PINT_STAGING(MSection):
+    '''
+    The section that controls the staging transformation
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.STAGING'))
+
+    x_cp2k_input_MOTION_PINT_STAGING_J = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the j parameter for the staging transformation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.STAGING.J'))
+
+    x_cp2k_input_MOTION_PINT_STAGING_Q_END = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Value of the nose-hoover mass for the endbead (Q_end)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.STAGING.Q_END'))
+
+
+class x_cp2k_section_input_MOTION_PINT(MSection):
+    '''
+    The section that controls a path integral run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT'))
+
+    x_cp2k_input_MOTION_PINT_DT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        timestep (might be subdivised in nrespa subtimesteps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.DT'))
+
+    x_cp2k_input_MOTION_PINT_FIX_CENTROID_POS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Propagate all DOF but the centroid - useful for equilibration of the non-centroid
+        modes (activated only if TRANSFORMATION==NORMAL)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.FIX_CENTROID_POS'))
+
+    x_cp2k_input_MOTION_PINT_ITERATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the iteration number from which it should be counted
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.ITERATION'))
+
+    x_cp2k_input_MOTION_PINT_MAX_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum step number (the program will stop if ITERATION >= MAX_STEP even if
+        NUM_STEPS has not been reached)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.MAX_STEP'))
+
+    x_cp2k_input_MOTION_PINT_NRESPA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of respa steps for the bead for each md step
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NRESPA'))
+
+    x_cp2k_input_MOTION_PINT_NUM_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of steps (if MAX_STEP is not explicitly given the program will perform this
+        number of steps)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.NUM_STEPS'))
+
+    x_cp2k_input_MOTION_PINT_PROC_PER_REPLICA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify number of processors to use for each replica
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.PROC_PER_REPLICA'))
+
+    x_cp2k_input_MOTION_PINT_P = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify number beads to use
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.P'))
+
+    x_cp2k_input_MOTION_PINT_T_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        threshold for the oscillations of the temperature excedeed which the temperature
+        is rescaled. 0 means no rescaling.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.T_TOL'))
+
+    x_cp2k_input_MOTION_PINT_TEMP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The temperature you want to simulate
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.TEMP'))
+
+    x_cp2k_input_MOTION_PINT_TRANSFORMATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the coordinate transformation to use
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PINT.TRANSFORMATION'))
+
+    x_cp2k_section_input_MOTION_PINT_BEADS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_BEADS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.BEADS'))
+
+    x_cp2k_section_input_MOTION_PINT_GLE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_GLE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.GLE'))
+
+    x_cp2k_section_input_MOTION_PINT_HELIUM = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_HELIUM'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.HELIUM'))
+
+    x_cp2k_section_input_MOTION_PINT_INIT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_INIT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.INIT'))
+
+    x_cp2k_section_input_MOTION_PINT_NORMALMODE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_NORMALMODE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NORMALMODE'))
+
+    x_cp2k_section_input_MOTION_PINT_NOSE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_NOSE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.NOSE'))
+
+    x_cp2k_section_input_MOTION_PINT_STAGING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT_STAGING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT.STAGING'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CELL_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CELL.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CELL(MSection):
+    '''
+    Controls the output of the simulation cell. For later analysis of the trajectory it is
+    recommendable that the frequency of printing is the same as the one used for the
+    trajectory file.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CELL'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_CELL_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CELL.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PRINT_CELL_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CELL_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CELL.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CORE_FORCES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_FORCES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CORE_FORCES(MSection):
+    '''
+    controls the output of the forces on cores when shell-model is used
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_FORCES'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the forces on cores.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_FORCES_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_FORCES.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_CORE_FORCES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CORE_FORCES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_FORCES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CORE_TRAJECTORY_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_TRAJECTORY.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CORE_TRAJECTORY(MSection):
+    '''
+    Controls the output of the trajectory of cores when the shell-model is used
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_TRAJECTORY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_CHARGE_BETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the BETA field of the PDB file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.CHARGE_BETA'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_CHARGE_EXTENDED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the very last field of the PDB file (starting from column
+        81)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.CHARGE_EXTENDED'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_CHARGE_OCCUP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the OCCUP field of the PDB file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.CHARGE_OCCUP'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the trajectory of cores.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_TRAJECTORY_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_TRAJECTORY.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_CORE_TRAJECTORY_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CORE_TRAJECTORY_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_TRAJECTORY.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CORE_VELOCITIES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_VELOCITIES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_CORE_VELOCITIES(MSection):
+    '''
+    controls the output of the velocities of cores when the shell model is used
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_VELOCITIES'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the velocities of cores.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_CORE_VELOCITIES_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.CORE_VELOCITIES.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_CORE_VELOCITIES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CORE_VELOCITIES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_VELOCITIES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_FORCE_MIXING_LABELS(MSection):
+    '''
+    Controls the output of the force mixing (FORCE_EVAL&QMMM&FORCE_MIXING) labels
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCE_MIXING_LABELS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the force mixing labels.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_FORCE_MIXING_LABELS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCE_MIXING_LABELS.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_FORCE_MIXING_LABELS_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCE_MIXING_LABELS.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_FORCES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_FORCES(MSection):
+    '''
+    Controls the output of the forces
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCES'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the forces.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_FORCES_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.FORCES.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_FORCES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_FORCES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_MIXED_ENERGIES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.MIXED_ENERGIES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_MIXED_ENERGIES(MSection):
+    '''
+    Controls the output of the energies of the tworegular FORCE_EVALS in the MIXED
+    methodprinted is step,time,Etot,E_F1,E_F2,CONS_QNT
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.MIXED_ENERGIES'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_MIXED_ENERGIES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.MIXED_ENERGIES.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PRINT_MIXED_ENERGIES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_MIXED_ENERGIES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.MIXED_ENERGIES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_RESTART_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_RESTART_HISTORY_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART_HISTORY.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_RESTART_HISTORY(MSection):
+    '''
+    Dumps unique restart files during the run keeping all of them.Most useful if recovery
+    is needed at a later point.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART_HISTORY'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_HISTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART_HISTORY.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PRINT_RESTART_HISTORY_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_RESTART_HISTORY_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART_HISTORY.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_RESTART(MSection):
+    '''
+    Controls the dumping of the restart file during runs. By default keeps a short history
+    of three restarts. See also RESTART_HISTORY
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_BACKUP_COPIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum number of backup copies.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.BACKUP_COPIES'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_RESTART_SPLIT_RESTART_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If specified selected input sections, which are growing with the number of atoms
+        in the system, are written to another restart file in binary format instead of the
+        default restart file in human readable ASCII format. This split of the restart
+        file may provide significant memory savings and an accelerated I/O for systems
+        with a very large number of atoms
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.RESTART.SPLIT_RESTART_FILE'))
+
+    x_cp2k_section_input_MOTION_PRINT_RESTART_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_RESTART_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_SHELL_FORCES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_FORCES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_SHELL_FORCES(MSection):
+    '''
+    controls the output of the forces on shells when shell-model is used
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_FORCES'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the forces on shells.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_FORCES_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_FORCES.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_SHELL_FORCES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_SHELL_FORCES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_FORCES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_SHELL_TRAJECTORY(MSection):
+    '''
+    Controls the output of the trajectory of shells when the shell-model is used
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_TRAJECTORY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_CHARGE_BETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the BETA field of the PDB file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.CHARGE_BETA'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_CHARGE_EXTENDED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the very last field of the PDB file (starting from column
+        81)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.CHARGE_EXTENDED'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_CHARGE_OCCUP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the OCCUP field of the PDB file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.CHARGE_OCCUP'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the trajectory of shells.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_TRAJECTORY_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_TRAJECTORY.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_SHELL_TRAJECTORY_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_TRAJECTORY.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_SHELL_VELOCITIES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_VELOCITIES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_SHELL_VELOCITIES(MSection):
+    '''
+    Controls the output of the velocities of shells when the shell model is used
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_VELOCITIES'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the velocities of shells.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_SHELL_VELOCITIES_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.SHELL_VELOCITIES.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_SHELL_VELOCITIES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_SHELL_VELOCITIES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_VELOCITIES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_STRESS_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRESS.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_STRESS(MSection):
+    '''
+    Controls the output of the stress tensor
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRESS'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_STRESS_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRESS.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PRINT_STRESS_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_STRESS_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRESS.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_STRUCTURE_DATA_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRUCTURE_DATA.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_STRUCTURE_DATA(MSection):
+    '''
+    Request the printing of special structure data during a structure optimization (in
+    MOTION%PRINT) or when setting up a subsys (in SUBSYS%PRINT).
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRUCTURE_DATA'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_ANGLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the angle formed by the atoms specified by their indices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.ANGLE'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_DIHEDRAL_ANGLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the dihedral angle between the planes defined by the atoms (a,b,c) and the
+        atoms (b,c,d) specified by their indices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.DIHEDRAL_ANGLE'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_DISTANCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the distance between the atoms a and b specified by their indices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.DISTANCE'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_POSITION_SCALED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the position vectors in scaled coordinates of the atoms specified by a list
+        of their indices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.POSITION_SCALED'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_POSITION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Print the position vectors in Cartesian coordinates of the atoms specified by a
+        list of their indices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.POSITION'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_STRUCTURE_DATA_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.STRUCTURE_DATA.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_STRUCTURE_DATA_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_STRUCTURE_DATA_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRUCTURE_DATA.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_TRAJECTORY_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRAJECTORY.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_TRAJECTORY(MSection):
+    '''
+    Controls the output of the trajectory
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRAJECTORY'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_CHARGE_BETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the BETA field of the PDB file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.CHARGE_BETA'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_CHARGE_EXTENDED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the very last field of the PDB file (starting from column
+        81)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.CHARGE_EXTENDED'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_CHARGE_OCCUP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Write the MM charges to the OCCUP field of the PDB file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.CHARGE_OCCUP'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the trajectory.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_TRAJECTORY_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRAJECTORY.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_TRAJECTORY_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_TRAJECTORY_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRAJECTORY.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_TRANSLATION_VECTOR(MSection):
+    '''
+    Dumps the translation vector applied along an MD (if any). Useful for postprocessing
+    of QMMM trajectories in which the QM fragment is continuously centered in the QM box
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRANSLATION_VECTOR'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_TRANSLATION_VECTOR_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.TRANSLATION_VECTOR.SECTION_PARAMETERS'))
+
+    x_cp2k_section_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_TRANSLATION_VECTOR_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRANSLATION_VECTOR.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_VELOCITIES_EACH(MSection):
+    '''
+    This section specifies how often this proprety is printed.Each keyword inside this
+    section is mapping to a specific iteration level and the value of each of these
+    keywords is matched with the iteration level during the calculation. How to handle the
+    last iteration is treated separately in ADD_LAST (this mean that each iteration level
+    (MD, GEO_OPT, etc..), though equal to 0, might print the last iteration). If an
+    iteration level is specified that is not present in the flow of the calculation it is
+    just ignored.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.VELOCITIES.EACH'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_BAND = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Band Calculation Steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.BAND'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_BSSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Basis Set Superposition Error (BSSE) Calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.BSSE'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_CELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Cell optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.CELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_EP_LIN_SOLVER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Energy Perturbation (EP) linear solver
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.EP_LIN_SOLVER'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_GEO_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Geometry optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.GEO_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_JUST_ENERGY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for an ENERGY/ENERGY_FORCE calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.JUST_ENERGY'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_MD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the MD steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.MD'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_METADYNAMICS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the METADYNAMICS steps (number of hills added).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.METADYNAMICS'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_POWELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for POWELL based optimization steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.POWELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_QS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.QS_SCF'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_REPLICA_EVAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the evaluation of the Replica Environment
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.REPLICA_EVAL'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_ROT_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Rotational optimization steps in the Dimer Calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.ROT_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_SHELL_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the Shell-Core distances optimization steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_SPLINE_FIND_COEFFS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the solution of the coefficients of the splines
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.SPLINE_FIND_COEFFS'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_EACH_XAS_SCF = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Iteration level for the X-Ray Absorption Spectroscopy (XAS) SCF Steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.EACH.XAS_SCF'))
+
+
+class x_cp2k_section_input_MOTION_PRINT_VELOCITIES(MSection):
+    '''
+    Controls the output of the velocities
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.VELOCITIES'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.ADD_LAST'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.FILENAME'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_FORMAT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the format of the output file for the velocities.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.FORMAT'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_PRINT_VELOCITIES_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.PRINT.VELOCITIES.UNIT'))
+
+    x_cp2k_section_input_MOTION_PRINT_VELOCITIES_EACH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_VELOCITIES_EACH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.VELOCITIES.EACH'))
+
+
+class x_cp2k_section_input_MOTION_PRINT(MSection):
+    '''
+    Controls the printing properties during an MD run
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT'))
+
+    x_cp2k_section_input_MOTION_PRINT_CELL = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CELL'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CELL'))
+
+    x_cp2k_section_input_MOTION_PRINT_CORE_FORCES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CORE_FORCES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_FORCES'))
+
+    x_cp2k_section_input_MOTION_PRINT_CORE_TRAJECTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CORE_TRAJECTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_TRAJECTORY'))
+
+    x_cp2k_section_input_MOTION_PRINT_CORE_VELOCITIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_CORE_VELOCITIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.CORE_VELOCITIES'))
+
+    x_cp2k_section_input_MOTION_PRINT_FORCE_MIXING_LABELS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_FORCE_MIXING_LABELS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCE_MIXING_LABELS'))
+
+    x_cp2k_section_input_MOTION_PRINT_FORCES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_FORCES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.FORCES'))
+
+    x_cp2k_section_input_MOTION_PRINT_MIXED_ENERGIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_MIXED_ENERGIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.MIXED_ENERGIES'))
+
+    x_cp2k_section_input_MOTION_PRINT_RESTART_HISTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_RESTART_HISTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART_HISTORY'))
+
+    x_cp2k_section_input_MOTION_PRINT_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.RESTART'))
+
+    x_cp2k_section_input_MOTION_PRINT_SHELL_FORCES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_SHELL_FORCES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_FORCES'))
+
+    x_cp2k_section_input_MOTION_PRINT_SHELL_TRAJECTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_SHELL_TRAJECTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_TRAJECTORY'))
+
+    x_cp2k_section_input_MOTION_PRINT_SHELL_VELOCITIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_SHELL_VELOCITIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.SHELL_VELOCITIES'))
+
+    x_cp2k_section_input_MOTION_PRINT_STRESS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_STRESS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRESS'))
+
+    x_cp2k_section_input_MOTION_PRINT_STRUCTURE_DATA = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_STRUCTURE_DATA'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.STRUCTURE_DATA'))
+
+    x_cp2k_section_input_MOTION_PRINT_TRAJECTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_TRAJECTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRAJECTORY'))
+
+    x_cp2k_section_input_MOTION_PRINT_TRANSLATION_VECTOR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_TRANSLATION_VECTOR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.TRANSLATION_VECTOR'))
+
+    x_cp2k_section_input_MOTION_PRINT_VELOCITIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT_VELOCITIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT.VELOCITIES'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_BFGS_RESTART(MSection):
+    '''
+    Controls the printing of Hessian Restart file
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.BFGS.RESTART'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART.ADD_LAST'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART.FILENAME'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_BFGS(MSection):
+    '''
+    Provides parameters to tune the BFGS optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.BFGS'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the file used to read the initial Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART_FILE_NAME'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_RESTART_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Controls the reading of the initial Hessian from file.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.RESTART_HESSIAN'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_TRUST_RADIUS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Trust radius used in BFGS. Previously set to 0.1. Large values can lead to
+        instabilities
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.TRUST_RADIUS'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_USE_MODEL_HESSIAN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses a model Hessian as initial guess instead of a unit matrix. Should lead in
+        general to improved convergence might be switched off for exotic cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.USE_MODEL_HESSIAN'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_BFGS_USE_RAT_FUN_OPT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Includes a rational function optimization to determine the step. Previously
+        default but did not improve convergence in many cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.BFGS.USE_RAT_FUN_OPT'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_BFGS_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_BFGS_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.BFGS.RESTART'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_2PNT(MSection):
+    '''
+    Provides parameters to tune the line search for the two point based line search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_2PNT_LINMIN_GRAD_ONLY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use only the gradient, not the energy for line minimizations (e.g. in conjugate
+        gradients).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.2PNT.LINMIN_GRAD_ONLY'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_2PNT_MAX_ALLOWED_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Max allowed value for the line search step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.2PNT.MAX_ALLOWED_STEP'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD(MSection):
+    '''
+    Provides parameters to tune the line search for the gold search.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.GOLD'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD_BRACK_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Limit in 1D bracketing during line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.GOLD.BRACK_LIMIT'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD_BRENT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of iterations in brent algorithm (used for the line search in
+        Conjugated Gradients Optimization)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.GOLD.BRENT_MAX_ITER'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD_BRENT_TOL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tolerance requested during Brent line search in Conjugate Gradients Optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.GOLD.BRENT_TOL'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD_INITIAL_STEP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size used, e.g. for bracketing or minimizers. Might need to be
+        reduced for systems with close contacts
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.GOLD.INITIAL_STEP'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH(MSection):
+    '''
+    Provides parameters to tune the line search during the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG.LINE_SEARCH'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        1D line search algorithm to be used with the CG optimizer, in increasing order of
+        robustness and cost.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.TYPE'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_2PNT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_2PNT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.2PNT'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH_GOLD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG.LINE_SEARCH.GOLD'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_CG(MSection):
+    '''
+    Provides parameters to tune the conjugate gradient optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_FLETCHER_REEVES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Uses FLETCHER-REEVES instead of POLAK-RIBIERE when using Conjugate Gradients
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.FLETCHER_REEVES'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_MAX_STEEP_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of steepest descent steps before starting the conjugate gradients
+        optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.MAX_STEEP_STEPS'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_CG_RESTART_LIMIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Cosine of the angle between two consecutive searching directions. If the angle
+        during a CG optimization is less than the one corresponding to  to the
+        RESTART_LIMIT the CG is reset and one step of steepest descent is  performed.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.CG.RESTART_LIMIT'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_CG_LINE_SEARCH'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG.LINE_SEARCH'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT_LBFGS(MSection):
+    '''
+    Provides parameters to tune the limited memory BFGS (LBFGS) optimization
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.LBFGS'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_LBFGS_MAX_F_PER_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of force evaluations per iteration(used for the line search)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.LBFGS.MAX_F_PER_ITER'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_LBFGS_MAX_H_RANK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum rank (and consequently size) of the approximate Hessian matrix used by the
+        LBFGS optimizer. Larger values (e.g. 30) will accelerate the convergence behaviour
+        at the cost of a larger memory consumption.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.LBFGS.MAX_H_RANK'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_LBFGS_WANTED_PROJ_GRADIENT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested norm threshold of the
+        gradient multiplied by the approximate Hessian.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.LBFGS.WANTED_PROJ_GRADIENT'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_LBFGS_WANTED_REL_F_ERROR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium (overrides the general ones):Requested relative error on the
+        objective functionof the optimizer (the energy)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.LBFGS.WANTED_REL_F_ERROR'))
+
+
+class x_cp2k_section_input_MOTION_SHELL_OPT(MSection):
+    '''
+    This section sets the environment for the optimization of the shell-core distances
+    that might turn to be necessary along a MD run using a shell-model potential.  The
+    optimization procedure is activated when at least one of the shell-core pairs becomes
+    too elongated,  i.e. when the assumption of point dipole is not longer valid.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_MAX_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum geometry change between the current and the
+        last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.MAX_DR'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_MAX_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the maximum force component of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.MAX_FORCE'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum number of geometry optimization steps. One step might imply
+        several force evaluations for the CG and LBFGS optimizers.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.MAX_ITER'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_OPTIMIZER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify which method to use to perform a geometry optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.OPTIMIZER'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_RMS_DR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) geometry change between the
+        current and the last optimizer iteration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.RMS_DR'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_RMS_FORCE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the root mean square (RMS) force of the current
+        configuration.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.RMS_FORCE'))
+
+    x_cp2k_input_MOTION_SHELL_OPT_STEP_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The starting step value for the SHELL_OPT module.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.SHELL_OPT.STEP_START_VAL'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_BFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_BFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.BFGS'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_CG = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_CG'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.CG'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT_LBFGS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT_LBFGS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT.LBFGS'))
+
+
+class x_cp2k_section_input_MOTION_TMC_MOVE_TYPE(MSection):
+    '''
+    This section specifies the TMC move type, and its properties. Selectable types are:
+    ATOM_TRANS atom translation, MOL_TRANS molecule translation, MOL_ROT molecule
+    rotation, PROT_REORDER proton reordering, PT_SWAP Parallel Tempering swap, VOL_MOVE
+    volume change, ATOM_SWAP swaps two atoms of different type.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.MOVE_TYPE'))
+
+    x_cp2k_input_MOTION_TMC_MOVE_TYPE_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the atomic kinds involved in the move. Up to now only used for the atom
+        swap.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.MOVE_TYPE.ATOMS'))
+
+    x_cp2k_input_MOTION_TMC_MOVE_TYPE_INIT_ACC_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the initial probability of accepting the move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.MOVE_TYPE.INIT_ACC_PROB'))
+
+    x_cp2k_input_MOTION_TMC_MOVE_TYPE_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the probability of the move (considering the ration between the selected
+        moves)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.MOVE_TYPE.PROB'))
+
+    x_cp2k_input_MOTION_TMC_MOVE_TYPE_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The name of the move type described in this section.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.MOVE_TYPE.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_TMC_MOVE_TYPE_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the size of the move:ATOM_TRANS [A], MOL_TRANS [A], MOL_ROT [degree],
+        PROT_REORDER [], VOL_MOVE [A], ATOM_SWAP
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.MOVE_TYPE.SIZE'))
+
+
+class x_cp2k_section_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE(MSection):
+    '''
+    This section specifies the TMC move type, and its properties. Selectable types are:
+    ATOM_TRANS atom translation, MOL_TRANS molecule translation, MOL_ROT molecule
+    rotation, PROT_REORDER proton reordering, PT_SWAP Parallel Tempering swap, VOL_MOVE
+    volume change, ATOM_SWAP swaps two atoms of different type.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the atomic kinds involved in the move. Up to now only used for the atom
+        swap.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE.ATOMS'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE_INIT_ACC_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the initial probability of accepting the move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE.INIT_ACC_PROB'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the probability of the move (considering the ration between the selected
+        moves)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE.PROB'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The name of the move type described in this section.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE.SECTION_PARAMETERS'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the size of the move:ATOM_TRANS [A], MOL_TRANS [A], MOL_ROT [degree],
+        PROT_REORDER [], VOL_MOVE [A], ATOM_SWAP
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE.SIZE'))
+
+
+class x_cp2k_section_input_MOTION_TMC_NMC_MOVES(MSection):
+    '''
+    This section specifies the TMC move types, which are performed within the nested Monte
+    Carlo (NMC). thus using the approximate potential.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.NMC_MOVES'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_INIT_ACC_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the initial probability of accepting the move.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.INIT_ACC_PROB'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_NMC_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        input file name for the approximate potential for Nested Monte Carlo.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.NMC_FILE_NAME'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_NR_NMC_STEPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the number of Nested Mont Carlo moves with in one MC move should be huge enough to
+        reach euilibrium state
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.NR_NMC_STEPS'))
+
+    x_cp2k_input_MOTION_TMC_NMC_MOVES_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the probability of the NMC move (considering the ration between the
+        selected other moves)the probabilities of the move types in the NMC section
+        defines only the weight within the NMC steps
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NMC_MOVES.PROB'))
+
+    x_cp2k_section_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_NMC_MOVES_MOVE_TYPE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.NMC_MOVES.MOVE_TYPE'))
+
+
+class x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_CHARGE(MSection):
+    '''
+    This section specifies the charge of the MM atoms
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS.CHARGE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_CHARGE_ATOM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the atomic kind of the charge.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.CHARGE.ATOM'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_CHARGE_CHARGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the charge of the MM atom in electron charge unit.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.CHARGE.CHARGE'))
+
+
+class x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_FILES_CHARGE(MSection):
+    '''
+    This section specifies the charge of the MM atoms
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS_FILES.CHARGE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_CHARGE_ATOM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the atomic kind of the charge.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.CHARGE.ATOM'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_CHARGE_CHARGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the charge of the MM atom in electron charge unit.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.CHARGE.CHARGE'))
+
+
+class x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_FILES(MSection):
+    '''
+    Analysing the Markov Chain elments with the specified methods, reading form default or
+    specified files
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS_FILES'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_CELL_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        file name for analysing the cell file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.CELL_FILE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_CLASSICAL_DIPOLE_MOMENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        calculates the classical dipole Moment. Following flag specifies if they should be
+        written. Class. Dip. Mom. are also used to unfold the exact dipole moment.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.CLASSICAL_DIPOLE_MOMENTS'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_DENSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Mass density in the simulation cell, or if specified in sub cubes
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.DENSITY'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_DEVIATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculates the deviation of the position from the last configuration
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.DEVIATION'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_DIPOLE_ANALYSIS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enables analysis of dipole moments, espacially dielectric constant. An additional
+        type can be specified, e.g. analyzing ice structures.using SYM_XYZ also dipoles
+        (-x,y,z) .. .. (-x,-y,z).... (-x,-y-z) are regarded, only use it if this
+        configurations have all the same energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.DIPOLE_ANALYSIS'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_DIPOLE_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        file name for analysing the dipole file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.DIPOLE_FILE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_DIRECTORIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Analysing multiple directories, created by standard parallel MC (e.g. using TMC
+        farming
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.DIRECTORIES'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_END_ELEM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        end analysis at element with number #
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.END_ELEM'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_FORCE_ENV_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        input file name for force env, to get initial configuration with dimensions and
+        cell
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.FORCE_ENV_FILE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_G_R = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Radial Distribution Function for each pair of atomsusing the amount of specified
+        bins within MAX(cell_lenght)/2
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.G_R'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_NR_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the number of different temperature for parallel tempering
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.NR_TEMPERATURE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_POSITION_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        file name for analysing the position file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.POSITION_FILE'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_PREFIX_ANA_FILES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        specifies a prefix for all analysis files.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.PREFIX_ANA_FILES'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_RESTART = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enables/disables the reading and writing of  analysis restart files
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.RESTART'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_START_ELEM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        start analysis at element with number #
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.START_ELEM'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_FILES_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        one temperatue OR for parallel tempering: Tmin Tmax or each temperature T1 T2 T3
+        ... If every single temperature is specified, do NOT use keyword NR_TEMPERATURE
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS_FILES.TEMPERATURE'))
+
+    x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_FILES_CHARGE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_FILES_CHARGE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS_FILES.CHARGE'))
+
+
+class x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS(MSection):
+    '''
+    Analysing the Markov Chain elments with the specified methods
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_CLASSICAL_DIPOLE_MOMENTS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        calculates the classical dipole Moment. Following flag specifies if they should be
+        written. Class. Dip. Mom. are also used to unfold the exact dipole moment.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.CLASSICAL_DIPOLE_MOMENTS'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_DENSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Mass density in the simulation cell, or if specified in sub cubes
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.DENSITY'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_DEVIATION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculates the deviation of the position from the last configuration
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.DEVIATION'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_DIPOLE_ANALYSIS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enables analysis of dipole moments, espacially dielectric constant. An additional
+        type can be specified, e.g. analyzing ice structures.using SYM_XYZ also dipoles
+        (-x,y,z) .. .. (-x,-y,z).... (-x,-y-z) are regarded, only use it if this
+        configurations have all the same energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.DIPOLE_ANALYSIS'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_G_R = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Radial Distribution Function for each pair of atomsusing the amount of specified
+        bins within MAX(cell_lenght)/2
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.G_R'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_PREFIX_ANA_FILES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        specifies a prefix for all analysis files.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.PREFIX_ANA_FILES'))
+
+    x_cp2k_input_MOTION_TMC_TMC_ANALYSIS_RESTART = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Enables/disables the reading and writing of  analysis restart files
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TMC_ANALYSIS.RESTART'))
+
+    x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_CHARGE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_CHARGE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS.CHARGE'))
+
+
+class x_cp2k_section_input_MOTION_TMC(MSection):
+    '''
+    A parallelized MC algorithm, presampling the configurations, espacially the Markov
+    chain elements
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC'))
+
+    x_cp2k_input_MOTION_TMC_ALL_CONF_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        file name for printing every single calculated configuration (e.g. for fitting).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.ALL_CONF_FILE_NAME'))
+
+    x_cp2k_input_MOTION_TMC_DOT_TREE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        file name for GrapgViz dot file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.DOT_TREE'))
+
+    x_cp2k_input_MOTION_TMC_ENERGY_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        input file name for the exact potential energy calculation.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.ENERGY_FILE_NAME'))
+
+    x_cp2k_input_MOTION_TMC_ESIMATE_ACC_PROB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        set the estimation of the acceptance probability using run time information of the
+        energy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.ESIMATE_ACC_PROB'))
+
+    x_cp2k_input_MOTION_TMC_GROUP_ANLYSIS_NR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        amount of groups (cores) for analysing the configurations
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.GROUP_ANLYSIS_NR'))
+
+    x_cp2k_input_MOTION_TMC_GROUP_CC_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        amount of of CPUs per group for configurational change
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.GROUP_CC_SIZE'))
+
+    x_cp2k_input_MOTION_TMC_GROUP_ENERGY_NR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        amount of groups for exact energy calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.GROUP_ENERGY_NR'))
+
+    x_cp2k_input_MOTION_TMC_GROUP_ENERGY_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        amount of CPUs per group for energy calculation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.GROUP_ENERGY_SIZE'))
+
+    x_cp2k_input_MOTION_TMC_INFO_OUT_STEP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the number the amount of calculated configurations between to output printings.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.INFO_OUT_STEP_SIZE'))
+
+    x_cp2k_input_MOTION_TMC_MOVE_CENTER_OF_MASS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Moves the center of mass of defined molecules (in volume moves)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.MOVE_CENTER_OF_MASS'))
+
+    x_cp2k_input_MOTION_TMC_NR_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the number of different temperature for parallel tempering
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NR_TEMPERATURE'))
+
+    x_cp2k_input_MOTION_TMC_NUM_MC_ELEM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the minimum Markov Chain elements, to be sampled
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NUM_MC_ELEM'))
+
+    x_cp2k_input_MOTION_TMC_NUM_MV_ELEM_IN_CELL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the number of elements (atoms or molecules) moves in cell or sub box.if 0 all
+        elements are moved once in a MC move
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.NUM_MV_ELEM_IN_CELL'))
+
+    x_cp2k_input_MOTION_TMC_PRESSURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        enables NPT calculation with specified constant pressure [bar]
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRESSURE'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_CELL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        printing the cell vectors of the Markov Chain elements
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_CELL'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_COORDS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        printing coordinates of the Markov Chain elements
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_COORDS'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_DIPOLE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        enables the calculation and printing the exact cell dipoles (only for QS methods)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_DIPOLE'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_ENERGIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        printing the different calculated energies (approximated, scf and exact)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_ENERGIES'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_FORCES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        printing forces of the Markov Chain elements
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_FORCES'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_ONLY_ACC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        printing only accepted elements of the Markov Chain.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_ONLY_ACC'))
+
+    x_cp2k_input_MOTION_TMC_PRINT_TEST_OUTPUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        printing different values for regtest comparison
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.PRINT_TEST_OUTPUT'))
+
+    x_cp2k_input_MOTION_TMC_RESTART_IN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        if existing use the last restart file
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.RESTART_IN'))
+
+    x_cp2k_input_MOTION_TMC_RESTART_OUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the frequency to write restart files. If no frequency is specified (lone
+        keyword) the restart file is written at the end (only). If the value is 0, no
+        restart file is written at all. The frequency specifies is related to the
+        calculated Markov chain elements
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.RESTART_OUT'))
+
+    x_cp2k_input_MOTION_TMC_RESULT_LIST_IN_MEMORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        enables the storing of the whole Markov Chain
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.RESULT_LIST_IN_MEMORY'))
+
+    x_cp2k_input_MOTION_TMC_RND_DETERMINISTIC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the initialisation number for the random number generator
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.RND_DETERMINISTIC'))
+
+    x_cp2k_input_MOTION_TMC_SPECULATIVE_CANCELING = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        enables or disables the speculative canceling. If we have further knowledge of
+        acceptance probabilities using parent acceptance or the estimated energy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.SPECULATIVE_CANCELING'))
+
+    x_cp2k_input_MOTION_TMC_SUB_BOX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        specifies the size ot the sub box. Standard moves only within subbox of random
+        position, to compensate the potential difference of the approximate potential.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.SUB_BOX'))
+
+    x_cp2k_input_MOTION_TMC_TASK_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Select specialized types. Selectable:IDEAL_GAS (constant configuration energy
+        E=0.0),
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TASK_TYPE'))
+
+    x_cp2k_input_MOTION_TMC_TEMPERATURE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        one temperatue OR for parallel tempering: Tmin Tmax or each temperature T1 T2 T3
+        ... If every single temperature is specified, do NOT use keyword NR_TEMPERATURE
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.TEMPERATURE'))
+
+    x_cp2k_input_MOTION_TMC_USE_SCF_ENERGY_INFO = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        enables or disables the usage of SCF energy information for  estimating the
+        acceptance probability.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.USE_SCF_ENERGY_INFO'))
+
+    x_cp2k_input_MOTION_TMC_VOLUME_ISOTROPIC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        volume move is equal in each direction
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MOTION.TMC.VOLUME_ISOTROPIC'))
+
+    x_cp2k_section_input_MOTION_TMC_MOVE_TYPE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_MOVE_TYPE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.MOVE_TYPE'))
+
+    x_cp2k_section_input_MOTION_TMC_NMC_MOVES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_NMC_MOVES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.NMC_MOVES'))
+
+    x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_FILES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS_FILES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS_FILES'))
+
+    x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC_TMC_ANALYSIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC.TMC_ANALYSIS'))
+
+
+class x_cp2k_section_input_MOTION(MSection):
+    '''
+    This section defines a set of tool connected with the motion of the nuclei.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION'))
+
+    x_cp2k_section_input_MOTION_BAND = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_BAND'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.BAND'))
+
+    x_cp2k_section_input_MOTION_CELL_OPT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CELL_OPT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CELL_OPT'))
+
+    x_cp2k_section_input_MOTION_CONSTRAINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_CONSTRAINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.CONSTRAINT'))
+
+    x_cp2k_section_input_MOTION_DRIVER = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_DRIVER'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.DRIVER'))
+
+    x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FLEXIBLE_PARTITIONING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FLEXIBLE_PARTITIONING'))
+
+    x_cp2k_section_input_MOTION_FREE_ENERGY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_FREE_ENERGY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.FREE_ENERGY'))
+
+    x_cp2k_section_input_MOTION_GEO_OPT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_GEO_OPT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.GEO_OPT'))
+
+    x_cp2k_section_input_MOTION_MC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MC'))
+
+    x_cp2k_section_input_MOTION_MD = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_MD'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.MD'))
+
+    x_cp2k_section_input_MOTION_PINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PINT'))
+
+    x_cp2k_section_input_MOTION_PRINT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_PRINT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.PRINT'))
+
+    x_cp2k_section_input_MOTION_SHELL_OPT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_SHELL_OPT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.SHELL_OPT'))
+
+    x_cp2k_section_input_MOTION_TMC = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION_TMC'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION.TMC'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_MOTION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MOTION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MOTION'))
+
+
+m_package.__init_metainfo__()
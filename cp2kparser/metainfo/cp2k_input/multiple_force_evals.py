@@ -0,0 +1,74 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_multiple_force_evals_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_multiple_force_evals.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_MULTIPLE_FORCE_EVALS(MSection):
+    '''
+    Describes how to handle multiple force_evals.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_MULTIPLE_FORCE_EVALS'))
+
+    x_cp2k_input_MULTIPLE_FORCE_EVALS_FORCE_EVAL_ORDER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the orders of the different force_eval. When using a MIXED force_eval this
+        does not need to be specified in this list, because it that takes into account
+        only the real energy contributions
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MULTIPLE_FORCE_EVALS.FORCE_EVAL_ORDER'))
+
+    x_cp2k_input_MULTIPLE_FORCE_EVALS_MULTIPLE_SUBSYS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify if force_eval have different subsys. In case they share the same subsys,
+        it needs to be specified only in the MIXED force_eval (if using MIXED) or in the
+        force_eval corresponding to first force_eval of the previous order (when not using
+        MIXED).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_MULTIPLE_FORCE_EVALS.MULTIPLE_SUBSYS'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_MULTIPLE_FORCE_EVALS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_MULTIPLE_FORCE_EVALS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_MULTIPLE_FORCE_EVALS'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,368 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_optimize_basis_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_optimize_basis.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND_CONSTRAIN_EXPONENTS(MSection):
+    '''
+    specicifies contraints for the exponents to be fitted. Only a single constraint can be
+    applied to an exponent
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.FIT_KIND.CONSTRAIN_EXPONENTS'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_CONSTRAIN_EXPONENTS_BOUNDARIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the boundaries to which the optimization is restricted. First value is the
+        lower bound, second value is the upper bound.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.CONSTRAIN_EXPONENTS.BOUNDARIES'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_CONSTRAIN_EXPONENTS_MAX_VAR_FRACTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the maximum fractionr by which the exponent is allowed to vary. e.g. 0.5
+        allows the exp to vary by 0.5*exp in both directions.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.CONSTRAIN_EXPONENTS.MAX_VAR_FRACTION'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_CONSTRAIN_EXPONENTS_USE_EXP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Defines the exponent to be constraint. The two integers indicate the set number
+        and i'th exponent. The value -1 can be used to mark all sets/expoenents in a set.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.CONSTRAIN_EXPONENTS.USE_EXP'))
+
+
+class x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND_DERIVED_BASIS_SETS(MSection):
+    '''
+    This section can be used to create subsets of a basis  which will be fitted at the
+    same time. This is especially useful if connected bsis sets e.g. TZVP, DZVP, SZV
+    should be fitted.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.FIT_KIND.DERIVED_BASIS_SETS'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_DERIVED_BASIS_SETS_REFERENCE_SET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the reference basis ID which is used as template to create the new set.
+        The original basis has ID 0. All follwing sets are counted in order as specified
+        in the Input. The decriptors always assume the structure of the input basis set.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.DERIVED_BASIS_SETS.REFERENCE_SET'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_DERIVED_BASIS_SETS_REMOVE_CONTRACTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Can be used to remove a contraction from the reference basis set. The contraction
+        is speciefied by set number, angular momentum and number of contraction. The
+        decriptors always assume the structure of the input basis set.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.DERIVED_BASIS_SETS.REMOVE_CONTRACTION'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_DERIVED_BASIS_SETS_REMOVE_SET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Can be used to remove a set from the reference basis set.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.DERIVED_BASIS_SETS.REMOVE_SET'))
+
+
+class x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND(MSection):
+    '''
+    specicifies the atomic kinds to be fitted and the basis sets associated with the kind.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.FIT_KIND'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_BASIS_SET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The name of the basis set for the kind. Has to be specified in
+        BASIS_TEMPLATE_FILE.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.BASIS_SET'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_INITIAL_DEGREES_OF_FREEDOM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the initial degrees of freedom in the basis optimization.This can be
+        used to make further specifications easier
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.INITIAL_DEGREES_OF_FREEDOM'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The name of the kind described in this section.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.SECTION_PARAMETERS'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_SWITCH_COEFF_STATE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allows to switch the state of a given coefficient from current state
+        (varibale/fixed)) to the opposite state. The three integers indicate the set
+        number, the angular momentum i'th contraction and i'th coefficient
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.SWITCH_COEFF_STATE'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_SWITCH_CONTRACTION_STATE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allows to switch the state of a given contraction from current state
+        (varibale/fixed)) to the opposite state. The three integers indicate the set
+        number, the angular momentum and i'th contraction
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.SWITCH_CONTRACTION_STATE'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_SWITCH_EXP_STATE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allows to switch the state of a given exponent from current state
+        (varibale/fixed)) to the opposite state. The two integers indicate the set number
+        and i'th exponent
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.SWITCH_EXP_STATE'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_FIT_KIND_SWITCH_SET_STATE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allows to switch the states of in a set from current state (varibale/fixed)) to
+        the opposite state. The two integers indicate the affected part
+        (0=ALL,1=EXPS,2=COEFF) and i'th set
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.FIT_KIND.SWITCH_SET_STATE'))
+
+    x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND_CONSTRAIN_EXPONENTS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND_CONSTRAIN_EXPONENTS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.FIT_KIND.CONSTRAIN_EXPONENTS'))
+
+    x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND_DERIVED_BASIS_SETS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND_DERIVED_BASIS_SETS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.FIT_KIND.DERIVED_BASIS_SETS'))
+
+
+class x_cp2k_section_input_OPTIMIZE_BASIS_OPTIMIZATION(MSection):
+    '''
+    sets the parameters for optimizition, output frequency and restarts
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.OPTIMIZATION'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_OPTIMIZATION_ACCURACY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Final accuracy requested in optimization (RHOEND)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.OPTIMIZATION.ACCURACY'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_OPTIMIZATION_MAX_FUN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of function evaluations
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.OPTIMIZATION.MAX_FUN'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_OPTIMIZATION_STEP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size for search algorithm (RHOBEG)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.OPTIMIZATION.STEP_SIZE'))
+
+
+class x_cp2k_section_input_OPTIMIZE_BASIS_TRAINING_FILES(MSection):
+    '''
+    specicifies the location in which the files necessary for fitting procedure are
+    located. Each Training set needs a reptition of this section.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.TRAINING_FILES'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_TRAINING_FILES_DIRECTORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the directory in which the files are placed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.TRAINING_FILES.DIRECTORY'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_TRAINING_FILES_INPUT_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the input file used to run the original calcuation
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.TRAINING_FILES.INPUT_FILE_NAME'))
+
+
+class x_cp2k_section_input_OPTIMIZE_BASIS(MSection):
+    '''
+    describes a basis optimization job, in which an ADMM like approach is used to find the
+    best exponents and/or coefficients to match a given training set.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_BASIS_COMBINATIONS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If multiple atomic kinds are fitted at the same time, this keyword allows to
+        specify which basis sets should be used together in optimization (underived set
+        ID=0). If skipped all combinations are used. The order is taken as the kinds and
+        sets are specified in the input
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.BASIS_COMBINATIONS'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_BASIS_OUTPUT_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the basis set file containing the optimized basis
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.BASIS_OUTPUT_FILE'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_BASIS_TEMPLATE_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the basis set file, containing the structure of the new basis set
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.BASIS_TEMPLATE_FILE'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_BASIS_WORK_FILE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Name of the basis set file which is created to be read as initial guess
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.BASIS_WORK_FILE'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_CONDITION_WEIGHT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword allows to give different weight factors to the condition number of
+        different basis combinations (LOG(cond) is used). The first entry corresponds to
+        the original basis sets. Every further value is assigned to the combinations in
+        the order given for BASIS_COMBINATIONS.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.CONDITION_WEIGHT'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_GROUP_PARTITION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Allows the specification of the group mpi group sizes in parallel runs. If less
+        Groups than tasks are speciefied, consecutive calculations  Will be assigned to
+        one group (derived basis sets and then training sets) If keyword is skipped, equal
+        group sizes will be generated trying to fit all calculations.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.GROUP_PARTITION'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_RESIDUUM_WEIGHT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keyword allows to give different weight factors to the residuum of the
+        different basis combinations. The first entry corresponds to the original basis
+        sets. Every further value is assigned to the combinations in the order given for
+        BASIS_COMBINATIONS.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.RESIDUUM_WEIGHT'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_USE_CONDITION_NUMBER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Determines whether condition number should be part of optimization or not
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.USE_CONDITION_NUMBER'))
+
+    x_cp2k_input_OPTIMIZE_BASIS_WRITE_FREQUENCY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Frequency at which the intermediate results should be written
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_BASIS.WRITE_FREQUENCY'))
+
+    x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_BASIS_FIT_KIND'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.FIT_KIND'))
+
+    x_cp2k_section_input_OPTIMIZE_BASIS_OPTIMIZATION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_BASIS_OPTIMIZATION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.OPTIMIZATION'))
+
+    x_cp2k_section_input_OPTIMIZE_BASIS_TRAINING_FILES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_BASIS_TRAINING_FILES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS.TRAINING_FILES'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_OPTIMIZE_BASIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_BASIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_BASIS'))
+
+
+m_package.__init_metainfo__()
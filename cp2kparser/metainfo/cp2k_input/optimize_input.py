@@ -0,0 +1,523 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_optimize_input_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_optimize_input.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES(MSection):
+    '''
+    A comparison of energies between fit and reference
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES.ADD_LAST'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES.FILENAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES(MSection):
+    '''
+    A comparison of forces between fit and reference
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES.ADD_LAST'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES.FILENAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES.LOG_PRINT_KEY'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING(MSection):
+    '''
+    Specify the force matching input.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.FORCE_MATCHING'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_ENERGY_WEIGHT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Relative weight of the energy RMSD vs the force RMSD
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.ENERGY_WEIGHT'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_FRAME_COUNT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use at most FRAME_COUNT frames from the reference trajectory, adjusting the stride
+        to have them as fas apart as possible (all=-1).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.FRAME_COUNT'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_FRAME_START = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        starting frame to be used from the reference trajectory
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.FRAME_START'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_FRAME_STOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        final frame to be used from the reference trajectory (all=-1)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.FRAME_STOP'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_FRAME_STRIDE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        stride when using the reference trajectory
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.FRAME_STRIDE'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_GROUP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Gives the preferred size of a working group, groups will always be equal or larger
+        than this size.Usually this should take the number of cores per socket into
+        account for good performance.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.GROUP_SIZE'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_OPTIMIZE_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the input file which contains the parameters to be optimized
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.OPTIMIZE_FILE_NAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_REF_CELL_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the reference cell
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.REF_CELL_FILE_NAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_REF_FORCE_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the reference forces, should also contain the energy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.REF_FORCE_FILE_NAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_REF_TRAJ_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        the filename of the reference coordinates.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.REF_TRAJ_FILE_NAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_SHIFT_AVERAGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Shift averages of the energies before computing energy RMSD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.SHIFT_AVERAGE'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_SHIFT_MM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Shift of the fit energies applied before computing energy RMSD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.SHIFT_MM'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_FORCE_MATCHING_SHIFT_QM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Shift of the reference energies applied before computing energy RMSD.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.FORCE_MATCHING.SHIFT_QM'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_ENERGIES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_ENERGIES'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING_COMPARE_FORCES'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.FORCE_MATCHING.COMPARE_FORCES'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT_HISTORY(MSection):
+    '''
+    writes a history of the function value and parameters
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.HISTORY'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_HISTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.HISTORY.ADD_LAST'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_HISTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.HISTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_HISTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.HISTORY.FILENAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_HISTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.HISTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_HISTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.HISTORY.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT_RESTART(MSection):
+    '''
+    writes an input file that can be used to restart
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.RESTART'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RESTART_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RESTART.ADD_LAST'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RESTART_BACKUP_COPIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the maximum index of backup copies.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RESTART.BACKUP_COPIES'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RESTART_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RESTART.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RESTART_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RESTART.FILENAME'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RESTART_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RESTART.LOG_PRINT_KEY'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RESTART_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RESTART.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT_VARIABLE(MSection):
+    '''
+    Defines initial values for variables and their labels
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.VARIABLE'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_VARIABLE_FIXED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Is this variable fixed or should it be optimized.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.VARIABLE.FIXED'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_VARIABLE_LABEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The label used in the input file, i.e. ${LABEL} will be replaced by the VALUE
+        specified.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.VARIABLE.LABEL'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_VARIABLE_VALUE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial value of the variable
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.VARIABLE.VALUE'))
+
+
+class x_cp2k_section_input_OPTIMIZE_INPUT(MSection):
+    '''
+    describes an input optimization job, in which parameters in input files get optimized.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_ACCURACY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Final accuracy requested in optimization (RHOEND)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.ACCURACY'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_ITER_START_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Used for restarting, starting value of the iteration
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.ITER_START_VAL'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_MAX_FUN = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of function evaluations
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.MAX_FUN'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        What kind of input optimization to perform.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.METHOD'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_RANDOMIZE_VARIABLES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Percentage randomization of the free variables applied initially
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.RANDOMIZE_VARIABLES'))
+
+    x_cp2k_input_OPTIMIZE_INPUT_STEP_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial step size for search algorithm (RHOBEG)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_OPTIMIZE_INPUT.STEP_SIZE'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT_FORCE_MATCHING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.FORCE_MATCHING'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT_HISTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT_HISTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.HISTORY'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT_RESTART = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT_RESTART'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.RESTART'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT_VARIABLE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT_VARIABLE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT.VARIABLE'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_OPTIMIZE_INPUT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_OPTIMIZE_INPUT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_OPTIMIZE_INPUT'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,486 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_swarm_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_swarm.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_SWARM_GLOBAL_OPT_HISTORY(MSection):
+    '''
+    Section controling the history of visited minima and how minima are recognized at a
+    later point.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.HISTORY'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_HISTORY_ENERGY_PRECISION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the difference of two energies is below this threshold they are considert
+        equal.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.HISTORY.ENERGY_PRECISION'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_HISTORY_FINGERPRINT_PRECISION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the euclidean distance of two fingerprints is below this threshold, they are
+        considert equal.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.HISTORY.FINGERPRINT_PRECISION'))
+
+
+class x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY(MSection):
+    '''
+    Printkey to controll the writting of the minima trajectory. This trajectory contains
+    all encountered local minima.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY.ADD_LAST'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY.FILENAME'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY.SECTION_PARAMETERS'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY.UNIT'))
+
+
+class x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING(MSection):
+    '''
+    Section controls Minima Crawling run.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_ESCAPE_HISTORY_LENGTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of escapes averaged for scoring of minima.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.ESCAPE_HISTORY_LENGTH'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_TEMPDIST_INIT_WIDTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial width of temperature distribution.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.TEMPDIST_INIT_WIDTH'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_TEMPDIST_UPDATE_HEIGHT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Height of gaussian used to update temperature distribution.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.TEMPDIST_UPDATE_HEIGHT'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_TEMPDIST_UPDATE_WIDTH = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Width of gaussian used to update temperature distribution.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.TEMPDIST_UPDATE_WIDTH'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_TEMPERATURE_INIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial temperature in Kelvin
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.TEMPERATURE_INIT'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_TEMPSTEP_BASE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Base used to calculate temperature steps base**n
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.TEMPSTEP_BASE'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_TEMPSTEP_MAX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of temperature steps.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.TEMPSTEP_MAX'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_WORKER_PER_MINIMA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Maximum number of active workers per Minima.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.WORKER_PER_MINIMA'))
+
+    x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING_MINIMA_TRAJECTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING.MINIMA_TRAJECTORY'))
+
+
+class x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING(MSection):
+    '''
+    Section controlling the Minima Hopping method.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_ALPHA_1 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Factor used to decrease acceptance energy, when minima was accepted, should be
+        smaller than 1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.ALPHA_1'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_ALPHA_2 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Factor used to increase acceptance energy, when minima was rejected, should be
+        larger than 1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.ALPHA_2'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_BETA_1 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Factor used to increase temperature when escape failed, should be larger than 1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.BETA_1'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_BETA_2 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Factor used to increase temperature when escape found known minima, should be
+        larger than 1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.BETA_2'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_BETA_3 = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Factor used to decrease temperature when escape succeeded, should be smaller than
+        1.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.BETA_3'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_E_ACCEPT_INIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initial value of acceptance energy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.E_ACCEPT_INIT'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_SHARE_HISTORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If set all worker will use a single share history of visited minima.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.SHARE_HISTORY'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING_TEMPERATURE_INIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initially temperature in Kelvin
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING.TEMPERATURE_INIT'))
+
+
+class x_cp2k_section_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY(MSection):
+    '''
+    Printkey to controll the writting of the progress trajectory. This trajectory contains
+    the minima, which are lower in energy than the by then lowerest.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY.ADD_LAST'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY.FILENAME'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY.LOG_PRINT_KEY'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY.SECTION_PARAMETERS'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY_UNIT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the unit of measurement for the quantity in output. All available CP2K
+        units can be used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY.UNIT'))
+
+
+class x_cp2k_section_input_SWARM_GLOBAL_OPT(MSection):
+    '''
+    Section to control global geometry optimizations.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_BUMP_STEPS_DOWNWARDS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of MD steps with potential energy decreases required for a bump.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.BUMP_STEPS_DOWNWARDS'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_BUMP_STEPS_UPWARDS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of MD steps with potential energy increases required for a bump.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.BUMP_STEPS_UPWARDS'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_E_TARGET = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Target Energy, the optimization will quit once a lower potential energy is
+        reached.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.E_TARGET'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_FRAGMENTATION_THRESHOLD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Threshold for atom distance used for detecting fragmentation of clusters.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.FRAGMENTATION_THRESHOLD'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_MD_BUMPS_MAX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of bumps in potential energy after which MD runs ends.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.MD_BUMPS_MAX'))
+
+    x_cp2k_input_SWARM_GLOBAL_OPT_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Methods to use for optimization.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.GLOBAL_OPT.METHOD'))
+
+    x_cp2k_section_input_SWARM_GLOBAL_OPT_HISTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM_GLOBAL_OPT_HISTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.HISTORY'))
+
+    x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_CRAWLING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.MINIMA_CRAWLING'))
+
+    x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM_GLOBAL_OPT_MINIMA_HOPPING'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.MINIMA_HOPPING'))
+
+    x_cp2k_section_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM_GLOBAL_OPT_PROGRESS_TRAJECTORY'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT.PROGRESS_TRAJECTORY'))
+
+
+class x_cp2k_section_input_SWARM(MSection):
+    '''
+    Section to control swarm runs. The swarm framework provides a common ground for
+    master/worker algorithms.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM'))
+
+    x_cp2k_input_SWARM_BEHAVIOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which behaviour should control the swarm.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.BEHAVIOR'))
+
+    x_cp2k_input_SWARM_MAX_ITER = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The maximum number iterations the master should perform
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.MAX_ITER'))
+
+    x_cp2k_input_SWARM_NUMBER_OF_WORKERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of workers used for swarm.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.NUMBER_OF_WORKERS'))
+
+    x_cp2k_input_SWARM_REPLAY_COMMUNICATION_LOG = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Filename of communication log of previous run. Use this to restart a swarm.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_SWARM.REPLAY_COMMUNICATION_LOG'))
+
+    x_cp2k_section_input_SWARM_GLOBAL_OPT = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM_GLOBAL_OPT'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM.GLOBAL_OPT'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_SWARM = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_SWARM'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_SWARM'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,800 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_test_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_test.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_TEST_CP_DBCSR(MSection):
+    '''
+    Benchmark and test the cp_dbcsr routines
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.CP_DBCSR'))
+
+    x_cp2k_input_TEST_CP_DBCSR_ALPHA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Multiplication factor
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.ALPHA'))
+
+    x_cp2k_input_TEST_CP_DBCSR_ALWAYS_CHECKSUM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        perform a checksum after each multiplication
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.ALWAYS_CHECKSUM'))
+
+    x_cp2k_input_TEST_CP_DBCSR_ASPARSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sparsity of A matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.ASPARSITY'))
+
+    x_cp2k_input_TEST_CP_DBCSR_ATYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Matrix A type
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.ATYPE'))
+
+    x_cp2k_input_TEST_CP_DBCSR_BETA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Product premultiplication factor
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.BETA'))
+
+    x_cp2k_input_TEST_CP_DBCSR_BS_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Block sizes of inner dimension
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.BS_K'))
+
+    x_cp2k_input_TEST_CP_DBCSR_BS_M = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Row block sizes of C
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.BS_M'))
+
+    x_cp2k_input_TEST_CP_DBCSR_BS_N = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Column block sizes of C
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.BS_N'))
+
+    x_cp2k_input_TEST_CP_DBCSR_BSPARSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sparsity of B matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.BSPARSITY'))
+
+    x_cp2k_input_TEST_CP_DBCSR_BTYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Matrix B type
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.BTYPE'))
+
+    x_cp2k_input_TEST_CP_DBCSR_CSPARSITY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Sparsity of C matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.CSPARSITY'))
+
+    x_cp2k_input_TEST_CP_DBCSR_CTYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Matrix C type
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.CTYPE'))
+
+    x_cp2k_input_TEST_CP_DBCSR_DATA_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Data type of the matrices
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.DATA_TYPE'))
+
+    x_cp2k_input_TEST_CP_DBCSR_FILTER_EPS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Threshold for on-the-fly and final filtering.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.FILTER_EPS'))
+
+    x_cp2k_input_TEST_CP_DBCSR_KEEPSPARSE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Keep product sparse
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.KEEPSPARSE'))
+
+    x_cp2k_input_TEST_CP_DBCSR_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Inner dimension M
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.K'))
+
+    x_cp2k_input_TEST_CP_DBCSR_M = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Dimension 1 of C
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.M'))
+
+    x_cp2k_input_TEST_CP_DBCSR_N_LOOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of operations being timed (useful for small matrices).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.N_LOOP'))
+
+    x_cp2k_input_TEST_CP_DBCSR_NPROC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of processors to test
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.NPROC'))
+
+    x_cp2k_input_TEST_CP_DBCSR_N = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Dimension 2 of C
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.N'))
+
+    x_cp2k_input_TEST_CP_DBCSR_TEST_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Which part of DBCSR is tested
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.TEST_TYPE'))
+
+    x_cp2k_input_TEST_CP_DBCSR_TRANSA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Transpose matrix A
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.TRANSA'))
+
+    x_cp2k_input_TEST_CP_DBCSR_TRANSB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Transpose matrix B
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_DBCSR.TRANSB'))
+
+
+class x_cp2k_section_input_TEST_CP_FM_GEMM(MSection):
+    '''
+    Benchmark and test the cp_fm_gemm routines by multiplying C=A*B
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.CP_FM_GEMM'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_FORCE_BLOCKSIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Forces the blocksize, even if this implies that a few processes might have no data
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.FORCE_BLOCKSIZE'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_GRID_2D = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Explicitly set the blacs 2D processor layout. If the product differs from the
+        number of MPI ranks, it is ignored and a default nearly square layout is used.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.GRID_2D'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_K = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Dimension 1 of C
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.K'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_M = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Inner dimension M
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.M'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_N_LOOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of cp_fm_gemm operations being timed (useful for small matrices).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.N_LOOP'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_NCOL_BLOCK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        block_size for cols
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.NCOL_BLOCK'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_NROW_BLOCK = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        block_size for rows
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.NROW_BLOCK'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_N = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Dimension 2 of C
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.N'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_ROW_MAJOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Use a row major blacs grid
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.ROW_MAJOR'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_TRANSA = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Transpose matrix A
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.TRANSA'))
+
+    x_cp2k_input_TEST_CP_FM_GEMM_TRANSB = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Transpose matrix B
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CP_FM_GEMM.TRANSB'))
+
+
+class x_cp2k_section_input_TEST_EIGENSOLVER(MSection):
+    '''
+    Benchmark and test the eigensolver routines.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.EIGENSOLVER'))
+
+    x_cp2k_input_TEST_EIGENSOLVER_DIAG_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Diagonalization strategy
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.EIGENSOLVER.DIAG_METHOD'))
+
+    x_cp2k_input_TEST_EIGENSOLVER_EIGENVALUES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of eigenvalues to be computed (all=<0)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.EIGENSOLVER.EIGENVALUES'))
+
+    x_cp2k_input_TEST_EIGENSOLVER_INIT_METHOD = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Initialization approach
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.EIGENSOLVER.INIT_METHOD'))
+
+    x_cp2k_input_TEST_EIGENSOLVER_N_LOOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of operations being timed (useful for small matrices).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.EIGENSOLVER.N_LOOP'))
+
+    x_cp2k_input_TEST_EIGENSOLVER_N = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Dimension of the square matrix
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.EIGENSOLVER.N'))
+
+
+class x_cp2k_section_input_TEST_GRID_INFORMATION(MSection):
+    '''
+    Controls the printing of information regarding the PW and RS grid structures (ONLY for
+    TEST run).
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.GRID_INFORMATION'))
+
+    x_cp2k_input_TEST_GRID_INFORMATION_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.GRID_INFORMATION.ADD_LAST'))
+
+    x_cp2k_input_TEST_GRID_INFORMATION_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.GRID_INFORMATION.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_TEST_GRID_INFORMATION_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.GRID_INFORMATION.FILENAME'))
+
+    x_cp2k_input_TEST_GRID_INFORMATION_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.GRID_INFORMATION.LOG_PRINT_KEY'))
+
+    x_cp2k_input_TEST_GRID_INFORMATION_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.GRID_INFORMATION.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_TEST_PROGRAM_RUN_INFO(MSection):
+    '''
+    controls the printing of tests output
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.PROGRAM_RUN_INFO'))
+
+    x_cp2k_input_TEST_PROGRAM_RUN_INFO_ADD_LAST = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the last iteration should be added, and if it should be marked symbolically
+        (with lowercase letter l) or with the iteration number. Not every iteration level
+        is able to identify the last iteration early enough to be able to output. When
+        this keyword is activated all iteration levels are checked for the last iteration
+        step.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PROGRAM_RUN_INFO.ADD_LAST'))
+
+    x_cp2k_input_TEST_PROGRAM_RUN_INFO_COMMON_ITERATION_LEVELS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        How many iterations levels should be written in the same file (no extra
+        information about the actual iteration level is written to the file)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PROGRAM_RUN_INFO.COMMON_ITERATION_LEVELS'))
+
+    x_cp2k_input_TEST_PROGRAM_RUN_INFO_FILENAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        controls part of the filename for output.  use __STD_OUT__ (exactly as written
+        here) for the screen or standard logger.  use filename to obtain projectname-
+        filename.  use ./filename to get filename. A middle name (if present), iteration
+        numbers and extension are always added to the filename. if you want to avoid it
+        use =filename, in this case the filename is always exactly as typed. Please note
+        that this can lead to clashes of filenames.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PROGRAM_RUN_INFO.FILENAME'))
+
+    x_cp2k_input_TEST_PROGRAM_RUN_INFO_LOG_PRINT_KEY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        This keywords enables the logger for the print_key (a message is printed on screen
+        everytime data, controlled by this print_key, are written)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PROGRAM_RUN_INFO.LOG_PRINT_KEY'))
+
+    x_cp2k_input_TEST_PROGRAM_RUN_INFO_SECTION_PARAMETERS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Level starting at which this proprety is printed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PROGRAM_RUN_INFO.SECTION_PARAMETERS'))
+
+
+class x_cp2k_section_input_TEST_PW_TRANSFER(MSection):
+    '''
+    Benchmark and test the pw_transfer routines.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.PW_TRANSFER'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_DEBUG = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Do the FFT in debug mode in all cases
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.DEBUG'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_GRID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of grid points (not all grid points are allowed)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.GRID'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_N_LOOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of pw_transfers (backward&forward) being timed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.N_LOOP'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_PW_GRID_BLOCKED = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Expert use only, leave the default...Can be used to set the distribution in
+        g-space for the pw grids and their FFT.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.PW_GRID_BLOCKED'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_PW_GRID_LAYOUT_ALL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        loop overal all PW_GRID_LAYOUTs that are compatible with a given number of CPUs
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.PW_GRID_LAYOUT_ALL'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_PW_GRID_LAYOUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Expert use only, leave the default...Can be used to set the distribution for ray-
+        distributed FFT.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.PW_GRID_LAYOUT'))
+
+    x_cp2k_input_TEST_PW_TRANSFER_PW_GRID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        What kind of PW_GRID should be employed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.PW_TRANSFER.PW_GRID'))
+
+
+class x_cp2k_section_input_TEST_RS_PW_TRANSFER_RS_GRID(MSection):
+    '''
+    Set options that influence how the realspace grids are being distributed in parallel
+    runs.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.RS_PW_TRANSFER.RS_GRID'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS_GRID_DISTRIBUTION_LAYOUT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the number of slices in the x, y and z directions.-1 specifies that any
+        number of slices is OK.If a given distribution can not be satisfied, a replicated
+        grid will result.Also see LOCK_DISTRIBUTION.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS_GRID.DISTRIBUTION_LAYOUT'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS_GRID_DISTRIBUTION_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Parallelization strategy.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS_GRID.DISTRIBUTION_TYPE'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS_GRID_HALO_REDUCTION_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Can be used to reduce the halo of the distributed grid (experimental features).
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS_GRID.HALO_REDUCTION_FACTOR'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS_GRID_LOCK_DISTRIBUTION = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Expert use only, only basic QS deals correctly with a non-default value.If the
+        distribution is locked, a grid will have the same distribution asthe next finer
+        multigrid (provided it is distributed).If unlocked, all grids can be distributed
+        freely.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS_GRID.LOCK_DISTRIBUTION'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS_GRID_MAX_DISTRIBUTED_LEVEL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        If the multigrid-level of a grid is larger than the parameter, it will not be
+        distributed in the automatic scheme.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS_GRID.MAX_DISTRIBUTED_LEVEL'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS_GRID_MEMORY_FACTOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        A grid will only be distributed if the memory usage for that grid (including halo)
+        is smaller than a replicated grid by this parameter.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS_GRID.MEMORY_FACTOR'))
+
+
+class x_cp2k_section_input_TEST_RS_PW_TRANSFER(MSection):
+    '''
+    Describes how to benchmark the rs_pw_transfer routines.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.RS_PW_TRANSFER'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_GRID = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of grid points (not all grid points are allowed)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.GRID'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_HALO_SIZE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        number of grid points of the halo
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.HALO_SIZE'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_N_LOOP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Number of rs_pw_transfers being timed
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.N_LOOP'))
+
+    x_cp2k_input_TEST_RS_PW_TRANSFER_RS2PW = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        should the direction be rs2pw (pw2rs otherwise)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RS_PW_TRANSFER.RS2PW'))
+
+    x_cp2k_section_input_TEST_RS_PW_TRANSFER_RS_GRID = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_RS_PW_TRANSFER_RS_GRID'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.RS_PW_TRANSFER.RS_GRID'))
+
+
+class x_cp2k_section_input_TEST(MSection):
+    '''
+    Tests to perform on the supported libraries.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST'))
+
+    x_cp2k_input_TEST_CLEBSCH_GORDON = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the Clebsch-Gordon Coefficients. Tests are repeated the given number of
+        times.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.CLEBSCH_GORDON'))
+
+    x_cp2k_input_TEST_COPY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the performance to copy two vectors.The results of these tests allow to
+        determine the size of the cache of the CPU. This can be used to optimize the
+        performance of theFFTSG library. Tests are repeated the given number of times.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.COPY'))
+
+    x_cp2k_input_TEST_DGEMM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the performance of different kinds of matrix matrix multiply kernels for the
+        BLAS INTRINSIC DGEMM. Matrices up to 2**N+1 will be tested.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.DGEMM'))
+
+    x_cp2k_input_TEST_ERI = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the performance and correctness of ERI libraries
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.ERI'))
+
+    x_cp2k_input_TEST_FFT = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the performance of all available FFT libraries for 3D FFTs Tests are
+        repeated the given number of times.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.FFT'))
+
+    x_cp2k_input_TEST_MATMUL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the performance of different kinds of matrix matrix multiply kernels for the
+        F95 INTRINSIC matmul. Matrices up to 2**N+1 will be tested.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.MATMUL'))
+
+    x_cp2k_input_TEST_MEMORY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Set the maximum amount of memory allocated for a given test (in bytes)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.MEMORY'))
+
+    x_cp2k_input_TEST_MPI = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests mpi, quickly adapted benchmark code,will ONLY work on an even number of
+        CPUs. comm is the relevant, initialized communicator. This test will produce
+        messages of the size 8*10**requested_size, where requested_size is the value given
+        to this keyword
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.MPI'))
+
+    x_cp2k_input_TEST_RANDOM_NUMBER_GENERATOR = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Tests the parallel random number generator (RNG)
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_TEST.RANDOM_NUMBER_GENERATOR'))
+
+    x_cp2k_section_input_TEST_CP_DBCSR = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_CP_DBCSR'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.CP_DBCSR'))
+
+    x_cp2k_section_input_TEST_CP_FM_GEMM = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_CP_FM_GEMM'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.CP_FM_GEMM'))
+
+    x_cp2k_section_input_TEST_EIGENSOLVER = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_EIGENSOLVER'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.EIGENSOLVER'))
+
+    x_cp2k_section_input_TEST_GRID_INFORMATION = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_GRID_INFORMATION'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.GRID_INFORMATION'))
+
+    x_cp2k_section_input_TEST_PROGRAM_RUN_INFO = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_PROGRAM_RUN_INFO'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.PROGRAM_RUN_INFO'))
+
+    x_cp2k_section_input_TEST_PW_TRANSFER = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_PW_TRANSFER'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.PW_TRANSFER'))
+
+    x_cp2k_section_input_TEST_RS_PW_TRANSFER = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST_RS_PW_TRANSFER'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST.RS_PW_TRANSFER'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_TEST = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_TEST'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_TEST'))
+
+
+m_package.__init_metainfo__()
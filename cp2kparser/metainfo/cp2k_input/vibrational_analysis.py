@@ -0,0 +1,203 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import numpy as np            # pylint: disable=unused-import
+import typing                 # pylint: disable=unused-import
+from nomad.metainfo import (  # pylint: disable=unused-import
+    MSection, MCategory, Category, Package, Quantity, Section, SubSection, SectionProxy,
+    Reference
+)
+from nomad.metainfo.legacy import LegacyDefinition
+
+from cp2kparser.metainfo import cp2k
+
+m_package = Package(
+    name='cp2k_input_vibrational_analysis_nomadmetainfo_json',
+    description='None',
+    a_legacy=LegacyDefinition(name='cp2k_input_vibrational_analysis.nomadmetainfo.json'))
+
+
+class x_cp2k_section_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_INVOLVED_ATOMS(MSection):
+    '''
+    All parameters needed for the tracking of modes dominated by the motion of selected
+    atoms
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.INVOLVED_ATOMS'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_INVOLVED_ATOMS_INVOLVED_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the list of atoms on which the tracked eigenvector should have the
+        highest value similar to looking for the vibration of a set of atoms
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.INVOLVED_ATOMS.INVOLVED_ATOMS'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_INVOLVED_ATOMS_RANGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the range of wavenumbers in which the modes related to the ATOMS have to
+        be tracked.  If not specified frequencies >400cm-1 will be used to avoid tracking
+        of translational or rotational modes
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.INVOLVED_ATOMS.RANGE'))
+
+
+class x_cp2k_section_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE(MSection):
+    '''
+    All parameters needed for to run a mode selective vibrational analysis
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_ATOMS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the list of atoms which should be displaced for the Initial guess
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.ATOMS'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_EPS_MAX_VAL = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the davidson algorithm. Specifies the maximal value in
+        the residuum vectors
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.EPS_MAX_VAL'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_EPS_NORM = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Convergence criterium for the davidson algorithm. Specifies the maximal value of
+        the norm of the residuum vectors
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.EPS_NORM'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_FREQUENCY = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        value close to the expected value of the frequency for to look for. If the block
+        Davidson algorithm is applied, the nrep closest frequencies are tracked.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.FREQUENCY'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_INITIAL_GUESS = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        The type of initial guess for the normal modes
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.INITIAL_GUESS'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_RANGE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Track modes in a given range of frequencies. No warranty that the set of
+        frequencies is complete.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.RANGE'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_RESTART_FILE_NAME = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specifies the name of the file used to create the restarted vectors
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.RESTART_FILE_NAME'))
+
+    x_cp2k_section_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_INVOLVED_ATOMS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE_INVOLVED_ATOMS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE.INVOLVED_ATOMS'))
+
+
+class x_cp2k_section_input_VIBRATIONAL_ANALYSIS(MSection):
+    '''
+    Section to setup parameters to perform a Normal Modes analysis.
+    '''
+
+    m_def = Section(validate=False, a_legacy=LegacyDefinition(name='x_cp2k_section_input_VIBRATIONAL_ANALYSIS'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_DX = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the increment to be used to construct the HESSIAN with finite difference
+        method
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.DX'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_FULLY_PERIODIC = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Avoids to clean rotations from the Hessian matrix.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.FULLY_PERIODIC'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_INTENSITIES = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Calculation of the IR-Intensities. Calculation of dipols has to be specified
+        explicitly
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.INTENSITIES'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_NPROC_REP = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the number of processors to be used per replica environment (for parallel
+        runs). In case of mode selective calculations more than one replica will start a
+        block Davidson algorithm to track more than only one frequency
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.NPROC_REP'))
+
+    x_cp2k_input_VIBRATIONAL_ANALYSIS_PROC_DIST_TYPE = Quantity(
+        type=str,
+        shape=[],
+        description='''
+        Specify the topology of the mapping of processors into replicas.
+        ''',
+        a_legacy=LegacyDefinition(name='x_cp2k_input_VIBRATIONAL_ANALYSIS.PROC_DIST_TYPE'))
+
+    x_cp2k_section_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_VIBRATIONAL_ANALYSIS_MODE_SELECTIVE'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_VIBRATIONAL_ANALYSIS.MODE_SELECTIVE'))
+
+
+class x_cp2k_section_input(cp2k.x_cp2k_section_input):
+
+    m_def = Section(validate=False, extends_base_section=True, a_legacy=LegacyDefinition(name='x_cp2k_section_input'))
+
+    x_cp2k_section_input_VIBRATIONAL_ANALYSIS = SubSection(
+        sub_section=SectionProxy('x_cp2k_section_input_VIBRATIONAL_ANALYSIS'),
+        repeats=True,
+        a_legacy=LegacyDefinition(name='x_cp2k_section_input_VIBRATIONAL_ANALYSIS'))
+
+
+m_package.__init_metainfo__()
@@ -0,0 +1,162 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD.
+# See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Prebuilt definitions of the CP2K input sections. The definitions in
+:mod:`cp2kparser.metainfo.cp2k_input` are serialized together with a name index into a
+compact artifact with
+
+.. code-block:: sh
+
+    python -m cp2kparser.metainfo.prebuilt
+
+At runtime, only the definitions of the sections that are actually used are created
+from the artifact. The artifact is ignored if it was built from different sources.
+'''
+
+import os
+import sys
+import glob
+import gzip
+import json
+import hashlib
+import importlib
+from typing import Any, Dict
+
+from nomad.metainfo import Package, Section, Quantity, SubSection
+from nomad.metainfo.legacy import LegacyDefinition
+
+
+artifact_path = os.path.join(os.path.dirname(__file__), 'cp2k_input.json.gz')
+format_version = 1
+
+
+def source_version():
+    '''
+    Returns a hash of the sources of the input section definitions.
+    '''
+    sha1 = hashlib.sha1(b'%d' % format_version)
+    source_dir = os.path.join(os.path.dirname(__file__), 'cp2k_input')
+    for filename in sorted(glob.glob(os.path.join(source_dir, '*.py'))):
+        with open(filename, 'rb') as f:
+            sha1.update(f.read())
+    return sha1.hexdigest()
+
+
+def build(module_names, path=artifact_path):
+    '''
+    Serializes the section definitions of the given modules. Each section is stored as
+    [legacy name, description, parent section, quantities] where quantities is a list of
+    [name, legacy name, description]. The name index maps the quantity names to the
+    section names.
+    '''
+    sections: Dict[str, Any] = dict()
+    quantities: Dict[str, str] = dict()
+    for module_name in module_names:
+        package = importlib.import_module(module_name).m_package
+        for section in package.section_definitions:
+            name = section.name
+            if section.extends_base_section:
+                # extension of the root section which is defined in cp2k
+                name = section.base_sections[0].name
+            else:
+                sections.setdefault(name, [None] * 4)[0:2] = [
+                    section.a_legacy.name, section.description]
+                sections[name][3] = [[
+                    quantity.name, quantity.a_legacy.name, quantity.description]
+                    for quantity in section.quantities]
+            for sub_section in section.sub_sections:
+                sections.setdefault(sub_section.sub_section.name, [None] * 4)[2] = name
+            for quantity in section.quantities:
+                quantities[quantity.name] = name
+
+    with gzip.open(path, 'wt') as f:
+        json.dump(dict(
+            version=source_version(), sections=sections, quantities=quantities), f,
+            separators=(',', ':'))
+
+
+class PrebuiltDefinitions:
+    '''
+    Creates the definitions of the input sections from the artifact on demand. The
+    definitions are added to the given package. Raises ValueError if the artifact is
+    stale.
+    '''
+    def __init__(self, package: Package, root: Section, path: str = artifact_path):
+        with gzip.open(path, 'rt') as f:
+            data = json.load(f)
+        if data.get('version') != source_version():
+            raise ValueError('Prebuilt input definitions are outdated.')
+
+        self.package = package
+        self._root = root
+        self._sections = data['sections']
+        self._quantities = data['quantities']
+        self._definitions: Dict[str, Any] = {root.name: root}
+
+    def _create_section(self, name):
+        if name in self._definitions:
+            return self._definitions[name]
+
+        section_data = self._sections.get(name)
+        if section_data is None:
+            return
+
+        legacy_name, description, parent_name, quantities = section_data
+        parent = self._create_section(parent_name)
+        section = Section(
+            name=name, description=description, validate=False,
+            a_legacy=LegacyDefinition(name=legacy_name))
+        for quantity_name, quantity_legacy_name, quantity_description in quantities:
+            section.m_add_sub_section(Section.quantities, Quantity(
+                name=quantity_name, type=str, shape=[], description=quantity_description,
+                a_legacy=LegacyDefinition(name=quantity_legacy_name)))
+        self.package.m_add_sub_section(Package.section_definitions, section)
+        for definition in [section] + section.quantities:
+            definition.__init_metainfo__()
+
+        sub_section = SubSection(
+            name=name, sub_section=section, repeats=True,
+            a_legacy=LegacyDefinition(name=legacy_name))
+        parent.m_add_sub_section(Section.sub_sections, sub_section)
+        sub_section.__init_metainfo__()
+        setattr(parent.section_cls, name, sub_section)
+
+        self._definitions[name] = section
+        return section
+
+    def resolve(self, name):
+        '''
+        Returns the section or quantity definition with the given name.
+        '''
+        if name in self._quantities:
+            section = self._create_section(self._quantities[name])
+            return section.all_quantities.get(name)
+
+        return self._create_section(name)
+
+    def resolve_all(self):
+        for name in self._sections:
+            self._create_section(name)
+
+
+if __name__ == '__main__':
+    from cp2kparser.metainfo import _input_modules
+
+    build(_input_modules.values(), sys.argv[1] if len(sys.argv) > 1 else artifact_path)
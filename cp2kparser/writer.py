@@ -0,0 +1,180 @@
+#
+# Copyright The NOMAD Authors.
+#
+# This file is part of NOMAD. See https://nomad-lab.eu for further info.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+'''
+Streaming serialization of archives. The sections are written one after the other to
+the stream and numpy arrays are written row by row, such that neither the dictionary of
+:func:`MSection.m_to_dict` nor the complete string is created. The JSON output is the
+same as ``json.dump(archive.m_to_dict(), f, indent=indent)``.
+'''
+
+import json
+import numpy as np
+
+from nomad.metainfo import MSection, Quantity
+
+
+def section_items(section):
+    '''
+    Returns the (name, value) pairs of the section in the order of m_to_dict. Values
+    are numpy arrays, sections, lists of sections or json serializable values.
+    '''
+    arrays = dict()
+    for name, quantity in section.m_def.all_quantities.items():
+        if quantity.virtual or not isinstance(quantity.type, np.dtype):
+            continue
+        value = section.__dict__.get(name)
+        if isinstance(value, np.ndarray) and not quantity.is_scalar:
+            arrays[name] = value
+
+    # serialize the remaining quantities of this section only
+    values = section.m_to_dict(
+        partial=lambda definition, _: isinstance(definition, Quantity) and definition.name not in arrays)
+
+    items = []
+    for name in section.m_def.all_quantities:
+        if name in arrays:
+            items.append((name, arrays[name]))
+        elif name in values:
+            items.append((name, values[name]))
+
+    for name, sub_section_def in section.m_def.all_sub_sections.items():
+        if sub_section_def.repeats:
+            if section.m_sub_section_count(sub_section_def) > 0:
+                items.append((name, section.m_get_sub_sections(sub_section_def)))
+        else:
+            sub_section = section.m_get_sub_section(sub_section_def, -1)
+            if sub_section is not None:
+                items.append((name, sub_section))
+
+    return items
+
+
+class JSONWriter:
+    '''
+    Writes sections as JSON to a text stream. Without indent, the output is compact.
+    '''
+    def __init__(self, f, indent=None):
+        self.f = f
+        self.indent = indent
+        self.key_separator = ':' if indent is None else ': '
+
+    def _newline(self, level):
+        if self.indent is not None:
+            self.f.write('\n' + ' ' * (self.indent * level))
+
+    def _dumps(self, value, level):
+        if self.indent is None:
+            return json.dumps(value, separators=(',', ':'))
+        return json.dumps(value, indent=self.indent).replace(
+            '\n', '\n' + ' ' * (self.indent * level))
+
+    def _write_list(self, values, write, level):
+        if len(values) == 0:
+            self.f.write('[]')
+            return
+        self.f.write('[')
+        for n, value in enumerate(values):
+            if n > 0:
+                self.f.write(',')
+            self._newline(level + 1)
+            write(value, level + 1)
+        self._newline(level)
+        self.f.write(']')
+
+    def write_array(self, value, level=0):
+        if value.ndim <= 1:
+            self.f.write(self._dumps(value.tolist(), level))
+        else:
+            self._write_list(value, self.write_array, level)
+
+    def write_value(self, value, level=0):
+        if isinstance(value, MSection):
+            self.write_section(value, level)
+        elif isinstance(value, np.ndarray):
+            self.write_array(value, level)
+        elif isinstance(value, list) and any(isinstance(v, MSection) for v in value):
+            self._write_list(value, self.write_value, level)
+        else:
+            self.f.write(self._dumps(value, level))
+
+    def write_section(self, section, level=0):
+        items = section_items(section)
+        if not items:
+            self.f.write('{}')
+            return
+        self.f.write('{')
+        for n, (name, value) in enumerate(items):
+            if n > 0:
+                self.f.write(',')
+            self._newline(level + 1)
+            self.f.write(json.dumps(name) + self.key_separator)
+            self.write_value(value, level + 1)
+        self._newline(level)
+        self.f.write('}')
+
+
+class MsgPackWriter:
+    '''
+    Writes sections as msgpack to a binary stream.
+    '''
+    def __init__(self, f):
+        import msgpack  # pylint: disable=import-outside-toplevel
+
+        self.f = f
+        self.packer = msgpack.Packer(autoreset=True, use_bin_type=True)
+
+    def write_array(self, value):
+        if value.ndim <= 1:
+            self.f.write(self.packer.pack(value.tolist()))
+        else:
+            self.f.write(self.packer.pack_array_header(len(value)))
+            for row in value:
+                self.write_array(row)
+
+    def write_value(self, value):
+        if isinstance(value, MSection):
+            self.write_section(value)
+        elif isinstance(value, np.ndarray):
+            self.write_array(value)
+        elif isinstance(value, list) and any(isinstance(v, MSection) for v in value):
+            self.f.write(self.packer.pack_array_header(len(value)))
+            for item in value:
+                self.write_value(item)
+        else:
+            self.f.write(self.packer.pack(value))
+
+    def write_section(self, section):
+        items = section_items(section)
+        self.f.write(self.packer.pack_map_header(len(items)))
+        for name, value in items:
+            self.f.write(self.packer.pack(name))
+            self.write_value(value)
+
+
+def write_archive(archive, f, format='json', indent=None):
+    '''
+    Writes the archive to the stream f, a text stream for json and a binary stream for
+    msgpack.
+    '''
+    if format == 'json':
+        JSONWriter(f, indent=indent).write_section(archive)
+    elif format == 'msgpack':
+        MsgPackWriter(f).write_section(archive)
+    else:
+        raise ValueError('Unknown format %s.' % format)
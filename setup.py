@@ -27,6 +27,7 @@ def main():
         author='The NOMAD Authors',
         license='APACHE 2.0',
         packages=find_packages(exclude=['tests']),
+        package_data={'cp2kparser.metainfo': ['cp2k_input.json.gz']},
         install_requires=['nomad-lab'])
 
 
@@ -16,10 +16,31 @@
 # limitations under the License.
 #
 
+import io
+import os
+import json
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import threading
+import tracemalloc
+import numpy as np
 import pytest
 
 from nomad.datamodel import EntryArchive
+from nomad.metainfo import MSection, Package, Section
 from cp2kparser import CP2KParser
+from cp2kparser.cp2k_parser import InpParser, RestartParser, cellpar_to_cell, read_xyz, read_dcd,\
+    get_input_sections, get_scale_factor, resolve_unit, current_rss, Trajectory, XCFunctional,\
+    ForceParser
+from cp2kparser.metainfo import _input_modules
+from cp2kparser.metainfo.prebuilt import build, PrebuiltDefinitions
+from cp2kparser.writer import write_archive
+from cp2kparser.batch import find_mainfiles, parse_files, write_result
+from cp2kparser.cache import ResultCache, parser_options
+from cp2kparser.daemon import Daemon, get_parser
 
 
 def approx(value, abs=0, rel=1e-6):
@@ -68,6 +89,8 @@ def test_single_point(parser):
     sec_scc = sec_run.section_single_configuration_calculation[0]
     assert sec_scc.energy_total.magnitude == approx(-1.36450791e-16)
     assert sec_scc.atom_forces[4][1].magnitude == approx(-8.2387235e-16)
+    x_cp2k_forces = sec_run.x_cp2k_section_quickstep_calculation[0].x_cp2k_atom_forces
+    assert x_cp2k_forces.magnitude == approx(sec_scc.atom_forces.magnitude)
     assert len(sec_scc.section_scf_iteration) == 10
     assert sec_scc.section_scf_iteration[1].energy_total_scf_iteration.magnitude == approx(-1.35770357e-16)
 
@@ -121,3 +144,474 @@ def test_molecular_dynamics(parser):
     sec_systems = archive.section_run[0].section_system
     assert len(sec_systems) == 12
     assert sec_systems[5].atom_positions[4][0].magnitude == approx(5.8374765e-11)
+
+
+def test_md_frames():
+    archive = EntryArchive()
+    CP2KParser(md_frames=True, md_step_sections=False).parse(
+        'tests/data/molecular_dynamics/H2O-32.out', archive, None)
+
+    sec_sccs = archive.section_run[0].section_single_configuration_calculation
+    assert sum(len(sec_scc.x_cp2k_section_md_step) for sec_scc in sec_sccs) == 0
+    sec_frame_sequence = archive.section_run[0].section_frame_sequence[0]
+    assert sec_frame_sequence.number_of_frames_in_sequence == 10
+    assert sec_frame_sequence.frame_sequence_kinetic_energy[8].magnitude == approx(2.34172483e-20)
+    sec_md = sec_frame_sequence.x_cp2k_section_md[0]
+    assert sec_md.x_cp2k_md_frames_index[8] == 10
+    assert sec_md.x_cp2k_md_frames_kinetic_energy_instantaneous[8] == approx(2.34172483e-20)
+    assert sec_md.x_cp2k_md_frames_time[8] == approx(4.5)
+
+
+def test_warm_parser(tmp_path):
+    with open('tests/data/single_point/si_bulk8.inp') as f:
+        inp = f.read()
+    mainfiles = []
+    # explicit functional with a scale and the same functional by shortcut
+    for name, functional in [
+            ('scaled', '\n        &PBE\n          SCALE_X 0.5\n        &END PBE\n'),
+            ('shortcut', ' PBE\n')]:
+        shutil.copytree('tests/data/single_point', str(tmp_path / name))
+        with open(str(tmp_path / name / 'si_bulk8.inp'), 'w') as f:
+            f.write(inp.replace('&XC_FUNCTIONAL PADE\n', '&XC_FUNCTIONAL%s' % functional))
+        mainfiles.append(str(tmp_path / name / 'si_bulk8.out'))
+    mainfiles.insert(1, 'tests/data/molecular_dynamics/H2O-32.out')
+
+    parser = CP2KParser()
+    for mainfile in mainfiles:
+        archive = EntryArchive()
+        parser.parse(mainfile, archive, None)
+        cold_archive = EntryArchive()
+        CP2KParser().parse(mainfile, cold_archive, None)
+        assert archive.m_to_dict() == cold_archive.m_to_dict()
+    assert parser.traj_parser.format is None
+
+
+def test_dedup_systems():
+    archive = EntryArchive()
+    CP2KParser(dedup_systems=True).parse('tests/data/molecular_dynamics/H2O-32.out', archive, None)
+
+    sec_systems = archive.section_run[0].section_system
+    assert sec_systems[0].lattice_vectors[1][1].magnitude == approx(9.853e-10)
+    assert sec_systems[0].atom_labels[0] == 'O'
+    assert len(sec_systems[0].section_system_to_system_refs) == 0
+    for sec_system in sec_systems[1:]:
+        assert sec_system.lattice_vectors is None
+        assert sec_system.atom_positions is not None
+        sec_system_ref = sec_system.section_system_to_system_refs[0]
+        assert sec_system_ref.system_to_system_kind == 'invariants'
+        assert sec_system_ref.system_to_system_ref == sec_systems[0]
+
+
+def test_scan_profile():
+    parser = CP2KParser(profile=True)
+    archive = EntryArchive()
+    parser.parse('tests/data/molecular_dynamics/H2O-32.out', archive, None)
+
+    report = {entry['key']: entry for entry in parser.scan_profile.report()}
+    assert report['*']['amplification'] == approx(1)
+    md_step = report['quickstep.molecular_dynamics.md_step']
+    assert md_step['evaluations'] == 1
+    assert md_step['matches'] == 10
+    assert report['quickstep.molecular_dynamics.md_step.*']['evaluations'] >= 10
+    assert parser.scan_profile.amplification > 1
+    assert len(archive.section_run[0].section_system) == 12
+
+    parser = CP2KParser()
+    parser.parse('tests/data/molecular_dynamics/H2O-32.out', EntryArchive(), None)
+    assert parser.scan_profile is None
+
+
+def test_shared_quantities():
+    parsers = [CP2KParser(), CP2KParser(profile=True)]
+    assert parsers[0].out_parser.quantities is parsers[1].out_parser.quantities
+
+    archives = [EntryArchive(), EntryArchive()]
+    threads = [threading.Thread(target=parser.parse, args=(
+        'tests/data/molecular_dynamics/H2O-32.out', archive, None))
+        for parser, archive in zip(parsers, archives)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert archives[0].m_to_dict() == archives[1].m_to_dict()
+    assert parsers[0].out_parser.profile is None
+    assert parsers[1].scan_profile.stats['quickstep.molecular_dynamics.md_step'][3] == 10
+
+
+@pytest.mark.parametrize('reset_peak', [True, False])
+def test_memory_profile(monkeypatch, reset_peak):
+    if not reset_peak and hasattr(tracemalloc, 'reset_peak'):
+        monkeypatch.delattr(tracemalloc, 'reset_peak')
+    parser = CP2KParser(profile_memory=True)
+    parser.parse('tests/data/molecular_dynamics/H2O-32.out', EntryArchive(), None)
+
+    report = {entry['phase']: entry for entry in parser.memory_profile.report()}
+    assert list(report)[:3] == ['parse', 'output', 'parse_input']
+    assert report['force_parser']['calls'] == 12
+    for phase in ['output', 'parse_input', 'parse_configurations_quickstep', 'traj_parser']:
+        assert 0 < report[phase]['peak'] <= report['parse']['peak']
+    assert not tracemalloc.is_tracing()
+
+
+def test_budget(tmp_path):
+    parser = CP2KParser(time_budget=0)
+    archive = EntryArchive()
+    data = ResultCache(str(tmp_path)).parse(
+        parser, 'tests/data/molecular_dynamics/H2O-32.out', archive, None)
+
+    sec_run = archive.section_run[0]
+    assert sec_run.x_cp2k_partial_reason == parser.partial_reason
+    assert 'time budget' in sec_run.x_cp2k_partial_reason
+    assert 0 < len(sec_run.section_single_configuration_calculation) < 12
+    assert len(sec_run.section_single_configuration_calculation[0].section_scf_iteration) == 0
+    assert parser.aux_files == []
+    assert json.loads(data)['section_run'][0]['x_cp2k_partial_reason'] == parser.partial_reason
+    assert ResultCache(str(tmp_path)).get(
+        'tests/data/molecular_dynamics/H2O-32.out', parser_options(parser)) is None
+
+    parser = CP2KParser(time_budget=100, memory_budget=1 << 40)
+    archive = EntryArchive()
+    parser.parse('tests/data/molecular_dynamics/H2O-32.out', archive, None)
+    assert archive.section_run[0].x_cp2k_partial_reason is None
+    assert len(archive.section_run[0].section_single_configuration_calculation) == 12
+
+    # the memory of previous parses does not count
+    parser = CP2KParser(memory_budget=current_rss() // 2)
+    archive = EntryArchive()
+    parser.parse('tests/data/molecular_dynamics/H2O-32.out', archive, None)
+    assert archive.section_run[0].x_cp2k_partial_reason is None
+
+    # the aux files of the previous parse are not read
+    parser.time_budget = 0
+    archive = EntryArchive()
+    parser.parse('tests/data/single_point/si_bulk8.out', archive, None)
+    assert archive.section_run[0].x_cp2k_partial_reason is not None
+    assert len(archive.section_run[0].x_cp2k_section_input) == 0
+
+
+def test_write_archive():
+    archive = EntryArchive()
+    CP2KParser(md_frames=True).parse('tests/data/molecular_dynamics/H2O-32.out', archive, None)
+    archive_dict = archive.m_to_dict()
+
+    f = io.StringIO()
+    write_archive(archive, f, indent=2)
+    assert f.getvalue() == json.dumps(archive_dict, indent=2)
+    f = io.StringIO()
+    write_archive(archive, f)
+    assert f.getvalue() == json.dumps(archive_dict, separators=(',', ':'))
+
+
+def test_write_archive_msgpack():
+    msgpack = pytest.importorskip('msgpack')
+    archive = EntryArchive()
+    CP2KParser(md_frames=True).parse('tests/data/molecular_dynamics/H2O-32.out', archive, None)
+    f = io.BytesIO()
+    write_archive(archive, f, format='msgpack')
+    assert msgpack.unpackb(f.getvalue(), raw=False) == archive.m_to_dict()
+
+
+def test_batch(tmp_path):
+    mainfiles = list(find_mainfiles(['tests/data']))
+    assert len(mainfiles) == 3
+    assert 'tests/data/single_point/si_bulk8.out' in mainfiles
+
+    results = list(parse_files(mainfiles + ['tests/data/missing.out'], processes=1))
+    assert [result['error'] is None for result in results] == [True, True, True, False]
+    f = io.StringIO()
+    write_result(results[2], f)
+    result = json.loads(f.getvalue())
+    assert result['parse_time'] > 0
+    assert result['archive']['section_run'][0]['program_version'] == 'CP2K version 2.6.2'
+
+    results = list(parse_files(mainfiles, output_dir=str(tmp_path), processes=1))
+    assert 'archive' not in results[0]
+    with open(tmp_path / 'single_point' / 'si_bulk8.out.json') as f:
+        assert json.load(f)['section_run'][0]['program_name'] == 'CP2K'
+
+
+def test_daemon(tmp_path):
+    requests = [
+        dict(id=1, mainfile='tests/data/single_point/si_bulk8.out'),
+        dict(id=2, mainfile='tests/data/single_point/si_bulk8.out', options=dict(compact_input=True)),
+        dict(id=3, mainfile='tests/data/molecular_dynamics/H2O-32.out', output=str(tmp_path / 'md.json')),
+        dict(id=4, mainfile='tests/data/missing.out'),
+        dict(id=5),
+        dict(id=6, mainfile=None),
+        dict(id=7, mainfile='tests/data/single_point/si_bulk8.out', output=1)]
+    f_in = io.StringIO('\n'.join(json.dumps(request) for request in requests) + '\nnot json\n')
+    f_out = io.StringIO()
+    daemon = Daemon(processes=1)
+    daemon.serve_stream(f_in, f_out)
+    daemon.close()
+
+    responses = [json.loads(line) for line in f_out.getvalue().splitlines()]
+    assert [response['id'] for response in responses] == [1, 2, 3, 4, 5, 6, 7, None]
+    assert responses[0]['archive']['section_run'][0]['program_name'] == 'CP2K'
+    assert 'x_cp2k_input_tree' in responses[1]['archive']['section_run'][0]
+    assert 'archive' not in responses[2]
+    with open(str(tmp_path / 'md.json')) as f:
+        assert len(json.load(f)['section_run'][0]['section_system']) == 12
+    assert responses[3]['error'].startswith('FileNotFoundError')
+    assert all(response['error'] is not None for response in responses[4:])
+
+    # connections of serve_socket share the parser of this process
+    daemon = Daemon(processes=1)
+    f_outs = [io.StringIO() for _ in range(4)]
+    threads = [threading.Thread(target=daemon.serve_stream, args=(io.StringIO(
+        json.dumps(requests[n % 2]) + '\n'), f_out)) for n, f_out in enumerate(f_outs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    daemon.close()
+    for n, f_out in enumerate(f_outs):
+        assert json.loads(f_out.getvalue())['archive'] == responses[n % 2]['archive']
+
+    # the budgets are set per request on a shared parser
+    parser = get_parser(dict(time_budget=1))
+    assert get_parser(dict(time_budget=2)) is parser and parser.time_budget == 2
+    assert get_parser(dict()).time_budget is None
+
+    # only sockets of daemons that are gone are replaced
+    path = str(tmp_path / 'daemon.sock')
+    open(path, 'w').close()
+    with pytest.raises(FileExistsError):
+        daemon.serve_socket(path)
+    os.remove(path)
+    with socket.socket(socket.AF_UNIX) as sock:
+        sock.bind(path)
+        sock.listen()
+        with pytest.raises(FileExistsError):
+            daemon.serve_socket(path)
+    assert os.path.exists(path)
+
+
+def test_result_cache(tmp_path):
+    shutil.copytree('tests/data/molecular_dynamics', str(tmp_path / 'data'))
+    mainfile = str(tmp_path / 'data' / 'H2O-32.out')
+    cache = ResultCache(str(tmp_path / 'cache'))
+    parser = CP2KParser()
+
+    archive = EntryArchive()
+    cache.parse(parser, mainfile, archive)
+    assert str(tmp_path / 'data' / 'H2O-32-1.ener') in parser.aux_files
+    cached_archive = EntryArchive()
+    cache.parse(parser, mainfile, cached_archive)
+    assert cached_archive.m_to_dict() == archive.m_to_dict()
+
+    options = parser_options(parser)
+    assert cache.get(mainfile, options) is not None
+    assert cache.get(mainfile, dict(options, md_frames=True)) is None
+    with open(str(tmp_path / 'data' / 'H2O-32-1.ener'), 'a') as f:
+        f.write('\n')
+    assert cache.get(mainfile, options) is None
+
+    # the least recently used entry is removed
+    cache = ResultCache(str(tmp_path / 'lru'), max_size=100)
+    cache.put(mainfile, [], 'x' * 60, dict(n=1))
+    os.utime(cache._path(cache.key(mainfile, dict(n=1))), (0, 0))
+    cache.put(mainfile, [], 'x' * 60, dict(n=2))
+    assert cache.get(mainfile, dict(n=1)) is None
+    assert cache.get(mainfile, dict(n=2)) == 'x' * 60
+
+    # writes of other processes are seen after the scan interval
+    caches = [ResultCache(str(tmp_path / 'shared'), max_size=150) for _ in range(2)]
+    caches[0].put(mainfile, [], 'x' * 60, dict(n=1))
+    os.utime(caches[0]._path(caches[0].key(mainfile, dict(n=1))), (0, 0))
+    caches[1].put(mainfile, [], 'x' * 60, dict(n=2))
+    tmp_file = str(tmp_path / 'shared' / '00' / 'stale.json.tmp')
+    os.makedirs(os.path.dirname(tmp_file))
+    open(tmp_file, 'w').close()
+    os.utime(tmp_file, (0, 0))
+    caches[0].scan_interval = 0
+    caches[0].put(mainfile, [], 'x' * 60, dict(n=3))
+    assert caches[0].get(mainfile, dict(n=1)) is None
+    assert caches[0].get(mainfile, dict(n=2)) is not None
+    assert not os.path.exists(tmp_file)
+
+    assert 'time_budget' not in options and 'profile' not in options
+
+    # a fresh process reads the entry without having parsed before
+    cache = ResultCache(str(tmp_path / 'fresh'))
+    cache.parse(parser, 'tests/data/single_point/si_bulk8.out', EntryArchive())
+    code = '''
+from nomad.datamodel import EntryArchive
+from cp2kparser import CP2KParser
+from cp2kparser.cache import ResultCache
+archive = EntryArchive()
+ResultCache(%r).parse(CP2KParser(), 'tests/data/single_point/si_bulk8.out', archive)
+print(len(archive.section_run[0].x_cp2k_section_input[0].m_to_dict()))
+''' % str(tmp_path / 'fresh')
+    assert subprocess.check_output([sys.executable, '-c', code]).split()[-1] == b'2'
+    with pytest.raises(FileNotFoundError):
+        cache.parse(parser, str(tmp_path / 'missing.out'), EntryArchive())
+
+
+def test_compact_input():
+    archive = EntryArchive()
+    CP2KParser(compact_input=True).parse('tests/data/single_point/si_bulk8.out', archive, None)
+
+    sec_run = archive.section_run[0]
+    assert len(sec_run.x_cp2k_section_input) == 0
+    assert json.loads(sec_run.x_cp2k_input_tree)['GLOBAL']['PROJECT_NAME'] == 'Si_bulk8'
+    sec_input = get_input_sections(sec_run)[0]
+    assert sec_input.x_cp2k_section_input_GLOBAL[0].x_cp2k_input_GLOBAL_PROJECT_NAME == 'Si_bulk8'
+    assert sec_run.section_method[0].section_XC_functionals[0].XC_functional_name == 'LDA_XC_TETER93'
+
+
+def test_scf_iterations(parser):
+    archive = EntryArchive()
+    parser.parse('tests/data/single_point/si_bulk8.out', archive, None)
+    sec_scfs = archive.section_run[0].section_single_configuration_calculation[0].section_scf_iteration
+    sec_x_scfs = archive.section_run[0].x_cp2k_section_quickstep_calculation[0].x_cp2k_section_scf_iteration
+    assert len(sec_x_scfs) == len(sec_scfs) == 10
+    assert sec_x_scfs[1].x_cp2k_energy_total_scf_iteration == sec_scfs[1].energy_total_scf_iteration
+
+    archive = EntryArchive()
+    CP2KParser(legacy_scf_iterations=False).parse('tests/data/single_point/si_bulk8.out', archive, None)
+    sec_scfs = archive.section_run[0].section_single_configuration_calculation[0].section_scf_iteration
+    assert len(sec_scfs) == 10
+    assert len(archive.section_run[0].x_cp2k_section_quickstep_calculation[0].x_cp2k_section_scf_iteration) == 0
+
+
+def test_scale_factor():
+    assert get_scale_factor('hartree') == approx(4.359744722207e-18)
+    assert get_scale_factor(resolve_unit('hartree/bohr'), 'newton') == approx(8.2387235e-8)
+    assert get_scale_factor(resolve_unit('angstrom'), 'm') == approx(1e-10)
+    # products bind weaker than powers
+    velocity = get_scale_factor(resolve_unit('bohr/au_t'), 'm/s')
+    assert get_scale_factor(resolve_unit('bohr*au_t^-1'), 'm/s') == approx(velocity)
+    assert get_scale_factor(resolve_unit('(bohr*au_t)^-1'), '1/(m*s)') == approx(1 / (velocity * 2.4188843e-17 ** 2))
+    assert resolve_unit(' Bohr * AU_T^-1') is resolve_unit('bohr*au_t^-1')
+    assert get_scale_factor(None) == 1
+
+
+def test_records():
+    trajectory = Trajectory(labels=['Si'], positions=np.zeros((1, 3)))
+    trajectory._frame = 2
+    assert not hasattr(trajectory, '__dict__')
+    assert trajectory.labels == ['Si'] and trajectory._frame == 2
+    assert trajectory.velocities is None and trajectory.units is None
+    with pytest.raises(AttributeError):
+        trajectory.energy = 0.
+    functional = XCFunctional('GGA_X_PBE')
+    assert functional.name == 'GGA_X_PBE' and functional.weight is None
+
+
+def test_input_tree_cache():
+    parsers = [InpParser(), InpParser()]
+    for inp_parser in parsers:
+        inp_parser.mainfile = 'tests/data/single_point/si_bulk8.inp'
+    tree = parsers[0].tree
+    assert parsers[1].tree is tree
+    assert parsers[1].get('GLOBAL/PROJECT_NAME') == 'Si_bulk8'
+    with pytest.raises(TypeError):
+        tree.add('GLOBAL', None)
+
+
+def test_restart_parser():
+    restart_parser = RestartParser()
+    restart_parser.mainfile = 'tests/data/molecular_dynamics/H2O-32-1.restart'
+    assert restart_parser.get('MOTION/MD/STEP_START_VAL') == '10'
+    coord = restart_parser.tree.FORCE_EVAL.SUBSYS.COORD
+    assert not coord.loaded
+    assert not restart_parser.tree.FORCE_EVAL.SUBSYS.VELOCITY.loaded
+    assert len(restart_parser.get('FORCE_EVAL/SUBSYS/COORD/DEFAULT_KEYWORD')) == 6
+    assert coord.loaded
+    assert not restart_parser.tree.FORCE_EVAL.SUBSYS.VELOCITY.loaded
+    velocity = restart_parser.get('MOTION/MD/THERMOSTAT/NOSE/VELOCITY/DEFAULT_KEYWORD')
+    assert velocity[0].split()[2] == '3.0000000000000000E-04'
+
+
+def test_restart_information(tmp_path):
+    for filename in os.listdir('tests/data/molecular_dynamics'):
+        shutil.copy(os.path.join('tests/data/molecular_dynamics', filename), str(tmp_path))
+    with open(str(tmp_path / 'H2O-32.out')) as f:
+        lines = f.readlines()
+    stars = ' %s\n' % ('*' * 79)
+    block = [stars, ' *%sRESTART INFORMATION%s*\n' % (' ' * 28, ' ' * 30), stars] + [
+        ' * %-75s *\n' % line for line in [
+            '   RESTART FILE NAME: H2O-32-1.restart', '',
+            'RESTARTED QUANTITIES:', '                      CELL',
+            '                      COORDINATES']] + [stars]
+    with open(str(tmp_path / 'H2O-32.out'), 'w') as f:
+        f.writelines(lines[:13] + block + lines[13:])
+
+    parser = CP2KParser()
+    archive = EntryArchive()
+    parser.parse(str(tmp_path / 'H2O-32.out'), archive, None)
+    sec_restart = archive.section_run[0].x_cp2k_section_restart_information[0]
+    assert sec_restart.x_cp2k_restart_file_name == 'H2O-32-1.restart'
+    assert sec_restart.x_cp2k_restarted_quantity_name == 'CELL COORDINATES'
+    assert sec_restart.x_cp2k_restart_project_name == 'H2O-32'
+    assert sec_restart.x_cp2k_restart_step_start_val == 10
+    assert sec_restart.x_cp2k_restart_time_start_val.magnitude == approx(5e-15)
+    assert str(tmp_path / 'H2O-32-1.restart') in parser.aux_files
+    # the heavy blocks are not decoded
+    assert not parser.restart_parser.tree.FORCE_EVAL.SUBSYS.COORD.loaded
+
+
+def test_prebuilt_definitions(tmp_path):
+    class x_cp2k_section_input(MSection):
+        m_def = Section(validate=False)
+
+    path = str(tmp_path / 'cp2k_input.json.gz')
+    build(_input_modules.values(), path)
+    definitions = PrebuiltDefinitions(Package(name='test'), x_cp2k_section_input.m_def, path)
+    quantity = definitions.resolve('x_cp2k_input_GLOBAL_PROJECT_NAME')
+    assert quantity.m_parent.name == 'x_cp2k_section_input_GLOBAL'
+    # only the sections that are used are created
+    sub_sections = x_cp2k_section_input.m_def.sub_sections
+    assert [sub_section.name for sub_section in sub_sections] == ['x_cp2k_section_input_GLOBAL']
+
+    sec_input = x_cp2k_section_input()
+    sec_global = sec_input.m_create(quantity.m_parent.section_cls)
+    sec_global.x_cp2k_input_GLOBAL_PROJECT_NAME = 'Si_bulk8'
+    assert sec_input.x_cp2k_section_input_GLOBAL[0].x_cp2k_input_GLOBAL_PROJECT_NAME == 'Si_bulk8'
+
+
+def test_force_parser(tmp_path):
+    path = str(tmp_path / 'H2O-frc-1_0.xyz')
+    with open(path, 'w') as f:
+        f.write(''' ATOMIC FORCES in [a.u.]
+
+ # Atom   Kind   Element          X              Y              Z
+      1      1      O          -0.01284553     0.00470431    -0.00431004
+      2      2      H           0.00738226    -0.00243911     0.00318563
+      3      2      H           0.00569164    -0.00239052     0.00119734
+ SUM OF ATOMIC FORCES          0.00022837    -0.00012532     0.00007293     0.00027047
+''')
+    force_parser = ForceParser()
+    force_parser.mainfile = path
+    forces = np.array(force_parser.get('atom_forces'))
+    assert forces.shape == (3, 3)
+    assert forces[0][0] == approx(-0.01284553)
+
+
+def test_native_readers(tmp_path):
+    from ase.geometry import cellpar_to_cell as ase_cellpar_to_cell
+
+    for cellpar in [[5.431] * 3 + [90.] * 3, [3., 3., 5., 90., 90., 120.], [4., 5., 6., 70., 80., 100.]]:
+        assert cellpar_to_cell(cellpar) == approx(ase_cellpar_to_cell(cellpar), abs=1e-12)
+
+    positions, labels = read_xyz('tests/data/molecular_dynamics/H2O-32-pos-1.xyz')
+    assert labels[0][:3] == ['O', 'O', 'H']
+    assert positions[0][0] == approx([2.2803980000, 9.1465390000, 5.0886960000])
+
+    def record(data):
+        return struct.pack('<i', len(data)) + data + struct.pack('<i', len(data))
+
+    # charmm dcd with unit cell
+    header = [len(positions), 0, 1, 0, 0, 0, 0, 0, 0, 0, 1] + [0] * 8 + [24]
+    dcd = record(b'CORD' + struct.pack('<20i', *header)) + record(struct.pack('<i', 0))
+    dcd += record(struct.pack('<i', len(positions[0])))
+    for frame in positions:
+        dcd += record(struct.pack('<6d', *[10., 90., 10., 90., 90., 10.]))
+        for coordinate in np.transpose(frame):
+            dcd += record(np.array(coordinate, dtype='<f4').tobytes())
+    path = tmp_path / 'pos.dcd'
+    path.write_bytes(dcd)
+    dcd_positions = read_dcd(str(path))
+    assert len(dcd_positions) == len(positions)
+    assert dcd_positions[-1] == approx(positions[-1], rel=1e-6)